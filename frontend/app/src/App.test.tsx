@@ -441,6 +441,35 @@ describe("App", () => {
     )
   })
 
+  it("treats a run that is waiting for the server as a requested rerun", async () => {
+    renderApp(getProps())
+
+    sendForwardMessage("newSession", NEW_SESSION_JSON)
+
+    sendForwardMessage("sessionStatusChanged", {
+      runOnSave: false,
+      scriptIsRunning: false,
+      scriptIsWaiting: true,
+    })
+
+    await waitFor(() => {
+      expect(screen.getByTestId("stApp")).toHaveAttribute(
+        "data-test-script-state",
+        ScriptRunState.RERUN_REQUESTED
+      )
+    })
+
+    sendForwardMessage("sessionStatusChanged", {
+      runOnSave: false,
+      scriptIsRunning: true,
+    })
+
+    expect(screen.getByTestId("stApp")).toHaveAttribute(
+      "data-test-script-state",
+      ScriptRunState.RUNNING
+    )
+  })
+
   describe("streamlit server version changes", () => {
     let prevWindowLocation: Location
 
@@ -919,6 +919,14 @@ export class App extends PureComponent<Props, State> {
         ) {
           dialog = undefined
         }
+      } else if (
+        statusChangeProto.scriptIsWaiting &&
+        prevState.scriptRunState !== ScriptRunState.STOP_REQUESTED
+      ) {
+        // The server has queued our run until it has capacity to start it.
+        // From the user's point of view, this is a rerun that's about to
+        // start.
+        scriptRunState = ScriptRunState.RERUN_REQUESTED
       } else if (
         !statusChangeProto.scriptIsRunning &&
         prevState.scriptRunState !== ScriptRunState.RERUN_REQUESTED &&
@@ -448,6 +448,66 @@ describe("DefaultStreamlitEndpoints", () => {
     })
   })
 
+  describe("fetchDataframePage()", () => {
+    let axiosMock: MockAdapter
+    let endpoints: DefaultStreamlitEndpoints
+
+    beforeEach(() => {
+      axiosMock = new MockAdapter(axios)
+      endpoints = new DefaultStreamlitEndpoints({
+        getServerUri: () => MOCK_SERVER_URI,
+        csrfEnabled: false,
+      })
+    })
+
+    afterEach(() => {
+      axiosMock.restore()
+    })
+
+    it("requests rows by offset and limit", async () => {
+      const mockArrowBytes = new Uint8Array([1, 2, 3])
+
+      axiosMock
+        .onGet(
+          "http://streamlit.mock:80/mock/base/path/_stcore/dataframe/mockId?offset=1000&limit=500"
+        )
+        .reply(() => [200, mockArrowBytes])
+
+      await expect(
+        endpoints.fetchDataframePage("/_stcore/dataframe/mockId", 1000, 500)
+      ).resolves.toEqual(mockArrowBytes)
+    })
+
+    it("requests sorted rows", async () => {
+      const mockArrowBytes = new Uint8Array([1, 2, 3])
+
+      axiosMock
+        .onGet(
+          "http://streamlit.mock:80/mock/base/path/_stcore/dataframe/mockId?offset=0&limit=500&sort=col&order=desc"
+        )
+        .reply(() => [200, mockArrowBytes])
+
+      await expect(
+        endpoints.fetchDataframePage("/_stcore/dataframe/mockId", 0, 500, {
+          column: "col",
+          ascending: false,
+        })
+      ).resolves.toEqual(mockArrowBytes)
+    })
+
+    it("errors on bad status", async () => {
+      axiosMock
+        .onGet(
+          "http://streamlit.mock:80/mock/base/path/_stcore/dataframe/mockId?offset=0&limit=500"
+        )
+        .reply(() => [404])
+
+      await expect(
+        endpoints.fetchDataframePage("/_stcore/dataframe/mockId", 0, 500)
+      ).rejects.toThrow("Request failed with status code 404")
+    })
+  })
+
   // Test our private csrfRequest() API, which is responsible for setting
   // the "X-Xsrftoken" header.
   describe("csrfRequest()", () => {
@@ -207,6 +207,30 @@ export class DefaultStreamlitEndpoints implements StreamlitEndpoints {
     return new Uint8Array(rsp.data)
   }
 
+  public async fetchDataframePage(
+    url: string,
+    offset: number,
+    limit: number,
+    sort?: { column: string; ascending: boolean }
+  ): Promise<Uint8Array> {
+    const params = new URLSearchParams({
+      offset: offset.toString(),
+      limit: limit.toString(),
+    })
+    if (notNullOrUndefined(sort)) {
+      params.set("sort", sort.column)
+      params.set("order", sort.ascending ? "asc" : "desc")
+    }
+
+    const rsp = await axios.request({
+      url: buildHttpUri(this.requireServerUri(), `${url}?${params}`),
+      method: "GET",
+      responseType: "arraybuffer",
+    })
+
+    return new Uint8Array(rsp.data)
+  }
+
   /**
    * Fetch the server URI. If our server is disconnected, default to the most
    * recent cached value of the URI. If we're disconnected and have no cached
@@ -18,7 +18,7 @@ import axios from "axios"
 import { default as WS } from "vitest-websocket-mock"
 import zip from "lodash/zip"
 
-import { BackMsg } from "@streamlit/protobuf"
+import { BackMsg, ForwardMsg } from "@streamlit/protobuf"
 
 import { ConnectionState } from "./ConnectionState"
 import { Args, WebsocketConnection } from "./WebsocketConnection"
@@ -646,6 +646,34 @@ describe("WebsocketConnection", () => {
     expect(sendSpy).toHaveBeenCalledWith(buffer)
   })
 
+  it("dispatches batched messages in order", async () => {
+    const onMessage = vi.fn()
+    client = new WebsocketConnection(createMockArgs({ onMessage }))
+
+    const batch = ForwardMsg.create({
+      forwardMsgList: {
+        messages: [
+          {
+            scriptFinished:
+              ForwardMsg.ScriptFinishedStatus.FINISHED_WITH_COMPILE_ERROR,
+          },
+          { sessionStatusChanged: { runOnSave: true } },
+        ],
+      },
+    })
+    const single = ForwardMsg.create({ pageNotFound: { pageName: "foo" } })
+
+    // @ts-expect-error
+    await client.handleMessage(ForwardMsg.encode(batch).finish())
+    // @ts-expect-error
+    await client.handleMessage(ForwardMsg.encode(single).finish())
+
+    expect(onMessage).toHaveBeenCalledTimes(3)
+    expect(onMessage.mock.calls[0][0].type).toBe("scriptFinished")
+    expect(onMessage.mock.calls[1][0].type).toBe("sessionStatusChanged")
+    expect(onMessage.mock.calls[2][0].type).toBe("pageNotFound")
+  })
+
   describe("getBaseUriParts", () => {
     it("returns correct base uri parts when ConnectionState == Connected", () => {
       // @ts-expect-error
@@ -24,7 +24,7 @@ import {
 } from "@streamlit/utils"
 
 import { ForwardMsgCache } from "./ForwardMessageCache"
-import { buildWsUri } from "./utils"
+import { buildWsUri, getEncodedBatchedForwardMsgs } from "./utils"
 import {
   PING_MAXIMUM_RETRY_PERIOD_MS,
   PING_MINIMUM_RETRY_PERIOD_MS,
@@ -493,13 +493,35 @@ export class WebsocketConnection {
   }
 
   private async handleMessage(data: ArrayBuffer): Promise<void> {
+    const encodedMsg = new Uint8Array(data)
+    const msg = ForwardMsg.decode(encodedMsg)
+
+    if (msg.type === "forwardMsgList") {
+      // The server batched several messages into this frame. Process them
+      // in order, as if each of them had been received on its own. (The
+      // messages are assigned their indices synchronously, before any of
+      // them is awaited.)
+      const batchedMsgs = (msg.forwardMsgList?.messages ?? []) as ForwardMsg[]
+      const encodedBatchedMsgs = getEncodedBatchedForwardMsgs(encodedMsg)
+      await Promise.all(
+        batchedMsgs.map((batchedMsg, i) =>
+          this.processMessage(batchedMsg, encodedBatchedMsgs[i])
+        )
+      )
+      return
+    }
+
+    await this.processMessage(msg, encodedMsg)
+  }
+
+  private async processMessage(
+    msg: ForwardMsg,
+    encodedMsg: Uint8Array
+  ): Promise<void> {
     // Assign this message an index.
     const messageIndex = this.nextMessageIndex
     this.nextMessageIndex += 1
 
-    const encodedMsg = new Uint8Array(data)
-    const msg = ForwardMsg.decode(encodedMsg)
-
     this.messageQueue[messageIndex] = await this.cache.processMessagePayload(
       msg,
       encodedMsg
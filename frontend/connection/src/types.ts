@@ -134,6 +134,24 @@ export interface StreamlitEndpoints {
    */
   fetchCachedForwardMsg(hash: string): Promise<Uint8Array>
 
+  /**
+   * Fetch rows of a dataframe that is kept on the server and sent in pages.
+   *
+   * @param url the dataframe's relative URL, from the Arrow proto's pagedData
+   * @param offset the index of the first row to fetch
+   * @param limit the maximum number of rows to fetch
+   * @param sort optional column to sort the dataframe by before the rows are selected
+   *
+   * @return a Promise<Uint8Array> that resolves with the rows as serialized Arrow IPC data.
+   * Callers can use it as the data of a Quiver.
+   */
+  fetchDataframePage?(
+    url: string,
+    offset: number,
+    limit: number,
+    sort?: { column: string; ascending: boolean }
+  ): Promise<Uint8Array>
+
   /**
    * setFileUploadClientConfig.
    * @param config the object that contains prefix and headers object
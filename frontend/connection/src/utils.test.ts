@@ -14,10 +14,12 @@
  * limitations under the License.
  */
 
+import { ForwardMsg } from "@streamlit/protobuf"
 import { buildHttpUri } from "@streamlit/utils"
 
 import {
   buildWsUri,
+  getEncodedBatchedForwardMsgs,
   getPossibleBaseUris,
   getWindowBaseUriParts,
 } from "./utils"
@@ -187,3 +189,38 @@ describe("getPossibleBaseUris", () => {
     })
   })
 })
+
+describe("getEncodedBatchedForwardMsgs", () => {
+  it("returns the encoded bytes of the batched messages", () => {
+    const msgs = [
+      ForwardMsg.create({
+        scriptFinished:
+          ForwardMsg.ScriptFinishedStatus.FINISHED_WITH_COMPILE_ERROR,
+      }),
+      ForwardMsg.create({
+        hash: "some-hash",
+        metadata: { cacheable: true, deltaPath: [0, 1] },
+        pageNotFound: { pageName: "foo" },
+      }),
+    ]
+    const batch = ForwardMsg.create({
+      metadata: { cacheable: false },
+      forwardMsgList: { messages: msgs },
+    })
+
+    const encodedMsgs = getEncodedBatchedForwardMsgs(
+      ForwardMsg.encode(batch).finish()
+    )
+
+    expect(encodedMsgs.map(encodedMsg => Array.from(encodedMsg))).toEqual(
+      msgs.map(msg => Array.from(ForwardMsg.encode(msg).finish()))
+    )
+  })
+
+  it("returns no messages for a message that isn't batched", () => {
+    const msg = ForwardMsg.create({ pageNotFound: { pageName: "foo" } })
+    const encodedMsg = ForwardMsg.encode(msg).finish()
+
+    expect(getEncodedBatchedForwardMsgs(encodedMsg)).toEqual([])
+  })
+})
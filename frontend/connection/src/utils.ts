@@ -91,3 +91,103 @@ export function buildWsUri(
   const fullPath = makePath(pathname, path)
   return `${protocol}://${hostname}:${port}/${fullPath}`
 }
+
+// Field numbers of ForwardMsg.forward_msg_list and ForwardMsgList.messages.
+const FORWARD_MSG_LIST_FIELD = 25
+const FORWARD_MSG_LIST_MESSAGES_FIELD = 1
+
+// Protobuf wire types.
+const WIRE_TYPE_VARINT = 0
+const WIRE_TYPE_FIXED64 = 1
+const WIRE_TYPE_LENGTH_DELIMITED = 2
+const WIRE_TYPE_FIXED32 = 5
+
+/** Read a varint, and return its value and the position after it. */
+function readVarint(bytes: Uint8Array, pos: number): [number, number] {
+  let value = 0
+  let multiplier = 1
+  let byte: number
+  do {
+    if (pos >= bytes.length) {
+      throw new Error("Truncated protobuf varint")
+    }
+    byte = bytes[pos]
+    pos += 1
+    value += (byte & 0x7f) * multiplier
+    multiplier *= 128
+  } while (byte & 0x80)
+  return [value, pos]
+}
+
+/**
+ * Call the callback with the field number and the start and end positions
+ * of the value of every length-delimited field of the protobuf message in
+ * bytes[start, end).
+ */
+function forEachLengthDelimitedField(
+  bytes: Uint8Array,
+  start: number,
+  end: number,
+  callback: (fieldNumber: number, valueStart: number, valueEnd: number) => void
+): void {
+  let pos = start
+  while (pos < end) {
+    const [tag, valuePos] = readVarint(bytes, pos)
+    const wireType = tag & 0x7
+    pos = valuePos
+
+    switch (wireType) {
+      case WIRE_TYPE_VARINT:
+        pos = readVarint(bytes, pos)[1]
+        break
+      case WIRE_TYPE_FIXED64:
+        pos += 8
+        break
+      case WIRE_TYPE_FIXED32:
+        pos += 4
+        break
+      case WIRE_TYPE_LENGTH_DELIMITED: {
+        const [length, dataPos] = readVarint(bytes, pos)
+        pos = dataPos + length
+        callback(Math.floor(tag / 8), dataPos, pos)
+        break
+      }
+      default:
+        throw new Error(`Unsupported protobuf wire type: ${wireType}`)
+    }
+  }
+}
+
+/**
+ * Return the encoded bytes of the messages in the `forwardMsgList` of an
+ * encoded ForwardMsg, in order.
+ *
+ * The bytes are views into the encoded ForwardMsg, so that the messages of
+ * a batched websocket frame don't need to be encoded again.
+ */
+export function getEncodedBatchedForwardMsgs(
+  encodedMsg: Uint8Array
+): Uint8Array[] {
+  const encodedMsgs: Uint8Array[] = []
+  forEachLengthDelimitedField(
+    encodedMsg,
+    0,
+    encodedMsg.length,
+    (fieldNumber, listStart, listEnd) => {
+      if (fieldNumber !== FORWARD_MSG_LIST_FIELD) {
+        return
+      }
+      forEachLengthDelimitedField(
+        encodedMsg,
+        listStart,
+        listEnd,
+        (listFieldNumber, msgStart, msgEnd) => {
+          if (listFieldNumber === FORWARD_MSG_LIST_MESSAGES_FIELD) {
+            encodedMsgs.push(encodedMsg.subarray(msgStart, msgEnd))
+          }
+        }
+      )
+    }
+  )
+  return encodedMsgs
+}
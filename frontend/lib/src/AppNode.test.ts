@@ -292,6 +292,21 @@ describe("ElementNode.arrowAddRows", () => {
       expect(q.getCell(2, 1).content).toEqual("foo")
     })
 
+    test("addRows keeps the last maxRows rows", () => {
+      const node = arrowDataFrame()
+      const newNode = node.arrowAddRows(
+        { ...MOCK_UNNAMED_DATASET, maxRows: 3 } as ArrowNamedDataSet,
+        NO_SCRIPT_RUN_ID
+      )
+      const q = newNode.quiverElement
+
+      expect(q.dimensions.numDataRows).toEqual(3)
+      expect(q.getCell(0, 0).content).toEqual("i2")
+      expect(q.getCell(1, 0).content).toEqual("i1")
+      expect(q.getCell(0, 1).content).toEqual("bar")
+      expect(q.getCell(1, 1).content).toEqual("foo")
+    })
+
     test("addRows throws an error when called with a named dataset", () => {
       const node = arrowDataFrame()
       expect(() =>
@@ -389,6 +404,33 @@ describe("ElementNode.arrowAddRows", () => {
         expect(quiverData?.getCell(0, 1).content).toEqual("foo")
       })
 
+      test("maxRows is set -> keep the last maxRows rows of data", () => {
+        const node = arrowVegaLiteChart(getVegaLiteChart(undefined, UNICODE))
+        const newNode = node.arrowAddRows(
+          { ...MOCK_UNNAMED_DATASET, maxRows: 3 } as ArrowNamedDataSet,
+          NO_SCRIPT_RUN_ID
+        )
+        const element = newNode.vegaLiteChartElement
+
+        const quiverData = element.data
+        expect(quiverData?.dimensions.numDataRows).toEqual(3)
+        expect(quiverData?.getCell(0, 0).content).toEqual("i2")
+        expect(quiverData?.getCell(1, 0).content).toEqual("i1")
+      })
+
+      test("maxRows is set -> keep the last maxRows rows of the dataset", () => {
+        const node = arrowVegaLiteChart(getVegaLiteChart([MOCK_NAMED_DATASET]))
+        const newNode = node.arrowAddRows(
+          { ...MOCK_UNNAMED_DATASET, maxRows: 1 } as ArrowNamedDataSet,
+          NO_SCRIPT_RUN_ID
+        )
+        const element = newNode.vegaLiteChartElement
+
+        const quiverData = element.datasets[0].data
+        expect(quiverData.dimensions.numDataRows).toEqual(1)
+        expect(quiverData.getCell(0, 0).content).toEqual("i2")
+      })
+
       test("element doesn't have any datasets or data -> use new rows as data", () => {
         const node = arrowVegaLiteChart(getVegaLiteChart())
         const newNode = node.arrowAddRows(MOCK_NAMED_DATASET, NO_SCRIPT_RUN_ID)
@@ -440,6 +482,33 @@ describe("ElementNode.arrowAddRows", () => {
         expect(quiverData?.getCell(2, 1).content).toEqual("foo")
       })
 
+      test("maxRows is set -> keep the last maxRows rows of data", () => {
+        const node = arrowVegaLiteChart(getVegaLiteChart(undefined, UNICODE))
+        const newNode = node.arrowAddRows(
+          { ...MOCK_UNNAMED_DATASET, maxRows: 3 } as ArrowNamedDataSet,
+          NO_SCRIPT_RUN_ID
+        )
+        const element = newNode.vegaLiteChartElement
+
+        const quiverData = element.data
+        expect(quiverData?.dimensions.numDataRows).toEqual(3)
+        expect(quiverData?.getCell(0, 0).content).toEqual("i2")
+        expect(quiverData?.getCell(1, 0).content).toEqual("i1")
+      })
+
+      test("maxRows is set -> keep the last maxRows rows of the dataset", () => {
+        const node = arrowVegaLiteChart(getVegaLiteChart([MOCK_NAMED_DATASET]))
+        const newNode = node.arrowAddRows(
+          { ...MOCK_UNNAMED_DATASET, maxRows: 1 } as ArrowNamedDataSet,
+          NO_SCRIPT_RUN_ID
+        )
+        const element = newNode.vegaLiteChartElement
+
+        const quiverData = element.datasets[0].data
+        expect(quiverData.dimensions.numDataRows).toEqual(1)
+        expect(quiverData.getCell(0, 0).content).toEqual("i2")
+      })
+
       test("element doesn't have any datasets or data -> use new rows as data", () => {
         const node = arrowVegaLiteChart(getVegaLiteChart())
         const newNode = node.arrowAddRows(
@@ -346,7 +346,10 @@ export class ElementNode implements AppNode {
     }
 
     const newQuiver = new Quiver(namedDataSet.data as IArrow)
-    return element.addRows(newQuiver)
+    const newElement = element.addRows(newQuiver)
+    return namedDataSet.maxRows
+      ? newElement.keepLastRows(namedDataSet.maxRows)
+      : newElement
   }
 
   private static vegaLiteChartAddRowsHelper(
@@ -355,15 +358,18 @@ export class ElementNode implements AppNode {
   ): VegaLiteChartElement {
     const newDataSetName = namedDataSet.hasName ? namedDataSet.name : null
     const newDataSetQuiver = new Quiver(namedDataSet.data as IArrow)
+    const { maxRows } = namedDataSet
 
     return produce(element, (draft: VegaLiteChartElement) => {
       const existingDataSet = getNamedDataSet(draft.datasets, newDataSetName)
       if (existingDataSet) {
-        existingDataSet.data = existingDataSet.data.addRows(newDataSetQuiver)
+        const data = existingDataSet.data.addRows(newDataSetQuiver)
+        existingDataSet.data = maxRows ? data.keepLastRows(maxRows) : data
       } else {
-        draft.data = draft.data
+        const data = draft.data
           ? draft.data.addRows(newDataSetQuiver)
           : newDataSetQuiver
+        draft.data = maxRows ? data.keepLastRows(maxRows) : data
       }
     })
   }
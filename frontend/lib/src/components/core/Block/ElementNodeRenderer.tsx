@@ -443,6 +443,7 @@ const RawElementNodeRenderer = (
           key={arrowProto.id || undefined}
           element={arrowProto}
           data={node.quiverElement as Quiver}
+          endpoints={props.endpoints}
           {...widgetProps}
         />
       )
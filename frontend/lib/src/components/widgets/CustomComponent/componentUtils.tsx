@@ -23,7 +23,8 @@ import {
   SpecialArg as SpecialArgProto,
 } from "@streamlit/protobuf"
 
-import { isNullOrUndefined } from "~lib/util/utils"
+import { decompressArrowIpcBytes } from "~lib/dataframes/arrowCompression"
+import { isNullOrUndefined, notNullOrUndefined } from "~lib/util/utils"
 import { EmotionTheme, toExportedTheme } from "~lib/theme"
 import { Source, WidgetStateManager } from "~lib/WidgetStateManager"
 
@@ -66,6 +67,9 @@ export interface IframeMessageHandlerProps {
 export interface Args {
   [name: string]: any
 }
+// The fields of the ArrowTable proto that contain Arrow IPC bytes.
+const ARROW_TABLE_BYTES_FIELDS = ["data", "index", "columns"]
+
 export interface DataframeArg {
   key: string
   value: any
@@ -209,14 +213,21 @@ export function parseArgs(
   for (const specialArg of specialArgs as SpecialArgProto[]) {
     const { key } = specialArg
     switch (specialArg.value?.toLowerCase()) {
-      case "arrowdataframe":
-        dataframeArgs.push({
-          key,
-          value: ArrowDataframe.toObject(
-            specialArg.arrowDataframe as ArrowDataframe
-          ),
+      case "arrowdataframe": {
+        const value = ArrowDataframe.toObject(
+          specialArg.arrowDataframe as ArrowDataframe
+        )
+        // The iframe reads the Arrow bytes with its own version of
+        // apache-arrow, which can't read compressed buffers.
+        ARROW_TABLE_BYTES_FIELDS.forEach(field => {
+          const bytes = value.data?.[field]
+          if (notNullOrUndefined(bytes)) {
+            value.data[field] = decompressArrowIpcBytes(bytes)
+          }
         })
+        dataframeArgs.push({ key, value })
         break
+      }
 
       case "bytes":
         newArgs[key] = specialArg.bytes
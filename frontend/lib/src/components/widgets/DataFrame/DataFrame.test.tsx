@@ -22,6 +22,7 @@ import * as glideDataGridModule from "@glideapps/glide-data-grid"
 import { Arrow as ArrowProto } from "@streamlit/protobuf"
 
 import { TEN_BY_TEN } from "~lib/mocks/arrow"
+import { mockEndpoints } from "~lib/mocks/mocks"
 import { render } from "~lib/test_util"
 import { Quiver } from "~lib/dataframes/Quiver"
 import * as UseResizeObserver from "~lib/hooks/useResizeObserver"
@@ -99,6 +100,29 @@ describe("DataFrame widget", () => {
     expect(toolbarButtons).toHaveLength(3)
   })
 
+  it("shows the rows of paged dataframes and hides search and download", () => {
+    const pagedProps = getProps(new Quiver({ data: TEN_BY_TEN }))
+    pagedProps.element.pagedData = ArrowProto.PagedData.create({
+      url: "/_stcore/dataframe/mockId",
+      numRows: 1000000,
+      pageRows: 10,
+    })
+    pagedProps.endpoints = mockEndpoints({
+      fetchDataframePage: vi.fn().mockResolvedValue(TEN_BY_TEN),
+    })
+
+    render(<DataFrame {...pagedProps} />)
+
+    expect(glideDataGridModule.DataEditor).toHaveBeenCalledWith(
+      expect.objectContaining({
+        rows: 1000000,
+      }),
+      {}
+    )
+    expect(screen.queryByLabelText("Search")).not.toBeInTheDocument()
+    expect(screen.queryByLabelText("Download as CSV")).not.toBeInTheDocument()
+  })
+
   it("Touch detection correctly deactivates some features", () => {
     // Set window.matchMedia to simulate a touch device
     window.matchMedia = vi.fn().mockImplementation(() => ({
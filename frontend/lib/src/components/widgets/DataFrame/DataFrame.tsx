@@ -44,7 +44,8 @@ import { useFormClearHelper } from "~lib/components/widgets/Form"
 import { withFullScreenWrapper } from "~lib/components/shared/FullScreenWrapper"
 import { Quiver } from "~lib/dataframes/Quiver"
 import { WidgetInfo, WidgetStateManager } from "~lib/WidgetStateManager"
-import { isNullOrUndefined } from "~lib/util/utils"
+import { isNullOrUndefined, notNullOrUndefined } from "~lib/util/utils"
+import { StreamlitEndpoints } from "~lib/StreamlitEndpoints"
 import Toolbar, { ToolbarAction } from "~lib/components/shared/Toolbar"
 import { LibContext } from "~lib/components/core/LibContext"
 import { ElementFullscreenContext } from "~lib/components/shared/ElementFullscreen/ElementFullscreenContext"
@@ -68,6 +69,7 @@ import {
   useDataEditor,
   useDataExporter,
   useDataLoader,
+  usePagedDataLoader,
   useRowHover,
   useSelectionHandler,
   useTableSizer,
@@ -110,6 +112,7 @@ export interface DataFrameProps {
   disableFullscreenMode?: boolean
   fragmentId?: string
   height?: number
+  endpoints?: StreamlitEndpoints
 }
 
 /**
@@ -119,6 +122,7 @@ export interface DataFrameProps {
  * @param data - The Arrow data to render (extracted from the proto message)
  * @param disabled - Whether the widget is disabled
  * @param widgetMgr - The widget manager
+ * @param endpoints - The endpoints used to load the rows of paged dataframes
  */
 function DataFrame({
   element,
@@ -127,6 +131,7 @@ function DataFrame({
   widgetMgr,
   disableFullscreenMode,
   fragmentId,
+  endpoints,
 }: Readonly<DataFrameProps>): ReactElement {
   const {
     expanded: isFullScreen,
@@ -190,9 +195,20 @@ function DataFrame({
 
   const { READ_ONLY, DYNAMIC } = ArrowProto.EditingMode
 
+  // Paged dataframes are kept on the server, and `data` only contains
+  // their first page. The other rows are loaded when they are shown.
+  const isPagedTable =
+    notNullOrUndefined(element.pagedData) &&
+    notNullOrUndefined(endpoints?.fetchDataframePage)
+
   // Number of rows of the table minus 1 for the header row:
   const dataDimensions = data.dimensions
-  const originalNumRows = Math.max(0, dataDimensions.numDataRows)
+  const originalNumRows = Math.max(
+    0,
+    isPagedTable
+      ? (element.pagedData?.numRows ?? 0)
+      : dataDimensions.numDataRows
+  )
 
   // For empty tables, we show an extra row that
   // contains "empty" as a way to indicate that the table is empty.
@@ -202,10 +218,16 @@ function DataFrame({
     // data columns defined.
     !(element.editingMode === DYNAMIC && dataDimensions.numDataColumns > 0)
 
-  // For large tables, we apply some optimizations to handle large data
-  const isLargeTable = originalNumRows > LARGE_TABLE_ROWS_THRESHOLD
+  // For large tables, we apply some optimizations to handle large data.
+  // Paged tables are sorted by the server, so they can always be sorted.
+  // But they can't be searched or downloaded, since only some of their
+  // rows are loaded.
+  const isLargeTable =
+    isPagedTable || originalNumRows > LARGE_TABLE_ROWS_THRESHOLD
   const isSortingEnabled =
-    !isLargeTable && !isEmptyTable && element.editingMode !== DYNAMIC
+    (isPagedTable || !isLargeTable) &&
+    !isEmptyTable &&
+    element.editingMode !== DYNAMIC
 
   const isDynamicAndEditable =
     !isEmptyTable && element.editingMode === DYNAMIC && !disabled
@@ -283,15 +305,56 @@ function DataFrame({
     []
   )
 
-  const { getCellContent: getOriginalCellContent } = useDataLoader(
+  const { getCellContent: getLoadedCellContent } = useDataLoader(
     data,
     originalColumns,
     numRows,
     editingState
   )
 
-  const { columns, sortColumn, getOriginalIndex, getCellContent } =
-    useColumnSort(originalNumRows, originalColumns, getOriginalCellContent)
+  // The sort order of paged tables is applied by the server when rows are
+  // loaded. The column sort hook needs the cell getter of the data loader,
+  // so the sort order is passed back to the loader via this state.
+  const [pagedDataSort, setPagedDataSort] = React.useState<{
+    column: string
+    ascending: boolean
+  }>()
+
+  const { getCellContent: getPagedCellContent } = usePagedDataLoader(
+    element.pagedData,
+    data,
+    originalColumns,
+    pagedDataSort,
+    endpoints
+  )
+
+  const getOriginalCellContent = isPagedTable
+    ? getPagedCellContent
+    : getLoadedCellContent
+
+  const { columns, sortColumn, getOriginalIndex, getCellContent, sortedColumn } =
+    useColumnSort(
+      originalNumRows,
+      originalColumns,
+      getOriginalCellContent,
+      isPagedTable
+    )
+
+  React.useEffect(() => {
+    if (!isPagedTable) {
+      return
+    }
+    setPagedDataSort(
+      sortedColumn
+        ? {
+            column:
+              data.columnTypes[sortedColumn.column.indexNumber].arrowField
+                .name,
+            ascending: sortedColumn.ascending,
+          }
+        : undefined
+    )
+  }, [isPagedTable, sortedColumn, data])
 
   /**
    * Synchronizes the selection state with the state of the widget state of the component.
@@ -809,7 +872,7 @@ function DataFrame({
             onClick={() => exportToCsv()}
           />
         )}
-        {!isEmptyTable && (
+        {!isEmptyTable && !isPagedTable && (
           <ToolbarAction
             label="Search"
             icon={Search}
@@ -911,7 +974,11 @@ function DataFrame({
           // Search needs to be activated manually, to support search
           // via the toolbar:
           onKeyDown={event => {
-            if ((event.ctrlKey || event.metaKey) && event.key === "f") {
+            if (
+              (event.ctrlKey || event.metaKey) &&
+              event.key === "f" &&
+              !isPagedTable
+            ) {
               setShowSearch(cv => !cv)
               event.stopPropagation()
               event.preventDefault()
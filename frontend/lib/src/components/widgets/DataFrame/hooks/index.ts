@@ -27,6 +27,7 @@ export { default as useCustomTheme } from "./useCustomTheme"
 export { default as useDataEditor } from "./useDataEditor"
 export { default as useDataExporter } from "./useDataExporter"
 export { default as useDataLoader } from "./useDataLoader"
+export { default as usePagedDataLoader } from "./usePagedDataLoader"
 export { default as useRowHover } from "./useRowHover"
 export { default as useSelectionHandler } from "./useSelectionHandler"
 export { default as useTableSizer } from "./useTableSizer"
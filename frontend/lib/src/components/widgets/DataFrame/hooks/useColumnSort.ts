@@ -76,6 +76,8 @@ export type ColumnSortReturn = {
     autoReset?: boolean
   ) => void
   getOriginalIndex: (index: number) => number
+  // The column that the table is sorted by, if any:
+  sortedColumn?: { column: BaseColumn; ascending: boolean }
 } & Pick<DataEditorProps, "getCellContent">
 
 /**
@@ -84,17 +86,21 @@ export type ColumnSortReturn = {
  * @param numRows - The number of rows in the table.
  * @param columns - The columns of the table.
  * @param getCellContent - A function that returns the content of the cell at the given column and row indices.
+ * @param isServerSideSort - If true, the rows are sorted by the server, and only the sort state
+ * is tracked here. This is used for paged dataframes, which only have some rows loaded.
  *
  * @returns An object containing the following properties:
  * - `columns`: The updated list of columns.
  * - `sortColumn`: A function that sorts the column at the given index.
  * - `getOriginalIndex`: A function that returns the original index of the row at the given index.
  * - `getCellContent`: An updated function that returns the content of the cell at the given column and row indices.
+ * - `sortedColumn`: The column that the table is sorted by and the sort direction, if any.
  */
 function useColumnSort(
   numRows: number,
   columns: BaseColumn[],
-  getCellContent: ([col, row]: readonly [number, number]) => GridCell
+  getCellContent: ([col, row]: readonly [number, number]) => GridCell,
+  isServerSideSort = false
 ): ColumnSortReturn {
   const [sort, setSort] = React.useState<ColumnSortConfig>()
 
@@ -103,9 +109,18 @@ function useColumnSort(
       columns: columns.map(column => toGlideColumn(column)),
       getCellContent,
       rows: numRows,
-      sort,
+      // Without a sort config, the cells are returned in the original order:
+      sort: isServerSideSort ? undefined : sort,
     })
 
+  const sortedColumn = React.useMemo(() => {
+    const column = columns.find(c => c.id === sort?.column.id)
+    if (sort === undefined || column === undefined) {
+      return undefined
+    }
+    return { column, ascending: sort.direction !== "desc" }
+  }, [columns, sort])
+
   const updatedColumns = React.useMemo(() => {
     return updateSortingHeader(columns, sort)
   }, [columns, sort])
@@ -160,6 +175,7 @@ function useColumnSort(
     sortColumn,
     getOriginalIndex,
     getCellContent: getCellContentSorted,
+    sortedColumn,
   }
 }
 
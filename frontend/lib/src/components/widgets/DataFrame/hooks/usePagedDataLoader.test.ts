@@ -0,0 +1,213 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { GridCellKind } from "@glideapps/glide-data-grid"
+import { renderHook } from "@testing-library/react-hooks"
+import { Field, Utf8 } from "apache-arrow"
+
+import { Arrow as ArrowProto } from "@streamlit/protobuf"
+
+import {
+  BaseColumn,
+  isErrorCell,
+  TextColumn,
+} from "~lib/components/widgets/DataFrame/columns"
+import { DataFrameCellType } from "~lib/dataframes/arrowTypeUtils"
+import { Quiver } from "~lib/dataframes/Quiver"
+import { UNICODE } from "~lib/mocks/arrow"
+import { mockEndpoints } from "~lib/mocks/mocks"
+
+import usePagedDataLoader from "./usePagedDataLoader"
+
+// These columns are based on the UNICODE mock arrow table:
+const MOCK_COLUMNS: BaseColumn[] = [
+  TextColumn({
+    arrowType: {
+      type: DataFrameCellType.DATA,
+      arrowField: new Field("index-0", new Utf8(), true),
+      pandasType: {
+        field_name: "index-0",
+        name: "index-0",
+        pandas_type: "unicode",
+        numpy_type: "unicode",
+        metadata: null,
+      },
+    },
+    id: "index-0",
+    name: "",
+    indexNumber: 0,
+    isEditable: false,
+    isHidden: false,
+    isIndex: true,
+    isPinned: true,
+    isStretched: false,
+    title: "",
+  }),
+  TextColumn({
+    arrowType: {
+      type: DataFrameCellType.DATA,
+      arrowField: new Field("column-c1-0", new Utf8(), true),
+      pandasType: {
+        field_name: "column-c1-0",
+        name: "column-c1-0",
+        pandas_type: "unicode",
+        numpy_type: "object",
+        metadata: null,
+      },
+    },
+    id: "column-c1-0",
+    name: "c1",
+    indexNumber: 1,
+    isEditable: false,
+    isHidden: false,
+    isIndex: false,
+    isPinned: false,
+    isStretched: false,
+    title: "c1",
+  }),
+]
+
+// The UNICODE mock arrow table has two rows, which is used as page size:
+const PAGED_DATA = ArrowProto.PagedData.create({
+  url: "/_stcore/dataframe/mockId",
+  numRows: 6,
+  pageRows: 2,
+})
+
+describe("usePagedDataLoader hook", () => {
+  it("returns cells of the first page without loading it", () => {
+    const firstPage = new Quiver({ data: UNICODE })
+    const endpoints = mockEndpoints({ fetchDataframePage: vi.fn() })
+
+    const { result } = renderHook(() =>
+      usePagedDataLoader(
+        PAGED_DATA,
+        firstPage,
+        MOCK_COLUMNS,
+        undefined,
+        endpoints
+      )
+    )
+
+    expect(
+      MOCK_COLUMNS[0].getCellValue(result.current.getCellContent([0, 1]))
+    ).toBe("i2")
+    expect(
+      MOCK_COLUMNS[1].getCellValue(result.current.getCellContent([1, 0]))
+    ).toBe("foo")
+    expect(endpoints.fetchDataframePage).not.toHaveBeenCalled()
+
+    // if column out of bounds. return error cell
+    expect(isErrorCell(result.current.getCellContent([2, 0]))).toBe(true)
+  })
+
+  it("loads other pages when their cells are requested", async () => {
+    const firstPage = new Quiver({ data: UNICODE })
+    const endpoints = mockEndpoints({
+      fetchDataframePage: vi.fn().mockResolvedValue(UNICODE),
+    })
+
+    const { result, waitForNextUpdate } = renderHook(() =>
+      usePagedDataLoader(
+        PAGED_DATA,
+        firstPage,
+        MOCK_COLUMNS,
+        undefined,
+        endpoints
+      )
+    )
+
+    expect(result.current.getCellContent([1, 4]).kind).toBe(
+      GridCellKind.Loading
+    )
+    // The page is only requested once:
+    expect(result.current.getCellContent([0, 5]).kind).toBe(
+      GridCellKind.Loading
+    )
+    expect(endpoints.fetchDataframePage).toHaveBeenCalledTimes(1)
+    expect(endpoints.fetchDataframePage).toHaveBeenCalledWith(
+      "/_stcore/dataframe/mockId",
+      4,
+      2,
+      undefined
+    )
+
+    await waitForNextUpdate()
+
+    expect(
+      MOCK_COLUMNS[1].getCellValue(result.current.getCellContent([1, 4]))
+    ).toBe("foo")
+    expect(
+      MOCK_COLUMNS[0].getCellValue(result.current.getCellContent([0, 5]))
+    ).toBe("i2")
+  })
+
+  it("loads all pages in the requested sort order", async () => {
+    const firstPage = new Quiver({ data: UNICODE })
+    const endpoints = mockEndpoints({
+      fetchDataframePage: vi.fn().mockResolvedValue(UNICODE),
+    })
+    const sort = { column: "c1", ascending: false }
+
+    const { result, waitForNextUpdate } = renderHook(() =>
+      usePagedDataLoader(PAGED_DATA, firstPage, MOCK_COLUMNS, sort, endpoints)
+    )
+
+    // The first page sent with the element is in the original order:
+    expect(result.current.getCellContent([1, 0]).kind).toBe(
+      GridCellKind.Loading
+    )
+    expect(endpoints.fetchDataframePage).toHaveBeenCalledWith(
+      "/_stcore/dataframe/mockId",
+      0,
+      2,
+      sort
+    )
+
+    await waitForNextUpdate()
+
+    expect(
+      MOCK_COLUMNS[1].getCellValue(result.current.getCellContent([1, 0]))
+    ).toBe("foo")
+  })
+
+  it("returns error cells for pages that failed to load", async () => {
+    const firstPage = new Quiver({ data: UNICODE })
+    const endpoints = mockEndpoints({
+      fetchDataframePage: vi
+        .fn()
+        .mockRejectedValue(new Error("Request failed with status code 404")),
+    })
+
+    const { result, waitForNextUpdate } = renderHook(() =>
+      usePagedDataLoader(
+        PAGED_DATA,
+        firstPage,
+        MOCK_COLUMNS,
+        undefined,
+        endpoints
+      )
+    )
+
+    expect(result.current.getCellContent([1, 2]).kind).toBe(
+      GridCellKind.Loading
+    )
+
+    await waitForNextUpdate()
+
+    expect(isErrorCell(result.current.getCellContent([1, 2]))).toBe(true)
+  })
+})
@@ -0,0 +1,172 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import React from "react"
+
+import {
+  DataEditorProps,
+  GridCell,
+  GridCellKind,
+} from "@glideapps/glide-data-grid"
+import { getLogger } from "loglevel"
+
+import { Arrow as ArrowProto } from "@streamlit/protobuf"
+
+import { getCellFromArrow } from "~lib/components/widgets/DataFrame/arrowUtils"
+import {
+  BaseColumn,
+  getErrorCell,
+} from "~lib/components/widgets/DataFrame/columns"
+import { Quiver } from "~lib/dataframes/Quiver"
+import { StreamlitEndpoints } from "~lib/StreamlitEndpoints"
+import { isNullOrUndefined, notNullOrUndefined } from "~lib/util/utils"
+
+const LOG = getLogger("usePagedDataLoader")
+
+/** The sort order that rows of a paged dataframe are requested in. */
+export type PagedDataSort = {
+  // The name of the Arrow field to sort by.
+  column: string
+  ascending: boolean
+}
+
+type PagedDataLoaderReturn = Pick<DataEditorProps, "getCellContent">
+
+/**
+ * Custom hook that loads the rows of a dataframe that is kept on the server
+ * (see `Arrow.PagedData`). Pages are requested when their rows are first
+ * rendered, so only the rows in the viewport are ever loaded. The sorting is
+ * applied by the server.
+ *
+ * @param pagedData - The paged data info from the proto message
+ * @param firstPage - The Arrow data of the first page, sent with the proto message
+ * @param columns - The columns of the table
+ * @param sort - The sort order to request rows in, or undefined for the original order
+ * @param endpoints - The endpoints used to request pages
+ *
+ * @returns the cell content getter compatible with glide-data-grid.
+ */
+function usePagedDataLoader(
+  pagedData: ArrowProto.IPagedData | null | undefined,
+  firstPage: Quiver,
+  columns: BaseColumn[],
+  sort: PagedDataSort | undefined,
+  endpoints: StreamlitEndpoints | undefined
+): PagedDataLoaderReturn {
+  const url = pagedData?.url ?? ""
+  const pageRows = Math.max(1, pagedData?.pageRows ?? 1)
+  const sortColumn = sort?.column
+  const sortAscending = sort?.ascending
+
+  // The pages of the current dataframe and sort order, by page index. Pages
+  // that failed to load are null. The first page sent with the proto message
+  // is in the original order.
+  const pageCache = React.useMemo(() => {
+    const pages = new Map<number, Quiver | null>()
+    if (isNullOrUndefined(sortColumn)) {
+      pages.set(0, firstPage)
+    }
+    return { pages, requestedPages: new Set<number>() }
+    // A new cache is needed for every dataframe and sort order:
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [url, sortColumn, sortAscending, firstPage])
+
+  // Changes whenever a page is loaded, to re-render the loaded cells.
+  const [loadedPagesVersion, setLoadedPagesVersion] = React.useState(0)
+
+  const requestPage = React.useCallback(
+    (pageIndex: number): void => {
+      if (
+        pageCache.requestedPages.has(pageIndex) ||
+        !endpoints?.fetchDataframePage
+      ) {
+        return
+      }
+      pageCache.requestedPages.add(pageIndex)
+
+      const pageSort = notNullOrUndefined(sortColumn)
+        ? { column: sortColumn, ascending: sortAscending ?? true }
+        : undefined
+      endpoints
+        .fetchDataframePage(url, pageIndex * pageRows, pageRows, pageSort)
+        .then(bytes => new Quiver({ data: bytes }))
+        .catch(error => {
+          LOG.error(`Failed to load rows of dataframe ${url}: ${error}`)
+          return null
+        })
+        .then(page => {
+          // If the sort order has changed in the meantime, this sets the
+          // page in a cache that isn't used anymore.
+          pageCache.pages.set(pageIndex, page)
+          setLoadedPagesVersion(version => version + 1)
+        })
+    },
+    [endpoints, url, pageRows, sortColumn, sortAscending, pageCache]
+  )
+
+  const getCellContent = React.useCallback(
+    ([col, row]: readonly [number, number]): GridCell => {
+      if (col > columns.length - 1) {
+        return getErrorCell(
+          "Column index out of bounds",
+          "This error should never happen. Please report this bug."
+        )
+      }
+
+      const pageIndex = Math.floor(row / pageRows)
+      if (!pageCache.pages.has(pageIndex)) {
+        requestPage(pageIndex)
+        return {
+          kind: GridCellKind.Loading,
+          allowOverlay: false,
+        }
+      }
+
+      const page = pageCache.pages.get(pageIndex)
+      if (isNullOrUndefined(page)) {
+        return getErrorCell(
+          "Failed to load rows",
+          "The rows of this dataframe could not be loaded from the server. " +
+            "Rerun the app to reload them."
+        )
+      }
+
+      const column = columns[col]
+      try {
+        const arrowCell = page.getCell(
+          row - pageIndex * pageRows,
+          column.indexNumber
+        )
+        return getCellFromArrow(column, arrowCell, undefined)
+      } catch (error) {
+        return getErrorCell(
+          "Error during cell creation",
+          `This error should never happen. Please report this bug. \nError: ${error}`
+        )
+      }
+    },
+    // loadedPagesVersion is used to create a new getter whenever a page is
+    // loaded, so that the grid re-renders the cells:
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [columns, pageRows, pageCache, requestPage, loadedPagesVersion]
+  )
+
+  return {
+    getCellContent,
+  }
+}
+
+export default usePagedDataLoader
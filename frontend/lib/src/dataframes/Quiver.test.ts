@@ -936,6 +936,57 @@ describe("Quiver", () => {
     })
   })
 
+  describe("Keep last rows", () => {
+    test("range index", () => {
+      const q = new Quiver({ data: RANGE })
+      const qq = q.addRows(q).keepLastRows(3)
+
+      expect(qq.dimensions.numDataRows).toEqual(3)
+
+      // Check index cells
+      expect(qq.getCell(0, 0).content).toEqual(1)
+      expect(qq.getCell(1, 0).content).toEqual(2)
+      expect(qq.getCell(2, 0).content).toEqual(3)
+
+      // Check data cells
+      expect(qq.getCell(0, 1).content).toEqual("bar")
+      expect(qq.getCell(1, 1).content).toEqual("foo")
+      expect(qq.getCell(2, 1).content).toEqual("bar")
+    })
+
+    test("unicode index", () => {
+      const q = new Quiver({ data: UNICODE })
+      const qq = q.addRows(q).keepLastRows(3)
+
+      expect(qq.dimensions.numDataRows).toEqual(3)
+
+      // Check index cells
+      expect(qq.getCell(0, 0).content).toEqual("i2")
+      expect(qq.getCell(1, 0).content).toEqual("i1")
+      expect(qq.getCell(2, 0).content).toEqual("i2")
+
+      // Check data cells
+      expect(qq.getCell(0, 1).content).toEqual("bar")
+      expect(qq.getCell(1, 1).content).toEqual("foo")
+      expect(qq.getCell(2, 1).content).toEqual("bar")
+    })
+
+    it("returns the same table if it doesn't have more rows", () => {
+      const q = new Quiver({ data: UNICODE })
+
+      expect(q.keepLastRows(2)).toBe(q)
+    })
+
+    it("adds rows to a table whose first rows were dropped", () => {
+      const q = new Quiver({ data: RANGE })
+      const qq = q.addRows(q).keepLastRows(3).addRows(q)
+
+      expect(qq.dimensions.numDataRows).toEqual(5)
+      expect(qq.getCell(3, 0).content).toEqual(4)
+      expect(qq.getCell(4, 0).content).toEqual(5)
+    })
+  })
+
   describe("Add rows", () => {
     describe("Pandas index types", () => {
       test("categorical", () => {
@@ -1700,6 +1751,13 @@ describe("Quiver", () => {
         expect(q).toEqual(qClone)
       })
 
+      it("changes the hash even if the number of rows stays the same", () => {
+        const q = new Quiver({ data: UNICODE })
+        const qq = q.addRows(q)
+
+        expect(qq.keepLastRows(2).hash).not.toEqual(q.hash)
+      })
+
       test("multi-index", () => {
         const mockElement = { data: MULTI }
         const q = new Quiver(mockElement)
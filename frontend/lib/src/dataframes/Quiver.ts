@@ -339,6 +339,29 @@ st.add_rows(my_styler.data)
       draft._data = newData
       draft._pandasIndexColumnTypes = newIndexTypes
       draft._dataColumnTypes = newDataTypes
+      // The bytes are part of the hash, which needs to change even if the
+      // number of rows stays the same because old rows are dropped.
+      draft._num_bytes = this._num_bytes + other._num_bytes
+    })
+  }
+
+  /**
+   * Return a table with only the last `maxRows` rows of this table (data +
+   * indexes), or this table if it doesn't have more rows.
+   */
+  public keepLastRows(maxRows: number): Quiver {
+    const { numDataRows } = this.dimensions
+    if (numDataRows <= maxRows) {
+      return this
+    }
+
+    const start = numDataRows - maxRows
+    const newIndex = this._pandasIndexData.map(index => index.slice(start))
+    const newData = this._data.slice(start)
+
+    return produce(this, (draft: Quiver) => {
+      draft._pandasIndexData = newIndex
+      draft._data = newData
     })
   }
 }
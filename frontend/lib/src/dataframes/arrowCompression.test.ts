@@ -0,0 +1,79 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { tableFromIPC } from "apache-arrow"
+
+import {
+  decompressArrowIpcBytes,
+  decompressLz4Frame,
+} from "~lib/dataframes/arrowCompression"
+import { Quiver } from "~lib/dataframes/Quiver"
+import { LZ4_COMPRESSED, UNICODE } from "~lib/mocks/arrow"
+
+describe("decompressArrowIpcBytes", () => {
+  it("decompresses LZ4 compressed buffers", () => {
+    const table = tableFromIPC(decompressArrowIpcBytes(LZ4_COMPRESSED))
+
+    expect(table.numRows).toEqual(3)
+    expect(table.getChild("ints")?.toArray()).toEqual(
+      new BigInt64Array([1n, 2n, 3n])
+    )
+    expect(table.getChild("strings")?.toJSON()).toEqual(["foo", "bar", null])
+    expect(table.getChild("categories")?.toJSON()).toEqual(["a", "b", "a"])
+  })
+
+  it("returns uncompressed bytes as they are", () => {
+    expect(decompressArrowIpcBytes(UNICODE)).toBe(UNICODE)
+  })
+
+  it("is used to parse the data of Quiver", () => {
+    const q = new Quiver({ data: LZ4_COMPRESSED })
+
+    expect(q.dimensions.numDataRows).toEqual(3)
+    expect(q.getCell(1, 2).content).toEqual("bar")
+  })
+})
+
+describe("decompressLz4Frame", () => {
+  it("decompresses compressed blocks", () => {
+    // pa.Codec("lz4").compress(b"abc" * 100 + b"xyz")
+    const frame = new Uint8Array([
+      4, 34, 77, 24, 96, 64, 130, 14, 0, 0, 0, 63, 97, 98, 99, 3, 0, 255, 21,
+      80, 98, 99, 120, 121, 122, 0, 0, 0, 0,
+    ])
+
+    const expected = new TextEncoder().encode(`${"abc".repeat(100)}xyz`)
+    expect(decompressLz4Frame(frame, expected.length)).toEqual(expected)
+  })
+
+  it("decompresses uncompressed blocks", () => {
+    // pa.Codec("lz4").compress(bytes([7, 200, 13, 99, 1, 250, 42, 17]))
+    const frame = new Uint8Array([
+      4, 34, 77, 24, 96, 64, 130, 8, 0, 0, 128, 7, 200, 13, 99, 1, 250, 42, 17,
+      0, 0, 0, 0,
+    ])
+
+    expect(decompressLz4Frame(frame, 8)).toEqual(
+      new Uint8Array([7, 200, 13, 99, 1, 250, 42, 17])
+    )
+  })
+
+  it("throws an error for invalid frames", () => {
+    expect(() => decompressLz4Frame(new Uint8Array(8), 8)).toThrow(
+      "Invalid LZ4 frame"
+    )
+  })
+})
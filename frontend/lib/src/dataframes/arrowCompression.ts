@@ -0,0 +1,464 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+/**
+ * Decompression of Arrow IPC streams with compressed record batch buffers,
+ * which the server sends if the server.arrowCompression config option is set.
+ *
+ * apache-arrow can't read compressed buffers, so the compressed messages of
+ * a stream are rewritten into uncompressed messages before it reads them.
+ * See https://arrow.apache.org/docs/format/Columnar.html#compression
+ */
+
+// Every message of an IPC stream starts with this marker, followed by the
+// length of the message's metadata.
+const CONTINUATION_MARKER = -1
+
+// Values of the MessageHeader union in Message.fbs.
+const MESSAGE_HEADER_DICTIONARY_BATCH = 2
+const MESSAGE_HEADER_RECORD_BATCH = 3
+
+// Indices of the fields of the flatbuffer tables in Message.fbs.
+const MESSAGE_HEADER_TYPE_FIELD = 1
+const MESSAGE_HEADER_FIELD = 2
+const MESSAGE_BODY_LENGTH_FIELD = 3
+const DICTIONARY_BATCH_DATA_FIELD = 1
+const RECORD_BATCH_BUFFERS_FIELD = 2
+const RECORD_BATCH_COMPRESSION_FIELD = 3
+const BODY_COMPRESSION_CODEC_FIELD = 0
+
+// Value of the CompressionType enum in Message.fbs.
+const COMPRESSION_TYPE_LZ4_FRAME = 0
+
+// The uncompressed length of buffers that are stored uncompressed.
+const UNCOMPRESSED_BUFFER_LENGTH = -1
+
+// The size in bytes of the Buffer struct in Schema.fbs.
+const BUFFER_STRUCT_SIZE = 16
+
+const LZ4_FRAME_MAGIC_NUMBER = 0x184d2204
+
+/** Round up to a multiple of 8 bytes, the alignment of Arrow buffers. */
+function padTo8Bytes(length: number): number {
+  return Math.ceil(length / 8) * 8
+}
+
+function getDataView(bytes: Uint8Array): DataView {
+  return new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength)
+}
+
+/** Return the position of the vtable of a flatbuffer table. */
+function getVtablePosition(view: DataView, table: number): number {
+  return table - view.getInt32(table, true)
+}
+
+/**
+ * Return the position of a field of a flatbuffer table, or undefined if the
+ * field isn't set.
+ */
+function getFieldPosition(
+  view: DataView,
+  table: number,
+  field: number
+): number | undefined {
+  const vtable = getVtablePosition(view, table)
+  const vtableEntry = 4 + 2 * field
+  if (vtableEntry >= view.getUint16(vtable, true)) {
+    return undefined
+  }
+  const fieldOffset = view.getUint16(vtable + vtableEntry, true)
+  return fieldOffset === 0 ? undefined : table + fieldOffset
+}
+
+/**
+ * Return the position of a table or vector that a field of a flatbuffer table
+ * refers to, or undefined if the field isn't set.
+ */
+function getReferencePosition(
+  view: DataView,
+  table: number,
+  field: number
+): number | undefined {
+  const fieldPosition = getFieldPosition(view, table, field)
+  return fieldPosition === undefined
+    ? undefined
+    : fieldPosition + view.getUint32(fieldPosition, true)
+}
+
+function getMessageBodyLength(view: DataView): number {
+  const message = view.getUint32(0, true)
+  const bodyLengthPosition = getFieldPosition(
+    view,
+    message,
+    MESSAGE_BODY_LENGTH_FIELD
+  )
+  return bodyLengthPosition === undefined
+    ? 0
+    : Number(view.getBigInt64(bodyLengthPosition, true))
+}
+
+/**
+ * Return the position of the RecordBatch table of a message's metadata, or
+ * undefined if the message contains no record batch.
+ */
+function getRecordBatchPosition(view: DataView): number | undefined {
+  const message = view.getUint32(0, true)
+  const headerTypePosition = getFieldPosition(
+    view,
+    message,
+    MESSAGE_HEADER_TYPE_FIELD
+  )
+  const headerType =
+    headerTypePosition === undefined ? 0 : view.getUint8(headerTypePosition)
+  const header = getReferencePosition(view, message, MESSAGE_HEADER_FIELD)
+
+  if (header === undefined) {
+    return undefined
+  }
+  if (headerType === MESSAGE_HEADER_RECORD_BATCH) {
+    return header
+  }
+  if (headerType === MESSAGE_HEADER_DICTIONARY_BATCH) {
+    return getReferencePosition(view, header, DICTIONARY_BATCH_DATA_FIELD)
+  }
+  return undefined
+}
+
+/**
+ * Decompress an LZ4 block into the output, starting at outputPosition.
+ * See https://github.com/lz4/lz4/blob/dev/doc/lz4_Block_format.md
+ *
+ * @returns the position in the output after the decompressed bytes.
+ */
+function decompressLz4Block(
+  source: Uint8Array,
+  sourceStart: number,
+  sourceEnd: number,
+  output: Uint8Array,
+  outputStart: number
+): number {
+  let sourcePosition = sourceStart
+  let outputPosition = outputStart
+
+  while (sourcePosition < sourceEnd) {
+    const token = source[sourcePosition++]
+
+    let literalLength = token >>> 4
+    if (literalLength === 15) {
+      let lengthByte: number
+      do {
+        lengthByte = source[sourcePosition++]
+        literalLength += lengthByte
+      } while (lengthByte === 255)
+    }
+    output.set(
+      source.subarray(sourcePosition, sourcePosition + literalLength),
+      outputPosition
+    )
+    sourcePosition += literalLength
+    outputPosition += literalLength
+
+    // The last sequence of a block only contains literals.
+    if (sourcePosition >= sourceEnd) {
+      break
+    }
+
+    const matchOffset =
+      source[sourcePosition] | (source[sourcePosition + 1] << 8)
+    sourcePosition += 2
+
+    let matchLength = token & 0x0f
+    if (matchLength === 15) {
+      let lengthByte: number
+      do {
+        lengthByte = source[sourcePosition++]
+        matchLength += lengthByte
+      } while (lengthByte === 255)
+    }
+    matchLength += 4
+
+    let matchPosition = outputPosition - matchOffset
+    if (matchOffset >= matchLength) {
+      output.copyWithin(
+        outputPosition,
+        matchPosition,
+        matchPosition + matchLength
+      )
+      outputPosition += matchLength
+    } else {
+      // The match overlaps the bytes that it's copied to, so it repeats
+      // its first matchOffset bytes.
+      const matchEnd = outputPosition + matchLength
+      while (outputPosition < matchEnd) {
+        output[outputPosition++] = output[matchPosition++]
+      }
+    }
+  }
+
+  return outputPosition
+}
+
+/**
+ * Decompress an LZ4 frame.
+ * See https://github.com/lz4/lz4/blob/dev/doc/lz4_Frame_format.md
+ *
+ * @param source - The LZ4 frame
+ * @param uncompressedLength - The length of the decompressed bytes
+ *
+ * @returns the decompressed bytes.
+ */
+export function decompressLz4Frame(
+  source: Uint8Array,
+  uncompressedLength: number
+): Uint8Array {
+  const view = getDataView(source)
+  if (view.getUint32(0, true) !== LZ4_FRAME_MAGIC_NUMBER) {
+    throw new Error("Invalid LZ4 frame: unknown magic number.")
+  }
+
+  const flags = source[4]
+  const hasBlockChecksums = (flags & 0x10) !== 0
+  const hasContentSize = (flags & 0x08) !== 0
+  const hasDictionaryId = (flags & 0x01) !== 0
+  // The magic number, the flags, the block descriptor, the optional fields
+  // and the header checksum:
+  let sourcePosition =
+    6 + (hasContentSize ? 8 : 0) + (hasDictionaryId ? 4 : 0) + 1
+
+  const output = new Uint8Array(uncompressedLength)
+  let outputPosition = 0
+  for (;;) {
+    const blockSize = view.getUint32(sourcePosition, true)
+    sourcePosition += 4
+    if (blockSize === 0) {
+      // The end mark.
+      break
+    }
+
+    const blockLength = blockSize & 0x7fffffff
+    if (blockLength !== blockSize) {
+      // The highest bit is set for blocks that are stored uncompressed.
+      output.set(
+        source.subarray(sourcePosition, sourcePosition + blockLength),
+        outputPosition
+      )
+      outputPosition += blockLength
+    } else {
+      outputPosition = decompressLz4Block(
+        source,
+        sourcePosition,
+        sourcePosition + blockLength,
+        output,
+        outputPosition
+      )
+    }
+    sourcePosition += blockLength + (hasBlockChecksums ? 4 : 0)
+  }
+
+  if (outputPosition !== uncompressedLength) {
+    throw new Error(
+      `Invalid LZ4 frame: expected ${uncompressedLength} bytes, but got ${outputPosition}.`
+    )
+  }
+  return output
+}
+
+/**
+ * Decompress the buffers of a message of an IPC stream.
+ *
+ * @param metadata - The flatbuffer metadata of the message
+ * @param body - The body of the message
+ *
+ * @returns the metadata and body of the uncompressed message, or undefined if
+ * the message isn't compressed.
+ */
+function decompressMessage(
+  metadata: Uint8Array,
+  body: Uint8Array
+): { metadata: Uint8Array; body: Uint8Array } | undefined {
+  const metadataView = getDataView(metadata)
+  const recordBatch = getRecordBatchPosition(metadataView)
+  if (recordBatch === undefined) {
+    return undefined
+  }
+
+  const compression = getReferencePosition(
+    metadataView,
+    recordBatch,
+    RECORD_BATCH_COMPRESSION_FIELD
+  )
+  if (compression === undefined) {
+    return undefined
+  }
+
+  const codecPosition = getFieldPosition(
+    metadataView,
+    compression,
+    BODY_COMPRESSION_CODEC_FIELD
+  )
+  const codec =
+    codecPosition === undefined ? 0 : metadataView.getInt8(codecPosition)
+  if (codec !== COMPRESSION_TYPE_LZ4_FRAME) {
+    throw new Error(`Unsupported Arrow compression codec: ${codec}`)
+  }
+
+  // The metadata is changed in a copy, which has room for a new vtable of
+  // the record batch.
+  const vtable = getVtablePosition(metadataView, recordBatch)
+  const vtableSize = metadataView.getUint16(vtable, true)
+  const newVtable = padTo8Bytes(metadata.byteLength)
+  const newMetadata = new Uint8Array(padTo8Bytes(newVtable + vtableSize))
+  newMetadata.set(metadata)
+  const newMetadataView = getDataView(newMetadata)
+
+  const buffers = getReferencePosition(
+    metadataView,
+    recordBatch,
+    RECORD_BATCH_BUFFERS_FIELD
+  )
+  const numBuffers =
+    buffers === undefined ? 0 : metadataView.getUint32(buffers, true)
+  const bodyView = getDataView(body)
+
+  const uncompressedBuffers: Uint8Array[] = []
+  let newBodyLength = 0
+  for (let i = 0; i < numBuffers; i++) {
+    const bufferStruct = (buffers as number) + 4 + i * BUFFER_STRUCT_SIZE
+    const offset = Number(metadataView.getBigInt64(bufferStruct, true))
+    const length = Number(metadataView.getBigInt64(bufferStruct + 8, true))
+
+    let uncompressedBuffer = body.subarray(offset, offset)
+    if (length > 0) {
+      // Compressed buffers start with their uncompressed length.
+      const uncompressedLength = Number(bodyView.getBigInt64(offset, true))
+      const compressedBuffer = body.subarray(offset + 8, offset + length)
+      uncompressedBuffer =
+        uncompressedLength === UNCOMPRESSED_BUFFER_LENGTH
+          ? compressedBuffer
+          : decompressLz4Frame(compressedBuffer, uncompressedLength)
+    }
+
+    newMetadataView.setBigInt64(bufferStruct, BigInt(newBodyLength), true)
+    newMetadataView.setBigInt64(
+      bufferStruct + 8,
+      BigInt(uncompressedBuffer.byteLength),
+      true
+    )
+    uncompressedBuffers.push(uncompressedBuffer)
+    newBodyLength += padTo8Bytes(uncompressedBuffer.byteLength)
+  }
+
+  const newBody = new Uint8Array(newBodyLength)
+  let bodyPosition = 0
+  uncompressedBuffers.forEach(buffer => {
+    newBody.set(buffer, bodyPosition)
+    bodyPosition += padTo8Bytes(buffer.byteLength)
+  })
+
+  const message = metadataView.getUint32(0, true)
+  const bodyLengthPosition = getFieldPosition(
+    metadataView,
+    message,
+    MESSAGE_BODY_LENGTH_FIELD
+  )
+  if (bodyLengthPosition === undefined) {
+    throw new Error("Invalid Arrow message: the body length is missing.")
+  }
+  newMetadataView.setBigInt64(bodyLengthPosition, BigInt(newBodyLength), true)
+
+  // The compression field is removed by pointing the record batch to a copy
+  // of its vtable without the field. The vtable itself can't be changed,
+  // since other tables may share it.
+  newMetadata.set(metadata.subarray(vtable, vtable + vtableSize), newVtable)
+  const compressionVtableEntry = 4 + 2 * RECORD_BATCH_COMPRESSION_FIELD
+  newMetadataView.setUint16(newVtable + compressionVtableEntry, 0, true)
+  newMetadataView.setInt32(recordBatch, recordBatch - newVtable, true)
+
+  return { metadata: newMetadata, body: newBody }
+}
+
+/**
+ * Decompress the compressed buffers of an Arrow IPC stream.
+ *
+ * @param ipcBytes - Arrow bytes (IPC stream format)
+ *
+ * @returns the Arrow bytes with uncompressed buffers, or ipcBytes itself if
+ * none of its buffers are compressed.
+ */
+export function decompressArrowIpcBytes(ipcBytes: Uint8Array): Uint8Array {
+  const view = getDataView(ipcBytes)
+  const messages: Uint8Array[] = []
+  let isCompressed = false
+
+  let position = 0
+  while (position + 4 <= ipcBytes.byteLength) {
+    let metadataStart = position + 4
+    let metadataLength = view.getInt32(position, true)
+    if (metadataLength === CONTINUATION_MARKER) {
+      metadataLength = view.getInt32(position + 4, true)
+      metadataStart += 4
+    }
+    if (metadataLength === 0) {
+      // The end of the stream.
+      break
+    }
+
+    const metadata = ipcBytes.subarray(
+      metadataStart,
+      metadataStart + metadataLength
+    )
+    const bodyStart = metadataStart + metadataLength
+    const bodyEnd = bodyStart + getMessageBodyLength(getDataView(metadata))
+    const uncompressedMessage = decompressMessage(
+      metadata,
+      ipcBytes.subarray(bodyStart, bodyEnd)
+    )
+
+    if (uncompressedMessage === undefined) {
+      messages.push(ipcBytes.subarray(position, bodyEnd))
+    } else {
+      isCompressed = true
+      const prefix = new Uint8Array(8)
+      const prefixView = getDataView(prefix)
+      prefixView.setInt32(0, CONTINUATION_MARKER, true)
+      prefixView.setInt32(4, uncompressedMessage.metadata.byteLength, true)
+      messages.push(
+        prefix,
+        uncompressedMessage.metadata,
+        uncompressedMessage.body
+      )
+    }
+    position = bodyEnd
+  }
+
+  if (!isCompressed) {
+    return ipcBytes
+  }
+
+  const endOfStream = new Uint8Array(8)
+  getDataView(endOfStream).setInt32(0, CONTINUATION_MARKER, true)
+  messages.push(endOfStream)
+
+  const uncompressedBytes = new Uint8Array(
+    messages.reduce((length, message) => length + message.byteLength, 0)
+  )
+  let outputPosition = 0
+  messages.forEach(message => {
+    uncompressedBytes.set(message, outputPosition)
+    outputPosition += message.byteLength
+  })
+  return uncompressedBytes
+}
@@ -33,6 +33,7 @@ import unzip from "lodash/unzip"
 
 import { isNullOrUndefined, notNullOrUndefined } from "~lib/util/utils"
 
+import { decompressArrowIpcBytes } from "./arrowCompression"
 import {
   ArrowType,
   convertVectorToList,
@@ -349,7 +350,11 @@ export function parseArrowIpcBytes(
   // Load arrow table object from Arrow IPC bytes.
   // The table contains all the cell data, the arrow schema
   // and the pandas schema (if processed through Pandas).
-  const table = tableFromIPC(ipcBytes)
+  // The buffers of the bytes are compressed if the server.arrowCompression
+  // config option is set.
+  const table = tableFromIPC(
+    notNullOrUndefined(ipcBytes) ? decompressArrowIpcBytes(ipcBytes) : ipcBytes
+  )
 
   // The arrow schema contains type information for all columns
   // that are part of the table. This doesn't include range indices
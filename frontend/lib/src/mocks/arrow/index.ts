@@ -36,6 +36,7 @@ import { NAMED_INDEX } from "./namedIndex"
 import { DISPLAY_VALUES, STYLER } from "./styler"
 import { FEWER_COLUMNS } from "./fewerColumns"
 import { DIFFERENT_COLUMN_TYPES } from "./differentColumnTypes"
+import { LZ4_COMPRESSED } from "./lz4Compressed"
 import { VEGA_LITE } from "./vegaLite"
 import { TEN_BY_TEN } from "./tenByTen"
 import { TALL, VERY_TALL } from "./tall"
@@ -70,6 +71,7 @@ export {
   DISPLAY_VALUES,
   FEWER_COLUMNS,
   DIFFERENT_COLUMN_TYPES,
+  LZ4_COMPRESSED,
   VEGA_LITE,
   NAMED_INDEX,
   // Specific sizes
@@ -420,6 +420,69 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "global.maxCacheDataBytes",
+    description="""
+        Maximum total size, in bytes, of the values that all st.cache_data
+        functions together keep in memory. When the limit is exceeded, the
+        least recently used values are dropped from memory, whichever function
+        they belong to. Values persisted to disk remain there. If 0, there is
+        no limit.
+    """,
+    visibility="hidden",
+    default_val=0.0,
+    type_=float,
+)
+
+_create_option(
+    "global.maxDiskCacheBytes",
+    description="""
+        Maximum total size, in bytes, of the values that st.cache_data
+        functions with persist="disk" keep on disk. When the limit is exceeded,
+        the least recently used values are removed, whichever function they
+        belong to. The limit is shared by all server processes that use the
+        same cache folder. If 0, there is no limit.
+    """,
+    visibility="hidden",
+    default_val=0.0,
+    type_=float,
+)
+
+_create_option(
+    "global.cacheHashAlgorithm",
+    description="""
+        Digest algorithm that st.cache_data and st.cache_resource use to build
+        keys from a function's source code and arguments. Changing it
+        invalidates the values persisted to disk.
+
+        Allowed values:
+        - "md5": The default.
+        - "blake2b": Faster than "md5" on 64-bit platforms.
+        - "xxhash": A non-cryptographic hash that is much faster on large
+          arguments. Requires the xxhash package.
+    """,
+    visibility="hidden",
+    default_val="md5",
+    type_=str,
+)
+
+_create_option(
+    "global.exactCacheHashing",
+    description="""
+        If True, st.cache_data and st.cache_resource hash all the data of
+        large dataframes and NumPy arrays passed to cached functions. If
+        False, they hash a sample of the rows or elements, so two large
+        arguments that only differ outside of the sample return the same
+        cached value.
+
+        Exact hashing reads the memory of NumPy-backed columns, arrays and
+        Arrow-backed data directly, on several threads.
+    """,
+    visibility="hidden",
+    default_val=False,
+    type_=bool,
+)
+
 _create_option(
     "global.includeFragmentRunsInForwardMessageCacheCount",
     description="""
@@ -596,6 +659,40 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "runner.scriptThreadPoolSize",
+    description="""
+        Run scripts on a shared pool of this many long-lived threads, instead
+        of starting a new thread whenever a session's script needs to run.
+        Threads are reused across script runs and sessions, and script runs
+        beyond this many at a time wait for a thread to become free.
+
+        Note that thread-local data set by a script may then be visible to
+        later script runs on the same thread.
+
+        Set to 0 to start a new thread for every script runner.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.maxConcurrentScriptRuns",
+    description="""
+        Maximum number of script runs, across all sessions, that may execute
+        at the same time. Script runs beyond this wait in a first-come,
+        first-served queue, and their sessions are shown as waiting to run.
+        Reruns requested by a session while it waits are combined into its
+        queued run.
+
+        Set to 0 to run every script as soon as it's requested.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "runner.enforceSerializableSessionState",
     description="""
@@ -812,6 +909,39 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "server.arrowTruncationStrategy",
+    description="""
+        Which rows are kept if a table is truncated because of
+        server.enableArrowTruncation.
+
+        Allowed values:
+        - "head": The first rows.
+        - "sample": The first and last rows, and an evenly spaced sample of
+          the rows in between.
+    """,
+    visibility="hidden",
+    default_val="head",
+    scriptable=True,
+    type_=str,
+)
+
+_create_option(
+    "server.arrowCompression",
+    description="""
+        Compression of the buffers of the Arrow data that is sent to the
+        browser for dataframes, charts and custom components. Compressed
+        data is smaller, but takes longer to encode and decode.
+
+        Allowed values:
+        - "none": No compression.
+        - "lz4": LZ4 frame compression.
+    """,
+    visibility="hidden",
+    default_val="none",
+    type_=str,
+)
+
 _create_option(
     "server.enableWebsocketCompression",
     description="""
@@ -821,6 +951,97 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "server.maxWebsocketBatchSize",
+    description="""
+        Max size, in kilobytes, of a WebSocket frame that batches several
+        messages together. When set, all messages queued for a session are
+        written in as few frames as possible per Runtime loop iteration, and
+        only messages larger than this limit are sent in their own frame.
+
+        Set to 0 to disable batching and send every message in its own frame.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "server.maxSessionQueueSize",
+    description="""
+        Max size, in megabytes, of the messages that can be waiting to be sent
+        to a single session's client. When the limit is hit, Streamlit
+        coalesces queued messages more aggressively and pauses the session's
+        script thread until its client has caught up.
+
+        Set to 0 to leave the queue unbounded.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=float,
+)
+
+_create_option(
+    "server.workerProcesses",
+    description="""
+        Number of worker processes to serve the app from. Each worker runs
+        its own sessions and scripts, so that CPU-bound apps can use more
+        than one core. All workers share the server's port: a session's
+        connections are always routed to the worker that runs it.
+
+        Caches that live in memory, like `st.cache_resource` and
+        `st.cache_data` without `persist="disk"`, aren't shared between
+        workers.
+
+        Only supported on Linux and macOS, and not together with
+        server.sslCertFile.
+    """,
+    visibility="hidden",
+    default_val=1,
+    type_=int,
+)
+
+_create_option(
+    "server.warmupScript",
+    description="""
+        Path to a script that warms up `st.cache_data` and `st.cache_resource`
+        caches when the server starts, relative to the app's main script.
+
+        The script runs in the background, and schedules calls to cached
+        functions with their `warmup` method, e.g. `load_data.warmup("2024")`.
+        The cached functions must be defined in a module that the app and the
+        script import, not in the app's main script.
+        Until the script and all calls it scheduled have finished, the
+        server's health check reports that it's warming up and isn't ready
+        for connections yet.
+    """,
+    visibility="hidden",
+    default_val=None,
+    type_=str,
+)
+
+_create_option(
+    "server.warmupMaxWorkers",
+    description="""
+        Max number of cache warm-up calls that run at the same time.
+    """,
+    visibility="hidden",
+    default_val=4,
+    type_=int,
+)
+
+_create_option(
+    "server.dataframePagingRowThreshold",
+    description="""
+        Dataframes with more rows than this are kept on the server and sent
+        to the browser in pages as they're scrolled into view, instead of
+        all at once. Set to 0 to disable paging.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "server.enableStaticServing",
     description="""
@@ -53,7 +53,10 @@ from streamlit.type_util import (
 )
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     import numpy as np
+    import numpy.typing as npt
     import pyarrow as pa
     from pandas import DataFrame, Index, Series
     from pandas.core.indexing import _iLocIndexer
@@ -65,6 +68,30 @@ _LOGGER: Final = logger.get_logger(__name__)
 # Maximum number of rows to request from an unevaluated (out-of-core) dataframe
 _MAX_UNEVALUATED_DF_ROWS = 10000
 
+# The kinds of NumPy dtypes that are converted to Arrow directly: booleans,
+# integers, floats, and unicode strings. Other dtypes need the type
+# conversions of pandas.
+_NUMPY_ARROW_DTYPE_KINDS: Final = "biufU"
+
+# The strategies that can be set with the server.arrowTruncationStrategy
+# config option.
+_ARROW_TRUNCATION_STRATEGIES: Final = ("head", "sample")
+
+# The number of bytes of a message that are reserved for everything but the
+# Arrow table, if the table gets truncated.
+_ARROW_MESSAGE_OVERHEAD_BYTES: Final = int(1e6)
+
+# The Arrow IPC compression codecs by value of the server.arrowCompression
+# config option.
+_ARROW_COMPRESSION_CODECS: Final[dict[str, str | None]] = {
+    "none": None,
+    "lz4": "lz4",
+}
+
+# Tables smaller than this are never compressed, since their compressed
+# buffers are barely smaller, or even larger, than the uncompressed ones.
+_MIN_COMPRESSED_ARROW_TABLE_BYTES: Final = 64 * 1024
+
 _PANDAS_DATA_OBJECT_TYPE_RE: Final = re.compile(r"^pandas.*$")
 
 _DASK_DATAFRAME: Final = "dask.dataframe.core.DataFrame"
@@ -762,6 +789,9 @@ Offending object:
 def convert_arrow_table_to_arrow_bytes(table: pa.Table) -> bytes:
     """Serialize pyarrow.Table to Arrow IPC bytes.
 
+    The buffers of the table are compressed with the codec set by the
+    server.arrowCompression config option.
+
     Parameters
     ----------
     table : pyarrow.Table
@@ -772,31 +802,25 @@ def convert_arrow_table_to_arrow_bytes(table: pa.Table) -> bytes:
     bytes
         The serialized Arrow IPC bytes.
     """
-    try:
-        table = _maybe_truncate_table(table)
-    except RecursionError as err:
-        # This is a very unlikely edge case, but we want to make sure that
-        # it doesn't lead to unexpected behavior.
-        # If there is a recursion error, we just return the table as-is
-        # which will lead to the normal message limit exceed error.
-        _LOGGER.warning(
-            "Recursion error while truncating Arrow table. This is not "
-            "supposed to happen.",
-            exc_info=err,
+    compression = config.get_option("server.arrowCompression")
+    if compression not in _ARROW_COMPRESSION_CODECS:
+        raise errors.StreamlitAPIException(
+            "Invalid value for config option server.arrowCompression. "
+            f"Expected one of {tuple(_ARROW_COMPRESSION_CODECS)}, but got "
+            f"'{compression}'."
         )
 
-    import pyarrow as pa
-
-    # Convert table to bytes
-    sink = pa.BufferOutputStream()
-    writer = pa.RecordBatchStreamWriter(sink, table.schema)
-    writer.write_table(table)
-    writer.close()
-    return cast(bytes, sink.getvalue().to_pybytes())
+    table = _maybe_truncate_table(table)
+    if table.nbytes < _MIN_COMPRESSED_ARROW_TABLE_BYTES:
+        return _serialize_arrow_table(table)
+    return _serialize_arrow_table(
+        table, compression=_ARROW_COMPRESSION_CODECS[compression]
+    )
 
 
-def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
-    """Serialize pandas.DataFrame to Arrow IPC bytes.
+def convert_pandas_df_to_arrow_table(df: DataFrame) -> pa.Table:
+    """Convert pandas.DataFrame to pyarrow.Table, fixing column types that
+    Arrow doesn't support if necessary.
 
     Parameters
     ----------
@@ -805,13 +829,13 @@ def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
 
     Returns
     -------
-    bytes
-        The serialized Arrow IPC bytes.
+    pyarrow.Table
+        The converted table.
     """
     import pyarrow as pa
 
     try:
-        table = pa.Table.from_pandas(df)
+        return pa.Table.from_pandas(df)
     except (pa.ArrowTypeError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as ex:
         _LOGGER.info(
             "Serialization of dataframe to Arrow table was unsuccessful. "
@@ -820,8 +844,23 @@ def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
             exc_info=ex,
         )
         df = fix_arrow_incompatible_column_types(df)
-        table = pa.Table.from_pandas(df)
-    return convert_arrow_table_to_arrow_bytes(table)
+        return pa.Table.from_pandas(df)
+
+
+def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
+    """Serialize pandas.DataFrame to Arrow IPC bytes.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe to convert.
+
+    Returns
+    -------
+    bytes
+        The serialized Arrow IPC bytes.
+    """
+    return convert_arrow_table_to_arrow_bytes(convert_pandas_df_to_arrow_table(df))
 
 
 def convert_arrow_bytes_to_pandas_df(source: bytes) -> DataFrame:
@@ -855,6 +894,227 @@ def _show_data_information(msg: str) -> None:
     get_dg_singleton_instance().main_dg.caption(msg)
 
 
+def _has_arrow_type(arrow_type: pa.DataType, *type_checks: str) -> bool:
+    """True if the type passes one of the given `pyarrow.types` checks. Checks
+    that don't exist in the installed pyarrow version are skipped.
+    """
+    import pyarrow as pa
+
+    return any(
+        getattr(pa.types, type_check, lambda _: False)(arrow_type)
+        for type_check in type_checks
+    )
+
+
+def _to_frontend_compatible_arrow_type(arrow_type: pa.DataType) -> pa.DataType:
+    """Replace view and large list types, which the frontend can't read, with
+    equivalent types that it can.
+    """
+    import pyarrow as pa
+
+    if _has_arrow_type(arrow_type, "is_string_view"):
+        return pa.large_string()
+    if _has_arrow_type(arrow_type, "is_binary_view"):
+        return pa.large_binary()
+    if _has_arrow_type(
+        arrow_type, "is_list", "is_large_list", "is_list_view", "is_large_list_view"
+    ):
+        return pa.list_(
+            arrow_type.value_field.with_type(
+                _to_frontend_compatible_arrow_type(arrow_type.value_type)
+            )
+        )
+    if pa.types.is_struct(arrow_type):
+        return pa.struct(
+            [
+                field.with_type(_to_frontend_compatible_arrow_type(field.type))
+                for field in (arrow_type.field(i) for i in range(arrow_type.num_fields))
+            ]
+        )
+    if pa.types.is_dictionary(arrow_type):
+        return pa.dictionary(
+            arrow_type.index_type,
+            _to_frontend_compatible_arrow_type(arrow_type.value_type),
+            arrow_type.ordered,
+        )
+    return arrow_type
+
+
+def _make_arrow_table_frontend_compatible(table: pa.Table) -> pa.Table:
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [
+            field.with_type(_to_frontend_compatible_arrow_type(field.type))
+            for field in table.schema
+        ],
+        metadata=table.schema.metadata,
+    )
+    return table if schema.equals(table.schema) else table.cast(schema)
+
+
+def _numpy_array_to_arrow_table(
+    data: np.ndarray[Any, np.dtype[Any]],
+) -> pa.Table | None:
+    """Convert a 1- or 2-dimensional NumPy array, or a structured array, to an
+    Arrow table, with the same column names as `convert_anything_to_pandas_df`.
+    Return None for arrays that need pandas' type conversions.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if data.size == 0 or data.ndim not in (1, 2):
+        return None
+
+    if data.dtype.names is not None:
+        if data.ndim != 1:
+            return None
+        columns = [data[name] for name in data.dtype.names]
+        names = list(data.dtype.names)
+    elif data.ndim == 1:
+        columns = [data]
+        names = ["value"]
+    else:
+        # Copy the matrix to column-major order once, so that its columns are
+        # contiguous and can be wrapped by Arrow arrays without copying them.
+        data = np.asfortranarray(data)
+        columns = [data[:, i] for i in range(data.shape[1])]
+        names = (
+            ["value"] if len(columns) == 1 else [str(i) for i in range(len(columns))]
+        )
+
+    if any(column.dtype.kind not in _NUMPY_ARROW_DTYPE_KINDS for column in columns):
+        return None
+
+    return pa.Table.from_arrays(
+        [_numpy_column_to_arrow_array(column) for column in columns], names=names
+    )
+
+
+def _numpy_column_to_arrow_array(column: np.ndarray[Any, np.dtype[Any]]) -> pa.Array:
+    """Convert a 1-dimensional NumPy array to an Arrow array, with NaN values
+    converted to nulls like in pa.Table.from_pandas.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    # This is a lot faster for large arrays than
+    # pa.array(column, from_pandas=True).
+    if column.dtype.kind == "f":
+        nan_mask = np.isnan(column)
+        if nan_mask.any():
+            return pa.array(column, mask=nan_mask)
+    return pa.array(column)
+
+
+def convert_to_arrow_table_directly(
+    data: Any,
+    data_format: DataFormat,
+    max_unevaluated_rows: int = _MAX_UNEVALUATED_DF_ROWS,
+) -> pa.Table | None:
+    """Convert data to a pyarrow.Table without converting it to a pandas
+    DataFrame first, if its format supports it.
+
+    Polars and DuckDB data, NumPy arrays, and objects that implement the
+    Arrow PyCapsule or the dataframe interchange protocol are converted
+    natively, which avoids copying the data twice and pandas' type
+    inference.
+
+    Parameters
+    ----------
+    data : dataframe-, array-, or collections-like object
+        The data to convert.
+
+    data_format : DataFormat
+        The format of the data, as determined by `determine_data_format`.
+
+    max_unevaluated_rows: int
+        If unevaluated data is detected this func will evaluate it,
+        taking max_unevaluated_rows, defaults to 10k.
+
+    Returns
+    -------
+    pyarrow.Table or None
+        The converted table, or None if the data has to be converted via
+        pandas.
+    """
+    import pyarrow as pa
+
+    table: pa.Table | None = None
+    try:
+        if data_format == DataFormat.POLARS_DATAFRAME:
+            table = data.to_arrow()
+        elif data_format == DataFormat.POLARS_SERIES:
+            table = pa.Table.from_arrays([data.to_arrow()], names=[data.name])
+        elif data_format == DataFormat.POLARS_LAZYFRAME:
+            table = data.limit(max_unevaluated_rows).collect().to_arrow()
+            if table.num_rows == max_unevaluated_rows:
+                _show_data_information(
+                    f"⚠️ Showing only {string_util.simplify_number(max_unevaluated_rows)} "
+                    "rows. Call `collect()` on the dataframe to show more."
+                )
+        elif data_format == DataFormat.DUCKDB_RELATION:
+            # Recent DuckDB versions return a RecordBatchReader.
+            result = data.limit(max_unevaluated_rows).arrow()
+            table = result if isinstance(result, pa.Table) else result.read_all()
+            if table.num_rows == max_unevaluated_rows:
+                _show_data_information(
+                    f"⚠️ Showing only {string_util.simplify_number(max_unevaluated_rows)} "
+                    "rows. Call `df()` on the relation to show more."
+                )
+        elif data_format in (DataFormat.NUMPY_LIST, DataFormat.NUMPY_MATRIX):
+            table = _numpy_array_to_arrow_table(data)
+        elif data_format == DataFormat.UNKNOWN:
+            # Arrow PyCapsule interface, supported by pyarrow >= 14:
+            # https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html
+            if (
+                (
+                    has_callable_attr(data, "__arrow_c_stream__")
+                    or has_callable_attr(data, "__arrow_c_array__")
+                )
+                # Chunked arrays are streams of a single column, not a table.
+                and not isinstance(data, pa.ChunkedArray)
+                and not is_pyarrow_version_less_than("14.0.0")
+            ):
+                table = pa.table(data)
+            # Objects with a `to_pandas` method are converted with it, like in
+            # `convert_anything_to_pandas_df`.
+            elif (
+                has_callable_attr(data, "__dataframe__")
+                and not has_callable_attr(data, "to_pandas")
+                and not is_pyarrow_version_less_than("11.0.0")
+            ):
+                from pyarrow.interchange import from_dataframe
+
+                table = from_dataframe(data)
+    except (
+        pa.ArrowTypeError,
+        pa.ArrowInvalid,
+        pa.ArrowNotImplementedError,
+        TypeError,
+    ) as ex:
+        _LOGGER.info(
+            "Direct conversion of %s data to an Arrow table was unsuccessful. "
+            "Converting it to a pandas DataFrame instead.",
+            data_format.name,
+            exc_info=ex,
+        )
+        return None
+
+    if table is None:
+        return None
+
+    try:
+        return _make_arrow_table_frontend_compatible(table)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as ex:
+        _LOGGER.info(
+            "Conversion of Arrow table to frontend-compatible types was "
+            "unsuccessful. Converting it to a pandas DataFrame instead.",
+            exc_info=ex,
+        )
+        return None
+
+
 def convert_anything_to_arrow_bytes(
     data: Any,
     max_unevaluated_rows: int = _MAX_UNEVALUATED_DF_ROWS,
@@ -885,7 +1145,11 @@ def convert_anything_to_arrow_bytes(
     if isinstance(data, pa.Table):
         return convert_arrow_table_to_arrow_bytes(data)
 
-    # TODO(lukasmasuch): Add direct conversion to Arrow for supported formats here
+    table = convert_to_arrow_table_directly(
+        data, determine_data_format(data), max_unevaluated_rows
+    )
+    if table is not None:
+        return convert_arrow_table_to_arrow_bytes(table)
 
     # Fallback: try to convert to pandas DataFrame
     # and then to Arrow bytes.
@@ -950,79 +1214,351 @@ def convert_anything_to_list(obj: OptionSequence[V_co]) -> list[V_co]:
         return [obj]  # type: ignore
 
 
-def _maybe_truncate_table(
-    table: pa.Table, truncated_rows: int | None = None
-) -> pa.Table:
+def materialize_pandas_range_index(table: pa.Table) -> pa.Table:
+    """Replace the pandas RangeIndex described in the table's metadata with
+    an index column.
+
+    A RangeIndex isn't stored in the table, only its start, stop and step.
+    So it no longer matches the rows if only some rows of the table are
+    selected, unless it's stored like any other index.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        A table created from a pandas.DataFrame.
+
+    Returns
+    -------
+    pyarrow.Table
+        The table with an index column instead of the RangeIndex, or the
+        table itself if it has no RangeIndex.
+    """
+    import json
+
+    import pyarrow as pa
+
+    metadata = table.schema.metadata or {}
+    if b"pandas" not in metadata:
+        return table
+
+    pandas_metadata = json.loads(metadata[b"pandas"])
+    index_columns = pandas_metadata.get("index_columns", [])
+    if not any(isinstance(index, dict) for index in index_columns):
+        return table
+
+    for i, index in enumerate(index_columns):
+        if not isinstance(index, dict) or index.get("kind") != "range":
+            continue
+
+        field_name = f"__index_level_{i}__"
+        table = table.append_column(
+            field_name,
+            pa.array(range(index["start"], index["stop"], index["step"]), pa.int64()),
+        )
+        index_columns[i] = field_name
+        pandas_metadata["columns"].append(
+            {
+                "name": index.get("name"),
+                "field_name": field_name,
+                "pandas_type": "int64",
+                "numpy_type": "int64",
+                "metadata": None,
+            }
+        )
+
+    return table.replace_schema_metadata(
+        {**metadata, b"pandas": json.dumps(pandas_metadata).encode()}
+    )
+
+
+def _serialize_arrow_table(table: pa.Table, compression: str | None = None) -> bytes:
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    writer = pa.RecordBatchStreamWriter(
+        sink, table.schema, options=pa.ipc.IpcWriteOptions(compression=compression)
+    )
+    writer.write_table(table)
+    writer.close()
+    return cast(bytes, sink.getvalue().to_pybytes())
+
+
+def _arrow_ipc_size(table: pa.Table) -> int:
+    """Return the size of the table in Arrow IPC bytes.
+
+    The table is written to a stream that only counts the bytes, so this
+    doesn't copy the table's buffers.
+    """
+    import pyarrow as pa
+
+    sink = pa.MockOutputStream()
+    with pa.RecordBatchStreamWriter(sink, table.schema) as writer:
+        writer.write_table(table)
+    return cast(int, sink.size())
+
+
+def _arrow_column_row_sizes(
+    column: pa.ChunkedArray,
+) -> tuple[float | npt.NDArray[np.float64], bool]:
+    """Return the number of bytes that each row of the column takes up in
+    Arrow IPC bytes, and whether the sizes are exact.
+
+    The sizes don't include the padding of the column's buffers, which is at
+    most 8 bytes per buffer and record batch.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arrow_type = column.type
+    # Validity bitmaps are only written for arrays with nulls:
+    validity_size = 1 / 8 if column.null_count > 0 else 0.0
+
+    if pa.types.is_dictionary(arrow_type):
+        # The dictionary is written once per record batch, which is part of
+        # the record batch overhead.
+        return validity_size + arrow_type.index_type.bit_width / 8, True
+
+    if (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_binary(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_large_binary(arrow_type)
+    ):
+        offset_size = (
+            8
+            if pa.types.is_large_string(arrow_type)
+            or (pa.types.is_large_binary(arrow_type))
+            else 4
+        )
+        value_sizes = pc.fill_null(pc.binary_length(column), 0).to_numpy()
+        return validity_size + offset_size + value_sizes.astype("float64"), True
+
+    try:
+        return validity_size + arrow_type.bit_width / 8, True
+    except ValueError:
+        # Nested and other types without a fixed width. Their size is spread
+        # evenly over the rows.
+        return column.nbytes / max(len(column), 1), False
+
+
+def _arrow_row_sizes(table: pa.Table) -> tuple[npt.NDArray[np.float64], bool]:
+    """Return the number of bytes that each row of the table takes up in
+    Arrow IPC bytes, and whether the sizes are exact.
+    """
+    import numpy as np
+
+    row_sizes = np.zeros(table.num_rows, dtype="float64")
+    is_exact = True
+    for column in table.columns:
+        column_sizes, is_exact_column = _arrow_column_row_sizes(column)
+        row_sizes += column_sizes
+        is_exact = is_exact and is_exact_column
+    return row_sizes, is_exact
+
+
+def _arrow_record_batch_overhead(table: pa.Table) -> int:
+    """Return the maximum number of bytes that a record batch of the table
+    takes up in Arrow IPC bytes in addition to its rows: its metadata, its
+    dictionaries, and the padding of its buffers.
+    """
+    import pyarrow as pa
+
+    first_batch = table.slice(0, 1).to_batches()[0]
+    empty_batch = first_batch.slice(0, 0)
+    sink = pa.BufferOutputStream()
+    with pa.RecordBatchStreamWriter(sink, table.schema) as writer:
+        writer.write_batch(empty_batch)
+    # Every buffer is padded to a multiple of 8 bytes.
+    num_buffers = sum(len(column.buffers()) for column in first_batch.columns)
+    return cast(int, sink.getvalue().size) + 8 * num_buffers
+
+
+def _find_max_rows(
+    fits: Callable[[int], bool], num_rows: int, min_rows: int = 1
+) -> int:
+    """Return the largest number of rows between min_rows and num_rows that
+    fits, given that fewer rows always fit if a number of rows fits.
+    """
+    low, high = min_rows, num_rows
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _head_tail_sample_indices(num_rows: int, num_selected: int) -> npt.NDArray[Any]:
+    """Return the indices of the first and last rows of a table, and of an
+    evenly spaced sample of the rows in between, num_selected rows in total.
+    """
+    import numpy as np
+
+    num_head = num_selected // 3
+    num_tail = num_selected // 3
+    num_sample = num_selected - num_head - num_tail
+    num_middle = num_rows - num_head - num_tail
+    sample = num_head + (np.arange(num_sample, dtype="int64") * num_middle) // max(
+        num_sample, 1
+    )
+    return np.concatenate(
+        [
+            np.arange(num_head, dtype="int64"),
+            sample,
+            np.arange(num_rows - num_tail, num_rows, dtype="int64"),
+        ]
+    )
+
+
+def _maybe_truncate_table(table: pa.Table) -> pa.Table:
     """Experimental feature to automatically truncate tables that
     are larger than the maximum allowed message size. It needs to be enabled
     via the server.enableArrowTruncation config option.
 
+    The size of each row in Arrow IPC bytes is computed in a single pass over
+    the columns, so the table is cut at the last row that fits, instead of
+    estimating the cut-off from the table's total size. With the "sample"
+    strategy of the server.arrowTruncationStrategy config option, the first
+    and last rows and an evenly spaced sample of the rows in between are kept
+    instead of only the first rows.
+
     Parameters
     ----------
     table : pyarrow.Table
         A table to truncate.
 
-    truncated_rows : int or None
-        The number of rows that have been truncated so far. This is used by
-        the recursion logic to keep track of the total number of truncated
-        rows.
-
     """
 
-    if config.get_option("server.enableArrowTruncation"):
-        # This is an optimization problem: We don't know at what row
-        # the perfect cut-off is to comply with the max size. But we want to figure
-        # it out in as few iterations as possible. We almost always will cut out
-        # more than required to keep the iterations low.
-
-        # The maximum size allowed for protobuf messages in bytes:
-        max_message_size = int(config.get_option("server.maxMessageSize") * 1e6)
-        # We add 1 MB for other overhead related to the protobuf message.
-        # This is a very conservative estimate, but it should be good enough.
-        table_size = int(table.nbytes + 1 * 1e6)
-        table_rows = table.num_rows
-
-        if table_rows > 1 and table_size > max_message_size:
-            # targeted rows == the number of rows the table should be truncated to.
-            # Calculate an approximation of how many rows we need to truncate to.
-            targeted_rows = math.ceil(table_rows * (max_message_size / table_size))
-            # Make sure to cut out at least a couple of rows to avoid running
-            # this logic too often since it is quite inefficient and could lead
-            # to infinity recursions without these precautions.
-            targeted_rows = math.floor(
-                max(
-                    min(
-                        # Cut out:
-                        # an additional 5% of the estimated num rows to cut out:
-                        targeted_rows - math.floor((table_rows - targeted_rows) * 0.05),
-                        # at least 1% of table size:
-                        table_rows - (table_rows * 0.01),
-                        # at least 5 rows:
-                        table_rows - 5,
-                    ),
-                    1,  # but it should always have at least 1 row
-                )
-            )
-            sliced_table = table.slice(0, targeted_rows)
-            return _maybe_truncate_table(
-                sliced_table, (truncated_rows or 0) + (table_rows - targeted_rows)
-            )
+    if not config.get_option("server.enableArrowTruncation"):
+        return table
+
+    strategy = config.get_option("server.arrowTruncationStrategy")
+    if strategy not in _ARROW_TRUNCATION_STRATEGIES:
+        raise errors.StreamlitAPIException(
+            "Invalid value for config option server.arrowTruncationStrategy. "
+            f"Expected one of {_ARROW_TRUNCATION_STRATEGIES}, but got '{strategy}'."
+        )
 
-        if truncated_rows:
-            displayed_rows = string_util.simplify_number(table.num_rows)
-            total_rows = string_util.simplify_number(table.num_rows + truncated_rows)
+    table_rows = table.num_rows
+    # The maximum size allowed for protobuf messages in bytes, minus 1 MB
+    # for the rest of the message:
+    max_table_size = (
+        int(config.get_option("server.maxMessageSize") * 1e6)
+        - _ARROW_MESSAGE_OVERHEAD_BYTES
+    )
+    # Arrow IPC bytes only add metadata and padding to the table's buffers,
+    # so tables far below the limit don't need the row sizes to be computed:
+    if table_rows <= 1 or table.nbytes <= max_table_size * 0.5:
+        return table
 
-            if displayed_rows == total_rows:
-                # If the simplified numbers are the same,
-                # we just display the exact numbers.
-                displayed_rows = str(table.num_rows)
-                total_rows = str(table.num_rows + truncated_rows)
-            _show_data_information(
-                f"⚠️ Showing {displayed_rows} out of {total_rows} "
-                "rows due to data size limitations."
+    if _arrow_ipc_size(table) <= max_table_size:
+        return table
+
+    import numpy as np
+
+    row_sizes, is_exact = _arrow_row_sizes(table)
+    batch_overhead = _arrow_record_batch_overhead(table)
+    batch_ends = np.cumsum([batch.num_rows for batch in table.to_batches()])
+    schema_size = len(_serialize_arrow_table(table.schema.empty_table()))
+
+    if strategy == "head":
+        min_rows, max_rows = 1, table_rows
+        if is_exact:
+            # The row sizes give a number of rows that surely fits, when
+            # adding the maximum overhead of the record batches, and the most
+            # rows that could fit, when adding no overhead. The exact cut-off
+            # is found between them.
+            cumulative_sizes = np.cumsum(row_sizes)
+
+            def max_head_size(num_rows: int) -> float:
+                num_batches = int(np.searchsorted(batch_ends, num_rows)) + 1
+                return float(
+                    schema_size
+                    + num_batches * batch_overhead
+                    + cumulative_sizes[num_rows - 1]
+                )
+
+            min_rows = _find_max_rows(
+                lambda num_rows: max_head_size(num_rows) <= max_table_size,
+                table_rows,
+            )
+            max_rows = _find_max_rows(
+                lambda num_rows: (
+                    schema_size + cumulative_sizes[num_rows - 1] <= max_table_size
+                ),
+                table_rows,
+                min_rows,
             )
 
-    return table
+        # Slicing doesn't copy the table, so the exact size of the sliced
+        # tables is cheap to compute.
+        displayed_rows = _find_max_rows(
+            lambda num_rows: (
+                _arrow_ipc_size(table.slice(0, num_rows)) <= max_table_size
+            ),
+            max_rows,
+            min_rows,
+        )
+        truncated_table = table.slice(0, displayed_rows)
+    else:
+        # The rows keep their labels if the RangeIndex is stored as an index
+        # column, which takes up 8 bytes per row.
+        original_num_columns = table.num_columns
+        table = materialize_pandas_range_index(table)
+        row_sizes += 8 * (table.num_columns - original_num_columns)
+
+        def select_rows(num_rows: int) -> pa.Table:
+            return table.take(_head_tail_sample_indices(table_rows, num_rows))
+
+        # Taking rows combines them into at most one record batch per
+        # record batch of the table.
+        max_overhead = schema_size + len(batch_ends) * batch_overhead
+        displayed_rows = _find_max_rows(
+            lambda num_rows: (
+                max_overhead
+                + row_sizes[_head_tail_sample_indices(table_rows, num_rows)].sum()
+                <= max_table_size
+            ),
+            table_rows,
+        )
+        truncated_table = select_rows(displayed_rows)
+
+        if not is_exact:
+            # The sizes of some columns are estimates, so the size of the
+            # sampled table needs to be checked.
+            table_size = _arrow_ipc_size(truncated_table)
+            while displayed_rows > 1 and table_size > max_table_size:
+                displayed_rows = max(
+                    1,
+                    min(
+                        math.floor(displayed_rows * max_table_size / table_size),
+                        displayed_rows - 1,
+                    ),
+                )
+                truncated_table = select_rows(displayed_rows)
+                table_size = _arrow_ipc_size(truncated_table)
+
+    displayed_rows_str = string_util.simplify_number(displayed_rows)
+    total_rows_str = string_util.simplify_number(table_rows)
+    if displayed_rows_str == total_rows_str:
+        # If the simplified numbers are the same,
+        # we just display the exact numbers.
+        displayed_rows_str = str(displayed_rows)
+        total_rows_str = str(table_rows)
+
+    if strategy == "head":
+        _show_data_information(
+            f"⚠️ Showing {displayed_rows_str} out of {total_rows_str} "
+            "rows due to data size limitations."
+        )
+    else:
+        _show_data_information(
+            f"⚠️ Showing the first and last rows and a sample of the rows in "
+            f"between, {displayed_rows_str} out of {total_rows_str} rows, due to "
+            "data size limitations."
+        )
+    return truncated_table
 
 
 def is_colum_type_arrow_incompatible(column: Series[Any] | Index) -> bool:
@@ -55,6 +55,7 @@ from streamlit.runtime.state import WidgetCallback, register_widget
 if TYPE_CHECKING:
     from collections.abc import Hashable, Iterable
 
+    import pyarrow as pa
     from numpy import typing as npt
     from pandas import DataFrame
 
@@ -63,6 +64,9 @@ if TYPE_CHECKING:
     from streamlit.elements.lib.built_in_chart_utils import AddRowsMetadata
 
 
+# The largest value of the uint32 max_rows field of ArrowNamedDataSet.
+_MAX_UINT32: Final = 2**32 - 1
+
 SelectionMode: TypeAlias = Literal[
     "single-row", "multi-row", "single-column", "multi-column"
 ]
@@ -583,29 +587,49 @@ class ArrowMixin:
 
         if isinstance(data, pa.Table):
             # For pyarrow tables, we can just serialize the table directly
-            proto.data = dataframe_util.convert_arrow_table_to_arrow_bytes(data)
+            arrow_table = data
         else:
-            # For all other data formats, we need to convert them to a pandas.DataFrame
-            # thereby, we also apply some data specific configs
-
             # Determine the input data format
             data_format = dataframe_util.determine_data_format(data)
 
-            if dataframe_util.is_pandas_styler(data):
-                # If pandas.Styler uuid is not provided, a hash of the position
-                # of the element will be used. This will cause a rerender of the table
-                # when the position of the element is changed.
-                delta_path = self.dg._get_delta_path_str()
-                default_uuid = str(hash(delta_path))
-                marshall_styler(proto, data, default_uuid)
-
-            # Convert the input data into a pandas.DataFrame
-            data_df = dataframe_util.convert_anything_to_pandas_df(
-                data, ensure_copy=False
+            # Some data formats can be converted to a pyarrow table directly,
+            # all others need to be converted to a pandas.DataFrame first.
+            direct_arrow_table = dataframe_util.convert_to_arrow_table_directly(
+                data, data_format
             )
+
+            if direct_arrow_table is not None:
+                arrow_table = direct_arrow_table
+            else:
+                if dataframe_util.is_pandas_styler(data):
+                    # If pandas.Styler uuid is not provided, a hash of the position
+                    # of the element will be used. This will cause a rerender of the
+                    # table when the position of the element is changed.
+                    delta_path = self.dg._get_delta_path_str()
+                    default_uuid = str(hash(delta_path))
+                    marshall_styler(proto, data, default_uuid)
+
+                # Convert the input data into a pandas.DataFrame
+                data_df = dataframe_util.convert_anything_to_pandas_df(
+                    data, ensure_copy=False
+                )
+                arrow_table = dataframe_util.convert_pandas_df_to_arrow_table(data_df)
+
+            # Apply some data specific configs
             apply_data_specific_configs(column_config_mapping, data_format)
+
+        # Selections refer to rows by their position in the data that the
+        # frontend has, and styled tables come with their display values, so
+        # only other tables can be paged.
+        if (
+            not is_selection_activated
+            and not dataframe_util.is_pandas_styler(data)
+            and _should_page_table(arrow_table)
+        ):
+            _marshall_paged_data(proto, arrow_table, self.dg._get_delta_path_str())
+        else:
             # Serialize the data to bytes:
-            proto.data = dataframe_util.convert_pandas_df_to_arrow_bytes(data_df)
+            proto.data = dataframe_util.convert_arrow_table_to_arrow_bytes(arrow_table)
 
         if hide_index is not None:
             update_column_config(
@@ -734,14 +758,28 @@ class ArrowMixin:
         return self.dg._enqueue("arrow_table", proto)
 
     @gather_metrics("add_rows")
-    def add_rows(self, data: Data = None, **kwargs) -> DeltaGenerator | None:
+    def add_rows(
+        self, data: Data = None, *, max_rows: int | None = None, **kwargs
+    ) -> DeltaGenerator | None:
         """Concatenate a dataframe to the bottom of the current one.
 
+        Dicts of columns (lists, tuples, 1D NumPy arrays, or PyArrow arrays),
+        PyArrow record batches, and PyArrow tables without a pandas index are
+        converted directly to Arrow, without pandas, once the element has
+        received rows. Only the new rows are sent to the browser.
+
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, pyspark.sql.DataFrame, snowflake.snowpark.dataframe.DataFrame, Iterable, dict, or None
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, pyarrow.RecordBatch, numpy.ndarray, pyspark.sql.DataFrame, snowflake.snowpark.dataframe.DataFrame, Iterable, dict, or None
             Table to concat. Optional.
 
+        max_rows : int or None
+            The maximum number of rows that the element keeps. If set, the
+            oldest rows are dropped in the browser once the element has more
+            rows, so that streaming data into an element for a long time
+            doesn't grow the memory used by the browser and the server. If
+            None (default), all rows are kept.
+
         **kwargs : pandas.DataFrame, numpy.ndarray, Iterable, dict, or None
             The named dataset to concat. Optional. You can only pass in 1
             dataset (including the one in the data parameter).
@@ -790,8 +828,22 @@ class ArrowMixin:
         ... )
         >>> my_chart.add_rows(some_fancy_name=df2)  # <-- name used as keyword
 
+        To stream data into a chart that only shows the latest rows, pass the
+        new rows as a dict of columns and set ``max_rows``:
+
+        >>> import time
+        >>>
+        >>> my_chart = st.line_chart({"a": [0.0], "b": [0.0]})
+        >>>
+        >>> for _ in range(100):
+        ...     my_chart.add_rows(
+        ...         {"a": np.random.randn(10), "b": np.random.randn(10)},
+        ...         max_rows=500,
+        ...     )
+        ...     time.sleep(0.1)
+
         """
-        return _arrow_add_rows(self.dg, data, **kwargs)
+        return _arrow_add_rows(self.dg, data, max_rows=max_rows, **kwargs)
 
     @property
     def dg(self) -> DeltaGenerator:
@@ -821,9 +873,138 @@ def _prep_data_for_add_rows(
     return prep_chart_data_for_add_rows(data, add_rows_metadata)
 
 
+@dataclass
+class _AddRowsSchema:
+    """The Arrow schema of the rows added to an element, which the rows of
+    later add_rows calls are cast to when they're converted without pandas.
+    """
+
+    schema: pa.Schema
+    # The pandas metadata of the schema. Its only index is a RangeIndex.
+    pandas_metadata: dict[str, Any]
+
+
+def _get_add_rows_schema(table: pa.Table) -> _AddRowsSchema | None:
+    """Return the schema of a table of added rows, or None if later rows can't
+    be converted to it without pandas, since the table's index isn't a
+    RangeIndex.
+    """
+    metadata = table.schema.metadata or {}
+    if b"pandas" not in metadata:
+        return None
+
+    pandas_metadata = json.loads(metadata[b"pandas"])
+    index_columns = pandas_metadata.get("index_columns", [])
+    if (
+        len(index_columns) != 1
+        or not isinstance(index_columns[0], dict)
+        or index_columns[0].get("kind") != "range"
+    ):
+        return None
+    return _AddRowsSchema(table.schema, pandas_metadata)
+
+
+def _convert_to_arrow_table_for_add_rows(data: Data) -> pa.Table | None:
+    """Convert record batches, tables without a pandas index, and dicts of
+    columns directly to a pyarrow.Table, or return None for other data, which
+    needs to be converted with pandas.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+
+    if isinstance(data, pa.Table):
+        # Tables converted from pandas may have an index.
+        return None if b"pandas" in (data.schema.metadata or {}) else data
+
+    if (
+        isinstance(data, dict)
+        and len(data) > 0
+        and all(
+            isinstance(column, (list, tuple, np.ndarray, pa.Array, pa.ChunkedArray))
+            for column in data.values()
+        )
+    ):
+        try:
+            return pa.table({str(name): column for name, column in data.items()})
+        except (pa.ArrowException, ValueError, TypeError):
+            # E.g. columns of different lengths or with mixed types, which
+            # pandas handles differently.
+            return None
+
+    return None
+
+
+def _cast_to_add_rows_schema(
+    table: pa.Table, add_rows_schema: _AddRowsSchema, index_start: int
+) -> pa.Table | None:
+    """Cast a table to the schema of the rows added before, with a RangeIndex
+    that starts at index_start, or return None if it can't be cast.
+    """
+    import pyarrow as pa
+
+    schema = add_rows_schema.schema
+    if table.column_names != schema.names:
+        return None
+
+    try:
+        table = table.cast(schema)
+    except (pa.ArrowException, ValueError, TypeError):
+        return None
+
+    range_index = add_rows_schema.pandas_metadata["index_columns"][0]
+    pandas_metadata = {
+        **add_rows_schema.pandas_metadata,
+        "index_columns": [
+            {
+                **range_index,
+                "start": index_start,
+                "stop": index_start + table.num_rows,
+                "step": 1,
+            }
+        ],
+    }
+    return table.replace_schema_metadata(
+        {**(schema.metadata or {}), b"pandas": json.dumps(pandas_metadata).encode()}
+    )
+
+
+def _prep_table_for_add_rows(
+    data: Data,
+    add_rows_metadata: AddRowsMetadata | None,
+    add_rows_schema: _AddRowsSchema,
+) -> tuple[pa.Table, AddRowsMetadata | None] | None:
+    """Prepare the data for add_rows without pandas, like
+    _prep_data_for_add_rows. Returns None if the data needs to be prepared
+    with pandas.
+    """
+    table = _convert_to_arrow_table_for_add_rows(data)
+    if table is None:
+        return None
+
+    index_start = 0
+    if add_rows_metadata:
+        from streamlit.elements.lib.built_in_chart_utils import (
+            prep_chart_table_for_add_rows,
+        )
+
+        prepared = prep_chart_table_for_add_rows(table, add_rows_metadata)
+        if prepared is None:
+            return None
+        table, index_start, add_rows_metadata = prepared
+
+    cast_table = _cast_to_add_rows_schema(table, add_rows_schema, index_start)
+    if cast_table is None:
+        return None
+    return cast_table, add_rows_metadata
+
+
 def _arrow_add_rows(
     dg: DeltaGenerator,
     data: Data = None,
+    max_rows: int | None = None,
     **kwargs: (
         DataFrame | npt.NDArray[Any] | Iterable[Any] | dict[Hashable, Any] | None
     ),
@@ -832,9 +1013,13 @@ def _arrow_add_rows(
 
     Parameters
     ----------
-    data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict, or None
+    data : pandas.DataFrame, pandas.Styler, pyarrow.RecordBatch, numpy.ndarray, Iterable, dict, or None
         Table to concat. Optional.
 
+    max_rows : int or None
+        The maximum number of rows that the element keeps. If None, all rows
+        are kept.
+
     **kwargs : pandas.DataFrame, numpy.ndarray, Iterable, dict, or None
         The named dataset to concat. Optional. You can only pass in 1
         dataset (including the one in the data parameter).
@@ -888,6 +1073,13 @@ def _arrow_add_rows(
     if not dg._cursor.is_locked:
         raise StreamlitAPIException("Only existing elements can `add_rows`.")
 
+    if max_rows is not None and (
+        not isinstance(max_rows, int) or isinstance(max_rows, bool) or max_rows < 1
+    ):
+        raise StreamlitAPIException(
+            f"`max_rows` must be a positive integer or None, not {max_rows!r}."
+        )
+
     # Accept syntax st._arrow_add_rows(df).
     if data is not None and len(kwargs) == 0:
         name = ""
@@ -913,10 +1105,29 @@ def _arrow_add_rows(
         st_method(data, **kwargs)
         return None
 
-    new_data, dg._cursor.props["add_rows_metadata"] = _prep_data_for_add_rows(
-        data,
-        dg._cursor.props["add_rows_metadata"],
+    add_rows_metadata = dg._cursor.props["add_rows_metadata"]
+    add_rows_schema: _AddRowsSchema | None = dg._cursor.props.get("add_rows_schema")
+
+    # Once rows were added, later rows that are already in a columnar format
+    # are cast to the schema of these rows instead of being converted with
+    # pandas.
+    prepared = (
+        _prep_table_for_add_rows(data, add_rows_metadata, add_rows_schema)
+        if add_rows_schema is not None
+        else None
     )
+    new_data: Data
+    if prepared is not None:
+        new_data, dg._cursor.props["add_rows_metadata"] = prepared
+    else:
+        new_data, dg._cursor.props["add_rows_metadata"] = _prep_data_for_add_rows(
+            data, add_rows_metadata
+        )
+        if not dataframe_util.is_pandas_styler(new_data):
+            new_data = dataframe_util.convert_pandas_df_to_arrow_table(
+                cast("DataFrame", new_data)
+            )
+            dg._cursor.props["add_rows_schema"] = _get_add_rows_schema(new_data)
 
     msg = ForwardMsg()
     msg.metadata.delta_path[:] = dg._cursor.delta_path
@@ -928,6 +1139,21 @@ def _arrow_add_rows(
         msg.delta.arrow_add_rows.name = name
         msg.delta.arrow_add_rows.has_name = True
 
+    if max_rows is not None:
+        # Melted charts have a row per y column for each added row. The
+        # melted rows are ordered by the row they come from, so the last
+        # max_rows * num_y_columns rows hold the last max_rows rows of every
+        # y column.
+        columns = (
+            dg._cursor.props["add_rows_metadata"].columns
+            if dg._cursor.props["add_rows_metadata"]
+            else None
+        )
+        num_y_columns = len(columns["y_column_list"]) if columns else 1
+        msg.delta.arrow_add_rows.max_rows = min(
+            max_rows * max(1, num_y_columns), _MAX_UINT32
+        )
+
     enqueue_message(msg)
 
     return dg
@@ -960,3 +1186,34 @@ def marshall(proto: ArrowProto, data: Data, default_uuid: str | None = None) ->
         marshall_styler(proto, data, default_uuid)
 
     proto.data = dataframe_util.convert_anything_to_arrow_bytes(data)
+
+
+def _should_page_table(table: pa.Table) -> bool:
+    """True if the table has more rows than server.dataframePagingRowThreshold,
+    and is shown in an app that is served by a runtime.
+    """
+    from streamlit import config, runtime
+
+    threshold = config.get_option("server.dataframePagingRowThreshold")
+    return threshold > 0 and table.num_rows > threshold and runtime.exists()
+
+
+def _marshall_paged_data(proto: ArrowProto, table: pa.Table, coordinates: str) -> None:
+    """Store the table in the DataframePageManager, and marshall its first page
+    and the URL of its other pages into the Arrow proto.
+    """
+    from streamlit import runtime
+    from streamlit.runtime.dataframe_page_manager import (
+        DATAFRAME_PAGE_ENDPOINT,
+        PAGE_ROWS,
+    )
+
+    page_mgr = runtime.get_instance().dataframe_page_mgr
+    table_id = page_mgr.add(table, coordinates)
+    first_page = page_mgr.get_rows(table_id, 0, PAGE_ROWS)
+    assert first_page is not None, "The table was added to the page manager."
+
+    proto.data = dataframe_util.convert_arrow_table_to_arrow_bytes(first_page)
+    proto.paged_data.url = f"/{DATAFRAME_PAGE_ENDPOINT}/{table_id}"
+    proto.paged_data.num_rows = table.num_rows
+    proto.paged_data.page_rows = PAGE_ROWS
@@ -17,7 +17,7 @@
 from __future__ import annotations
 
 from collections.abc import Collection, Hashable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
 from enum import Enum
 from typing import (
@@ -44,6 +44,7 @@ from streamlit.errors import Error, StreamlitAPIException
 if TYPE_CHECKING:
     import altair as alt
     import pandas as pd
+    import pyarrow as pa
 
     from streamlit.dataframe_util import Data
 
@@ -326,6 +327,101 @@ def prep_chart_data_for_add_rows(
     return out_data, add_rows_metadata
 
 
+def prep_chart_table_for_add_rows(
+    table: pa.Table,
+    add_rows_metadata: AddRowsMetadata,
+) -> tuple[pa.Table, int, AddRowsMetadata] | None:
+    """Prepares an Arrow table for add_rows on our built-in charts, like
+    prep_chart_data_for_add_rows, but without converting it to pandas.
+
+    Returns the prepared table, the start of its RangeIndex, and the updated
+    metadata, or None if the table can only be prepared with pandas (e.g.
+    because the y columns have different types and need to be converted to
+    strings when they're melted).
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    last_index = add_rows_metadata.last_index
+    if not isinstance(last_index, (int, np.integer)) or isinstance(last_index, bool):
+        return None
+
+    columns = add_rows_metadata.columns
+    x_column = None if columns["x_column"] is None else str(columns["x_column"])
+    y_column_list = [str(c) for c in columns["y_column_list"]]
+    color_column = (
+        None if columns["color_column"] is None else str(columns["color_column"])
+    )
+    size_column = (
+        None if columns["size_column"] is None else str(columns["size_column"])
+    )
+
+    num_rows = table.num_rows
+    index_start = int(last_index) + 1
+    updated_metadata = replace(add_rows_metadata, last_index=index_start + num_rows - 1)
+
+    # If y is provided, but x is not, we use the index as x.
+    if x_column is None and len(y_column_list) > 0:
+        x_column = _SEPARATED_INDEX_COLUMN_NAME
+        table = table.append_column(
+            x_column,
+            pa.array(np.arange(index_start, index_start + num_rows), pa.int64()),
+        )
+        index_start = 0
+
+    selected_columns = list(
+        dict.fromkeys(
+            c
+            for c in (x_column, color_column, size_column, *y_column_list)
+            if c is not None
+        )
+    )
+    if any(c not in table.column_names for c in selected_columns):
+        return None
+    table = table.select(selected_columns)
+
+    if color_column is not None and pa.types.is_nested(table.column(color_column).type):
+        # Color tuples need to be converted to CSS colors.
+        return None
+
+    if len(y_column_list) > 1 and x_column is not None:
+        y_columns = [table.column(y) for y in y_column_list]
+        if len({column.type for column in y_columns}) > 1:
+            return None
+
+        # Melt the table from wide format into long format, ordered by row
+        # like _melt_data.
+        num_y_columns = len(y_column_list)
+        columns_to_leave_alone = [x_column]
+        if size_column:
+            columns_to_leave_alone.append(size_column)
+
+        melted_columns: dict[str, pa.ChunkedArray | pa.Array] = {
+            name: pc.take(
+                table.column(name), np.repeat(np.arange(num_rows), num_y_columns)
+            )
+            for name in columns_to_leave_alone
+        }
+        melted_columns[_MELTED_COLOR_COLUMN_NAME] = pc.take(
+            pa.array(y_column_list, pa.string()),
+            np.tile(np.arange(num_y_columns), num_rows),
+        )
+        melted_columns[_MELTED_Y_COLUMN_NAME] = pc.take(
+            pa.chunked_array(
+                [chunk for column in y_columns for chunk in column.chunks],
+                y_columns[0].type,
+            ),
+            np.arange(num_rows * num_y_columns)
+            .reshape(num_y_columns, num_rows)
+            .T.reshape(-1),
+        )
+        table = pa.table(melted_columns)
+        index_start = 0
+
+    return table, index_start, updated_metadata
+
+
 def _infer_vegalite_type(
     data: pd.Series[Any],
 ) -> VegaLiteType:
@@ -482,6 +578,11 @@ def _melt_data(
     You can find more info about melting on the Pandas documentation:
     https://pandas.pydata.org/docs/reference/api/pandas.melt.html
 
+    Unlike pandas.melt, the rows of the melted dataframe are ordered by the
+    row they come from, so that each row of the wide-format dataframe is a
+    contiguous block of rows of the melted dataframe. This lets add_rows
+    with max_rows keep the same number of rows of every melted column.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -515,11 +616,12 @@ def _melt_data(
     >>> _melt_data(df, ["a"], ["b", "c"], "value", "color")
     >>>    a color  value
     >>> 0  1        b      4
-    >>> 1  2        b      5
-    >>> 2  3        b      6
+    >>> 1  1        c      7
+    >>> 2  2        b      5
     >>> ...
 
     """
+    import numpy as np
     import pandas as pd
     from pandas.api.types import infer_dtype
 
@@ -531,6 +633,13 @@ def _melt_data(
         value_name=new_y_column_name,
     )
 
+    # pandas.melt appends the melted columns one after another. Interleave
+    # them, so that the melted dataframe is ordered by row.
+    num_rows = len(df)
+    if num_rows > 0 and len(melted_df) > num_rows:
+        row_major_order = np.arange(len(melted_df)).reshape(-1, num_rows).T.reshape(-1)
+        melted_df = melted_df.take(row_major_order).reset_index(drop=True)
+
     y_series = melted_df[new_y_column_name]
     if (
         y_series.dtype == "object"
@@ -496,6 +496,7 @@ def apply_data_specific_configs(
         DataFormat.LIST_OF_ROWS,
         DataFormat.COLUMN_VALUE_MAPPING,
         # Dataframe-like objects that don't have an index:
+        DataFormat.DUCKDB_RELATION,
         DataFormat.PANDAS_ARRAY,
         DataFormat.PANDAS_INDEX,
         DataFormat.POLARS_DATAFRAME,
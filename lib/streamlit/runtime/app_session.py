@@ -37,12 +37,13 @@ from streamlit.proto.NewSession_pb2 import (
     NewSession,
     UserInfo,
 )
-from streamlit.runtime import caching
+from streamlit.runtime import caching, worker_shard
 from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
 from streamlit.runtime.fragment import FragmentStorage, MemoryFragmentStorage
 from streamlit.runtime.metrics_util import Installation
 from streamlit.runtime.pages_manager import PagesManager
 from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
 from streamlit.runtime.secrets import secrets_singleton
 from streamlit.string_util import to_snake_case
 from streamlit.version import STREAMLIT_VERSION_STRING
@@ -51,6 +52,7 @@ from streamlit.watcher import LocalSourcesWatcher
 if TYPE_CHECKING:
     from streamlit.proto.BackMsg_pb2 import BackMsg
     from streamlit.runtime.script_data import ScriptData
+    from streamlit.runtime.script_run_admission import ScriptRunAdmissionController
     from streamlit.runtime.scriptrunner.script_cache import ScriptCache
     from streamlit.runtime.state import SessionState
     from streamlit.runtime.uploaded_file_manager import UploadedFileManager
@@ -70,6 +72,19 @@ def _generate_scriptrun_id() -> str:
     return str(uuid.uuid4())
 
 
+def _generate_session_id() -> str:
+    """Randomly generate a unique ID for a session.
+
+    If we're one of several worker processes, the ID is one that the server
+    routes to this process, so that the session's reconnects and file
+    uploads reach us.
+    """
+    while True:
+        session_id = str(uuid.uuid4())
+        if worker_shard.is_local_key(session_id):
+            return session_id
+
+
 class AppSession:
     """
     Contains session data for a single "user" of an active app
@@ -127,7 +142,7 @@ class AppSession:
         """
 
         # Each AppSession has a unique string ID.
-        self.id = session_id_override or str(uuid.uuid4())
+        self.id = session_id_override or _generate_session_id()
 
         self._event_loop = asyncio.get_running_loop()
         self._script_data = script_data
@@ -140,7 +155,9 @@ class AppSession:
         # The browser queue contains messages that haven't yet been
         # delivered to the browser. Periodically, the server flushes
         # this queue and delivers its contents to the browser.
-        self._browser_queue = ForwardMsgQueue()
+        self._browser_queue = ForwardMsgQueue(
+            max_bytes=int(config.get_option("server.maxSessionQueueSize") * 1e6)
+        )
         self._message_enqueued_callback = message_enqueued_callback
 
         self._state = AppSessionState.APP_NOT_RUNNING
@@ -159,6 +176,10 @@ class AppSession:
         self._run_on_save = config.get_option("server.runOnSave")
 
         self._scriptrunner: ScriptRunner | None = None
+        # The run we'll start once the Runtime admits us, if we're waiting for
+        # one of its limited script run slots. Reruns requested while waiting
+        # are coalesced into it.
+        self._pending_script_requests: ScriptRequests | None = None
 
         # This needs to be lazily imported to avoid a dependency cycle.
         from streamlit.runtime.state import SessionState
@@ -231,6 +252,12 @@ class AppSession:
         """
         return self._browser_queue.flush()
 
+    def get_browser_queue_bytes(self) -> int:
+        """Return the size of the messages waiting to be delivered to the
+        browser, in bytes.
+        """
+        return self._browser_queue.get_queued_bytes()
+
     def shutdown(self) -> None:
         """Shut down the AppSession.
 
@@ -247,11 +274,14 @@ class AppSession:
                 rt = runtime.get_instance()
                 rt.media_file_mgr.clear_session_refs(self.id)
                 rt.media_file_mgr.remove_orphaned_files()
+                rt.dataframe_page_mgr.clear_session_refs(self.id)
+                rt.dataframe_page_mgr.remove_orphaned_tables()
 
             # Shut down the ScriptRunner, if one is active.
             # self._state must not be set to SHUTDOWN_REQUESTED until
             # *after* this is called.
             self.request_script_stop()
+            self._cancel_pending_script_run()
 
             self._state = AppSessionState.SHUTDOWN_REQUESTED
 
@@ -415,21 +445,82 @@ class AppSession:
 
         # If we are here, then either we have no ScriptRunner, or our
         # current ScriptRunner is shutting down and cannot handle a rerun
-        # request - so we'll create and start a new ScriptRunner.
-        self._create_scriptrunner(rerun_data)
+        # request - so we'll create and start a new ScriptRunner, as soon as
+        # the Runtime lets us.
+        self._request_script_run(rerun_data)
 
     def request_script_stop(self) -> None:
         """Request that the scriptrunner stop execution.
 
-        Does nothing if no scriptrunner exists.
+        Also drops a script run that's waiting to be admitted. Does nothing
+        if no scriptrunner exists and no script run is waiting.
         """
         if self._scriptrunner is not None:
             self._scriptrunner.request_stop()
 
+        if self._pending_script_requests is not None:
+            self._cancel_pending_script_run()
+            self._enqueue_forward_msg(self._create_session_status_changed_message())
+
     def clear_user_info(self) -> None:
         """Clear the user info for this session."""
         self._user_info.clear()
 
+    def _get_script_run_admission(self) -> ScriptRunAdmissionController | None:
+        if not runtime.exists():
+            return None
+        return runtime.get_instance().script_run_admission
+
+    def _request_script_run(self, rerun_data: RerunData) -> None:
+        """Start a new ScriptRunner with the given RerunData if the Runtime
+        admits us. Otherwise, queue the run until it does, and let the
+        frontend know that we're waiting.
+        """
+        if self._pending_script_requests is not None:
+            # We're already waiting: fold this request into our queued run.
+            self._pending_script_requests.request_rerun(rerun_data)
+            return
+
+        admission = self._get_script_run_admission()
+        if admission is None or admission.request_admission(
+            self.id, self._on_script_run_admitted
+        ):
+            self._create_scriptrunner(rerun_data)
+            return
+
+        self._pending_script_requests = ScriptRequests()
+        self._pending_script_requests.request_rerun(rerun_data)
+        self._enqueue_forward_msg(self._create_session_status_changed_message())
+
+    def _on_script_run_admitted(self) -> None:
+        """Called by the Runtime's ScriptRunAdmissionController once our queued
+        script run may start.
+        """
+        pending_script_requests = self._pending_script_requests
+        self._pending_script_requests = None
+
+        if (
+            pending_script_requests is None
+            or self._state == AppSessionState.SHUTDOWN_REQUESTED
+        ):
+            # Our queued run was dropped in the meantime.
+            self._release_script_run_slot()
+            return
+
+        request = pending_script_requests.on_scriptrunner_ready()
+        self._create_scriptrunner(request.rerun_data)
+
+    def _cancel_pending_script_run(self) -> None:
+        self._pending_script_requests = None
+        admission = self._get_script_run_admission()
+        if admission is not None:
+            admission.cancel(self.id)
+
+    def _release_script_run_slot(self) -> None:
+        admission = self._get_script_run_admission()
+        if admission is not None:
+            admission.release(self.id)
+
     def _create_scriptrunner(self, initial_rerun_data: RerunData) -> None:
         """Create and run a new ScriptRunner with the given RerunData."""
         self._scriptrunner = ScriptRunner(
@@ -442,6 +533,7 @@ class AppSession:
             user_info=self._user_info,
             fragment_storage=self._fragment_storage,
             pages_manager=self._pages_manager,
+            browser_queue=self._browser_queue,
         )
         self._scriptrunner.on_event.connect(self._on_scriptrunner_event)
         self._scriptrunner.start()
@@ -672,9 +764,12 @@ class AppSession:
                 # Only clear media files if the script is done running AND the
                 # session is actually shutting down.
                 runtime.get_instance().media_file_mgr.clear_session_refs(self.id)
+                runtime.get_instance().dataframe_page_mgr.clear_session_refs(self.id)
 
             self._client_state = client_state
             self._scriptrunner = None
+            # Let the next waiting session, if any, start its script.
+            self._release_script_run_slot()
 
         elif event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
             assert forward_msg is not None, (
@@ -695,6 +790,9 @@ class AppSession:
         msg.session_status_changed.script_is_running = (
             self._state == AppSessionState.APP_IS_RUNNING
         )
+        msg.session_status_changed.script_is_waiting = (
+            self._pending_script_requests is not None
+        )
         return msg
 
     def _create_file_change_message(self) -> ForwardMsg:
@@ -16,7 +16,11 @@
 
 from __future__ import annotations
 
+import bisect
+import dataclasses
+import math
 import pickle
+import re
 import threading
 import types
 from typing import (
@@ -34,10 +38,12 @@ from typing import (
 from typing_extensions import TypeAlias
 
 import streamlit as st
-from streamlit import runtime
+from streamlit import dataframe_util, runtime, type_util
 from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
+from streamlit.runtime.caching import cache_serializers, cache_utils
 from streamlit.runtime.caching.cache_errors import CacheError, CacheKeyNotFoundError
+from streamlit.runtime.caching.cache_memory import SizedTTLCache, max_size_to_bytes
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.caching.cache_utils import (
     Cache,
@@ -63,8 +69,20 @@ from streamlit.runtime.caching.storage.cache_storage_protocol import (
 from streamlit.runtime.caching.storage.dummy_cache_storage import (
     MemoryCacheStorageManager,
 )
+from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
+    InMemoryCacheStorageWrapper,
+)
 from streamlit.runtime.metrics_util import gather_metrics
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    CounterStat,
+    CounterStatsProvider,
+    HistogramStat,
+    group_counter_stats,
+    group_histogram_stats,
+    group_stats,
+)
 from streamlit.time_util import time_to_seconds
 
 if TYPE_CHECKING:
@@ -79,6 +97,15 @@ CACHE_DATA_MESSAGE_REPLAY_CTX = CachedMessageReplayContext(CacheType.DATA)
 # The cache persistence options we support: "disk" or None
 CachePersistType: TypeAlias = Union[Literal["disk"], None]
 
+# The ways cache hits can return the cached value: "always" or "on_write"
+CacheCopyType: TypeAlias = Literal["always", "on_write"]
+
+# The ways expired values can be refreshed: "background" or None
+CacheRefreshType: TypeAlias = Union[Literal["background"], None]
+
+# The upper bounds of the buckets of the cache_staleness_seconds histogram.
+STALENESS_SECONDS_BUCKETS: Final = (1.0, 10.0, 60.0, 300.0, 900.0, 3600.0, 86400.0)
+
 
 class CachedDataFuncInfo(CachedFuncInfo):
     """Implements the CachedFuncInfo interface for @st.cache_data"""
@@ -91,6 +118,9 @@ class CachedDataFuncInfo(CachedFuncInfo):
         max_entries: int | None,
         ttl: float | timedelta | str | None,
         hash_funcs: HashFuncsDict | None = None,
+        copy: CacheCopyType = "always",
+        max_size: int | None = None,
+        refresh: CacheRefreshType = None,
     ):
         super().__init__(
             func,
@@ -99,7 +129,10 @@ class CachedDataFuncInfo(CachedFuncInfo):
         )
         self.persist = persist
         self.max_entries = max_entries
+        self.max_size = max_size
         self.ttl = ttl
+        self.copy = copy
+        self.refresh = refresh
 
         self.validate_params()
 
@@ -123,6 +156,9 @@ class CachedDataFuncInfo(CachedFuncInfo):
             max_entries=self.max_entries,
             ttl=self.ttl,
             display_name=self.display_name,
+            copy=self.copy,
+            max_size=self.max_size,
+            refresh=self.refresh,
         )
 
     def validate_params(self) -> None:
@@ -137,6 +173,8 @@ class CachedDataFuncInfo(CachedFuncInfo):
             persist=self.persist,
             max_entries=self.max_entries,
             ttl=self.ttl,
+            max_size=self.max_size,
+            refresh=self.refresh,
         )
 
 
@@ -154,6 +192,9 @@ class DataCaches(CacheStatsProvider):
         max_entries: int | None,
         ttl: int | float | timedelta | str | None,
         display_name: str,
+        copy: CacheCopyType = "always",
+        max_size: int | None = None,
+        refresh: CacheRefreshType = None,
     ) -> DataCache:
         """Return the mem cache for the given key.
 
@@ -170,7 +211,10 @@ class DataCaches(CacheStatsProvider):
                 cache is not None
                 and cache.ttl_seconds == ttl_seconds
                 and cache.max_entries == max_entries
+                and cache.max_size == max_size
                 and cache.persist == persist
+                and cache.copy == copy
+                and cache.refresh == refresh
             ):
                 return cache
 
@@ -199,9 +243,10 @@ class DataCaches(CacheStatsProvider):
             cache_context = self.create_cache_storage_context(
                 function_key=key,
                 function_name=display_name,
-                ttl_seconds=ttl_seconds,
+                ttl_seconds=_get_storage_ttl_seconds(ttl_seconds, refresh),
                 max_entries=max_entries,
                 persist=persist,
+                max_size=max_size,
             )
             cache_storage_manager = self.get_storage_manager()
             storage = cache_storage_manager.create(cache_context)
@@ -213,6 +258,9 @@ class DataCaches(CacheStatsProvider):
                 max_entries=max_entries,
                 ttl_seconds=ttl_seconds,
                 display_name=display_name,
+                copy=copy,
+                max_size=max_size,
+                refresh=refresh,
             )
             self._function_caches[key] = cache
             return cache
@@ -243,12 +291,32 @@ class DataCaches(CacheStatsProvider):
             stats.extend(cache.get_stats())
         return group_stats(stats)
 
+    def get_counter_stats(self) -> list[CounterStat]:
+        with self._caches_lock:
+            function_caches = self._function_caches.copy()
+
+        stats: list[CounterStat] = []
+        for cache in function_caches.values():
+            stats.extend(cache.get_counter_stats())
+        return group_counter_stats(stats)
+
+    def get_histogram_stats(self) -> list[HistogramStat]:
+        with self._caches_lock:
+            function_caches = self._function_caches.copy()
+
+        stats: list[HistogramStat] = []
+        for cache in function_caches.values():
+            stats.extend(cache.get_histogram_stats())
+        return group_histogram_stats(stats)
+
     def validate_cache_params(
         self,
         function_name: str,
         persist: CachePersistType,
         max_entries: int | None,
         ttl: int | float | timedelta | str | None,
+        max_size: int | None = None,
+        refresh: CacheRefreshType = None,
     ) -> None:
         """Validate that the cache params are valid for given storage.
 
@@ -264,9 +332,10 @@ class DataCaches(CacheStatsProvider):
         cache_context = self.create_cache_storage_context(
             function_key="DUMMY_KEY",
             function_name=function_name,
-            ttl_seconds=ttl_seconds,
+            ttl_seconds=_get_storage_ttl_seconds(ttl_seconds, refresh),
             max_entries=max_entries,
             persist=persist,
+            max_size=max_size,
         )
         try:
             self.get_storage_manager().check_context(cache_context)
@@ -286,12 +355,14 @@ class DataCaches(CacheStatsProvider):
         persist: CachePersistType,
         ttl_seconds: float | None,
         max_entries: int | None,
+        max_size: int | None = None,
     ) -> CacheStorageContext:
         return CacheStorageContext(
             function_key=function_key,
             function_display_name=function_name,
             ttl_seconds=ttl_seconds,
             max_entries=max_entries,
+            max_size=max_size,
             persist=persist,
         )
 
@@ -305,6 +376,16 @@ class DataCaches(CacheStatsProvider):
             return MemoryCacheStorageManager()
 
 
+def _get_storage_ttl_seconds(
+    ttl_seconds: float | None, refresh: CacheRefreshType
+) -> float | None:
+    """Return how long a cache's storage should keep its entries. With
+    refresh="background", expired entries are kept, so that they can be
+    returned while they're recomputed.
+    """
+    return None if refresh == "background" else ttl_seconds
+
+
 # Singleton DataCaches instance
 _data_caches = DataCaches()
 
@@ -353,6 +434,9 @@ class CacheDataAPI:
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        copy: CacheCopyType = "always",
+        max_size: int | str | None = None,
+        refresh: CacheRefreshType = None,
     ) -> Callable[[F], F]: ...
 
     def __call__(
@@ -365,6 +449,9 @@ class CacheDataAPI:
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        copy: CacheCopyType = "always",
+        max_size: int | str | None = None,
+        refresh: CacheRefreshType = None,
     ):
         return self._decorator(
             func,
@@ -374,6 +461,9 @@ class CacheDataAPI:
             show_spinner=show_spinner,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            copy=copy,
+            max_size=max_size,
+            refresh=refresh,
         )
 
     def _decorator(
@@ -386,12 +476,16 @@ class CacheDataAPI:
         persist: CachePersistType | bool,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        copy: CacheCopyType = "always",
+        max_size: int | str | None = None,
+        refresh: CacheRefreshType = None,
     ):
         """Decorator to cache functions that return data (e.g. dataframe transforms, database queries, ML inference).
 
         Cached objects are stored in "pickled" form, which means that the return
         value of a cached function must be pickleable. Each caller of the cached
-        function gets its own copy of the cached data.
+        function gets its own copy of the cached data, unless ``copy="on_write"``
+        is set.
 
         You can clear a function's cache with ``func.clear()`` or clear the entire
         cache with ``st.cache_data.clear()``.
@@ -403,6 +497,11 @@ class CacheDataAPI:
         arguments match a previous function call. Alternatively, you can
         declare custom hashing functions with ``hash_funcs``.
 
+        If the function is a coroutine function (``async def``), calling the
+        decorated function returns a coroutine, and its awaited result is
+        cached. Concurrent calls with the same arguments, e.g. from several
+        sessions, wait for a single call of the function to finish.
+
         To cache global resources, use ``st.cache_resource`` instead. Learn more
         about caching at https://docs.streamlit.io/develop/concepts/architecture/caching.
 
@@ -423,8 +522,6 @@ class CacheDataAPI:
               <https://docs.python.org/3/library/datetime.html#timedelta-objects>`_,
               e.g. ``timedelta(days=1)``.
 
-            Note that ``ttl`` will be ignored if ``persist="disk"`` or ``persist=True``.
-
         max_entries : int or None
             The maximum number of entries to keep in the cache, or None
             for an unbounded cache. When a new entry is added to a full cache,
@@ -438,7 +535,10 @@ class CacheDataAPI:
         persist : "disk", bool, or None
             Optional location to persist cached data to. Passing "disk" (or True)
             will persist the cached data to the local disk. None (or False) will disable
-            persistence. The default is None.
+            persistence. The default is None. Persisted entries expire and are
+            evicted according to ``ttl`` and ``max_entries``, like entries in
+            memory, and the total size of all persisted entries can be limited
+            with the ``global.maxDiskCacheBytes`` config option.
 
         experimental_allow_widgets : bool
             Allow widgets to be used in the cached function. Defaults to False.
@@ -451,6 +551,57 @@ class CacheDataAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        copy : "always" or "on_write"
+            How a cache hit returns the cached value. With ``"always"`` (default),
+            every call unpickles its own copy of the value, which the caller can
+            modify freely.
+
+            With ``"on_write"``, Streamlit keeps the unpickled value in memory,
+            and returns a cheap handle to it that can't be used to modify it,
+            if the value's type supports one:
+
+            - NumPy arrays are returned as read-only views.
+            - pandas DataFrames and Series are returned as shallow copies if
+              pandas' Copy-on-Write mode is enabled, so that modifying them
+              copies the affected data.
+            - Polars DataFrames and Series are returned as clones.
+            - PyArrow tables and arrays, strings, bytes, and numbers are
+              returned as they are.
+
+            Values of any other type are copied as with ``"always"``. This saves
+            unpickling, and holding a copy of, large values on every rerun.
+
+        max_size : int, str, or None
+            The maximum total size of the entries to keep in memory, or None
+            for no limit (default). This can be a number of bytes, or a string
+            like ``"500MB"`` or ``"2GB"``. An entry's size is the size of its
+            pickled value. When a new entry would exceed the limit, the least
+            recently used entries are removed from memory, and entries larger
+            than the limit aren't kept in memory at all. With
+            ``persist="disk"``, entries removed from memory remain on disk.
+
+            The memory that the caches of all functions use together can also
+            be limited with the ``global.maxCacheDataBytes`` config option.
+
+        refresh : "background" or None
+            How to refresh entries once they're older than ``ttl``. With
+            ``None`` (default), expired entries are removed, and the next call
+            recomputes its value while the caller waits.
+
+            With ``"background"``, a call that finds an expired entry returns
+            it right away, and the value is recomputed on a background thread.
+            Each value is recomputed once at a time, and replaces the expired
+            entry when it's done. If recomputing the value fails, the expired
+            entry is kept, and is recomputed again on the next call. Expired
+            entries are only removed when they're replaced, evicted because of
+            ``max_entries`` or ``max_size``, or cleared. This requires ``ttl``
+            to be set.
+
+            The function is recomputed with the arguments of the call that
+            found the expired entry, outside of any script run: it can't use
+            Session State, and the elements it adds are only replayed by
+            later calls.
+
         .. deprecated::
             The cached widget replay functionality was removed in 1.38. Please
             remove the ``experimental_allow_widgets`` parameter from your
@@ -561,6 +712,24 @@ class CacheDataAPI:
                 f"Unsupported persist option '{persist}'. Valid values are 'disk' or None."
             )
 
+        if copy not in ("always", "on_write"):
+            raise StreamlitAPIException(
+                f"Unsupported copy option '{copy}'. Valid values are 'always' or 'on_write'."
+            )
+
+        if refresh not in (None, "background"):
+            raise StreamlitAPIException(
+                f"Unsupported refresh option '{refresh}'. Valid values are 'background' or None."
+            )
+
+        if refresh == "background" and ttl is None:
+            raise StreamlitAPIException(
+                "`refresh='background'` refreshes entries once they're older "
+                "than `ttl`, so it requires `ttl` to be set."
+            )
+
+        max_size_bytes = max_size_to_bytes(max_size)
+
         if experimental_allow_widgets:
             show_widget_replay_deprecation("cache_data")
 
@@ -573,6 +742,9 @@ class CacheDataAPI:
                     max_entries=max_entries,
                     ttl=ttl,
                     hash_funcs=hash_funcs,
+                    copy=copy,
+                    max_size=max_size_bytes,
+                    refresh=refresh,
                 )
             )
 
@@ -587,6 +759,9 @@ class CacheDataAPI:
                 max_entries=max_entries,
                 ttl=ttl,
                 hash_funcs=hash_funcs,
+                copy=copy,
+                max_size=max_size_bytes,
+                refresh=refresh,
             )
         )
 
@@ -607,6 +782,9 @@ class DataCache(Cache):
         max_entries: int | None,
         ttl_seconds: float | None,
         display_name: str,
+        copy: CacheCopyType = "always",
+        max_size: int | None = None,
+        refresh: CacheRefreshType = None,
     ):
         super().__init__()
         self.key = key
@@ -614,27 +792,168 @@ class DataCache(Cache):
         self.storage = storage
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
+        self.max_size = max_size
         self.persist = persist
+        self.copy = copy
+        self.refresh = refresh
+
+        # How stale the expired entries we returned were, past their TTL, and
+        # how many times we couldn't recompute them. Guarded by _stats_lock.
+        self._stats_lock = threading.Lock()
+        self._staleness_bucket_counts = [0] * (len(STALENESS_SECONDS_BUCKETS) + 1)
+        self._staleness_seconds_sum = 0.0
+        self._refresh_failures = 0
+
+        # With copy="on_write": key -> (the pickled entry in our storage, that
+        # entry unpickled, the entry's size). An unpickled entry is only used
+        # while the storage still holds the exact same pickled entry, so values
+        # that have expired or been evicted from the storage are never
+        # returned. Entries expire and are evicted from here like they are from
+        # the storage, so that we don't hold on to values that are no longer
+        # cached for long.
+        storage_ttl_seconds = _get_storage_ttl_seconds(ttl_seconds, refresh)
+        self._unpickled_entries: SizedTTLCache[str, tuple[bytes, CachedResult, int]] = (
+            SizedTTLCache(
+                maxsize=max_entries if max_entries is not None else math.inf,
+                ttl=storage_ttl_seconds
+                if storage_ttl_seconds is not None
+                else math.inf,
+                timer=cache_utils.TTLCACHE_TIMER,
+                max_bytes=max_size if max_size is not None else math.inf,
+                getsizeof=lambda unpickled: unpickled[2],
+            )
+        )
+        self._unpickled_entries_lock = threading.Lock()
+
+        if isinstance(storage, InMemoryCacheStorageWrapper):
+            storage.add_eviction_listener(self._forget_unpickled_entry)
 
     def get_stats(self) -> list[CacheStat]:
         if isinstance(self.storage, CacheStatsProvider):
             return self.storage.get_stats()
         return []
 
+    def get_counter_stats(self) -> list[CounterStat]:
+        stats: list[CounterStat] = []
+        if isinstance(self.storage, CounterStatsProvider):
+            stats.extend(self.storage.get_counter_stats())
+        if self.refresh == "background":
+            with self._stats_lock:
+                stats.append(
+                    CounterStat(
+                        family_name="cache_refresh_failures",
+                        category_name="st_cache_data",
+                        cache_name=self.display_name,
+                        value=self._refresh_failures,
+                    )
+                )
+        return stats
+
+    def get_histogram_stats(self) -> list[HistogramStat]:
+        """Return how stale the expired entries that were returned were, past
+        their TTL.
+        """
+        if self.refresh != "background":
+            return []
+
+        with self._stats_lock:
+            buckets: list[tuple[float, int]] = []
+            cumulative_count = 0
+            for upper_bound, count in zip(
+                (*STALENESS_SECONDS_BUCKETS, math.inf), self._staleness_bucket_counts
+            ):
+                cumulative_count += count
+                buckets.append((upper_bound, cumulative_count))
+
+            return [
+                HistogramStat(
+                    family_name="cache_staleness_seconds",
+                    category_name="st_cache_data",
+                    cache_name=self.display_name,
+                    buckets=buckets,
+                    sum=self._staleness_seconds_sum,
+                )
+            ]
+
+    def is_stale(self, result: CachedResult) -> bool:
+        if self.refresh != "background" or self.ttl_seconds is None:
+            return False
+        if result.computed_at is None:
+            # We don't know how old the result is, so refresh it.
+            return True
+        age = cache_utils.COMPUTED_AT_CLOCK() - result.computed_at
+        return age >= self.ttl_seconds
+
+    def record_stale_hit(self, result: CachedResult) -> None:
+        if result.computed_at is None or self.ttl_seconds is None:
+            return
+        age = cache_utils.COMPUTED_AT_CLOCK() - result.computed_at
+        staleness = max(age - self.ttl_seconds, 0.0)
+        with self._stats_lock:
+            self._staleness_bucket_counts[
+                bisect.bisect_left(STALENESS_SECONDS_BUCKETS, staleness)
+            ] += 1
+            self._staleness_seconds_sum += staleness
+
+    def record_refresh_failure(self) -> None:
+        with self._stats_lock:
+            self._refresh_failures += 1
+
     def read_result(self, key: str) -> CachedResult:
         """Read a value and messages from the cache. Raise `CacheKeyNotFoundError`
         if the value doesn't exist, and `CacheError` if the value exists but can't
         be unpickled.
         """
         try:
-            pickled_entry = self.storage.get(key)
+            pickled_entry, buffers = self.storage.get_with_buffers(key)
         except CacheStorageKeyNotFoundError as e:
+            self._forget_unpickled_entry(key)
             raise CacheKeyNotFoundError(str(e)) from e
         except CacheStorageError as e:
             raise CacheError(str(e)) from e
 
+        if self.copy == "on_write":
+            with self._unpickled_entries_lock:
+                unpickled = self._unpickled_entries.get(key)
+            if unpickled is not None and unpickled[0] is pickled_entry:
+                unpickled_entry: CachedResult = unpickled[1]
+                return dataclasses.replace(
+                    unpickled_entry, value=_share_value(unpickled_entry.value)
+                )
+
+        # Values that callers share (with copy="on_write") can use the storage's
+        # buffers as they are. Otherwise, each caller gets its own copy.
+        entry = self._unpickle(
+            key, pickled_entry, buffers, copy_buffers=self.copy != "on_write"
+        )
+
+        if self.copy == "on_write":
+            shared_value = _share_value(entry.value)
+            if shared_value is not _NOT_SHAREABLE:
+                size = len(pickled_entry) + sum(b.nbytes for b in buffers)
+                with self._unpickled_entries_lock:
+                    self._unpickled_entries[key] = (pickled_entry, entry, size)
+                return dataclasses.replace(entry, value=shared_value)
+
+            if buffers:
+                # The value is handed out as it is, so it can't use the
+                # storage's buffers.
+                entry = self._unpickle(key, pickled_entry, buffers, copy_buffers=True)
+
+        return entry
+
+    def _unpickle(
+        self,
+        key: str,
+        pickled_entry: bytes,
+        buffers: list[memoryview],
+        copy_buffers: bool,
+    ) -> CachedResult:
         try:
-            entry = pickle.loads(pickled_entry)
+            entry = pickle.loads(
+                pickled_entry,
+                buffers=[bytearray(b) for b in buffers] if copy_buffers else buffers,
+            )
             if not isinstance(entry, CachedResult):
                 # Loaded an old cache file format, remove it and let the caller
                 # rerun the function.
@@ -652,14 +971,111 @@ class DataCache(Cache):
         try:
             main_id = st._main.id
             sidebar_id = st.sidebar.id
-            entry = CachedResult(value, messages, main_id, sidebar_id)
-            pickled_entry = pickle.dumps(entry)
+            entry = CachedResult(
+                cache_serializers.prepare_value_for_pickle(
+                    value, compress=self.persist == "disk"
+                ),
+                messages,
+                main_id,
+                sidebar_id,
+                computed_at=cache_utils.COMPUTED_AT_CLOCK(),
+            )
+            # Large buffers, like the data of NumPy arrays, are pickled
+            # out-of-band, so that they aren't copied into the pickled entry,
+            # and can be used without copying them out again.
+            pickle_buffers: list[pickle.PickleBuffer] = []
+            pickled_entry = pickle.dumps(
+                entry, protocol=5, buffer_callback=pickle_buffers.append
+            )
         except (pickle.PicklingError, TypeError) as exc:
             raise CacheError(f"Failed to pickle {key}") from exc
+
+        if pickle_buffers:
+            try:
+                # Copy the buffers, since the caller may go on to modify the
+                # value they belong to.
+                buffers = [
+                    memoryview(buffer.raw().tobytes()) for buffer in pickle_buffers
+                ]
+                self.storage.set_with_buffers(key, pickled_entry, buffers)
+                return
+            except (BufferError, NotImplementedError):
+                # The buffers aren't contiguous, or the storage doesn't support
+                # out-of-band buffers: pickle the entry in one piece instead.
+                pickled_entry = pickle.dumps(entry, protocol=5)
+
         self.storage.set(key, pickled_entry)
 
+    def _forget_unpickled_entry(self, key: str) -> None:
+        with self._unpickled_entries_lock:
+            self._unpickled_entries.pop(key, None)
+
     def _clear(self, key: str | None = None) -> None:
+        with self._unpickled_entries_lock:
+            if not key:
+                self._unpickled_entries.clear()
+            else:
+                self._unpickled_entries.pop(key, None)
+
         if not key:
             self.storage.clear()
         else:
             self.storage.delete(key)
+
+
+# Returned by _share_value for values that can't be shared between callers.
+_NOT_SHAREABLE: Final = object()
+
+_IMMUTABLE_TYPES: Final = (type(None), bool, int, float, complex, str, bytes)
+_NUMPY_ARRAY_TYPE_STR: Final = "numpy.ndarray"
+_PANDAS_DATA_OBJECT_TYPE_STRS: Final = (
+    "pandas.core.frame.DataFrame",
+    "pandas.core.series.Series",
+)
+_PYARROW_IMMUTABLE_TYPE_RE: Final = re.compile(
+    r"^pyarrow\.lib\.(Table|RecordBatch|ChunkedArray|\w*Array)$"
+)
+
+
+def _share_value(value: Any) -> Any:
+    """Return a handle to a cached value that is cheap to create, and that the
+    caller can't use to modify the value, or _NOT_SHAREABLE if there is no
+    such handle for the value's type.
+    """
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+
+    if type_util.is_type(value, _NUMPY_ARRAY_TYPE_STR):
+        if value.dtype.hasobject:
+            # The array's elements are mutable objects.
+            return _NOT_SHAREABLE
+        view = value.view()
+        view.flags.writeable = False
+        return view
+
+    if type_util.is_type(value, _PYARROW_IMMUTABLE_TYPE_RE):
+        return value
+
+    if dataframe_util.is_polars_dataframe(value) or dataframe_util.is_polars_series(
+        value
+    ):
+        # Polars never modifies data in place, so clones share their data.
+        return value.clone()
+
+    if (
+        any(type_util.is_type(value, t) for t in _PANDAS_DATA_OBJECT_TYPE_STRS)
+        and _is_pandas_copy_on_write_enabled()
+    ):
+        return value.copy(deep=False)
+
+    return _NOT_SHAREABLE
+
+
+def _is_pandas_copy_on_write_enabled() -> bool:
+    if not dataframe_util.is_pandas_version_less_than("3.0.0"):
+        # Copy-on-Write is the only mode since pandas 3.0.
+        return True
+
+    import pandas as pd
+
+    return pd.options.mode.copy_on_write is True
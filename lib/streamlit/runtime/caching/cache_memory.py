@@ -0,0 +1,336 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounding the memory that caches use: by the number of their entries, by
+the total size of their entries in bytes, and across all caches.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Final, Generic, Protocol, TypeVar
+
+from streamlit.errors import StreamlitAPIException
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+_BYTE_SIZE_RE: Final = re.compile(
+    r"^\s*(\d+(?:\.\d*)?|\.\d+)\s*(?:([kmgt])(i)?)?b?\s*$", re.IGNORECASE
+)
+_BYTE_SIZE_UNIT_EXPONENTS: Final = {"k": 1, "m": 2, "g": 3, "t": 4}
+
+# Stamps entries with the order in which they were last used, across all
+# caches. (next() on an itertools.count is atomic.)
+_access_counter = itertools.count()
+
+
+def max_size_to_bytes(max_size: int | str | None) -> int | None:
+    """Convert a max_size cache parameter to a number of bytes.
+
+    Parameters
+    ----------
+    max_size : int, str, or None
+        A number of bytes, or a string like "500MB", "2 GB" or "1.5GiB". Units
+        are decimal (1 KB is 1000 bytes) unless written with an "i" (1 KiB is
+        1024 bytes). None means there is no limit.
+
+    Returns
+    -------
+    int or None
+        The number of bytes, or None if there is no limit.
+    """
+    if max_size is None:
+        return None
+
+    if isinstance(max_size, int) and not isinstance(max_size, bool):
+        if max_size < 0:
+            raise StreamlitAPIException(
+                f"max_size must not be negative, but is {max_size}."
+            )
+        return max_size
+
+    match = _BYTE_SIZE_RE.match(max_size) if isinstance(max_size, str) else None
+    if match is None:
+        raise StreamlitAPIException(
+            f"Unsupported max_size value '{max_size}'. Valid values are a number "
+            'of bytes, a string like "500MB" or "2GB", or None.'
+        )
+
+    number, unit, binary = match.groups()
+    base = 1024 if binary else 1000
+    exponent = _BYTE_SIZE_UNIT_EXPONENTS[unit.lower()] if unit else 0
+    return int(float(number) * base**exponent)
+
+
+class _Entry(Generic[_V]):
+    __slots__ = ("value", "size", "expires", "last_used")
+
+    def __init__(self, value: _V, size: int, expires: float):
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.last_used = next(_access_counter)
+
+
+class SizedTTLCache(Generic[_K, _V]):
+    """A least-recently-used cache whose entries expire after a time-to-live,
+    and which evicts entries to stay within both a maximum number of entries
+    and a maximum total size in bytes.
+
+    Each entry's size is computed once, when it's set, so the cache's total
+    size is always known without measuring its entries again.
+
+    Notes
+    -----
+    Threading: UNSAFE. Callers must synchronize access to the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: float,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        max_bytes: float = math.inf,
+        getsizeof: Callable[[_V], int] | None = None,
+        on_evict: Callable[[_K, _V], None] | None = None,
+    ):
+        """Create a SizedTTLCache.
+
+        Parameters
+        ----------
+        maxsize : float
+            The maximum number of entries. May be math.inf.
+
+        ttl : float
+            The time, in seconds, after which an entry expires. May be
+            math.inf.
+
+        timer : Callable[[], float]
+            The clock that ttl is measured with.
+
+        max_bytes : float
+            The maximum total size of the entries, in bytes. May be math.inf.
+
+        getsizeof : Callable[[V], int] or None
+            Returns the size of a value, in bytes. If None, all values count as
+            0 bytes, so max_bytes has no effect.
+
+        on_evict : Callable[[K, V], None] or None
+            Called with each entry that is evicted to make room for others.
+            (Not with entries that expire, or that are removed explicitly.)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._timer = timer
+        self._getsizeof = getsizeof
+        self._on_evict = on_evict
+
+        # Ordered from least to most recently used.
+        self._entries: OrderedDict[_K, _Entry[_V]] = OrderedDict()
+        # Ordered from first to last to expire. Since all entries have the same
+        # ttl, that's the order in which they were set.
+        self._expiry_order: OrderedDict[_K, None] = OrderedDict()
+
+        self.currsize_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(key)  # type: ignore[arg-type]
+        return entry is not None and self._timer() < entry.expires
+
+    def __getitem__(self, key: _K) -> _V:
+        entry = self._entries[key]
+        if not (self._timer() < entry.expires):
+            self._remove(key)
+            raise KeyError(key)
+
+        self._entries.move_to_end(key)
+        entry.last_used = next(_access_counter)
+        return entry.value
+
+    def get(self, key: _K, default: _V | None = None) -> _V | None:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        now = self._timer()
+        self.expire(now)
+
+        size = self._getsizeof(value) if self._getsizeof is not None else 0
+        if key in self._entries:
+            self._remove(key)
+
+        if size > self.max_bytes or self.maxsize < 1:
+            # The value can never fit. Don't evict everything else for it.
+            self.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+            return
+
+        while self._entries and (
+            len(self._entries) >= self.maxsize
+            or self.currsize_bytes + size > self.max_bytes
+        ):
+            self.evict_oldest()
+
+        self._entries[key] = _Entry(value, size, now + self.ttl)
+        self._expiry_order[key] = None
+        self.currsize_bytes += size
+
+    def __delitem__(self, key: _K) -> None:
+        self._remove(key)
+
+    def pop(self, key: _K, default: _V | None = None) -> _V | None:
+        if key not in self._entries:
+            return default
+        return self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expiry_order.clear()
+        self.currsize_bytes = 0
+
+    def values(self) -> list[_V]:
+        """Return the values of the entries that haven't expired."""
+        now = self._timer()
+        return [entry.value for entry in self._entries.values() if now < entry.expires]
+
+    def expire(self, now: float | None = None) -> None:
+        """Remove all expired entries."""
+        if now is None:
+            now = self._timer()
+        while self._expiry_order:
+            key = next(iter(self._expiry_order))
+            if now < self._entries[key].expires:
+                break
+            self._remove(key)
+
+    @property
+    def oldest_use(self) -> int | None:
+        """When the least recently used entry was last used, as a stamp that
+        can be compared across caches, or None if the cache is empty.
+        """
+        if not self._entries:
+            return None
+        return next(iter(self._entries.values())).last_used
+
+    def evict_oldest(self) -> None:
+        """Evict the least recently used entry."""
+        key = next(iter(self._entries))
+        value = self._remove(key)
+        self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def _remove(self, key: _K) -> _V:
+        entry = self._entries.pop(key)
+        del self._expiry_order[key]
+        self.currsize_bytes -= entry.size
+        return entry.value
+
+
+class BudgetedCache(Protocol):
+    """A cache that counts against a CacheMemoryBudget.
+
+    All methods must be thread-safe.
+    """
+
+    @property
+    def currsize_bytes(self) -> int:
+        """The total size of the cache's entries, in bytes."""
+        raise NotImplementedError
+
+    @property
+    def oldest_use(self) -> int | None:
+        """See SizedTTLCache.oldest_use."""
+        raise NotImplementedError
+
+    def evict_oldest(self) -> None:
+        """Evict the cache's least recently used entry, if it has any."""
+        raise NotImplementedError
+
+
+class CacheMemoryBudget:
+    """Keeps the total size of the entries of several caches within a limit,
+    by evicting the least recently used entries across all of them.
+
+    Caches are held weakly, so they stop counting against the budget once
+    they're no longer used.
+
+    Notes
+    -----
+    Threading: SAFE. Don't call enforce() while holding a cache's lock.
+    """
+
+    def __init__(self, get_limit_bytes: Callable[[], float]):
+        """Create a CacheMemoryBudget.
+
+        Parameters
+        ----------
+        get_limit_bytes : Callable[[], float]
+            Returns the limit, in bytes. It's called whenever the budget is
+            enforced, so the limit may change over time. A limit of 0 or less
+            means there is no limit.
+        """
+        self._get_limit_bytes = get_limit_bytes
+        self._caches: weakref.WeakSet[BudgetedCache] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def register(self, cache: BudgetedCache) -> None:
+        """Make a cache count against the budget."""
+        with self._lock:
+            self._caches.add(cache)
+
+    @property
+    def currsize_bytes(self) -> int:
+        """The total size of the entries of all caches, in bytes."""
+        with self._lock:
+            caches = list(self._caches)
+        return sum(cache.currsize_bytes for cache in caches)
+
+    def enforce(self) -> None:
+        """Evict entries until the caches are within the budget again."""
+        limit = self._get_limit_bytes()
+        if limit <= 0:
+            return
+
+        with self._lock:
+            caches = list(self._caches)
+            while sum(cache.currsize_bytes for cache in caches) > limit:
+                oldest_cache = None
+                oldest_use = None
+                for cache in caches:
+                    cache_oldest_use = cache.oldest_use
+                    if cache_oldest_use is not None and (
+                        oldest_use is None or cache_oldest_use < oldest_use
+                    ):
+                        oldest_cache = cache
+                        oldest_use = cache_oldest_use
+
+                if oldest_cache is None:
+                    return
+                oldest_cache.evict_oldest()
@@ -21,13 +21,13 @@ import threading
 import types
 from typing import TYPE_CHECKING, Any, Callable, Final, TypeVar, cast, overload
 
-from cachetools import TTLCache
 from typing_extensions import TypeAlias
 
 import streamlit as st
 from streamlit.logger import get_logger
 from streamlit.runtime.caching import cache_utils
 from streamlit.runtime.caching.cache_errors import CacheKeyNotFoundError
+from streamlit.runtime.caching.cache_memory import SizedTTLCache, max_size_to_bytes
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.caching.cache_utils import (
     Cache,
@@ -41,7 +41,13 @@ from streamlit.runtime.caching.cached_message_replay import (
     show_widget_replay_deprecation,
 )
 from streamlit.runtime.metrics_util import gather_metrics
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    CounterStat,
+    group_counter_stats,
+    group_stats,
+)
 from streamlit.time_util import time_to_seconds
 
 if TYPE_CHECKING:
@@ -80,6 +86,7 @@ class ResourceCaches(CacheStatsProvider):
         max_entries: int | float | None,
         ttl: float | timedelta | str | None,
         validate: ValidateFunc | None,
+        max_size: int | None = None,
     ) -> ResourceCache:
         """Return the mem cache for the given key.
 
@@ -98,6 +105,7 @@ class ResourceCaches(CacheStatsProvider):
                 cache is not None
                 and cache.ttl_seconds == ttl_seconds
                 and cache.max_entries == max_entries
+                and cache.max_size == max_size
                 and _equal_validate_funcs(cache.validate, validate)
             ):
                 return cache
@@ -110,6 +118,7 @@ class ResourceCaches(CacheStatsProvider):
                 max_entries=max_entries,
                 ttl_seconds=ttl_seconds,
                 validate=validate,
+                max_size=max_size,
             )
             self._function_caches[key] = cache
             return cache
@@ -130,6 +139,15 @@ class ResourceCaches(CacheStatsProvider):
             stats.extend(cache.get_stats())
         return group_stats(stats)
 
+    def get_counter_stats(self) -> list[CounterStat]:
+        with self._caches_lock:
+            function_caches = self._function_caches.copy()
+
+        stats: list[CounterStat] = []
+        for cache in function_caches.values():
+            stats.extend(cache.get_counter_stats())
+        return group_counter_stats(stats)
+
 
 # Singleton ResourceCaches instance
 _resource_caches = ResourceCaches()
@@ -151,6 +169,7 @@ class CachedResourceFuncInfo(CachedFuncInfo):
         ttl: float | timedelta | str | None,
         validate: ValidateFunc | None,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | None = None,
     ):
         super().__init__(
             func,
@@ -158,6 +177,7 @@ class CachedResourceFuncInfo(CachedFuncInfo):
             hash_funcs=hash_funcs,
         )
         self.max_entries = max_entries
+        self.max_size = max_size
         self.ttl = ttl
         self.validate = validate
 
@@ -181,6 +201,7 @@ class CachedResourceFuncInfo(CachedFuncInfo):
             max_entries=self.max_entries,
             ttl=self.ttl,
             validate=self.validate,
+            max_size=self.max_size,
         )
 
 
@@ -222,6 +243,7 @@ class CacheResourceAPI:
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | str | None = None,
     ) -> Callable[[F], F]: ...
 
     def __call__(
@@ -234,6 +256,7 @@ class CacheResourceAPI:
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | str | None = None,
     ):
         return self._decorator(
             func,
@@ -243,6 +266,7 @@ class CacheResourceAPI:
             validate=validate,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            max_size=max_size,
         )
 
     def _decorator(
@@ -255,6 +279,7 @@ class CacheResourceAPI:
         validate: ValidateFunc | None,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | str | None = None,
     ):
         """Decorator to cache functions that return global resources (e.g. database connections, ML models).
 
@@ -273,6 +298,11 @@ class CacheResourceAPI:
         arguments match a previous function call. Alternatively, you can
         declare custom hashing functions with ``hash_funcs``.
 
+        If the function is a coroutine function (``async def``), calling the
+        decorated function returns a coroutine, and its awaited result is
+        cached. Concurrent calls with the same arguments, e.g. from several
+        sessions, wait for a single call of the function to finish.
+
         To cache data, use ``st.cache_data`` instead. Learn more about caching at
         https://docs.streamlit.io/develop/concepts/architecture/caching.
 
@@ -323,6 +353,16 @@ class CacheResourceAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        max_size : int, str, or None
+            The maximum total size of the entries to keep in the cache, or None
+            for no limit (default). This can be a number of bytes, or a string
+            like ``"500MB"`` or ``"2GB"``. An entry's size is measured once,
+            when it's added, by following the references of the cached object,
+            so it may not account for memory held outside of Python (e.g. by a
+            GPU). When a new entry would exceed the limit, the least recently
+            used entries are removed, and entries larger than the limit aren't
+            kept at all.
+
         .. deprecated::
             The cached widget replay functionality was removed in 1.38. Please
             remove the ``experimental_allow_widgets`` parameter from your
@@ -411,6 +451,8 @@ class CacheResourceAPI:
         ... def get_person_name(person: Person):
         ...     return person.name
         """
+        max_size_bytes = max_size_to_bytes(max_size)
+
         if experimental_allow_widgets:
             show_widget_replay_deprecation("cache_resource")
 
@@ -425,6 +467,7 @@ class CacheResourceAPI:
                     ttl=ttl,
                     validate=validate,
                     hash_funcs=hash_funcs,
+                    max_size=max_size_bytes,
                 )
             )
 
@@ -436,6 +479,7 @@ class CacheResourceAPI:
                 ttl=ttl,
                 validate=validate,
                 hash_funcs=hash_funcs,
+                max_size=max_size_bytes,
             )
         )
 
@@ -455,12 +499,19 @@ class ResourceCache(Cache):
         ttl_seconds: float,
         validate: ValidateFunc | None,
         display_name: str,
+        max_size: int | None = None,
     ):
         super().__init__()
         self.key = key
         self.display_name = display_name
-        self._mem_cache: TTLCache[str, CachedResult] = TTLCache(
-            maxsize=max_entries, ttl=ttl_seconds, timer=cache_utils.TTLCACHE_TIMER
+        self.max_size = max_size
+        self._mem_cache: SizedTTLCache[str, CachedResult] = SizedTTLCache(
+            maxsize=max_entries,
+            ttl=ttl_seconds,
+            timer=cache_utils.TTLCACHE_TIMER,
+            max_bytes=max_size if max_size is not None else math.inf,
+            # Measuring resources is expensive, so we only do it if we must.
+            getsizeof=_get_resource_size if max_size is not None else None,
         )
         self._mem_cache_lock = threading.Lock()
         self.validate = validate
@@ -525,3 +576,23 @@ class ResourceCache(Cache):
             )
             for entry in cache_entries
         ]
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        with self._mem_cache_lock:
+            evictions = self._mem_cache.evictions
+
+        return [
+            CounterStat(
+                family_name="cache_evictions",
+                category_name="st_cache_resource",
+                cache_name=self.display_name,
+                value=evictions,
+            )
+        ]
+
+
+def _get_resource_size(entry: CachedResult) -> int:
+    # Lazy-load vendored package to prevent import of numpy
+    from streamlit.vendor.pympler.asizeof import asizeof
+
+    return cast("int", asizeof(entry))
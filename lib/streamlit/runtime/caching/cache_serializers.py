@@ -0,0 +1,199 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serializers for st.cache_data return values that pickle handles poorly.
+
+DataCache pickles the results of cached functions. A return value whose type
+has a serializer registered here is pickled as the serializer's output
+instead: a single buffer, which DataCache stores out-of-band where the cache
+storage supports it, and which is turned back into a value when the entry is
+unpickled.
+
+Built-in serializers store Polars DataFrames and Series as Arrow IPC. (Polars
+pickles them as compressed IPC, which is several times slower to write and to
+read back.) pandas DataFrames and pyarrow Tables are left to pickle: with
+out-of-band buffers, pickle already reads them back without copying their
+data, which converting them from Arrow can't beat.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+from streamlit import type_util
+from streamlit.logger import get_logger
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_LOGGER: Final = get_logger(__name__)
+
+_POLARS_DATAFRAME: Final = "polars.dataframe.frame.DataFrame"
+_POLARS_SERIES: Final = "polars.series.series.Series"
+
+
+class CacheValueSerializer(Protocol):
+    """Serializes st.cache_data return values of one type."""
+
+    def serialize(self, value: Any, compress: bool) -> memoryview | None:
+        """Serialize a value to a buffer, or return None if the value can't
+        be serialized, in which case it's pickled as usual.
+
+        Parameters
+        ----------
+        value : Any
+            The value to serialize.
+
+        compress : bool
+            True if the value is persisted to disk, where a smaller footprint
+            is worth spending some time on decompression.
+        """
+        raise NotImplementedError
+
+    def deserialize(self, data: memoryview | bytes | bytearray) -> Any:
+        """Turn a buffer returned by serialize back into a value.
+
+        The buffer may be read-only and memory-mapped from a cache file. The
+        value may use it without copying it, as long as it doesn't modify it.
+        """
+        raise NotImplementedError
+
+
+_serializers: dict[str, CacheValueSerializer] = {}
+
+
+def register_serializer(fqn_type: str, serializer: CacheValueSerializer) -> None:
+    """Use `serializer` for cached values of the given type.
+
+    Parameters
+    ----------
+    fqn_type : str
+        The fully qualified name of the type, as returned by
+        type_util.get_fqn_type. Subclasses of the type aren't affected.
+
+    serializer : CacheValueSerializer
+        The serializer to use.
+    """
+    _serializers[fqn_type] = serializer
+
+
+def prepare_value_for_pickle(value: Any, compress: bool) -> Any:
+    """Return an object that pickles as the output of the value's serializer,
+    or the value itself if it has no serializer.
+    """
+    fqn_type = type_util.get_fqn_type(value)
+    serializer = _serializers.get(fqn_type)
+    if serializer is None:
+        return value
+
+    try:
+        data = serializer.serialize(value, compress)
+    except Exception as ex:
+        _LOGGER.debug(
+            "Unable to serialize %s, pickling it instead", fqn_type, exc_info=ex
+        )
+        return value
+
+    if data is None:
+        return value
+    return _SerializedValue(fqn_type, data)
+
+
+class _SerializedValue:
+    """A value serialized by its type's serializer. Unpickles as the value."""
+
+    def __init__(self, fqn_type: str, data: memoryview):
+        self.fqn_type = fqn_type
+        self.data = data
+
+    def __reduce_ex__(self, protocol: Any) -> tuple[Any, ...]:
+        data: Any = (
+            pickle.PickleBuffer(self.data) if protocol >= 5 else self.data.tobytes()
+        )
+        return _deserialize_value, (self.fqn_type, data)
+
+
+def _deserialize_value(fqn_type: str, data: memoryview | bytes | bytearray) -> Any:
+    serializer = _serializers.get(fqn_type)
+    if serializer is None:
+        raise pickle.UnpicklingError(f"No cache serializer for {fqn_type}")
+    return serializer.deserialize(data)
+
+
+def _write_arrow_ipc(table: pa.Table, compress: bool) -> memoryview:
+    import pyarrow as pa
+
+    # zstd compresses tables to about the size polars' own pickles have,
+    # while still writing and reading them a few times faster.
+    compression = "zstd" if compress and pa.Codec.is_available("zstd") else None
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(
+        sink, table.schema, options=pa.ipc.IpcWriteOptions(compression=compression)
+    ) as writer:
+        writer.write_table(table)
+    return memoryview(sink.getvalue())
+
+
+def _read_arrow_ipc(data: memoryview | bytes | bytearray) -> pa.Table:
+    import pyarrow as pa
+
+    # Uncompressed tables use `data` as it is, without copying it.
+    return pa.ipc.open_file(pa.py_buffer(data)).read_all()
+
+
+def _has_polars_object_columns(dtypes: list[Any]) -> bool:
+    import polars as pl
+
+    # Columns of arbitrary Python objects can't be converted to Arrow.
+    def is_or_contains_object(dtype: Any) -> bool:
+        if dtype == pl.Object:
+            return True
+        if isinstance(dtype, (pl.List, pl.Array)):
+            return is_or_contains_object(dtype.inner)
+        if isinstance(dtype, pl.Struct):
+            return any(is_or_contains_object(field.dtype) for field in dtype.fields)
+        return False
+
+    return any(is_or_contains_object(dtype) for dtype in dtypes)
+
+
+class _PolarsDataFrameSerializer:
+    def serialize(self, value: Any, compress: bool) -> memoryview | None:
+        if _has_polars_object_columns(value.dtypes):
+            return None
+        return _write_arrow_ipc(value.to_arrow(), compress)
+
+    def deserialize(self, data: memoryview | bytes | bytearray) -> Any:
+        import polars as pl
+
+        return pl.from_arrow(_read_arrow_ipc(data))
+
+
+class _PolarsSeriesSerializer:
+    def serialize(self, value: Any, compress: bool) -> memoryview | None:
+        if _has_polars_object_columns([value.dtype]):
+            return None
+        return _write_arrow_ipc(value.to_frame().to_arrow(), compress)
+
+    def deserialize(self, data: memoryview | bytes | bytearray) -> Any:
+        import polars as pl
+
+        frame = pl.from_arrow(_read_arrow_ipc(data))
+        assert isinstance(frame, pl.DataFrame)
+        return frame.to_series()
+
+
+register_serializer(_POLARS_DATAFRAME, _PolarsDataFrameSerializer())
+register_serializer(_POLARS_SERIES, _PolarsSeriesSerializer())
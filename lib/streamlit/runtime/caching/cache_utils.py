@@ -16,14 +16,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import functools
-import hashlib
 import inspect
 import threading
 import time
 from abc import abstractmethod
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable, Final
 
 from streamlit import type_util
@@ -39,13 +40,18 @@ from streamlit.runtime.caching.cache_errors import (
     UnserializableReturnValueError,
     get_cached_func_name_md,
 )
+from streamlit.runtime.caching.cache_warmup import get_cache_warmup
 from streamlit.runtime.caching.cached_message_replay import (
     CachedMessageReplayContext,
     CachedResult,
     MsgData,
     replay_cached_messages,
 )
-from streamlit.runtime.caching.hashing import HashFuncsDict, update_hash
+from streamlit.runtime.caching.hashing import (
+    HashFuncsDict,
+    new_hasher,
+    update_hash,
+)
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
     in_cached_function,
 )
@@ -61,6 +67,35 @@ _LOGGER: Final = get_logger(__name__)
 # is exposed here as a constant so that it can be patched in unit tests.
 TTLCACHE_TIMER = time.monotonic
 
+# The clock we use to record when cached values were computed. Values may be
+# persisted to disk and read by another process, so this is wall-clock time.
+# Exposed as a constant so that it can be patched in unit tests.
+COMPUTED_AT_CLOCK = time.time
+
+# The maximum number of stale cached values that are recomputed in the
+# background at once, across all cached functions.
+_MAX_REFRESH_WORKERS: Final = 4
+
+_refresh_executor_lock = threading.Lock()
+_refresh_executor: ThreadPoolExecutor | None = None
+
+
+def get_refresh_executor() -> ThreadPoolExecutor:
+    """Return the executor that stale cached values are recomputed on. It's
+    shared by all cached functions, and created on first use.
+
+    Threading: SAFE. May be called on any thread.
+    """
+    global _refresh_executor
+
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=_MAX_REFRESH_WORKERS,
+                thread_name_prefix="CacheRefresh",
+            )
+        return _refresh_executor
+
 
 class Cache:
     """Function cache interface. Caches persist across script runs."""
@@ -68,6 +103,10 @@ class Cache:
     def __init__(self):
         self._value_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
         self._value_locks_lock = threading.Lock()
+        # The keys of the values that are being recomputed in the background.
+        self._refreshing_keys: set[str] = set()
+        # The async computations of values that are in flight.
+        self._async_computations: dict[str, Future[None]] = {}
 
     @abstractmethod
     def read_result(self, value_key: str) -> CachedResult:
@@ -100,6 +139,62 @@ class Cache:
         with self._value_locks_lock:
             return self._value_locks[value_key]
 
+    def start_async_computation(self, value_key: str) -> tuple[Future[None], bool]:
+        """Return the future of the async computation of a value that is in
+        flight, and whether the caller started it. This is the async analogue
+        of compute_value_lock: callers that didn't start the computation wait
+        for the future, instead of computing the value again. A caller that
+        started the computation must call finish_async_computation when it's
+        done.
+
+        The future is a concurrent.futures.Future, so that callers on other
+        threads and event loops (e.g. in other sessions) can wait for it too.
+        """
+        with self._value_locks_lock:
+            future = self._async_computations.get(value_key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._async_computations[value_key] = future
+            return future, True
+
+    def finish_async_computation(self, value_key: str, future: Future[None]) -> None:
+        """Mark an async computation as done, whether it succeeded or not, and
+        wake up the callers waiting for it.
+        """
+        with self._value_locks_lock:
+            if self._async_computations.get(value_key) is future:
+                del self._async_computations[value_key]
+        future.set_result(None)
+
+    def is_stale(self, result: CachedResult) -> bool:
+        """Return True if a cached result should still be returned, but
+        recomputed in the background. Caches that support refreshing values
+        in the background override this.
+        """
+        return False
+
+    def record_stale_hit(self, result: CachedResult) -> None:
+        """Record that a stale result was returned, for metrics."""
+
+    def record_refresh_failure(self) -> None:
+        """Record that a stale result couldn't be recomputed, for metrics."""
+
+    def start_refresh(self, value_key: str) -> bool:
+        """Mark a value as being recomputed in the background. Return False if
+        it already is, so that each value is only recomputed once at a time.
+        """
+        with self._value_locks_lock:
+            if value_key in self._refreshing_keys:
+                return False
+            self._refreshing_keys.add(value_key)
+            return True
+
+    def finish_refresh(self, value_key: str) -> None:
+        """Mark a value as no longer being recomputed in the background."""
+        with self._value_locks_lock:
+            self._refreshing_keys.discard(value_key)
+
     def clear(self, key: str | None = None):
         """Clear values from this cache.
         If no argument is passed, all items are cleared from the cache.
@@ -156,8 +251,15 @@ def make_cached_func_wrapper(info: CachedFuncInfo) -> Callable[..., Any]:
 
     The wrapper also has a `clear` function that can be called to clear
     some or all of the wrapper's cached values.
+
+    If the function is a coroutine function, calling the wrapper returns a
+    coroutine, and the awaited results of the function are cached.
     """
-    cached_func = CachedFunc(info)
+    cached_func = (
+        AsyncCachedFunc(info)
+        if inspect.iscoroutinefunction(info.func)
+        else CachedFunc(info)
+    )
     return functools.update_wrapper(cached_func, info.func)
 
 
@@ -185,6 +287,9 @@ class BoundCachedFunc:
             # entire cache of this method:
             self._cached_func.clear()
 
+    def warmup(self, *args, **kwargs) -> Future[None]:
+        return self._cached_func.warmup(self._instance, *args, **kwargs)
+
 
 class CachedFunc:
     def __init__(self, info: CachedFuncInfo):
@@ -203,18 +308,38 @@ class CachedFunc:
 
     def __call__(self, *args, **kwargs) -> Any:
         """The wrapper. We'll only call our underlying function on a cache miss."""
+        spinner_message = self._get_spinner_message(args, kwargs)
+        return self._get_or_create_cached_value(args, kwargs, spinner_message)
 
-        spinner_message: str | None = None
+    def _get_spinner_message(
+        self, func_args: tuple[Any, ...], func_kwargs: dict[str, Any]
+    ) -> str | None:
         if isinstance(self._info.show_spinner, str):
-            spinner_message = self._info.show_spinner
-        elif self._info.show_spinner is True:
+            return self._info.show_spinner
+        if self._info.show_spinner is True:
             name = self._info.func.__qualname__
-            if len(args) == 0 and len(kwargs) == 0:
-                spinner_message = f"Running `{name}()`."
-            else:
-                spinner_message = f"Running `{name}(...)`."
+            if len(func_args) == 0 and len(func_kwargs) == 0:
+                return f"Running `{name}()`."
+            return f"Running `{name}(...)`."
+        return None
 
-        return self._get_or_create_cached_value(args, kwargs, spinner_message)
+    def _spinner_or_no_context(
+        self, spinner_message: str | None
+    ) -> contextlib.AbstractContextManager[Any]:
+        # only show spinner if there is a message to show and always only for the
+        # outermost cache function if cache functions are nested, because the outermost
+        # function has to wait for the inner functions anyways. This avoids surprising
+        # users with slowdowned apps in case the inner functions are called very often,
+        # which would lead to a ton of (empty/spinner) proto messages that will make the
+        # app slow (see https://github.com/streamlit/streamlit/issues/9951). This is
+        # basically like auto-setting "show_spinner=False" on the @st.cache decorators
+        # on behalf of the user.
+        is_nested_cache_function = in_cached_function.get()
+        return (
+            spinner(spinner_message, _cache=True)
+            if spinner_message is not None and not is_nested_cache_function
+            else contextlib.nullcontext()
+        )
 
     def _get_or_create_cached_value(
         self,
@@ -239,23 +364,14 @@ class CachedFunc:
 
         with contextlib.suppress(CacheKeyNotFoundError):
             cached_result = cache.read_result(value_key)
+            if cache.is_stale(cached_result):
+                # Return the stale value right away, and recompute it in the
+                # background for later calls.
+                cache.record_stale_hit(cached_result)
+                self._refresh_in_background(cache, value_key, func_args, func_kwargs)
             return self._handle_cache_hit(cached_result)
 
-        # only show spinner if there is a message to show and always only for the
-        # outermost cache function if cache functions are nested, because the outermost
-        # function has to wait for the inner functions anyways. This avoids surprising
-        # users with slowdowned apps in case the inner functions are called very often,
-        # which would lead to a ton of (empty/spinner) proto messages that will make the
-        # app slow (see https://github.com/streamlit/streamlit/issues/9951). This is
-        # basically like auto-setting "show_spinner=False" on the @st.cache decorators
-        # on behalf of the user.
-        is_nested_cache_function = in_cached_function.get()
-        spinner_or_no_context = (
-            spinner(spinner_message, _cache=True)
-            if spinner_message is not None and not is_nested_cache_function
-            else contextlib.nullcontext()
-        )
-        with spinner_or_no_context:
+        with self._spinner_or_no_context(spinner_message):
             return self._handle_cache_miss(cache, value_key, func_args, func_kwargs)
 
     def _handle_cache_hit(self, result: CachedResult) -> Any:
@@ -311,37 +427,104 @@ class CachedFunc:
                 pass
 
             # We acquired the lock before any other thread. Compute the value!
-            with self._info.cached_message_replay_ctx.calling_cached_function(
-                self._info.func
-            ):
-                computed_value = self._info.func(*func_args, **func_kwargs)
-
-            # We've computed our value, and now we need to write it back to the cache
-            # along with any "replay messages" that were generated during value computation.
-            messages = self._info.cached_message_replay_ctx._most_recent_messages
+            return self._compute_and_write_value(
+                cache, value_key, func_args, func_kwargs
+            )
+
+    def _refresh_in_background(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> None:
+        """Recompute a stale cached value on the shared refresh executor, unless
+        it's already being recomputed. The cache keeps returning the stale
+        value until the new one is written.
+        """
+        if not cache.start_refresh(value_key):
+            return
+
+        def refresh() -> None:
             try:
-                cache.write_result(value_key, computed_value, messages)
-                return computed_value
-            except (CacheError, RuntimeError) as ex:
-                # An exception was thrown while we tried to write to the cache. Report
-                # it to the user. (We catch `RuntimeError` here because it will be
-                # raised by Apache Spark if we do not collect dataframe before
-                # using `st.cache_data`.)
-                if is_unevaluated_data_object(computed_value):
-                    # If the returned value is an unevaluated dataframe, raise an error.
-                    # Unevaluated dataframes are not yet in the local memory, which also
-                    # means they cannot be properly cached (serialized).
-                    raise UnevaluatedDataFrameError(
-                        f"The function {get_cached_func_name_md(self._info.func)} is "
-                        "decorated with `st.cache_data` but it returns an unevaluated "
-                        f"data object of type `{type_util.get_fqn_type(computed_value)}`. "
-                        "Please convert the object to a serializable format "
-                        "(e.g. Pandas DataFrame) before returning it, so "
-                        "`st.cache_data` can serialize and cache it."
-                    ) from ex
-                raise UnserializableReturnValueError(
-                    return_value=computed_value, func=self._info.func
+                with cache.compute_value_lock(value_key):
+                    # Another thread may have recomputed the value while we
+                    # waited for the lock, e.g. after the cache was cleared.
+                    try:
+                        if not cache.is_stale(cache.read_result(value_key)):
+                            return
+                    except CacheKeyNotFoundError:
+                        pass
+                    self._compute_and_write_value(
+                        cache, value_key, func_args, func_kwargs
+                    )
+            except Exception as ex:
+                cache.record_refresh_failure()
+                _LOGGER.warning(
+                    "Unable to refresh the cached value of %s; the stale value "
+                    "will be returned until it can be refreshed.",
+                    self._info.func.__qualname__,
+                    exc_info=ex,
                 )
+            finally:
+                cache.finish_refresh(value_key)
+
+        try:
+            get_refresh_executor().submit(refresh)
+        except RuntimeError:
+            # The executor has been shut down, because the interpreter is
+            # exiting.
+            cache.finish_refresh(value_key)
+
+    def _compute_and_write_value(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> Any:
+        """Call the cached function, and write its result to the cache. The
+        caller must hold the value's compute_value_lock.
+        """
+        with self._info.cached_message_replay_ctx.calling_cached_function(
+            self._info.func
+        ):
+            computed_value = self._info.func(*func_args, **func_kwargs)
+
+        self._write_computed_value(cache, value_key, computed_value)
+        return computed_value
+
+    def _write_computed_value(
+        self, cache: Cache, value_key: str, computed_value: Any
+    ) -> None:
+        """Write a value that the cached function has just computed to the
+        cache.
+        """
+        # We've computed our value, and now we need to write it back to the cache
+        # along with any "replay messages" that were generated during value computation.
+        messages = self._info.cached_message_replay_ctx._most_recent_messages
+        try:
+            cache.write_result(value_key, computed_value, messages)
+        except (CacheError, RuntimeError) as ex:
+            # An exception was thrown while we tried to write to the cache. Report
+            # it to the user. (We catch `RuntimeError` here because it will be
+            # raised by Apache Spark if we do not collect dataframe before
+            # using `st.cache_data`.)
+            if is_unevaluated_data_object(computed_value):
+                # If the returned value is an unevaluated dataframe, raise an error.
+                # Unevaluated dataframes are not yet in the local memory, which also
+                # means they cannot be properly cached (serialized).
+                raise UnevaluatedDataFrameError(
+                    f"The function {get_cached_func_name_md(self._info.func)} is "
+                    "decorated with `st.cache_data` but it returns an unevaluated "
+                    f"data object of type `{type_util.get_fqn_type(computed_value)}`. "
+                    "Please convert the object to a serializable format "
+                    "(e.g. Pandas DataFrame) before returning it, so "
+                    "`st.cache_data` can serialize and cache it."
+                ) from ex
+            raise UnserializableReturnValueError(
+                return_value=computed_value, func=self._info.func
+            )
 
     def clear(self, *args, **kwargs):
         """Clear the cached function's associated cache.
@@ -393,6 +576,174 @@ class CachedFunc:
             key = None
         cache.clear(key=key)
 
+    def warmup(self, *args, **kwargs) -> Future[None]:
+        """Compute and cache the function's value for these arguments in the
+        background, unless it's cached already.
+
+        Calls scheduled from the script set by server.warmupScript run when
+        the server starts, before it reports that it's ready for browser
+        connections. At most server.warmupMaxWorkers calls run at the same
+        time.
+
+        The function must be defined in a module that both the app and the
+        warm-up script import, not in the app's main script: a function's
+        cache depends on the module it's defined in, and the app's main
+        script runs as the ``__main__`` module.
+
+        Parameters
+        ----------
+
+        *args: Any
+            Arguments of the cached functions.
+
+        **kwargs: Any
+            Keyword arguments of the cached function.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future that's done when the value is cached. If the function
+            raises an exception, it's logged and set on the future.
+
+        Raises
+        ------
+        StreamlitAPIException
+            If the function was imported from the app's main script.
+
+        Example
+        -------
+        In ``data.py``, next to the app's main script:
+
+        >>> import streamlit as st
+        >>>
+        >>> @st.cache_data
+        >>> def load_data(year):
+        >>>     ...
+
+        In the app's main script, e.g. ``streamlit_app.py``, and in a warm-up
+        script, e.g. ``warmup.py`` with ``server.warmupScript = "warmup.py"``:
+
+        >>> from data import load_data
+        >>>
+        >>> for year in range(2020, 2025):
+        >>>     load_data.warmup(year)
+
+        """
+        cache_warmup = get_cache_warmup()
+        cache_warmup.check_function(self._info.func)
+        return cache_warmup.submit(
+            functools.partial(self._warm_up, args, kwargs),
+            name=self._info.func.__qualname__,
+        )
+
+    def _warm_up(self, func_args: tuple[Any, ...], func_kwargs: dict[str, Any]) -> None:
+        self._get_or_create_cached_value(func_args, func_kwargs)
+
+
+class AsyncCachedFunc(CachedFunc):
+    """A CachedFunc for coroutine functions. Calling it returns a coroutine,
+    which returns the cached result of awaiting the function.
+    """
+
+    def __repr__(self):
+        return f"<AsyncCachedFunc: {self._info.func}>"
+
+    async def __call__(self, *args, **kwargs) -> Any:
+        """The wrapper. We'll only await our underlying function on a cache miss."""
+        spinner_message = self._get_spinner_message(args, kwargs)
+        return await self._get_or_create_cached_value_async(
+            args, kwargs, spinner_message
+        )
+
+    async def _get_or_create_cached_value_async(
+        self,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+        spinner_message: str | None = None,
+    ) -> Any:
+        cache = self._info.get_function_cache(self._function_key)
+        value_key = _make_value_key(
+            cache_type=self._info.cache_type,
+            func=self._info.func,
+            func_args=func_args,
+            func_kwargs=func_kwargs,
+            hash_funcs=self._info.hash_funcs,
+        )
+
+        while True:
+            with contextlib.suppress(CacheKeyNotFoundError):
+                cached_result = cache.read_result(value_key)
+                if cache.is_stale(cached_result):
+                    cache.record_stale_hit(cached_result)
+                    self._refresh_in_background(
+                        cache, value_key, func_args, func_kwargs
+                    )
+                return self._handle_cache_hit(cached_result)
+
+            # Like compute_value_lock in _handle_cache_miss, this ensures that
+            # concurrent callers don't compute the same value simultaneously.
+            # We don't hold a lock while awaiting the function, though, so
+            # that we don't block the event loop.
+            future, started = cache.start_async_computation(value_key)
+            if not started:
+                # Another caller is computing the value. Wait for it, and then
+                # read the value from the cache, so that we replay its
+                # messages, and get our own copy of it. If the other caller
+                # failed to compute or write the value, we try again. (The
+                # future is shielded, so that cancelling one waiting caller
+                # doesn't cancel it for the others.)
+                await asyncio.shield(asyncio.wrap_future(future))
+                continue
+
+            try:
+                # Another caller may have computed the value between our cache
+                # read and starting the computation.
+                with contextlib.suppress(CacheKeyNotFoundError):
+                    return self._handle_cache_hit(cache.read_result(value_key))
+
+                with self._spinner_or_no_context(spinner_message):
+                    return await self._compute_and_write_value_async(
+                        cache, value_key, func_args, func_kwargs
+                    )
+            finally:
+                cache.finish_async_computation(value_key, future)
+
+    async def _compute_and_write_value_async(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> Any:
+        """Await the cached function, and write its result to the cache."""
+        with self._info.cached_message_replay_ctx.calling_cached_function(
+            self._info.func
+        ):
+            computed_value = await self._info.func(*func_args, **func_kwargs)
+
+        self._write_computed_value(cache, value_key, computed_value)
+        return computed_value
+
+    def _warm_up(self, func_args: tuple[Any, ...], func_kwargs: dict[str, Any]) -> None:
+        # Warm-up calls run on the warm-up executor's threads, which don't run
+        # an event loop.
+        asyncio.run(self._get_or_create_cached_value_async(func_args, func_kwargs))
+
+    def _compute_and_write_value(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> Any:
+        # This is only called to refresh stale values in the background, on
+        # the refresh executor's threads, which don't run an event loop.
+        return asyncio.run(
+            self._compute_and_write_value_async(
+                cache, value_key, func_args, func_kwargs
+            )
+        )
+
 
 def _make_value_key(
     cache_type: CacheType,
@@ -429,7 +780,7 @@ def _make_value_key(
     # Create the hash from each arg value, except for those args whose name
     # starts with "_". (Underscore-prefixed args are deliberately excluded from
     # hashing.)
-    args_hasher = hashlib.new("md5", usedforsecurity=False)
+    args_hasher = new_hasher()
     for arg_name, arg_value in arg_pairs:
         if arg_name is not None and arg_name.startswith("_"):
             _LOGGER.debug("Not hashing %s because it starts with _", arg_name)
@@ -467,7 +818,7 @@ def _make_function_key(cache_type: CacheType, func: FunctionType) -> str:
     A function's key is stable across reruns of the app, and changes when
     the function's source code changes.
     """
-    func_hasher = hashlib.new("md5", usedforsecurity=False)
+    func_hasher = new_hasher()
 
     # Include the function's __module__ and __qualname__ strings in the hash.
     # This means that two identical functions in different modules
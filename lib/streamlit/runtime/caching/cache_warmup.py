@@ -0,0 +1,210 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pre-warming of st.cache_data and st.cache_resource caches at server startup."""
+
+from __future__ import annotations
+
+import os
+import runpy
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from streamlit import config
+from streamlit.errors import StreamlitAPIException
+from streamlit.logger import get_logger
+
+if TYPE_CHECKING:
+    from types import FunctionType
+    from typing import Callable
+
+_LOGGER: Final = get_logger(__name__)
+
+
+class WarmupProgress(NamedTuple):
+    """How far the cache warm-up at server startup has got."""
+
+    done: int
+    total: int
+    failed: int
+    finished: bool
+
+
+class CacheWarmup:
+    """Runs the calls that warm up cached functions, with bounded parallelism.
+
+    Calls are scheduled with `CachedFunc.warmup`, usually from the warm-up
+    script set by server.warmupScript. The startup warm-up is finished when
+    the script has run and all calls it scheduled, directly or from other
+    warm-up calls, have completed. Calls scheduled after that still run on
+    the warm-up threads, but don't count towards its progress.
+
+    Threading: SAFE. May be used from any thread.
+    """
+
+    def __init__(self, max_workers: int):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="CacheWarmup"
+        )
+        self._lock = threading.Lock()
+        self._started = False
+        self._script_done = False
+        self._finished = False
+        self._done = 0
+        self._total = 0
+        self._failed = 0
+        self._start_time = 0.0
+        self._main_script_path: str | None = None
+
+    def submit(self, fn: Callable[[], object], name: str) -> Future[None]:
+        """Schedule a warm-up call. Exceptions raised by the call are logged,
+        and set on the returned future.
+        """
+        with self._lock:
+            counted = self._started and not self._finished
+            if counted:
+                self._total += 1
+
+        def run() -> None:
+            failed = False
+            try:
+                fn()
+            except Exception:
+                failed = True
+                _LOGGER.warning("Cache warm-up call to %s failed.", name, exc_info=True)
+                raise
+            finally:
+                if counted:
+                    self._on_call_done(failed)
+
+        try:
+            return self._executor.submit(run)
+        except RuntimeError:
+            # The executor has been shut down, because the server is stopping.
+            if counted:
+                self._on_call_done(failed=True)
+            future: Future[None] = Future()
+            future.cancel()
+            return future
+
+    def check_function(self, func: FunctionType) -> None:
+        """Raise a StreamlitAPIException if warming up func can't warm up the
+        cache that the app reads.
+
+        A function's cache is keyed by its module name, among other things.
+        While the app runs, the functions of its main script are in the
+        "__main__" module, so a copy of them imported from the main script
+        (which also runs the whole app) has a cache of its own.
+        """
+        main_script_path = self._main_script_path
+        if (
+            main_script_path is None
+            or func.__module__ == "__main__"
+            or os.path.realpath(func.__code__.co_filename)
+            != os.path.realpath(main_script_path)
+        ):
+            return
+
+        raise StreamlitAPIException(
+            f"Cached function `{func.__qualname__}` can't be warmed up, because "
+            "it was imported from the app's main script, and the app uses a "
+            "separate cache for the functions of its main script. Move the "
+            "function into a module that both the app and the warm-up script "
+            "import."
+        )
+
+    def run_script(self, script_path: str, main_script_path: str | None = None) -> None:
+        """Run the warm-up script on a background thread, and track the
+        progress of the calls it schedules as the startup warm-up.
+
+        Parameters
+        ----------
+        script_path : str
+            The path of the warm-up script.
+
+        main_script_path : str or None
+            The path of the app's main script. Its functions can't be warmed
+            up (see `check_function`).
+        """
+        with self._lock:
+            self._started = True
+            self._main_script_path = main_script_path
+            self._start_time = time.monotonic()
+
+        def run() -> None:
+            try:
+                runpy.run_path(script_path, run_name="__main__")
+            except BaseException:
+                _LOGGER.exception("Cache warm-up script %s failed.", script_path)
+            finally:
+                with self._lock:
+                    self._script_done = True
+                    self._maybe_finish()
+
+        threading.Thread(target=run, name="CacheWarmupScript", daemon=True).start()
+
+    def get_progress(self) -> WarmupProgress:
+        with self._lock:
+            return WarmupProgress(
+                done=self._done,
+                total=self._total,
+                failed=self._failed,
+                finished=self._finished or not self._started,
+            )
+
+    def stop(self) -> None:
+        """Cancel all warm-up calls that haven't started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_call_done(self, failed: bool) -> None:
+        with self._lock:
+            self._done += 1
+            if failed:
+                self._failed += 1
+            self._maybe_finish()
+
+    def _maybe_finish(self) -> None:
+        # Must be called with self._lock held.
+        if self._finished or not self._script_done or self._done < self._total:
+            return
+
+        self._finished = True
+        _LOGGER.info(
+            "Cache warm-up finished in %.1f seconds: %d calls, %d failed.",
+            time.monotonic() - self._start_time,
+            self._total,
+            self._failed,
+        )
+
+
+_cache_warmup_lock = threading.Lock()
+_cache_warmup: CacheWarmup | None = None
+
+
+def get_cache_warmup() -> CacheWarmup:
+    """Return the CacheWarmup that cached functions are warmed up on, creating
+    it on first use.
+
+    Threading: SAFE. May be called on any thread.
+    """
+    global _cache_warmup
+
+    with _cache_warmup_lock:
+        if _cache_warmup is None:
+            _cache_warmup = CacheWarmup(
+                max_workers=max(1, config.get_option("server.warmupMaxWorkers"))
+            )
+        return _cache_warmup
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 import contextlib
-import threading
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, Union
 
@@ -74,12 +74,16 @@ MsgData = Union[ElementMsgData, BlockMsgData]
 class CachedResult:
     """The full results of calling a cache-decorated function, enough to
     replay the st functions called while executing it.
+
+    computed_at is the wall-clock time at which the value was computed, if
+    it's known. (Results cached by older versions of Streamlit don't have it.)
     """
 
     value: Any
     messages: list[MsgData]
     main_id: str
     sidebar_id: str
+    computed_at: float | None = None
 
 
 """
@@ -113,32 +117,56 @@ Explicit invocation on an unknown DG -> Raise an error
 """
 
 
-class CachedMessageReplayContext(threading.local):
+class CachedMessageReplayContext:
     """A utility for storing messages generated by `st` commands called inside
     a cached function.
 
-    Data is stored in a thread-local object, so it's safe to use an instance
-    of this class across multiple threads.
+    Data is stored in context variables, so it's safe to use an instance of
+    this class across multiple threads, and across asyncio tasks that call
+    cached async functions concurrently on the same thread.
     """
 
     def __init__(self, cache_type: CacheType):
-        self._cached_message_stack: list[list[MsgData]] = []
-        self._seen_dg_stack: list[set[str]] = []
-        self._most_recent_messages: list[MsgData] = []
-        self._media_data: list[MediaMsgData] = []
+        # The stacks are tuples, so that pushing to them in one context (e.g.
+        # an asyncio task) doesn't affect other contexts. The lists and sets
+        # in them are shared, so that the messages of nested calls are also
+        # recorded for the calls they're nested in.
+        self._cached_message_stack: ContextVar[tuple[list[MsgData], ...]] = ContextVar(
+            f"{cache_type.value}_cached_message_stack", default=()
+        )
+        self._seen_dg_stack: ContextVar[tuple[set[str], ...]] = ContextVar(
+            f"{cache_type.value}_seen_dg_stack", default=()
+        )
+        self._most_recent_messages_var: ContextVar[list[MsgData]] = ContextVar(
+            f"{cache_type.value}_most_recent_messages"
+        )
+        self._media_data: ContextVar[tuple[MediaMsgData, ...]] = ContextVar(
+            f"{cache_type.value}_media_data", default=()
+        )
         self._cache_type = cache_type
 
     def __repr__(self) -> str:
         return util.repr_(self)
 
+    @property
+    def _most_recent_messages(self) -> list[MsgData]:
+        """The messages of the most recent call of a cached function in this
+        context.
+        """
+        return self._most_recent_messages_var.get([])
+
     @contextlib.contextmanager
     def calling_cached_function(self, func: FunctionType) -> Iterator[None]:
         """Context manager that should wrap the invocation of a cached function.
         It allows us to track any `st.foo` messages that are generated from inside the
         function for playback during cache retrieval.
         """
-        self._cached_message_stack.append([])
-        self._seen_dg_stack.append(set())
+        message_stack_token = self._cached_message_stack.set(
+            (*self._cached_message_stack.get(), [])
+        )
+        seen_dg_stack_token = self._seen_dg_stack.set(
+            (*self._seen_dg_stack.get(), set())
+        )
         nested_call = False
         if in_cached_function.get():
             nested_call = True
@@ -150,8 +178,9 @@ class CachedMessageReplayContext(threading.local):
         try:
             yield
         finally:
-            self._most_recent_messages = self._cached_message_stack.pop()
-            self._seen_dg_stack.pop()
+            self._most_recent_messages_var.set(self._cached_message_stack.get()[-1])
+            self._cached_message_stack.reset(message_stack_token)
+            self._seen_dg_stack.reset(seen_dg_stack_token)
             if not nested_call:
                 # Reset the in_cached_function flag. But only if this
                 # is not nested inside a cached function that disallows widget usage.
@@ -171,10 +200,11 @@ class CachedMessageReplayContext(threading.local):
         """
         if not runtime.exists():
             return
-        if len(self._cached_message_stack) >= 1:
+        cached_message_stack = self._cached_message_stack.get()
+        if len(cached_message_stack) >= 1:
             id_to_save = self.select_dg_to_save(invoked_dg_id, used_dg_id)
 
-            media_data = self._media_data
+            media_data = list(self._media_data.get())
 
             element_msg_data = ElementMsgData(
                 delta_type,
@@ -183,14 +213,14 @@ class CachedMessageReplayContext(threading.local):
                 returned_dg_id,
                 media_data,
             )
-            for msgs in self._cached_message_stack:
+            for msgs in cached_message_stack:
                 msgs.append(element_msg_data)
 
-        # Reset instance state, now that it has been used for the
+        # Reset the context's state, now that it has been used for the
         # associated element.
-        self._media_data = []
+        self._media_data.set(())
 
-        for s in self._seen_dg_stack:
+        for s in self._seen_dg_stack.get():
             s.add(returned_dg_id)
 
     def save_block_message(
@@ -201,9 +231,9 @@ class CachedMessageReplayContext(threading.local):
         returned_dg_id: str,
     ) -> None:
         id_to_save = self.select_dg_to_save(invoked_dg_id, used_dg_id)
-        for msgs in self._cached_message_stack:
+        for msgs in self._cached_message_stack.get():
             msgs.append(BlockMsgData(block_proto, id_to_save, returned_dg_id))
-        for s in self._seen_dg_stack:
+        for s in self._seen_dg_stack.get():
             s.add(returned_dg_id)
 
     def select_dg_to_save(self, invoked_id: str, acting_on_id: str) -> str:
@@ -216,7 +246,8 @@ class CachedMessageReplayContext(threading.local):
         acting_on_id is the DG the st function ultimately runs on, which may be different
         if the invoked DG delegated to another one because it was in a `with` block.
         """
-        if len(self._seen_dg_stack) > 0 and acting_on_id in self._seen_dg_stack[-1]:
+        seen_dg_stack = self._seen_dg_stack.get()
+        if len(seen_dg_stack) > 0 and acting_on_id in seen_dg_stack[-1]:
             return acting_on_id
         else:
             return invoked_id
@@ -224,7 +255,9 @@ class CachedMessageReplayContext(threading.local):
     def save_image_data(
         self, image_data: bytes | str, mimetype: str, image_id: str
     ) -> None:
-        self._media_data.append(MediaMsgData(image_data, mimetype, image_id))
+        self._media_data.set(
+            (*self._media_data.get(), MediaMsgData(image_data, mimetype, image_id))
+        )
 
 
 def replay_cached_messages(
@@ -26,24 +26,32 @@ import inspect
 import io
 import os
 import pickle
+import re
 import sys
 import tempfile
 import threading
 import uuid
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from re import Pattern
 from types import MappingProxyType
-from typing import Any, Callable, Final, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Final, Protocol, Union, cast
 
-from typing_extensions import TypeAlias
+from typing_extensions import Buffer, TypeAlias
 
-from streamlit import logger, type_util, util
+from streamlit import config, logger, type_util, util
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.caching.cache_errors import UnhashableTypeError
 from streamlit.runtime.caching.cache_type import CacheType
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    get_script_run_ctx,
+)
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 _LOGGER: Final = logger.get_logger(__name__)
 
 # If a dataframe has more than this many rows, we consider it large and hash a sample.
@@ -54,8 +62,36 @@ _PANDAS_SAMPLE_SIZE: Final = 10_000
 _NP_SIZE_LARGE: Final = 500_000
 _NP_SAMPLE_SIZE: Final = 100_000
 
+# Digest algorithms that can be set with the global.cacheHashAlgorithm option.
+_HASH_ALGORITHMS: Final = ("md5", "blake2b", "xxhash")
+
+# With global.exactCacheHashing, the memory of large dataframes and arrays is
+# hashed in chunks of this size. hashlib releases the GIL while it hashes a
+# chunk, so the chunks are hashed on several threads.
+_HASH_CHUNK_BYTES: Final = 1024 * 1024
+_MAX_HASH_WORKERS: Final = 4
+
+_hash_executor_lock = threading.Lock()
+_hash_executor: ThreadPoolExecutor | None = None
+
+# PyArrow tables and arrays can't be modified after they are created.
+_PYARROW_DATA_TYPE_RE: Final = re.compile(
+    r"^pyarrow\.lib\.(Table|RecordBatch|ChunkedArray|\w*Array)$"
+)
+
 HashFuncsDict: TypeAlias = dict[Union[str, type[Any]], Callable[[Any], Any]]
 
+
+class Hasher(Protocol):
+    """The interface of the hashers returned by new_hasher."""
+
+    def update(self, data: Buffer, /) -> None: ...
+
+    def digest(self) -> bytes: ...
+
+    def hexdigest(self) -> str: ...
+
+
 # Arbitrary item to denote where we found a cycle in a hashed object.
 # This allows us to hash self-referencing lists, dictionaries, etc.
 _CYCLE_PLACEHOLDER: Final = (
@@ -162,6 +198,218 @@ def update_hash(
     ch.update(hasher, val)
 
 
+def get_hash_algorithm() -> str:
+    """Return the digest algorithm set with the global.cacheHashAlgorithm
+    config option.
+    """
+    algorithm = config.get_option("global.cacheHashAlgorithm")
+    if algorithm not in _HASH_ALGORITHMS:
+        raise StreamlitAPIException(
+            "Invalid value for config option global.cacheHashAlgorithm. "
+            f"Expected one of {_HASH_ALGORITHMS}, but got '{algorithm}'."
+        )
+    return cast(str, algorithm)
+
+
+def new_hasher(algorithm: str | None = None) -> Hasher:
+    """Return a new hasher for cache keys.
+
+    Parameters
+    ----------
+    algorithm : str or None
+        One of "md5", "blake2b" and "xxhash". If None, the algorithm set with
+        the global.cacheHashAlgorithm config option is used.
+
+    Returns
+    -------
+    Hasher
+        A hashlib-like hasher.
+    """
+    if algorithm is None:
+        algorithm = get_hash_algorithm()
+
+    if algorithm == "xxhash":
+        try:
+            import xxhash  # type: ignore[import-not-found]
+        except ImportError as ex:
+            raise StreamlitAPIException(
+                'The config option global.cacheHashAlgorithm is set to "xxhash", '
+                "but the xxhash package isn't installed. Install it with "
+                "`pip install xxhash`."
+            ) from ex
+        return cast(Hasher, xxhash.xxh3_128())
+
+    if algorithm == "blake2b":
+        # A 16 bytes digest keeps the keys as long as with md5.
+        return hashlib.blake2b(digest_size=16)
+
+    return hashlib.new("md5", usedforsecurity=False)
+
+
+def _get_arg_hash_memo() -> dict[tuple[int, str], tuple[Any, bytes]] | None:
+    """Return the hashes of immutable data memoized in this script run, or
+    None if there is no script run.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.arg_hashes_this_run if ctx is not None else None
+
+
+def _is_immutable_data(obj: Any) -> bool:
+    """Return whether obj is a PyArrow object or NumPy array whose contents
+    can't change while it exists.
+    """
+    if type_util.is_type(obj, _PYARROW_DATA_TYPE_RE):
+        return True
+
+    if not type_util.is_type(obj, "numpy.ndarray") or obj.dtype.hasobject:
+        # The elements of object arrays are mutable objects.
+        return False
+
+    # A read-only array can still change through a writeable array whose
+    # memory it shares.
+    base = obj
+    while type_util.is_type(base, "numpy.ndarray"):
+        if base.flags.writeable:
+            return False
+        base = base.base
+    if isinstance(base, memoryview):
+        if not base.readonly:
+            return False
+        base = base.obj
+    return base is None or isinstance(base, bytes)
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """Return the executor that chunks of large buffers are hashed on, creating
+    it on first use.
+
+    Threading: SAFE. May be called on any thread.
+    """
+    global _hash_executor
+
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=_MAX_HASH_WORKERS, thread_name_prefix="CacheHash"
+            )
+        return _hash_executor
+
+
+def _hash_buffers(buffers: Iterable[Buffer], algorithm: str) -> bytes:
+    """Hash the whole contents of buffers.
+
+    Each buffer is split into chunks whose digests are hashed together with
+    the buffer sizes, so the result doesn't depend on how many chunks are
+    hashed in parallel.
+    """
+    sizes: list[int] = []
+    chunks: list[memoryview] = []
+    for buffer in buffers:
+        view = memoryview(buffer).cast("B")
+        sizes.append(view.nbytes)
+        chunks.extend(
+            view[start : start + _HASH_CHUNK_BYTES]
+            for start in range(0, view.nbytes, _HASH_CHUNK_BYTES)
+        )
+
+    def digest(chunk: memoryview) -> bytes:
+        chunk_hasher = new_hasher(algorithm)
+        chunk_hasher.update(chunk)
+        return chunk_hasher.digest()
+
+    if len(chunks) > 1 and (os.cpu_count() or 1) > 1:
+        digests = list(_get_hash_executor().map(digest, chunks))
+    else:
+        digests = [digest(chunk) for chunk in chunks]
+
+    h = new_hasher(algorithm)
+    for size in sizes:
+        h.update(_int_to_bytes(size))
+    for chunk_digest in digests:
+        h.update(chunk_digest)
+    return h.digest()
+
+
+def _numpy_buffer(arr: Any) -> Buffer:
+    """Return the memory of a NumPy array without object elements as a flat
+    buffer, copying it only if it isn't contiguous.
+    """
+    import numpy as np
+
+    return cast(Buffer, np.ascontiguousarray(arr).reshape(-1).view(np.uint8))
+
+
+def _pandas_buffers(obj: Any) -> Iterator[Buffer]:
+    """Yield buffers that together hold all the index and values of a pandas
+    DataFrame or Series.
+
+    Columns with a NumPy dtype are yielded as they are in memory, and other
+    columns as their row hashes.
+    """
+    import numpy as np
+    import pandas as pd
+
+    index = obj.index
+    if isinstance(index, pd.RangeIndex):
+        yield _numpy_buffer(
+            np.array([index.start, index.stop, index.step], dtype=np.int64)
+        )
+    else:
+        yield pd.util.hash_pandas_object(index).to_numpy()
+
+    columns = obj.items() if isinstance(obj, pd.DataFrame) else [(obj.name, obj)]
+    for _, column in columns:
+        if isinstance(column.dtype, np.dtype) and not column.dtype.hasobject:
+            yield _numpy_buffer(column.to_numpy())
+        else:
+            yield pd.util.hash_pandas_object(column, index=False).to_numpy()
+
+
+def _arrow_buffers(obj: Any) -> Iterator[Buffer]:
+    """Yield buffers that together hold all the data of a PyArrow table,
+    record batch, chunked array or array.
+    """
+    import pyarrow as pa
+
+    if isinstance(obj, (pa.Table, pa.RecordBatch)):
+        yield obj.schema.to_string().encode()
+        columns = obj.columns
+    else:
+        yield str(obj.type).encode()
+        columns = [obj]
+
+    for column in columns:
+        chunks = column.chunks if isinstance(column, pa.ChunkedArray) else [column]
+        yield _int_to_bytes(len(chunks))
+        for chunk in chunks:
+            yield from _arrow_array_buffers(chunk)
+
+
+def _arrow_array_buffers(arr: Any) -> Iterator[Buffer]:
+    """Yield buffers that together hold all the data of a PyArrow array."""
+    import pyarrow as pa
+
+    if (
+        arr.type.num_fields == 0
+        and not pa.types.is_dictionary(arr.type)
+        and not isinstance(arr.type, pa.ExtensionType)
+    ):
+        # The buffers of a flat array hold all its data. Its offset and length
+        # tell which part of them belongs to it.
+        yield _int_to_bytes(arr.offset)
+        yield _int_to_bytes(len(arr))
+        for buffer in arr.buffers():
+            yield b"" if buffer is None else buffer
+    else:
+        # Nested and dictionary arrays keep some of their data in child arrays,
+        # so they are hashed in the IPC format, which includes all of it.
+        batch = pa.record_batch([arr], names=[""])
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        yield sink.getvalue()
+
+
 class _HashStack:
     """Stack of what has been hashed, for debug and circular reference detection.
 
@@ -298,6 +546,15 @@ class _CacheFuncHasher:
             self._hash_funcs = {}
         self._hashes: dict[Any, bytes] = {}
 
+        self._algorithm = get_hash_algorithm()
+        self._exact_hashing = bool(config.get_option("global.exactCacheHashing"))
+
+        # Hashes of immutable data are reused for the rest of the script
+        # run, so that an object passed to several cached functions is hashed
+        # only once. Custom hash functions could hash them differently, so
+        # they bypass the memo.
+        self._arg_hash_memo = None if self._hash_funcs else _get_arg_hash_memo()
+
         # The number of the bytes in the hash.
         self.size = 0
 
@@ -316,6 +573,15 @@ class _CacheFuncHasher:
             if key in self._hashes:
                 return self._hashes[key]
 
+        memo_key: tuple[int, str] | None = None
+        if self._arg_hash_memo is not None and _is_immutable_data(obj):
+            memo_key = (id(obj), self._algorithm)
+            memoized = self._arg_hash_memo.get(memo_key)
+            # The weak reference tells apart a new object that reuses the id
+            # of a deleted one.
+            if memoized is not None and memoized[0]() is obj:
+                return memoized[1]
+
         # Break recursive cycles.
         if obj in hash_stacks.current:
             return _CYCLE_PLACEHOLDER
@@ -333,6 +599,9 @@ class _CacheFuncHasher:
             if key[1] is not NoResult:
                 self._hashes[key] = b
 
+            if memo_key is not None and self._arg_hash_memo is not None:
+                self._arg_hash_memo[memo_key] = (weakref.ref(obj), b)
+
         finally:
             # In case an UnhashableTypeError (or other) error is thrown, clean up the
             # stack so we don't get false positives in future hashing calls
@@ -352,7 +621,7 @@ class _CacheFuncHasher:
         runs.
         """
 
-        h = hashlib.new("md5", usedforsecurity=False)
+        h = new_hasher(self._algorithm)
 
         if type_util.is_type(obj, "unittest.mock.Mock") or type_util.is_type(
             obj, "unittest.mock.MagicMock"
@@ -421,11 +690,15 @@ class _CacheFuncHasher:
             self.update(h, obj.size)
             self.update(h, obj.dtype.name)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
+            is_large = len(obj) >= _PANDAS_ROWS_LARGE
+            if is_large and not self._exact_hashing:
                 obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
 
             try:
-                self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
+                if is_large and self._exact_hashing:
+                    self.update(h, _hash_buffers(_pandas_buffers(obj), self._algorithm))
+                else:
+                    self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
                 return h.digest()
             except TypeError:
                 _LOGGER.warning(
@@ -443,15 +716,17 @@ class _CacheFuncHasher:
             obj = cast(pd.DataFrame, obj)
             self.update(h, obj.shape)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
+            is_large = len(obj) >= _PANDAS_ROWS_LARGE
+            if is_large and not self._exact_hashing:
                 obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
             try:
-                column_hash_bytes = self.to_bytes(
-                    pd.util.hash_pandas_object(obj.dtypes)
-                )
-                self.update(h, column_hash_bytes)
-                values_hash_bytes = self.to_bytes(pd.util.hash_pandas_object(obj))
-                self.update(h, values_hash_bytes)
+                # The row hashes are hashed as they are: hashing them as a
+                # Series would run them through hash_pandas_object again.
+                self.update(h, pd.util.hash_pandas_object(obj.dtypes).values.tobytes())
+                if is_large and self._exact_hashing:
+                    self.update(h, _hash_buffers(_pandas_buffers(obj), self._algorithm))
+                else:
+                    self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
                 return h.digest()
             except TypeError:
                 _LOGGER.warning(
@@ -470,11 +745,18 @@ class _CacheFuncHasher:
             self.update(h, str(obj.dtype).encode())
             self.update(h, obj.shape)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
+            is_large = len(obj) >= _PANDAS_ROWS_LARGE
+            if is_large and not self._exact_hashing:
                 obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
 
             try:
-                self.update(h, obj.hash(seed=0).to_arrow().to_string().encode())
+                if is_large and self._exact_hashing:
+                    self.update(
+                        h,
+                        _hash_buffers(_arrow_buffers(obj.to_arrow()), self._algorithm),
+                    )
+                else:
+                    self.update(h, obj.hash(seed=0).to_arrow().to_string().encode())
                 return h.digest()
             except TypeError:
                 _LOGGER.warning(
@@ -491,16 +773,26 @@ class _CacheFuncHasher:
             obj = cast(pl.DataFrame, obj)
             self.update(h, obj.shape)
 
-            if len(obj) >= _PANDAS_ROWS_LARGE:
+            is_large = len(obj) >= _PANDAS_ROWS_LARGE
+            if is_large and not self._exact_hashing:
                 obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
             try:
                 for c, t in obj.schema.items():
                     self.update(h, c.encode())
                     self.update(h, str(t).encode())
 
-                values_hash_bytes = (
-                    obj.hash_rows(seed=0).hash(seed=0).to_arrow().to_string().encode()
-                )
+                if is_large and self._exact_hashing:
+                    values_hash_bytes = _hash_buffers(
+                        _arrow_buffers(obj.to_arrow()), self._algorithm
+                    )
+                else:
+                    values_hash_bytes = (
+                        obj.hash_rows(seed=0)
+                        .hash(seed=0)
+                        .to_arrow()
+                        .to_string()
+                        .encode()
+                    )
 
                 self.update(h, values_hash_bytes)
                 return h.digest()
@@ -523,13 +815,23 @@ class _CacheFuncHasher:
             self.update(h, str(obj.dtype))
 
             if obj.size >= _NP_SIZE_LARGE:
-                import numpy as np
-
-                state = np.random.RandomState(0)
-                obj = state.choice(obj.flat, size=_NP_SAMPLE_SIZE)
+                if self._exact_hashing:
+                    if not obj.dtype.hasobject:
+                        self.update(
+                            h, _hash_buffers([_numpy_buffer(obj)], self._algorithm)
+                        )
+                        return h.digest()
+                else:
+                    state = np.random.RandomState(0)
+                    obj = state.choice(obj.flat, size=_NP_SAMPLE_SIZE)
 
             self.update(h, obj.tobytes())
             return h.digest()
+
+        elif type_util.is_type(obj, _PYARROW_DATA_TYPE_RE):
+            # PyArrow data is hashed exactly, since its memory can be hashed
+            # directly.
+            return _hash_buffers(_arrow_buffers(obj), self._algorithm)
         elif type_util.is_type(obj, "PIL.Image.Image"):
             import numpy as np
             from PIL.Image import Image
@@ -42,22 +42,27 @@ entries for a single `@st.cache_data` decorated function.
   │                               │
   └──┬────────────────────────────┘
      │
-     │                ┌──────────────────────┐
-     │                │  CacheStorage        │
-     │ create(context)│                      │
-     └────────────────►    - get             │
-                      │    - set             │
-                      │    - delete          │
-                      │    - close (optional)│
-                      │    - clear           │
-                      └──────────────────────┘
+     │                ┌───────────────────────────────┐
+     │                │  CacheStorage                 │
+     │ create(context)│                               │
+     └────────────────►    - get                      │
+                      │    - set                      │
+                      │    - get_with_buffers (opt.)  │
+                      │    - set_with_buffers (opt.)  │
+                      │    - delete                   │
+                      │    - close (optional)         │
+                      │    - clear                    │
+                      └───────────────────────────────┘
 """
 
 from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Literal, Protocol
+from typing import TYPE_CHECKING, Literal, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
 class CacheStorageError(Exception):
@@ -97,6 +102,11 @@ class CacheStorageContext:
         The maximum number of entries to store in the cache storage.
         If None, the cache storage will not limit the number of entries.
 
+    max_size : int or None
+        The maximum total size, in bytes, of the entries to store in the cache
+        storage. If None, the cache storage will not limit the size of its
+        entries.
+
     persist : Literal["disk"] or None
         The persistence mode for the cache storage.
         Legacy parameter, that used in Streamlit current cache storage implementation.
@@ -108,6 +118,7 @@ class CacheStorageContext:
     function_display_name: str
     ttl_seconds: float | None = None
     max_entries: int | None = None
+    max_size: int | None = None
     persist: Literal["disk"] | None = None
 
 
@@ -141,6 +152,40 @@ class CacheStorage(Protocol):
         """Sets the value for a given key"""
         raise NotImplementedError
 
+    def get_with_buffers(self, key: str) -> tuple[bytes, list[memoryview]]:
+        """Returns the stored value for the key, and the out-of-band buffers
+        that were stored with it by set_with_buffers.
+
+        The buffers are read-only. Storages may return views of memory they
+        hold on to (e.g. memory-mapped files), so callers that want to modify
+        them must copy them first.
+
+        It is optional to implement: the default implementation returns the
+        value stored with set(), without any buffers.
+
+        Raises
+        ------
+        CacheStorageKeyNotFoundError
+            Raised if the key is not in the storage.
+        """
+        return self.get(key), []
+
+    def set_with_buffers(
+        self, key: str, value: bytes, buffers: Sequence[memoryview]
+    ) -> None:
+        """Sets the value for a given key, along with out-of-band buffers that
+        the value refers to, e.g. the data of NumPy arrays pickled with
+        protocol 5. Entries set this way are read with get_with_buffers().
+
+        The buffers are read-only views of memory that won't change, so
+        storages may hold on to them without copying them.
+
+        It is optional to implement: storages that don't support buffers raise
+        NotImplementedError, and the caller stores the entry with set()
+        instead.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, key: str) -> None:
         """Delete a given key"""
@@ -13,6 +13,8 @@
 # limitations under the License.
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
     CacheStorage,
     CacheStorageContext,
@@ -23,6 +25,9 @@ from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
     InMemoryCacheStorageWrapper,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class MemoryCacheStorageManager(CacheStorageManager):
     def create(self, context: CacheStorageContext) -> CacheStorage:
@@ -50,6 +55,18 @@ class DummyCacheStorage(CacheStorage):
     def set(self, key: str, value: bytes) -> None:
         pass
 
+    def get_with_buffers(self, key: str) -> tuple[bytes, list[memoryview]]:
+        """
+        Dummy gets the value and buffers for a given key,
+        always raises an CacheStorageKeyNotFoundError
+        """
+        raise CacheStorageKeyNotFoundError("Key not found in dummy cache")
+
+    def set_with_buffers(
+        self, key: str, value: bytes, buffers: Sequence[memoryview]
+    ) -> None:
+        pass
+
     def delete(self, key: str) -> None:
         pass
 
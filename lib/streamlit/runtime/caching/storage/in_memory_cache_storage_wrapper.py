@@ -15,20 +15,35 @@ from __future__ import annotations
 
 import math
 import threading
+from typing import TYPE_CHECKING, Callable, Final
 
-from cachetools import TTLCache
-
+from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.runtime.caching import cache_utils
+from streamlit.runtime.caching.cache_memory import CacheMemoryBudget, SizedTTLCache
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
     CacheStorage,
     CacheStorageContext,
+    CacheStorageError,
     CacheStorageKeyNotFoundError,
 )
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, CounterStat
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 _LOGGER = get_logger(__name__)
 
+# The in-memory caches of all st.cache_data functions share this budget.
+_memory_budget: Final = CacheMemoryBudget(
+    lambda: config.get_option("global.maxCacheDataBytes")
+)
+
+
+def _get_entry_size(entry: tuple[bytes, list[memoryview]]) -> int:
+    entry_bytes, buffers = entry
+    return len(entry_bytes) + sum(buffer.nbytes for buffer in buffers)
+
 
 class InMemoryCacheStorageWrapper(CacheStorage):
     """
@@ -41,7 +56,10 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     automatically removed if a given time to live (TTL) has passed.
 
     The in-memory cache is also an LRU cache, which means that the entries
-    are automatically removed if the cache size exceeds a given maxsize.
+    are automatically removed if the cache size exceeds a given maxsize, if
+    their total size in bytes exceeds a given max_size, or if the in-memory
+    caches of all st.cache_data functions together exceed
+    global.maxCacheDataBytes.
 
     If the storage implements its strategy for maxsize, it is recommended
     (but not necessary) that the storage implement the same LRU strategy,
@@ -62,14 +80,28 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         self.function_display_name = context.function_display_name
         self._ttl_seconds = context.ttl_seconds
         self._max_entries = context.max_entries
-        self._mem_cache: TTLCache[str, bytes] = TTLCache(
-            maxsize=self.max_entries,
-            ttl=self.ttl_seconds,
-            timer=cache_utils.TTLCACHE_TIMER,
+        self._max_size = context.max_size
+        # key -> (value, out-of-band buffers set along with the value)
+        self._mem_cache: SizedTTLCache[str, tuple[bytes, list[memoryview]]] = (
+            SizedTTLCache(
+                maxsize=self.max_entries,
+                ttl=self.ttl_seconds,
+                timer=cache_utils.TTLCACHE_TIMER,
+                max_bytes=self.max_size,
+                getsizeof=_get_entry_size,
+                on_evict=self._on_evict,
+            )
         )
         self._mem_cache_lock = threading.Lock()
         self._persist_storage = persist_storage
 
+        # Keys evicted from the in-memory cache, which we have yet to tell our
+        # eviction listeners about. Guarded by self._mem_cache_lock.
+        self._evicted_keys: list[str] = []
+        self._eviction_listeners: list[Callable[[str], None]] = []
+
+        _memory_budget.register(self)
+
     @property
     def ttl_seconds(self) -> float:
         return self._ttl_seconds if self._ttl_seconds is not None else math.inf
@@ -78,23 +110,83 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     def max_entries(self) -> float:
         return float(self._max_entries) if self._max_entries is not None else math.inf
 
+    @property
+    def max_size(self) -> float:
+        return float(self._max_size) if self._max_size is not None else math.inf
+
+    @property
+    def currsize_bytes(self) -> int:
+        """The total size, in bytes, of the entries in the in-memory cache"""
+        return self._mem_cache.currsize_bytes
+
+    @property
+    def oldest_use(self) -> int | None:
+        with self._mem_cache_lock:
+            return self._mem_cache.oldest_use
+
+    def evict_oldest(self) -> None:
+        """Evict the least recently used entry from the in-memory cache"""
+        with self._mem_cache_lock:
+            if len(self._mem_cache) > 0:
+                self._mem_cache.evict_oldest()
+        self._notify_eviction_listeners()
+
+    def add_eviction_listener(self, listener: Callable[[str], None]) -> None:
+        """Call `listener` with the key of each entry that is evicted from the
+        in-memory cache to make room for other entries.
+
+        Listeners are called without holding any of our locks.
+        """
+        self._eviction_listeners.append(listener)
+
     def get(self, key: str) -> bytes:
         """
         Returns the stored value for the key or raise CacheStorageKeyNotFoundError if
         the key is not found
         """
         try:
-            entry_bytes = self._read_from_mem_cache(key)
+            entry_bytes, buffers = self._read_from_mem_cache(key)
         except CacheStorageKeyNotFoundError:
             entry_bytes = self._persist_storage.get(key)
-            self._write_to_mem_cache(key, entry_bytes)
+            buffers = []
+            self._write_to_mem_cache(key, entry_bytes, buffers)
+
+        if buffers:
+            raise CacheStorageError(
+                "The entry was stored with out-of-band buffers. Use get_with_buffers."
+            )
         return entry_bytes
 
     def set(self, key: str, value: bytes) -> None:
         """Sets the value for a given key"""
-        self._write_to_mem_cache(key, value)
+        self._write_to_mem_cache(key, value, [])
         self._persist_storage.set(key, value)
 
+    def get_with_buffers(self, key: str) -> tuple[bytes, list[memoryview]]:
+        """
+        Returns the stored value and out-of-band buffers for the key or raise
+        CacheStorageKeyNotFoundError if the key is not found
+        """
+        try:
+            return self._read_from_mem_cache(key)
+        except CacheStorageKeyNotFoundError:
+            entry_bytes, buffers = self._persist_storage.get_with_buffers(key)
+            self._write_to_mem_cache(key, entry_bytes, buffers)
+            return entry_bytes, buffers
+
+    def set_with_buffers(
+        self, key: str, value: bytes, buffers: Sequence[memoryview]
+    ) -> None:
+        """Sets the value and out-of-band buffers for a given key"""
+        self._write_to_mem_cache(key, value, list(buffers))
+        try:
+            self._persist_storage.set_with_buffers(key, value, buffers)
+        except NotImplementedError:
+            # We can keep the buffers in memory, but the underlying storage
+            # can't persist them: let the caller store the entry with set().
+            self._remove_from_mem_cache(key)
+            raise
+
     def delete(self, key: str) -> None:
         """Delete a given key"""
         self._remove_from_mem_cache(key)
@@ -111,35 +203,63 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         stats = []
 
         with self._mem_cache_lock:
-            for item in self._mem_cache.values():
+            for entry_bytes, buffers in self._mem_cache.values():
                 stats.append(
                     CacheStat(
                         category_name="st_cache_data",
                         cache_name=self.function_display_name,
-                        byte_length=len(item),
+                        byte_length=len(entry_bytes)
+                        + sum(buffer.nbytes for buffer in buffers),
                     )
                 )
         return stats
 
+    def get_counter_stats(self) -> list[CounterStat]:
+        """Returns the number of entries evicted from the in-memory cache"""
+        return [
+            CounterStat(
+                family_name="cache_evictions",
+                category_name="st_cache_data",
+                cache_name=self.function_display_name,
+                value=self._mem_cache.evictions,
+            )
+        ]
+
     def close(self) -> None:
         """Closes the cache storage"""
         self._persist_storage.close()
 
-    def _read_from_mem_cache(self, key: str) -> bytes:
+    def _read_from_mem_cache(self, key: str) -> tuple[bytes, list[memoryview]]:
         with self._mem_cache_lock:
             if key in self._mem_cache:
-                entry = bytes(self._mem_cache[key])
+                entry_bytes, buffers = self._mem_cache[key]
                 _LOGGER.debug("Memory cache HIT: %s", key)
-                return entry
+                return bytes(entry_bytes), list(buffers)
 
             else:
                 _LOGGER.debug("Memory cache MISS: %s", key)
                 raise CacheStorageKeyNotFoundError("Key not found in mem cache")
 
-    def _write_to_mem_cache(self, key: str, entry_bytes: bytes) -> None:
+    def _write_to_mem_cache(
+        self, key: str, entry_bytes: bytes, buffers: list[memoryview]
+    ) -> None:
         with self._mem_cache_lock:
-            self._mem_cache[key] = entry_bytes
+            self._mem_cache[key] = (entry_bytes, buffers)
+        self._notify_eviction_listeners()
+        _memory_budget.enforce()
 
     def _remove_from_mem_cache(self, key: str) -> None:
         with self._mem_cache_lock:
             self._mem_cache.pop(key, None)
+
+    def _on_evict(self, key: str, entry: tuple[bytes, list[memoryview]]) -> None:
+        # Called by self._mem_cache, so we're holding self._mem_cache_lock.
+        self._evicted_keys.append(key)
+
+    def _notify_eviction_listeners(self) -> None:
+        with self._mem_cache_lock:
+            evicted_keys = self._evicted_keys
+            self._evicted_keys = []
+        for key in evicted_keys:
+            for listener in self._eviction_listeners:
+                listener(key)
@@ -0,0 +1,314 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declares the DiskCacheIndex class, which records the files in the disk
+cache folder, and evicts them when they expire or the cache is full.
+
+The index is a SQLite database in the cache folder. It holds one row per cache
+file, with the file's size, when it expires, and when it was last used. SQLite
+locks the database for us, so any number of threads and server processes on
+one host can share the cache folder: each operation opens its own connection,
+and runs in a single write transaction, which also covers moving new cache
+files into place and removing the files that are evicted.
+
+The cache files remain the source of truth for what is cached. A file that
+the index doesn't know about is still read (e.g. if the index couldn't be
+updated when the file was written), and a row whose file is gone is dropped.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import time
+from typing import Callable, Final, TypeVar
+
+from streamlit.logger import get_logger
+
+_T = TypeVar("_T")
+
+_LOGGER: Final = get_logger(__name__)
+
+_INDEX_FILE_NAME: Final = "index.sqlite3"
+
+# Increment this when changing the schema. Indexes with an older version are
+# recreated from the files in the cache folder.
+_SCHEMA_VERSION: Final = 1
+
+_SCHEMA: Final = [
+    """
+    CREATE TABLE entries (
+        file_name TEXT PRIMARY KEY,
+        function_key TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX entries_by_function ON entries(function_key, accessed_at)",
+    "CREATE INDEX entries_by_access ON entries(accessed_at)",
+    "CREATE INDEX entries_by_expiry ON entries(expires_at)",
+]
+
+# How long we wait for other threads or processes to finish writing to the
+# index before giving up.
+_BUSY_TIMEOUT_SECONDS: Final = 10.0
+
+
+class DiskCacheIndex:
+    """The index of the cache files in a folder.
+
+    All methods are thread-safe, and safe to call from several processes at
+    once. The index is only used to expire and evict files, so if it can't be
+    used, errors are logged, and the cache keeps working without eviction.
+    """
+
+    def __init__(self, cache_dir: str, file_extension: str):
+        """Create a DiskCacheIndex.
+
+        Parameters
+        ----------
+        cache_dir : str
+            The folder that holds the cache files, and the index.
+
+        file_extension : str
+            The extension of the cache files, without a leading dot. Only files
+            with this extension are indexed when the index is created.
+        """
+        self._cache_dir = cache_dir
+        self._file_extension = file_extension
+
+    def touch(self, file_name: str) -> bool:
+        """Record that a cache file is being read.
+
+        Returns False, and removes the file, if it has expired.
+        """
+
+        def touch_entry(conn: sqlite3.Connection) -> bool:
+            now = time.time()
+            row = conn.execute(
+                "SELECT expires_at FROM entries WHERE file_name = ?", (file_name,)
+            ).fetchone()
+            if row is None:
+                return True
+            if row[0] <= now:
+                self._delete(conn, [file_name])
+                return False
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE file_name = ?",
+                (now, file_name),
+            )
+            return True
+
+        return self._run_transaction(touch_entry) is not False
+
+    def add(
+        self,
+        file_name: str,
+        temp_path: str,
+        function_key: str,
+        ttl_seconds: float,
+        max_entries: float,
+        max_bytes: float,
+    ) -> None:
+        """Move a newly written cache file into place, and evict files to stay
+        within the limits.
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the file, within the cache folder.
+
+        temp_path : str
+            The path that the file was written to. It's renamed to file_name.
+
+        function_key : str
+            The key of the cached function that the file belongs to.
+
+        ttl_seconds : float
+            The time, in seconds, after which the file expires. May be
+            math.inf.
+
+        max_entries : float
+            The maximum number of files of the function. The least recently
+            used files of the function are evicted beyond that. May be
+            math.inf.
+
+        max_bytes : float
+            The maximum total size of all files in the cache folder, whichever
+            function they belong to. The least recently used files are evicted
+            beyond that. May be math.inf.
+        """
+        path = os.path.join(self._cache_dir, file_name)
+
+        def add_entry(conn: sqlite3.Connection) -> None:
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(file_name, function_key, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (file_name, function_key, size, now + ttl_seconds, now),
+            )
+
+            self._delete(
+                conn,
+                [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT file_name FROM entries WHERE expires_at <= ?", (now,)
+                    )
+                ],
+            )
+
+            if not math.isinf(max_entries):
+                self._delete(
+                    conn,
+                    [
+                        row[0]
+                        for row in conn.execute(
+                            "SELECT file_name FROM entries WHERE function_key = ? "
+                            "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?",
+                            (function_key, int(max_entries)),
+                        )
+                    ],
+                )
+
+            if not math.isinf(max_bytes):
+                total_size = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()[0]
+                evicted: list[str] = []
+                if total_size > max_bytes:
+                    for evicted_file_name, evicted_size in conn.execute(
+                        "SELECT file_name, size FROM entries ORDER BY accessed_at"
+                    ):
+                        evicted.append(evicted_file_name)
+                        total_size -= evicted_size
+                        if total_size <= max_bytes:
+                            break
+                self._delete(conn, evicted)
+
+        self._run_transaction(add_entry)
+        if os.path.exists(temp_path):
+            # We couldn't use the index. Keep the file anyway.
+            os.replace(temp_path, path)
+
+    def remove(self, file_name: str) -> None:
+        """Remove a cache file and its row."""
+        self._run_transaction(lambda conn: self._delete(conn, [file_name]))
+
+    def remove_function(self, function_key: str) -> bool:
+        """Remove all cache files of a function.
+
+        Returns False if the index couldn't be used, so the caller has to find
+        the function's files itself.
+        """
+
+        def remove_entries(conn: sqlite3.Connection) -> bool:
+            self._delete(
+                conn,
+                [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT file_name FROM entries WHERE function_key = ?",
+                        (function_key,),
+                    )
+                ],
+            )
+            return True
+
+        return self._run_transaction(remove_entries) is True
+
+    def _run_transaction(self, body: Callable[[sqlite3.Connection], _T]) -> _T | None:
+        """Open the index, and call `body` in a write transaction on it.
+
+        Returns None if the index can't be used, e.g. because the cache folder
+        doesn't exist (in which case there is nothing to index). Errors are
+        logged, and roll the transaction back.
+        """
+        conn = None
+        try:
+            conn = sqlite3.connect(
+                os.path.join(self._cache_dir, _INDEX_FILE_NAME),
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+            )
+            # Readers never block writers (and vice versa) in WAL mode. This is
+            # a no-op once the index is in WAL mode.
+            conn.execute("PRAGMA journal_mode = WAL")
+            # Take the write lock right away, so that what we read stays true
+            # until we commit.
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                self._create_schema(conn)
+            result = body(conn)
+            conn.execute("COMMIT")
+            return result
+        except (sqlite3.Error, OSError) as ex:
+            _LOGGER.debug("Unable to use the disk cache index", exc_info=ex)
+            if conn is not None and conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return None
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the index, and add the cache files that are already in the
+        cache folder (e.g. written by an older version of Streamlit).
+        """
+        conn.execute("DROP TABLE IF EXISTS entries")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+
+        now = time.time()
+        suffix = f".{self._file_extension}"
+        for file_name in os.listdir(self._cache_dir):
+            if not file_name.endswith(suffix):
+                continue
+            try:
+                stat = os.stat(os.path.join(self._cache_dir, file_name))
+            except OSError:
+                continue
+            # Cache file names are "{function_key}-{value_key}.{extension}".
+            function_key = file_name.partition("-")[0]
+            conn.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?)",
+                (
+                    file_name,
+                    function_key,
+                    stat.st_size,
+                    math.inf,
+                    min(stat.st_mtime, now),
+                ),
+            )
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _delete(self, conn: sqlite3.Connection, file_names: list[str]) -> None:
+        """Delete rows and their files. We hold the write lock on the index,
+        so no other thread or process can move a new file with the same name
+        into place while we do.
+        """
+        for file_name in file_names:
+            conn.execute("DELETE FROM entries WHERE file_name = ?", (file_name,))
+            try:
+                os.remove(os.path.join(self._cache_dir, file_name))
+            except FileNotFoundError:
+                pass
+            except OSError as ex:
+                _LOGGER.debug("Unable to remove %s", file_name, exc_info=ex)
@@ -25,13 +25,15 @@ How these classes work together
 
 - LocalDiskCacheStorageManager : each instance of this is able
 to create LocalDiskCacheStorage instances wrapped by InMemoryCacheStorageWrapper,
-and to clear data from cache storage folder. It is also LocalDiskCacheStorageManager
-responsibility to check if the context is valid for the storage, and to log warning
-if the context is not valid.
+and to clear data from cache storage folder.
 
 - LocalDiskCacheStorage : each instance of this is able to get, set, delete, and clear
 entries from disk for a single `@st.cache_data` decorated function if `persist="disk"`
-is used in CacheStorageContext.
+is used in CacheStorageContext. Entries expire after the function's TTL, and
+are evicted when the function has more than max_entries of them, or when the
+cache folder holds more than global.maxDiskCacheBytes. The DiskCacheIndex
+of the cache folder keeps track of that for all functions, and all server
+processes, that share the folder.
 
 
     ┌───────────────────────────────┐
@@ -59,12 +61,15 @@ is used in CacheStorageContext.
 from __future__ import annotations
 
 import math
+import mmap
 import os
 import shutil
-from typing import Final
+import struct
+import tempfile
+from typing import TYPE_CHECKING, BinaryIO, Final, NamedTuple
 
-from streamlit import errors
-from streamlit.file_util import get_streamlit_file_path, streamlit_read, streamlit_write
+from streamlit import config, env_util
+from streamlit.file_util import get_streamlit_file_path, streamlit_read
 from streamlit.logger import get_logger
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
     CacheStorage,
@@ -76,6 +81,10 @@ from streamlit.runtime.caching.storage.cache_storage_protocol import (
 from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
     InMemoryCacheStorageWrapper,
 )
+from streamlit.runtime.caching.storage.local_disk_cache_index import DiskCacheIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -88,6 +97,17 @@ _CACHE_DIR_NAME: Final = "cache"
 # (`@st.cache_data` was originally called `@st.memo`)
 _CACHED_FILE_EXTENSION: Final = "memo"
 
+# Cache files of entries stored with out-of-band buffers start with this magic
+# string. (Cache files of other entries are plain pickles.) It's followed by a
+# header: the length of the pickled value and the number of buffers, then the
+# length of each buffer. The pickled value and each buffer start at an offset
+# that is a multiple of _BUFFER_ALIGNMENT, so that arrays can be used straight
+# from a memory-mapped file.
+_BUFFERED_FILE_MAGIC: Final = b"STCACHE5"
+_BUFFERED_FILE_HEADER: Final = struct.Struct("<QQ")
+_BUFFER_LENGTH: Final = struct.Struct("<Q")
+_BUFFER_ALIGNMENT: Final = 64
+
 
 class LocalDiskCacheStorageManager(CacheStorageManager):
     def create(self, context: CacheStorageContext) -> CacheStorage:
@@ -103,16 +123,9 @@ class LocalDiskCacheStorageManager(CacheStorageManager):
             shutil.rmtree(cache_path)
 
     def check_context(self, context: CacheStorageContext) -> None:
-        if (
-            context.persist == "disk"
-            and context.ttl_seconds is not None
-            and not math.isinf(context.ttl_seconds)
-        ):
-            _LOGGER.warning(
-                f"The cached function '{context.function_display_name}' has a TTL "
-                "that will be ignored. Persistent cached functions currently don't "
-                "support TTL."
-            )
+        # Persisted entries honor the TTL and max_entries of the cached
+        # function, so there's nothing to warn about.
+        pass
 
 
 class LocalDiskCacheStorage(CacheStorage):
@@ -140,14 +153,39 @@ class LocalDiskCacheStorage(CacheStorage):
         raise CacheStorageKeyNotFoundError if not found, or not configured
         with persist="disk"
         """
+        value, buffers = self.get_with_buffers(key)
+        if buffers:
+            raise CacheStorageError(
+                "The entry was stored with out-of-band buffers. Use get_with_buffers."
+            )
+        return value
+
+    def get_with_buffers(self, key: str) -> tuple[bytes, list[memoryview]]:
+        """
+        Returns the stored value and out-of-band buffers for the key if
+        persisted, raise CacheStorageKeyNotFoundError if not found, or not
+        configured with persist="disk"
+
+        Where possible, the buffers are memory-mapped from the cache file, so
+        that they aren't read into memory until they are used.
+        """
         if self.persist == "disk":
             path = self._get_cache_file_path(key)
+            index = _get_cache_index()
+            if not index.touch(os.path.basename(path)):
+                raise CacheStorageKeyNotFoundError("Key expired in disk cache")
             try:
                 with streamlit_read(path, binary=True) as input:
-                    value = input.read()
+                    magic = input.read(len(_BUFFERED_FILE_MAGIC))
+                    if magic == _BUFFERED_FILE_MAGIC:
+                        entry = _read_buffered_file(input)
+                    else:
+                        entry = bytes(magic + input.read()), []
                     _LOGGER.debug("Disk cache HIT: %s", key)
-                    return bytes(value)
+                    return entry
             except FileNotFoundError:
+                # Forget the file, in case the index still has it.
+                index.remove(os.path.basename(path))
                 raise CacheStorageKeyNotFoundError("Key not found in disk cache")
             except Exception as ex:
                 _LOGGER.exception("Error reading from cache")
@@ -162,16 +200,23 @@ class LocalDiskCacheStorage(CacheStorage):
         if self.persist == "disk":
             path = self._get_cache_file_path(key)
             try:
-                with streamlit_write(path, binary=True) as output:
-                    output.write(value)
-            except errors.Error as ex:
+                _write_cache_file(path, [value], self._get_limits())
+            except OSError as ex:
+                _LOGGER.debug("Unable to write to cache", exc_info=ex)
+                raise CacheStorageError("Unable to write to cache") from ex
+
+    def set_with_buffers(
+        self, key: str, value: bytes, buffers: Sequence[memoryview]
+    ) -> None:
+        """Sets the value and out-of-band buffers for a given key"""
+        if self.persist == "disk":
+            path = self._get_cache_file_path(key)
+            try:
+                _write_cache_file(
+                    path, _get_buffered_file_chunks(value, buffers), self._get_limits()
+                )
+            except OSError as ex:
                 _LOGGER.debug("Unable to write to cache", exc_info=ex)
-                # Clean up file so we don't leave zero byte files.
-                try:
-                    os.remove(path)
-                except (FileNotFoundError, OSError):
-                    # If we can't remove the file, it's not a big deal.
-                    pass
                 raise CacheStorageError("Unable to write to cache") from ex
 
     def delete(self, key: str) -> None:
@@ -180,6 +225,7 @@ class LocalDiskCacheStorage(CacheStorage):
         """
         if self.persist == "disk":
             path = self._get_cache_file_path(key)
+            _get_cache_index().remove(os.path.basename(path))
             try:
                 os.remove(path)
             except FileNotFoundError:
@@ -195,9 +241,13 @@ class LocalDiskCacheStorage(CacheStorage):
         cache_dir = get_cache_folder_path()
 
         if os.path.isdir(cache_dir):
-            # We try to remove all files in the cache directory that start with
-            # the function key, whether `clear` called for `self.persist`
-            # storage or not, to avoid leaving orphaned files in the cache directory.
+            # We remove the function's files whether `clear` is called for
+            # `self.persist` storage or not, to avoid leaving orphaned files in
+            # the cache directory.
+            if _get_cache_index().remove_function(self.function_key):
+                return
+
+            # The index can't be used, so we have to look for the files.
             for file_name in os.listdir(cache_dir):
                 if self._is_cache_file(file_name):
                     os.remove(os.path.join(cache_dir, file_name))
@@ -205,6 +255,15 @@ class LocalDiskCacheStorage(CacheStorage):
     def close(self) -> None:
         """Dummy implementation of close, we don't need to actually "close" anything"""
 
+    def _get_limits(self) -> _CacheFileLimits:
+        max_bytes = config.get_option("global.maxDiskCacheBytes")
+        return _CacheFileLimits(
+            function_key=self.function_key,
+            ttl_seconds=self.ttl_seconds,
+            max_entries=self.max_entries,
+            max_bytes=max_bytes if max_bytes > 0 else math.inf,
+        )
+
     def _get_cache_file_path(self, value_key: str) -> str:
         """Return the path of the disk cache file for the given value."""
         cache_dir = get_cache_folder_path()
@@ -221,3 +280,110 @@ class LocalDiskCacheStorage(CacheStorage):
 
 def get_cache_folder_path() -> str:
     return get_streamlit_file_path(_CACHE_DIR_NAME)
+
+
+def _get_cache_index() -> DiskCacheIndex:
+    return DiskCacheIndex(get_cache_folder_path(), _CACHED_FILE_EXTENSION)
+
+
+class _CacheFileLimits(NamedTuple):
+    """The limits that apply to a function's cache files."""
+
+    function_key: str
+    ttl_seconds: float
+    max_entries: float
+    max_bytes: float
+
+
+def _write_cache_file(
+    path: str, chunks: Sequence[bytes | memoryview], limits: _CacheFileLimits
+) -> None:
+    """Write a cache file, and evict other files to stay within the limits.
+
+    The file is written under a temporary name, and then moved into place, so
+    that readers (in this or other processes) never see a partially written
+    file, and readers that have memory-mapped a previous version of it never
+    see it change.
+    """
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as output:
+            for chunk in chunks:
+                output.write(chunk)
+        DiskCacheIndex(cache_dir, _CACHED_FILE_EXTENSION).add(
+            os.path.basename(path),
+            temp_path,
+            function_key=limits.function_key,
+            ttl_seconds=limits.ttl_seconds,
+            max_entries=limits.max_entries,
+            max_bytes=limits.max_bytes,
+        )
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+
+
+def _get_buffered_file_chunks(
+    value: bytes, buffers: Sequence[memoryview]
+) -> list[bytes | memoryview]:
+    """Return the contents of a cache file for a value and its out-of-band
+    buffers, in chunks.
+    """
+    chunks: list[bytes | memoryview] = [
+        _BUFFERED_FILE_MAGIC,
+        _BUFFERED_FILE_HEADER.pack(len(value), len(buffers)),
+        *(_BUFFER_LENGTH.pack(buffer.nbytes) for buffer in buffers),
+    ]
+    offset = sum(len(chunk) for chunk in chunks)
+    data_chunks: list[bytes | memoryview] = [value, *buffers]
+    for chunk in data_chunks:
+        padding = _aligned(offset) - offset
+        chunks.append(b"\0" * padding)
+        chunks.append(chunk)
+        offset += padding + memoryview(chunk).nbytes
+    return chunks
+
+
+def _read_buffered_file(input: BinaryIO) -> tuple[bytes, list[memoryview]]:
+    """Read a value and its out-of-band buffers from a cache file, positioned
+    right after its magic string.
+    """
+    if env_util.IS_WINDOWS:
+        # Windows doesn't let us replace or delete files that are mapped into
+        # memory, so we read them instead.
+        input.seek(0)
+        data = memoryview(input.read()).toreadonly()
+    else:
+        data = memoryview(mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ))
+
+    offset = len(_BUFFERED_FILE_MAGIC)
+    value_length, num_buffers = _BUFFERED_FILE_HEADER.unpack_from(data, offset)
+    offset += _BUFFERED_FILE_HEADER.size
+    buffer_lengths = [
+        _BUFFER_LENGTH.unpack_from(data, offset + i * _BUFFER_LENGTH.size)[0]
+        for i in range(num_buffers)
+    ]
+    offset += num_buffers * _BUFFER_LENGTH.size
+
+    offset = _aligned(offset)
+    value = bytes(data[offset : offset + value_length])
+    offset += value_length
+
+    buffers = []
+    for buffer_length in buffer_lengths:
+        offset = _aligned(offset)
+        buffers.append(data[offset : offset + buffer_length])
+        offset += buffer_length
+
+    if offset > len(data):
+        raise CacheStorageError("Truncated cache file")
+    return value, buffers
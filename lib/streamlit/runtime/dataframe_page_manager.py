@@ -0,0 +1,251 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Server-side storage of dataframes that are sent to the browser in pages."""
+
+from __future__ import annotations
+
+import collections
+import threading
+from typing import TYPE_CHECKING, Final
+
+from streamlit import dataframe_util, util
+from streamlit.logger import get_logger
+from streamlit.runtime import worker_shard
+from streamlit.runtime.caching.cache_type import CacheType
+from streamlit.runtime.caching.hashing import new_hasher, update_hash
+from streamlit.runtime.media_file_manager import _get_session_id
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_LOGGER: Final = get_logger(__name__)
+
+# The URL path that rows of paged dataframes are requested from.
+DATAFRAME_PAGE_ENDPOINT: Final = "_stcore/dataframe"
+
+# The number of rows in a page of a paged dataframe. The first page is sent
+# with the element, and the frontend requests the others when they're
+# scrolled into view.
+PAGE_ROWS: Final = 1000
+
+# The maximum number of rows that can be requested at once.
+MAX_REQUESTED_ROWS: Final = 20 * PAGE_ROWS
+
+# The maximum number of sort orders whose row indices are kept per table.
+_MAX_SORT_ORDERS_PER_TABLE: Final = 4
+
+
+class _PagedTable:
+    """A table that is sent to the browser in pages, and the row indices of
+    the orders that it was recently sorted in.
+    """
+
+    def __init__(self, table: pa.Table):
+        self.table = table
+        # Dict of [(column, ascending) -> row indices], in least recently
+        # used order.
+        self._sort_indices: collections.OrderedDict[tuple[str, bool], pa.Array] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_rows(
+        self, offset: int, limit: int, sort_column: str | None, ascending: bool
+    ) -> pa.Table:
+        if sort_column is None:
+            return self.table.slice(offset, limit)
+
+        indices = self._get_sort_indices(sort_column, ascending)
+        return self.table.take(indices.slice(offset, limit))
+
+    def _get_sort_indices(self, column: str, ascending: bool) -> pa.Array:
+        import pyarrow.compute as pc
+
+        if column not in self.table.column_names:
+            raise ValueError(f"The table has no column {column!r}.")
+
+        key = (column, ascending)
+        with self._lock:
+            if key in self._sort_indices:
+                self._sort_indices.move_to_end(key)
+                return self._sort_indices[key]
+
+        # Sorting large tables takes a while, so we don't hold the lock. If
+        # two threads sort the table in the same order at once, they compute
+        # the same indices.
+        indices = pc.sort_indices(
+            self.table,
+            sort_keys=[(column, "ascending" if ascending else "descending")],
+            null_placement="at_end",
+        )
+
+        with self._lock:
+            self._sort_indices[key] = indices
+            while len(self._sort_indices) > _MAX_SORT_ORDERS_PER_TABLE:
+                self._sort_indices.popitem(last=False)
+        return indices
+
+
+def _compute_table_id(table: pa.Table) -> str:
+    hasher = new_hasher()
+    update_hash(table, hasher=hasher, cache_type=CacheType.DATA)
+    table_id = hasher.hexdigest()
+
+    # When we're one of several worker processes, page requests are routed by
+    # the table's ID, so it must be an ID that routes to us. Rehashing the ID
+    # keeps it stable for the same table.
+    while not worker_shard.is_local_key(table_id):
+        table_id = util.calc_md5(table_id)
+
+    return table_id
+
+
+class DataframePageManager:
+    """In-memory store of the Arrow tables of dataframes that are sent to the
+    browser in pages.
+
+    Like MediaFileManager, this keeps track of which tables are shown by
+    which AppSession, and at which coordinates, so that tables are removed
+    from memory when no more sessions show them. Identical tables are stored
+    once and shared by all sessions that show them.
+    """
+
+    def __init__(self) -> None:
+        # Dict of [table_id -> _PagedTable]
+        self._tables: dict[str, _PagedTable] = {}
+
+        # Dict[session ID][coordinates] -> table_id.
+        self._tables_by_session_and_coord: dict[str, dict[str, str]] = (
+            collections.defaultdict(dict)
+        )
+
+        # DataframePageManager is used from multiple threads, so all
+        # operations need to be protected with a Lock.
+        self._lock = threading.Lock()
+
+    def add(self, table: pa.Table, coordinates: str) -> str:
+        """Store a table for the current session, and return its ID.
+
+        If an identical table is stored already, its ID is returned, and the
+        current session is registered as a user.
+
+        Safe to call from any thread.
+
+        Parameters
+        ----------
+        table : pyarrow.Table
+            The table to store.
+
+        coordinates : str
+            Unique string identifying the element's location, so that the
+            table is no longer used by the session when it's replaced by
+            another table at the same location.
+
+        Returns
+        -------
+        str
+            The table's ID.
+        """
+        # Pages of a table would all get the RangeIndex of the first page.
+        table = dataframe_util.materialize_pandas_range_index(table)
+        table_id = _compute_table_id(table)
+        session_id = _get_session_id()
+
+        with self._lock:
+            if table_id not in self._tables:
+                self._tables[table_id] = _PagedTable(table)
+            self._tables_by_session_and_coord[session_id][coordinates] = table_id
+        return table_id
+
+    def get_num_rows(self, table_id: str) -> int | None:
+        """Return the number of rows of a table, or None if it doesn't exist.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            paged_table = self._tables.get(table_id)
+        return None if paged_table is None else paged_table.table.num_rows
+
+    def get_rows(
+        self,
+        table_id: str,
+        offset: int,
+        limit: int,
+        sort_column: str | None = None,
+        ascending: bool = True,
+    ) -> pa.Table | None:
+        """Return rows of a table, or None if the table doesn't exist.
+
+        Safe to call from any thread.
+
+        Parameters
+        ----------
+        table_id : str
+            The ID returned by `add`.
+
+        offset : int
+            The index of the first row to return.
+
+        limit : int
+            The maximum number of rows to return.
+
+        sort_column : str or None
+            The name of the column to sort the table by before selecting the
+            rows. Nulls are sorted last. If None, the table isn't sorted.
+
+        ascending : bool
+            Whether to sort in ascending or descending order.
+
+        Raises
+        ------
+        ValueError
+            If the table has no column named `sort_column`.
+        """
+        with self._lock:
+            paged_table = self._tables.get(table_id)
+        if paged_table is None:
+            return None
+        return paged_table.get_rows(offset, limit, sort_column, ascending)
+
+    def clear_session_refs(self, session_id: str | None = None) -> None:
+        """Remove the given session's table references.
+
+        (This does not remove any tables from the manager - you must call
+        `remove_orphaned_tables` for that.)
+
+        Should be called whenever ScriptRunner completes and when a session ends.
+
+        Safe to call from any thread.
+        """
+        if session_id is None:
+            session_id = _get_session_id()
+
+        with self._lock:
+            self._tables_by_session_and_coord.pop(session_id, None)
+
+    def remove_orphaned_tables(self) -> None:
+        """Remove all tables that are no longer referenced by any active
+        session.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            table_ids = set(self._tables)
+            for session_table_ids in self._tables_by_session_and_coord.values():
+                table_ids.difference_update(session_table_ids.values())
+
+            for table_id in table_ids:
+                _LOGGER.debug("Removing paged dataframe: %s", table_id)
+                del self._tables[table_id]
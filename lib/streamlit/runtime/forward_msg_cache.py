@@ -20,6 +20,7 @@ from weakref import WeakKeyDictionary
 from streamlit import config, util
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime import worker_shard
 from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
 
 if TYPE_CHECKING:
@@ -30,6 +31,30 @@ if TYPE_CHECKING:
 _LOGGER: Final = get_logger(__name__)
 
 
+# The body bytes of the most recently hashed ForwardMsg, keyed by its hash.
+# populate_hash_if_needed is almost always followed by the message being
+# written to a client, so remembering the bytes that were hashed lets
+# serialize_forward_msg skip serializing the (possibly huge) body again.
+_last_serialized_body: tuple[str, bytes] | None = None
+
+
+def _serialize_body(msg: ForwardMsg) -> bytes:
+    """Serialize a ForwardMsg without its hash and metadata fields."""
+    # Move the message's hash and metadata aside. They're not part of
+    # the body.
+    msg_hash = msg.hash
+    metadata = msg.metadata
+    msg.ClearField("hash")
+    msg.ClearField("metadata")
+
+    body = msg.SerializeToString()
+
+    # Restore hash and metadata.
+    msg.hash = msg_hash
+    msg.metadata.CopyFrom(metadata)
+    return body
+
+
 def populate_hash_if_needed(msg: ForwardMsg) -> str:
     """Computes and assigns the unique hash for a ForwardMsg.
 
@@ -47,21 +72,58 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
         to do this.)
 
     """
+    global _last_serialized_body
+
     if msg.hash == "":
-        # Move the message's metadata aside. It's not part of the
-        # hash calculation.
-        metadata = msg.metadata
-        msg.ClearField("metadata")
+        body = _serialize_body(msg)
 
         # MD5 is good enough for what we need, which is uniqueness.
-        msg.hash = util.calc_md5(msg.SerializeToString())
+        msg_hash = util.calc_md5(body)
+
+        # When we're one of several worker processes, requests for cached
+        # messages are routed by their hash, so it must be a hash that routes
+        # to us. Rehashing the hash keeps it stable for the same message.
+        while not worker_shard.is_local_key(msg_hash):
+            msg_hash = util.calc_md5(msg_hash)
 
-        # Restore metadata.
-        msg.metadata.CopyFrom(metadata)
+        msg.hash = msg_hash
+        _last_serialized_body = (msg.hash, body)
 
     return msg.hash
 
 
+def get_serialized_body(msg: ForwardMsg) -> bytes:
+    """Return the serialized body of a ForwardMsg, populating its hash if needed.
+
+    The body is the message serialized without its ``hash`` and ``metadata``
+    fields, i.e. exactly the bytes the hash is computed from. Since protobuf
+    allows fields to appear in any order on the wire, the full message can be
+    produced by appending the serialized hash and metadata to the body (see
+    ``runtime_util.serialize_forward_msg``).
+
+    Parameters
+    ----------
+    msg : ForwardMsg
+
+    Returns
+    -------
+    bytes
+        The serialized body. If the message was just hashed, the bytes that
+        were hashed are returned without serializing the message again.
+
+    """
+    global _last_serialized_body
+
+    msg_hash = populate_hash_if_needed(msg)
+    last_serialized_body = _last_serialized_body
+    if last_serialized_body is not None and last_serialized_body[0] == msg_hash:
+        return last_serialized_body[1]
+
+    body = _serialize_body(msg)
+    _last_serialized_body = (msg_hash, body)
+    return body
+
+
 def create_reference_msg(msg: ForwardMsg) -> ForwardMsg:
     """Create a ForwardMsg that refers to the given message via its hash.
 
@@ -14,12 +14,16 @@
 
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.stats import CacheStat, CacheStatsProvider
 
 if TYPE_CHECKING:
     from streamlit.proto.Delta_pb2 import Delta
+    from streamlit.runtime.session_manager import SessionManager
 
 
 class ForwardMsgQueue:
@@ -29,8 +33,14 @@ class ForwardMsgQueue:
     flushes all session queues and delivers their messages to the appropriate
     clients.
 
+    If max_bytes is set, the queue is bounded: it keeps track of the size of
+    its messages, coalesces Deltas more aggressively, and reports itself as
+    full once it holds more than max_bytes. The queue never rejects messages;
+    it's up to the producer to wait for capacity (see `wait_until_not_full`).
+
     ForwardMsgQueue is not thread-safe - a queue should only be used from
-    a single thread.
+    a single thread. The exceptions are `is_full` and `wait_until_not_full`,
+    which may be called from any thread.
     """
 
     _before_enqueue_msg: Callable[[ForwardMsg], None] | None = None
@@ -43,7 +53,7 @@ class ForwardMsgQueue:
         Used in static streamlit app generation."""
         ForwardMsgQueue._before_enqueue_msg = before_enqueue_msg
 
-    def __init__(self):
+    def __init__(self, max_bytes: int = 0):
         self._queue: list[ForwardMsg] = []
         # A mapping of (delta_path -> _queue.indexof(msg)) for each
         # Delta message in the queue. We use this for coalescing
@@ -52,6 +62,13 @@ class ForwardMsgQueue:
         # queue).
         self._delta_index_map: dict[tuple[int, ...], int] = {}
 
+        self._max_bytes = max_bytes
+        # The serialized size of the queued messages. Only tracked if the
+        # queue is bounded.
+        self._queued_bytes = 0
+        # Notified whenever messages are removed from the queue.
+        self._not_full = threading.Condition()
+
     def get_debug(self) -> dict[str, Any]:
         from google.protobuf.json_format import MessageToDict
 
@@ -63,6 +80,29 @@ class ForwardMsgQueue:
     def is_empty(self) -> bool:
         return len(self._queue) == 0
 
+    def is_full(self) -> bool:
+        """True if the queue is bounded and holds more than max_bytes.
+
+        Threading: SAFE. May be called on any thread.
+        """
+        return self._max_bytes > 0 and self._queued_bytes > self._max_bytes
+
+    def wait_until_not_full(self, timeout: float) -> bool:
+        """Block until the queue isn't full anymore, or until the timeout
+        expires. Return True if the queue isn't full.
+
+        Threading: SAFE. May be called on any thread other than the one that
+        flushes the queue.
+        """
+        with self._not_full:
+            return self._not_full.wait_for(lambda: not self.is_full(), timeout)
+
+    def get_queued_bytes(self) -> int:
+        """Return the serialized size of the queued messages."""
+        if self._max_bytes > 0:
+            return self._queued_bytes
+        return sum(msg.ByteSize() for msg in self._queue)
+
     def enqueue(self, msg: ForwardMsg) -> None:
         """Add message into queue, possibly composing it with another message."""
 
@@ -70,7 +110,7 @@ class ForwardMsgQueue:
             ForwardMsgQueue._before_enqueue_msg(msg)
 
         if not _is_composable_message(msg):
-            self._queue.append(msg)
+            self._append(msg)
             return
 
         # If there's a Delta message with the same delta_path already in
@@ -82,18 +122,33 @@ class ForwardMsgQueue:
         if delta_key in self._delta_index_map:
             index = self._delta_index_map[delta_key]
             old_msg = self._queue[index]
-            composed_delta = _maybe_compose_deltas(old_msg.delta, msg.delta)
+            composed_delta = _maybe_compose_deltas(
+                old_msg.delta, msg.delta, compose_blocks=self._max_bytes > 0
+            )
             if composed_delta is not None:
                 new_msg = ForwardMsg()
                 new_msg.delta.CopyFrom(composed_delta)
                 new_msg.metadata.CopyFrom(msg.metadata)
                 self._queue[index] = new_msg
+                if self._max_bytes > 0:
+                    self._queued_bytes += new_msg.ByteSize() - old_msg.ByteSize()
+                    self._notify_if_not_full()
                 return
 
         # No composition occurred. Append this message to the queue, and
         # store its index for potential future composition.
         self._delta_index_map[delta_key] = len(self._queue)
+        self._append(msg)
+
+    def _append(self, msg: ForwardMsg) -> None:
         self._queue.append(msg)
+        if self._max_bytes > 0:
+            self._queued_bytes += msg.ByteSize()
+
+    def _notify_if_not_full(self) -> None:
+        if not self.is_full():
+            with self._not_full:
+                self._not_full.notify_all()
 
     def clear(
         self,
@@ -147,6 +202,9 @@ class ForwardMsgQueue:
             ]
 
         self._delta_index_map = {}
+        if self._max_bytes > 0:
+            self._queued_bytes = sum(msg.ByteSize() for msg in self._queue)
+            self._notify_if_not_full()
 
     def flush(self) -> list[ForwardMsg]:
         """Clear the queue and return a list of the messages it contained
@@ -160,6 +218,23 @@ class ForwardMsgQueue:
         return len(self._queue)
 
 
+@dataclass
+class ForwardMsgQueueStatProvider(CacheStatsProvider):
+    """Reports the size of each active session's queue of outgoing messages."""
+
+    _session_mgr: SessionManager
+
+    def get_stats(self) -> list[CacheStat]:
+        return [
+            CacheStat(
+                category_name="ForwardMsgQueue",
+                cache_name=session_info.session.id,
+                byte_length=session_info.session.get_browser_queue_bytes(),
+            )
+            for session_info in self._session_mgr.list_active_sessions()
+        ]
+
+
 def _is_composable_message(msg: ForwardMsg) -> bool:
     """True if the ForwardMsg is potentially composable with other ForwardMsgs."""
     if not msg.HasField("delta"):
@@ -173,7 +248,9 @@ def _is_composable_message(msg: ForwardMsg) -> bool:
     return delta_type != "add_rows" and delta_type != "arrow_add_rows"
 
 
-def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
+def _maybe_compose_deltas(
+    old_delta: Delta, new_delta: Delta, compose_blocks: bool = False
+) -> Delta | None:
     """Combines new_delta onto old_delta if possible.
 
     If the combination takes place, the function returns a new Delta that
@@ -181,9 +258,23 @@ def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
 
     If the new_delta is incompatible with old_delta, the function returns None.
     In this case, the new_delta should just be appended to the queue as normal.
+
+    If compose_blocks is set, an add_block Delta is also replaced by a newer
+    add_block Delta for a block of the same type.
     """
     old_delta_type = old_delta.WhichOneof("type")
     if old_delta_type == "add_block":
+        if (
+            compose_blocks
+            and new_delta.WhichOneof("type") == "add_block"
+            and new_delta.add_block.WhichOneof("type")
+            == old_delta.add_block.WhichOneof("type")
+        ):
+            # The frontend keeps the children of a block that's replaced by
+            # a block of the same type, so any dependent deltas later in the
+            # queue end up in the new block either way.
+            return new_delta
+
         # We never replace add_block deltas, because blocks can have
         # other dependent deltas later in the queue. For example:
         #
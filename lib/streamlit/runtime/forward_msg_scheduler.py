@@ -0,0 +1,258 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Final
+
+from streamlit.runtime.forward_msg_cache import get_serialized_body
+from streamlit.runtime.stats import (
+    CounterStat,
+    CounterStatsProvider,
+    GaugeStat,
+    GaugeStatsProvider,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from streamlit.runtime.session_manager import ActiveSessionInfo
+
+# The number of serialized bytes a session may send per tick of the Runtime
+# loop before the other sessions get their turn. A session always gets to send
+# at least one message per tick, however large it is.
+SESSION_BYTES_PER_TICK: Final = 1_000_000
+
+# Sessions whose client has more bytes than this waiting to be flushed to the
+# network are skipped until the client has caught up.
+MAX_CLIENT_BUFFERED_BYTES: Final = 8_000_000
+
+# How long the Runtime loop waits for clients to drain their buffers when no
+# session with pending messages can currently be sent to.
+BACKPRESSURE_WAIT_SECONDS: Final = 0.01
+
+# Messages that change the lifecycle of a session (rather than adding
+# elements to the app). Sessions whose next message is one of these are
+# served first, so that e.g. a "script finished" status isn't held up behind
+# another session's large dataframe.
+_LIFECYCLE_MSG_TYPES: Final = frozenset(
+    {"new_session", "session_status_changed", "session_event", "script_finished"}
+)
+
+# Elements of input widgets. The deltas of these are small, and echo the
+# user's interaction with the app, so sessions whose next message adds one of
+# these are served first, too. Elements that can also be widgets but carry
+# bulk data (e.g. dataframes and charts with selections) aren't included.
+_WIDGET_ELEMENT_TYPES: Final = frozenset(
+    {
+        "audio_input",
+        "button",
+        "button_group",
+        "camera_input",
+        "chat_input",
+        "checkbox",
+        "color_picker",
+        "date_input",
+        "download_button",
+        "file_uploader",
+        "multiselect",
+        "number_input",
+        "radio",
+        "selectbox",
+        "slider",
+        "text_area",
+        "text_input",
+        "time_input",
+    }
+)
+
+_CATEGORY_NAME: Final = "ForwardMsgScheduler"
+
+
+def _is_priority_msg(msg: ForwardMsg) -> bool:
+    """True if the message is a lifecycle message or adds a widget."""
+    msg_type = msg.WhichOneof("type")
+    if msg_type in _LIFECYCLE_MSG_TYPES:
+        return True
+    return (
+        msg_type == "delta"
+        and msg.delta.WhichOneof("type") == "new_element"
+        and msg.delta.new_element.WhichOneof("type") in _WIDGET_ELEMENT_TYPES
+    )
+
+
+def _get_sent_size(msg: ForwardMsg) -> int:
+    """Return the number of bytes of a message that are sent to the client."""
+    if msg.WhichOneof("type") == "ref_hash":
+        # Reference messages are tiny and aren't hashed themselves, so they
+        # don't have a memoized body.
+        return msg.ByteSize()
+    return len(get_serialized_body(msg))
+
+
+class ForwardMsgScheduler(CounterStatsProvider, GaugeStatsProvider):
+    """Decides which sessions' ForwardMsgs the Runtime sends on each tick of
+    its loop, and how many.
+
+    Messages are queued per session. On each tick, sessions take turns in
+    round-robin order, each sending at most SESSION_BYTES_PER_TICK bytes, so
+    that a single session producing a lot of data can't starve the others.
+    Sessions with a lifecycle message or a widget at the head of their queue
+    go first, and sessions whose client is backed up are skipped. The order of the
+    messages within a session is never changed.
+
+    Notes
+    -----
+    Threading: UNSAFE. Must be used on the eventloop thread.
+    """
+
+    def __init__(self):
+        # session_id -> (msg, time the message was queued)
+        self._queues: dict[str, deque[tuple[ForwardMsg, float]]] = {}
+        self._round_robin_offset = 0
+
+        # session_id -> stats
+        self._wait_seconds: dict[str, float] = {}
+        self._sent_counts: dict[str, int] = {}
+
+    def enqueue(self, session_id: str, msgs: Iterable[ForwardMsg]) -> None:
+        """Queue messages flushed from a session's browser queue."""
+        now = time.monotonic()
+        entries = [(msg, now) for msg in msgs]
+        if entries:
+            self._queues.setdefault(session_id, deque()).extend(entries)
+
+    def has_pending(self, session_id: str | None = None) -> bool:
+        """True if the given session, or any session if session_id is None,
+        has queued messages.
+        """
+        if session_id is not None:
+            return bool(self._queues.get(session_id))
+        return any(self._queues.values())
+
+    def remove_session(self, session_id: str) -> None:
+        """Drop a session's queued messages and stats, e.g. because its
+        client has disconnected.
+        """
+        self._queues.pop(session_id, None)
+        self._wait_seconds.pop(session_id, None)
+        self._sent_counts.pop(session_id, None)
+
+    def select_sessions(
+        self, active_sessions: list[ActiveSessionInfo]
+    ) -> list[ActiveSessionInfo]:
+        """Return the sessions to send messages to on this tick, in the order
+        in which they should be served.
+
+        Queued messages of sessions that are no longer active are dropped.
+        """
+        active_ids = {info.session.id for info in active_sessions}
+        for session_id in [sid for sid in self._queues if sid not in active_ids]:
+            self.remove_session(session_id)
+
+        pending = [
+            info for info in active_sessions if self._queues.get(info.session.id)
+        ]
+        if not pending:
+            return []
+
+        # Rotate the starting session on every tick.
+        offset = self._round_robin_offset % len(pending)
+        self._round_robin_offset += 1
+        pending = pending[offset:] + pending[:offset]
+
+        # sorted() is stable, so the round-robin order is kept within each
+        # priority class.
+        pending = sorted(
+            pending, key=lambda info: not self._has_priority_msg(info.session.id)
+        )
+
+        return [
+            info
+            for info in pending
+            if info.client.get_buffered_amount() <= MAX_CLIENT_BUFFERED_BYTES
+        ]
+
+    def take_messages(
+        self,
+        session_id: str,
+        prepare: Callable[[ForwardMsg], ForwardMsg] | None = None,
+    ) -> Iterator[ForwardMsg]:
+        """Yield the session's next messages, up to its byte budget for this
+        tick.
+
+        Messages are dequeued lazily as they are consumed, so that each one is
+        serialized right before it is sent.
+
+        If prepare is given, each message is replaced with the message it
+        returns, e.g. a reference to a message the client has cached, and
+        the budget is charged for the replacement.
+        """
+        queue = self._queues.get(session_id)
+        if not queue:
+            return
+
+        budget = SESSION_BYTES_PER_TICK
+        while queue and budget > 0:
+            msg, queued_at = queue.popleft()
+            if prepare is not None:
+                msg = prepare(msg)
+            budget -= _get_sent_size(msg)
+
+            self._wait_seconds[session_id] = (
+                self._wait_seconds.get(session_id, 0.0) + time.monotonic() - queued_at
+            )
+            self._sent_counts[session_id] = self._sent_counts.get(session_id, 0) + 1
+
+            yield msg
+
+    def _has_priority_msg(self, session_id: str) -> bool:
+        msg, _ = self._queues[session_id][0]
+        return _is_priority_msg(msg)
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        stats: list[CounterStat] = []
+        for session_id, wait_seconds in self._wait_seconds.items():
+            stats.append(
+                CounterStat(
+                    family_name="forward_msg_queue_wait_milliseconds",
+                    category_name=_CATEGORY_NAME,
+                    cache_name=session_id,
+                    value=int(wait_seconds * 1000),
+                )
+            )
+        for session_id, sent_count in self._sent_counts.items():
+            stats.append(
+                CounterStat(
+                    family_name="forward_msg_queue_sent_messages",
+                    category_name=_CATEGORY_NAME,
+                    cache_name=session_id,
+                    value=sent_count,
+                )
+            )
+        return stats
+
+    def get_gauge_stats(self) -> list[GaugeStat]:
+        return [
+            GaugeStat(
+                family_name="forward_msg_queue_depth",
+                category_name=_CATEGORY_NAME,
+                cache_name=session_id,
+                value=len(queue),
+            )
+            for session_id, queue in self._queues.items()
+        ]
@@ -23,6 +23,7 @@ import os.path
 from typing import Final, NamedTuple
 
 from streamlit.logger import get_logger
+from streamlit.runtime import worker_shard
 from streamlit.runtime.media_file_storage import (
     MediaFileKind,
     MediaFileStorage,
@@ -61,7 +62,17 @@ def _calculate_file_id(data: bytes, mimetype: str, filename: str | None = None)
     if filename is not None:
         filehash.update(bytes(filename.encode()))
 
-    return filehash.hexdigest()
+    file_id = filehash.hexdigest()
+
+    # When we're one of several worker processes, requests for the file are
+    # routed by its ID, so it must be an ID that routes to us. Rehashing the
+    # ID keeps it stable for the same data.
+    while not worker_shard.is_local_key(file_id):
+        file_id = hashlib.new(
+            "sha224", file_id.encode(), usedforsecurity=False
+        ).hexdigest()
+
+    return file_id
 
 
 def get_extension_for_mimetype(mimetype: str) -> str:
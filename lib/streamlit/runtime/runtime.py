@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
 import time
 import traceback
 from dataclasses import dataclass, field
@@ -30,18 +32,26 @@ from streamlit.runtime.caching import (
     get_data_cache_stats_provider,
     get_resource_cache_stats_provider,
 )
+from streamlit.runtime.caching.cache_warmup import CacheWarmup, get_cache_warmup
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.dataframe_page_manager import DataframePageManager
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
     populate_hash_if_needed,
 )
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueueStatProvider
+from streamlit.runtime.forward_msg_scheduler import (
+    BACKPRESSURE_WAIT_SECONDS,
+    ForwardMsgScheduler,
+)
 from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.runtime_util import is_cacheable_msg
 from streamlit.runtime.script_data import ScriptData
+from streamlit.runtime.script_run_admission import ScriptRunAdmissionController
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
 from streamlit.runtime.session_manager import (
     ActiveSessionInfo,
@@ -58,7 +68,7 @@ from streamlit.runtime.stats import StatsManager
 from streamlit.runtime.websocket_session_manager import WebsocketSessionManager
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable
+    from collections.abc import Awaitable, Iterable
 
     from streamlit.components.types.base_component_registry import BaseComponentRegistry
     from streamlit.proto.BackMsg_pb2 import BackMsg
@@ -204,10 +214,15 @@ class Runtime:
         # Initialize managers
         self._component_registry = config.component_registry
         self._message_cache = ForwardMsgCache()
+        self._msg_scheduler = ForwardMsgScheduler()
+        self._script_run_admission = ScriptRunAdmissionController()
         self._uploaded_file_mgr = config.uploaded_file_manager
         self._media_file_mgr = MediaFileManager(storage=config.media_file_storage)
+        self._dataframe_page_mgr = DataframePageManager()
         self._cache_storage_manager = config.cache_storage_manager
         self._script_cache = ScriptCache()
+        # Set when we start, if a cache warm-up script is configured.
+        self._cache_warmup: CacheWarmup | None = None
 
         self._session_mgr = config.session_manager_class(
             session_storage=config.session_storage,
@@ -220,8 +235,13 @@ class Runtime:
         self._stats_mgr.register_provider(get_data_cache_stats_provider())
         self._stats_mgr.register_provider(get_resource_cache_stats_provider())
         self._stats_mgr.register_provider(self._message_cache)
+        self._stats_mgr.register_provider(self._msg_scheduler)
+        self._stats_mgr.register_provider(self._script_run_admission)
         self._stats_mgr.register_provider(self._uploaded_file_mgr)
         self._stats_mgr.register_provider(SessionStateStatProvider(self._session_mgr))
+        self._stats_mgr.register_provider(
+            ForwardMsgQueueStatProvider(self._session_mgr)
+        )
 
     @property
     def state(self) -> RuntimeState:
@@ -247,10 +267,18 @@ class Runtime:
     def media_file_mgr(self) -> MediaFileManager:
         return self._media_file_mgr
 
+    @property
+    def dataframe_page_mgr(self) -> DataframePageManager:
+        return self._dataframe_page_mgr
+
     @property
     def stats_mgr(self) -> StatsManager:
         return self._stats_mgr
 
+    @property
+    def script_run_admission(self) -> ScriptRunAdmissionController:
+        return self._script_run_admission
+
     @property
     def stopped(self) -> Awaitable[None]:
         """A Future that completes when the Runtime's run loop has exited."""
@@ -309,12 +337,27 @@ class Runtime:
         )
         self._async_objs = async_objs
 
+        self._start_cache_warmup()
+
         self._loop_coroutine_task = asyncio.create_task(
             self._loop_coroutine(), name="Runtime.loop_coroutine"
         )
 
         await async_objs.started
 
+    def _start_cache_warmup(self) -> None:
+        """Run the cache warm-up script in the background, if one is configured."""
+        warmup_script = config.get_option("server.warmupScript")
+        if not warmup_script:
+            return
+
+        script_path = os.path.join(
+            os.path.dirname(os.path.abspath(self._main_script_path)), warmup_script
+        )
+        _LOGGER.info("Warming up caches with %s", script_path)
+        self._cache_warmup = get_cache_warmup()
+        self._cache_warmup.run_script(script_path, self._main_script_path)
+
     def stop(self) -> None:
         """Request that Streamlit close all sessions and stop running.
         Note that Streamlit won't stop running immediately.
@@ -333,6 +376,8 @@ class Runtime:
             _LOGGER.debug("Runtime stopping...")
             self._set_state(RuntimeState.STOPPING)
             async_objs.must_stop.set()
+            if self._cache_warmup is not None:
+                self._cache_warmup.stop()
 
         async_objs.eventloop.call_soon_threadsafe(stop_on_eventloop)
 
@@ -450,6 +495,7 @@ class Runtime:
         session_info = self._session_mgr.get_session_info(session_id)
         if session_info:
             self._message_cache.remove_refs_for_session(session_info.session)
+            self._msg_scheduler.remove_session(session_id)
             self._session_mgr.close_session(session_id)
         self._on_session_disconnected()
 
@@ -482,6 +528,7 @@ class Runtime:
             # we clean up refs now and accept the risk that we're deleting cache entries
             # that will be useful once the browser tab reconnects.
             self._message_cache.remove_refs_for_session(session_info.session)
+            self._msg_scheduler.remove_session(session_id)
             self._session_mgr.disconnect_session(session_id)
         self._on_session_disconnected()
 
@@ -549,6 +596,13 @@ class Runtime:
             RuntimeState.STOPPING,
             RuntimeState.STOPPED,
         ):
+            if self._cache_warmup is not None:
+                progress = self._cache_warmup.get_progress()
+                if not progress.finished:
+                    return (
+                        False,
+                        f"warming up caches: {progress.done}/{progress.total}",
+                    )
             return True, "ok"
 
         return False, "unavailable"
@@ -642,22 +696,59 @@ class Runtime:
                 elif self._state == RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED:
                     async_objs.need_send_data.clear()
 
-                    for active_session_info in self._session_mgr.list_active_sessions():
-                        msg_list = active_session_info.session.flush_browser_queue()
-                        for msg in msg_list:
-                            try:
-                                self._send_message(active_session_info, msg)
-                            except SessionClientDisconnectedError:
-                                self._session_mgr.disconnect_session(
-                                    active_session_info.session.id
-                                )
-
-                            # Yield for a tick after sending a message.
-                            await asyncio.sleep(0)
-
-                    # Yield for a few milliseconds between session message
-                    # flushing.
-                    await asyncio.sleep(0.01)
+                    batch_messages = (
+                        config.get_option("server.maxWebsocketBatchSize") > 0
+                    )
+
+                    active_sessions = self._session_mgr.list_active_sessions()
+                    for active_session_info in active_sessions:
+                        session_id = active_session_info.session.id
+                        # Leave new messages in the session's browser queue,
+                        # where they can still be coalesced, until its
+                        # previously flushed messages have been sent.
+                        if not self._msg_scheduler.has_pending(session_id):
+                            self._msg_scheduler.enqueue(
+                                session_id,
+                                active_session_info.session.flush_browser_queue(),
+                            )
+
+                    sessions_to_send = self._msg_scheduler.select_sessions(
+                        active_sessions
+                    )
+                    for active_session_info in sessions_to_send:
+                        session_id = active_session_info.session.id
+                        # Messages are prepared as they're taken, so that the
+                        # session is charged for references to cached
+                        # messages rather than for the messages themselves.
+                        msgs = self._msg_scheduler.take_messages(
+                            session_id,
+                            functools.partial(
+                                self._prepare_message, active_session_info
+                            ),
+                        )
+                        try:
+                            if batch_messages:
+                                self._send_messages(active_session_info, msgs)
+                            else:
+                                for msg in msgs:
+                                    self._send_message(active_session_info, msg)
+                                    # Yield for a tick after sending a message.
+                                    await asyncio.sleep(0)
+                        except SessionClientDisconnectedError:
+                            self._msg_scheduler.remove_session(session_id)
+                            self._session_mgr.disconnect_session(session_id)
+
+                        # Yield for a tick after serving a session.
+                        await asyncio.sleep(0)
+
+                    if self._msg_scheduler.has_pending():
+                        # Some sessions used up their budget for this tick or
+                        # are waiting for their client to catch up. Serve them
+                        # again without waiting for new messages, but give the
+                        # clients some time to drain if nobody could be served.
+                        if not sessions_to_send:
+                            await asyncio.sleep(BACKPRESSURE_WAIT_SECONDS)
+                        continue
                 else:
                     # Break out of the thread loop if we encounter any other state.
                     break
@@ -699,16 +790,42 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
     def _send_message(self, session_info: ActiveSessionInfo, msg: ForwardMsg) -> None:
         """Send a message to a client.
 
-        If the client is likely to have already cached the message, we may
-        instead send a "reference" message that contains only the hash of the
-        message.
-
         Parameters
         ----------
         session_info : ActiveSessionInfo
             The ActiveSessionInfo associated with websocket
         msg : ForwardMsg
-            The message to send to the client
+            The message to send to the client, as returned by
+            `_prepare_message`
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        # Ship it off!
+        session_info.client.write_forward_msg(msg)
+
+    def _send_messages(
+        self, session_info: ActiveSessionInfo, msgs: Iterable[ForwardMsg]
+    ) -> None:
+        """Send a sequence of messages to a client at once, allowing the
+        client to batch them into fewer websocket frames.
+
+        See `_send_message` for details.
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        # Ship them off!
+        session_info.client.write_forward_msgs(msgs)
+
+    def _prepare_message(
+        self, session_info: ActiveSessionInfo, msg: ForwardMsg
+    ) -> ForwardMsg:
+        """Update the ForwardMsgCache for a message that's about to be sent to
+        a client, and return the message to actually send: either the message
+        itself or a "reference" message containing only its hash.
 
         Notes
         -----
@@ -757,8 +874,7 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
                 session_info.session, session_info.script_run_count
             )
 
-        # Ship it off!
-        session_info.client.write_forward_msg(msg_to_send)
+        return msg_to_send
 
     def _enqueued_some_message(self) -> None:
         """Callback called by AppSession after the AppSession has enqueued a
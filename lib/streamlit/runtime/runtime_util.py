@@ -20,10 +20,11 @@ from typing import TYPE_CHECKING, Any
 
 from streamlit import config
 from streamlit.errors import MarkdownFormattedException, StreamlitAPIException
-from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg, ForwardMsgList
+from streamlit.runtime.forward_msg_cache import get_serialized_body
 
 if TYPE_CHECKING:
-    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from collections.abc import Iterable
 
 
 class MessageSizeError(MarkdownFormattedException):
@@ -65,27 +66,144 @@ def is_cacheable_msg(msg: ForwardMsg) -> bool:
     if msg.WhichOneof("type") in {"ref_hash", "initialize"}:
         # Some message types never get cached
         return False
-    return msg.ByteSize() >= int(config.get_option("global.minCachedMessageSize"))
+    if (
+        msg.WhichOneof("type") == "delta"
+        and msg.delta.WhichOneof("type") == "arrow_add_rows"
+        and msg.delta.arrow_add_rows.max_rows > 0
+    ):
+        # Rows streamed into an element that only keeps its last rows are
+        # dropped by the browser soon, so the cache would only keep them alive
+        # on the server.
+        return False
+    return len(get_serialized_body(msg)) >= int(
+        config.get_option("global.minCachedMessageSize")
+    )
 
 
 def serialize_forward_msg(msg: ForwardMsg) -> bytes:
     """Serialize a ForwardMsg to send to a client.
 
+    The message body is only serialized once: the bytes used to compute the
+    message's hash are reused, and the (small) hash and metadata fields are
+    serialized separately and appended to them.
+
     If the message is too large, it will be converted to an exception message
     instead.
     """
-    populate_hash_if_needed(msg)
-    msg_str = msg.SerializeToString()
+    body = get_serialized_body(msg)
+
+    envelope = ForwardMsg(hash=msg.hash)
+    envelope.metadata.CopyFrom(msg.metadata)
+    envelope_str = envelope.SerializeToString()
 
-    if len(msg_str) > get_max_message_size_bytes():
+    if len(body) + len(envelope_str) > get_max_message_size_bytes():
         import streamlit.elements.exception as exception
 
         # Overwrite the offending ForwardMsg.delta with an error to display.
         # This assumes that the size limit wasn't exceeded due to metadata.
-        exception.marshall(msg.delta.new_element.exception, MessageSizeError(msg_str))
-        msg_str = msg.SerializeToString()
+        exception.marshall(msg.delta.new_element.exception, MessageSizeError(body))
+        return msg.SerializeToString()
+
+    return body + envelope_str
+
+
+def serialize_forward_msg_batches(
+    msgs: Iterable[ForwardMsg],
+    max_batch_size_bytes: int,
+) -> list[bytes]:
+    """Serialize a sequence of ForwardMsgs into as few websocket frames as possible.
+
+    Consecutive messages are packed into a single ForwardMsg whose
+    `forward_msg_list` field contains them, as long as the resulting frame
+    stays under max_batch_size_bytes. Messages that don't fit into a batch on
+    their own are sent in a frame of their own, as are batches of a single
+    message. Message order is preserved.
+
+    Each message is serialized exactly once (see `serialize_forward_msg`); the
+    batch itself is assembled from the serialized messages without
+    re-encoding them, since a repeated message field is encoded as the
+    concatenation of its length-prefixed elements.
+    """
+    # Leave room for the tag and length prefix of the enclosing ForwardMsg.
+    max_entries_size = (
+        max_batch_size_bytes
+        - len(_FORWARD_MSG_LIST_TAG)
+        - _varint_size(max_batch_size_bytes)
+    )
+
+    frames: list[bytes] = []
+    batch: list[bytes] = []
+    batch_size = 0
+
+    def flush_batch() -> None:
+        nonlocal batch_size
+
+        if len(batch) == 1:
+            frames.append(batch[0])
+        elif len(batch) > 1:
+            frames.append(_pack_forward_msg_list(batch))
+        batch.clear()
+        batch_size = 0
+
+    for msg in msgs:
+        msg_str = serialize_forward_msg(msg)
+        entry_size = (
+            len(_FORWARD_MSG_LIST_ENTRY_TAG) + _varint_size(len(msg_str)) + len(msg_str)
+        )
+
+        if batch_size + entry_size > max_entries_size:
+            flush_batch()
+
+        if entry_size > max_entries_size:
+            frames.append(msg_str)
+        else:
+            batch.append(msg_str)
+            batch_size += entry_size
 
-    return msg_str
+    flush_batch()
+    return frames
+
+
+def _encode_tag(field_number: int) -> bytes:
+    """Encode the tag of a length-delimited protobuf field."""
+    return _encode_varint((field_number << 3) | 2)
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _varint_size(value: int) -> int:
+    return max(1, (value.bit_length() + 6) // 7)
+
+
+# ForwardMsg.forward_msg_list, and ForwardMsgList.messages.
+_FORWARD_MSG_LIST_TAG = _encode_tag(
+    ForwardMsg.DESCRIPTOR.fields_by_name["forward_msg_list"].number
+)
+_FORWARD_MSG_LIST_ENTRY_TAG = _encode_tag(
+    ForwardMsgList.DESCRIPTOR.fields_by_name["messages"].number
+)
+
+
+def _pack_forward_msg_list(msg_strs: list[bytes]) -> bytes:
+    """Wrap serialized ForwardMsgs into a serialized ForwardMsg whose
+    `forward_msg_list` field contains them."""
+    parts: list[bytes] = []
+    for msg_str in msg_strs:
+        parts.extend(
+            (_FORWARD_MSG_LIST_ENTRY_TAG, _encode_varint(len(msg_str)), msg_str)
+        )
+    msg_list_str = b"".join(parts)
+    return b"".join(
+        (_FORWARD_MSG_LIST_TAG, _encode_varint(len(msg_list_str)), msg_list_str)
+    )
 
 
 # This needs to be initialized lazily to avoid calling config.get_option() and
@@ -0,0 +1,175 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Callable, Final
+
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.runtime.stats import (
+    GaugeStat,
+    GaugeStatsProvider,
+    HistogramStat,
+    HistogramStatsProvider,
+)
+
+_LOGGER: Final = get_logger(__name__)
+
+# Upper bounds, in seconds, of the buckets of the queue wait histogram.
+WAIT_SECONDS_BUCKETS: Final = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+_CATEGORY_NAME: Final = "ScriptRunAdmission"
+
+
+class ScriptRunAdmissionController(GaugeStatsProvider, HistogramStatsProvider):
+    """Limits how many sessions may run their script at the same time.
+
+    A session must be admitted before it starts a ScriptRunner, and holds on
+    to its admission until its ScriptRunner has shut down. While the number of
+    admitted sessions is at the runner.maxConcurrentScriptRuns limit, further
+    sessions wait in a first-come, first-served queue and are admitted, via
+    the callback they passed to request_admission, as others are released.
+
+    A session is only ever counted once, however many reruns it requests
+    while it is admitted or waiting.
+
+    Notes
+    -----
+    Threading: SAFE. Admission callbacks are called on the thread that
+    released the slot they're admitted to.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._admitted: set[str] = set()
+        # session_id -> (on_admitted callback, time the session started waiting).
+        # Dicts are ordered, so this is our FIFO queue.
+        self._waiting: dict[str, tuple[Callable[[], None], float]] = {}
+
+        # Cumulative stats for the queue wait histogram. The last bucket
+        # counts waits longer than the last of WAIT_SECONDS_BUCKETS.
+        self._wait_bucket_counts = [0] * (len(WAIT_SECONDS_BUCKETS) + 1)
+        self._wait_seconds_sum = 0.0
+
+    def request_admission(
+        self, session_id: str, on_admitted: Callable[[], None]
+    ) -> bool:
+        """Ask for a session to be allowed to run its script.
+
+        Returns True if the session is admitted (or already was). Otherwise,
+        the session is queued and False is returned; `on_admitted` will be
+        called once the session has been admitted, unless cancel() is called
+        first.
+        """
+        with self._lock:
+            if session_id in self._admitted:
+                return True
+
+            if session_id in self._waiting:
+                _, waiting_since = self._waiting[session_id]
+                self._waiting[session_id] = (on_admitted, waiting_since)
+                return False
+
+            if not self._waiting and self._has_free_slot():
+                self._admitted.add(session_id)
+                self._record_wait(0.0)
+                return True
+
+            _LOGGER.debug("Queueing script run (session_id=%s)", session_id)
+            self._waiting[session_id] = (on_admitted, time.monotonic())
+            return False
+
+    def is_waiting(self, session_id: str) -> bool:
+        """True if the session is queued waiting to be admitted."""
+        with self._lock:
+            return session_id in self._waiting
+
+    def cancel(self, session_id: str) -> None:
+        """Remove a session from the queue, if it's waiting to be admitted."""
+        with self._lock:
+            self._waiting.pop(session_id, None)
+
+    def release(self, session_id: str) -> None:
+        """Give up a session's admission, e.g. because its ScriptRunner has
+        shut down, and admit as many waiting sessions as there are now free
+        slots.
+        """
+        admitted_callbacks: list[Callable[[], None]] = []
+        with self._lock:
+            self._admitted.discard(session_id)
+            self._waiting.pop(session_id, None)
+
+            now = time.monotonic()
+            while self._waiting and self._has_free_slot():
+                next_session_id = next(iter(self._waiting))
+                on_admitted, waiting_since = self._waiting.pop(next_session_id)
+                self._admitted.add(next_session_id)
+                self._record_wait(now - waiting_since)
+                admitted_callbacks.append(on_admitted)
+
+        # Call the callbacks outside the lock, as they'll usually start a
+        # ScriptRunner, and may release their admission right away.
+        for on_admitted in admitted_callbacks:
+            on_admitted()
+
+    def _has_free_slot(self) -> bool:
+        max_runs: int = config.get_option("runner.maxConcurrentScriptRuns")
+        return max_runs <= 0 or len(self._admitted) < max_runs
+
+    def _record_wait(self, wait_seconds: float) -> None:
+        self._wait_bucket_counts[
+            bisect.bisect_left(WAIT_SECONDS_BUCKETS, wait_seconds)
+        ] += 1
+        self._wait_seconds_sum += wait_seconds
+
+    def get_gauge_stats(self) -> list[GaugeStat]:
+        with self._lock:
+            return [
+                GaugeStat(
+                    family_name="script_runs_admitted",
+                    category_name=_CATEGORY_NAME,
+                    cache_name="",
+                    value=len(self._admitted),
+                ),
+                GaugeStat(
+                    family_name="script_runs_waiting",
+                    category_name=_CATEGORY_NAME,
+                    cache_name="",
+                    value=len(self._waiting),
+                ),
+            ]
+
+    def get_histogram_stats(self) -> list[HistogramStat]:
+        with self._lock:
+            buckets: list[tuple[float, int]] = []
+            cumulative_count = 0
+            for upper_bound, count in zip(
+                (*WAIT_SECONDS_BUCKETS, float("inf")), self._wait_bucket_counts
+            ):
+                cumulative_count += count
+                buckets.append((upper_bound, cumulative_count))
+
+            return [
+                HistogramStat(
+                    family_name="script_run_queue_wait_seconds",
+                    category_name=_CATEGORY_NAME,
+                    cache_name="",
+                    buckets=buckets,
+                    sum=self._wait_seconds_sum,
+                )
+            ]
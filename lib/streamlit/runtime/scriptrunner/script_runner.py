@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import contextvars
 import gc
 import sys
 import threading
@@ -40,6 +41,7 @@ from streamlit.runtime.scriptrunner.exec_code import (
     modified_sys_path,
 )
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_thread_pool import get_script_thread_pool
 from streamlit.runtime.scriptrunner_utils.exceptions import (
     RerunException,
     StopException,
@@ -50,6 +52,7 @@ from streamlit.runtime.scriptrunner_utils.script_requests import (
     ScriptRequestType,
 )
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME,
     ScriptRunContext,
     add_script_run_ctx,
     get_script_run_ctx,
@@ -62,12 +65,19 @@ from streamlit.runtime.state import (
 from streamlit.source_util import page_sort_key
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
     from streamlit.runtime.fragment import FragmentStorage
     from streamlit.runtime.scriptrunner.script_cache import ScriptCache
     from streamlit.runtime.uploaded_file_manager import UploadedFileManager
 
 _LOGGER: Final = get_logger(__name__)
 
+# How often a script thread that's waiting for a full browser queue to drain
+# checks for stop and rerun requests.
+_BROWSER_QUEUE_POLL_INTERVAL_SECONDS: Final = 0.1
+
 
 class ScriptRunnerEvent(Enum):
     # "Control" events. These are emitted when the ScriptRunner's state changes.
@@ -173,6 +183,7 @@ class ScriptRunner:
         user_info: dict[str, str | bool | None],
         fragment_storage: FragmentStorage,
         pages_manager: PagesManager,
+        browser_queue: ForwardMsgQueue | None = None,
     ):
         """Initialize the ScriptRunner.
 
@@ -211,6 +222,13 @@ class ScriptRunner:
 
         fragment_storage
             The AppSession's FragmentStorage instance.
+
+        pages_manager
+            The AppSession's PagesManager instance.
+
+        browser_queue
+            The AppSession's queue of outgoing messages. If it's bounded, the
+            script thread is paused whenever the queue is full.
         """
         self._session_id = session_id
         self._main_script_path = main_script_path
@@ -223,6 +241,7 @@ class ScriptRunner:
         self._fragment_storage = fragment_storage
 
         self._pages_manager = pages_manager
+        self._browser_queue = browser_queue
         self._requests = ScriptRequests()
         self._requests.request_rerun(initial_rerun_data)
 
@@ -258,8 +277,11 @@ class ScriptRunner:
         # _maybe_handle_execution_control_request.
         self._execing = False
 
-        # This is initialized in start()
+        # These are initialized in start(). If the ScriptRunner runs on the
+        # shared script thread pool, _script_thread is the pool thread that's
+        # running our script loop, and None before and after.
         self._script_thread: threading.Thread | None = None
+        self._script_future: Future[None] | None = None
 
     def __repr__(self) -> str:
         return util.repr_(self)
@@ -288,14 +310,20 @@ class ScriptRunner:
         return self._requests.request_rerun(rerun_data)
 
     def start(self) -> None:
-        """Start a new thread to process the ScriptEventQueue.
+        """Start a new thread to process the ScriptEventQueue, or hand it to
+        the shared script thread pool if runner.scriptThreadPoolSize is set.
 
         This must be called only once.
 
         """
-        if self._script_thread is not None:
+        if self._script_thread is not None or self._script_future is not None:
             raise Exception("ScriptRunner was already started")
 
+        pool = get_script_thread_pool()
+        if pool is not None:
+            self._script_future = pool.submit(self._run_script_thread_in_pool)
+            return
+
         self._script_thread = threading.Thread(
             target=self._run_script_thread,
             name="ScriptRunner.scriptThread",
@@ -329,6 +357,20 @@ class ScriptRunner:
             )
         return ctx
 
+    def _run_script_thread_in_pool(self) -> None:
+        """The entry point for a ScriptRunner that runs on a thread of the
+        shared script thread pool.
+        """
+        thread = threading.current_thread()
+        self._script_thread = thread
+        try:
+            # Run in a fresh context, so that no context variables leak between
+            # the ScriptRunners that share this thread.
+            contextvars.Context().run(self._run_script_thread)
+        finally:
+            self._script_thread = None
+            setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
     def _run_script_thread(self) -> None:
         """The entry point for the script thread.
 
@@ -399,6 +441,22 @@ class ScriptRunner:
             self, event=ScriptRunnerEvent.ENQUEUE_FORWARD_MSG, forward_msg=msg
         )
 
+        self._maybe_wait_for_browser_queue()
+
+    def _maybe_wait_for_browser_queue(self) -> None:
+        """Pause the script thread while the browser queue is full, i.e.
+        while the client is falling behind.
+
+        Stop and rerun requests are still handled while waiting.
+        """
+        if self._browser_queue is None or not self._is_in_script_thread():
+            return
+
+        while not self._browser_queue.wait_until_not_full(
+            _BROWSER_QUEUE_POLL_INTERVAL_SECONDS
+        ):
+            self._maybe_handle_execution_control_request()
+
     def _maybe_handle_execution_control_request(self) -> None:
         """Check our current ScriptRequestState to see if we have a
         pending STOP or RERUN request.
@@ -472,6 +530,7 @@ class ScriptRunner:
                 # download buttons/links to them present in the app, which will result
                 # in a 404 should the user click on them.
                 runtime.get_instance().media_file_mgr.clear_session_refs()
+                runtime.get_instance().dataframe_page_mgr.clear_session_refs()
 
             self._pages_manager.set_script_intent(
                 rerun_data.page_script_hash, rerun_data.page_name
@@ -711,9 +770,10 @@ class ScriptRunner:
         # even if we were stopped with an exception.)
         self.on_event.send(self, event=event)
 
-        # Remove orphaned files now that the script has run and files in use
-        # are marked as active.
+        # Remove orphaned files and paged dataframes now that the script has
+        # run and those in use are marked as active.
         runtime.get_instance().media_file_mgr.remove_orphaned_files()
+        runtime.get_instance().dataframe_page_mgr.remove_orphaned_tables()
 
         # Force garbage collection to run, to help avoid memory use building up
         # This is usually not an issue, but sometimes GC takes time to kick in and
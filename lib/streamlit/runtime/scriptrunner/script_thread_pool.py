@@ -0,0 +1,58 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A pool of long-lived threads that ScriptRunners run scripts on."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final
+
+from streamlit import config
+from streamlit.logger import get_logger
+
+_LOGGER: Final = get_logger(__name__)
+
+_pool_lock = threading.Lock()
+_pool: ThreadPoolExecutor | None = None
+_pool_size = 0
+
+
+def get_script_thread_pool() -> ThreadPoolExecutor | None:
+    """Return the thread pool that ScriptRunners should run on, or None if
+    every ScriptRunner should start its own thread.
+
+    The pool is shared by all sessions and is sized by the
+    runner.scriptThreadPoolSize config option. If the option changes, a new
+    pool is created; scripts already submitted to the old pool still run to
+    completion on it.
+
+    Threading: SAFE. May be called on any thread.
+    """
+    global _pool, _pool_size
+
+    size = config.get_option("runner.scriptThreadPoolSize")
+    with _pool_lock:
+        if size != _pool_size:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = None
+            if size > 0:
+                _LOGGER.debug("Creating script thread pool (size=%s)", size)
+                _pool = ThreadPoolExecutor(
+                    max_workers=size, thread_name_prefix="ScriptRunner.scriptThread"
+                )
+            _pool_size = size
+        return _pool
@@ -22,6 +22,7 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Final,
     Union,
@@ -97,6 +98,11 @@ class ScriptRunContext:
     widget_user_keys_this_run: set[str] = field(default_factory=set)
     form_ids_this_run: set[str] = field(default_factory=set)
     cursors: dict[int, RunningCursor] = field(default_factory=dict)
+    # Hashes of immutable data passed to cached functions, by object id,
+    # together with a weak reference to the object.
+    arg_hashes_this_run: dict[tuple[int, str], tuple[Any, bytes]] = field(
+        default_factory=dict
+    )
     script_requests: ScriptRequests | None = None
     current_fragment_id: str | None = None
     fragment_ids_this_run: list[str] | None = None
@@ -146,6 +152,7 @@ class ScriptRunContext:
         self.widget_ids_this_run = set()
         self.widget_user_keys_this_run = set()
         self.form_ids_this_run = set()
+        self.arg_hashes_this_run = {}
         self.query_string = query_string
         self.context_info = context_info
         self.pages_manager.set_current_page_script_hash(page_script_hash)
@@ -19,6 +19,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, Protocol, cast
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
     from streamlit.runtime.app_session import AppSession
     from streamlit.runtime.script_data import ScriptData
@@ -42,6 +44,31 @@ class SessionClient(Protocol):
         """
         raise NotImplementedError
 
+    def write_forward_msgs(self, msgs: Iterable[ForwardMsg]) -> None:
+        """Deliver a sequence of ForwardMsgs to the client, in order.
+
+        The Runtime calls this instead of write_forward_msg when message
+        batching is enabled (see the server.maxWebsocketBatchSize config
+        option). SessionClients that can send several messages at once should
+        override it; by default, each message is delivered individually.
+
+        If the SessionClient has been disconnected, it should raise a
+        SessionClientDisconnectedError.
+        """
+        for msg in msgs:
+            self.write_forward_msg(msg)
+
+    def get_buffered_amount(self) -> int:
+        """Return the number of bytes that were written to the client but
+        haven't been flushed to the network yet.
+
+        The Runtime stops sending messages to a session whose client reports
+        too many buffered bytes until they have drained. SessionClients that
+        can't tell how much data is buffered may leave the default, which
+        reports nothing as buffered.
+        """
+        return 0
+
 
 @dataclass
 class ActiveSessionInfo:
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import itertools
+import math
 from abc import abstractmethod
 from typing import TYPE_CHECKING, NamedTuple, Protocol, runtime_checkable
 
@@ -60,6 +61,158 @@ class CacheStat(NamedTuple):
         metric_point.gauge_value.int_value = self.byte_length
 
 
+class CounterStat(NamedTuple):
+    """Describes a single counter, e.g. the number of hits of a cache.
+
+    Properties
+    ----------
+    family_name : str
+        The name of the OpenMetrics metric family that the counter belongs to
+        - e.g. "forward_msg_queue_sent_messages". Counters with the same
+        family_name are reported together.
+    category_name : str
+        A human-readable name for the cache "category" that the counter
+        belongs to.
+    cache_name : str
+        A human-readable name for the cache instance that the counter belongs
+        to. If the cache category doesn't have multiple separate cache
+        instances, this can just be the empty string.
+    value : int
+        The counter's current value.
+    """
+
+    family_name: str
+    category_name: str
+    cache_name: str
+    value: int
+
+    def to_metric_str(self) -> str:
+        return f'{self.family_name}_total{{cache_type="{self.category_name}",cache="{self.cache_name}"}} {self.value}'
+
+    def marshall_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object."""
+        label = metric.labels.add()
+        label.name = "cache_type"
+        label.value = self.category_name
+
+        label = metric.labels.add()
+        label.name = "cache"
+        label.value = self.cache_name
+
+        metric_point = metric.metric_points.add()
+        metric_point.counter_value.int_value = self.value
+
+
+class GaugeStat(NamedTuple):
+    """Describes a single gauge, e.g. the number of messages waiting in a queue.
+
+    Properties
+    ----------
+    family_name : str
+        The name of the OpenMetrics metric family that the gauge belongs to
+        - e.g. "forward_msg_queue_depth". Gauges with the same family_name
+        are reported together.
+    category_name : str
+        A human-readable name for the "category" that the gauge belongs to.
+    cache_name : str
+        A human-readable name for the instance that the gauge belongs to -
+        e.g. a session ID. If the category doesn't have multiple separate
+        instances, this can just be the empty string.
+    value : int
+        The gauge's current value.
+    """
+
+    family_name: str
+    category_name: str
+    cache_name: str
+    value: int
+
+    def to_metric_str(self) -> str:
+        return f'{self.family_name}{{cache_type="{self.category_name}",cache="{self.cache_name}"}} {self.value}'
+
+    def marshall_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object."""
+        label = metric.labels.add()
+        label.name = "cache_type"
+        label.value = self.category_name
+
+        label = metric.labels.add()
+        label.name = "cache"
+        label.value = self.cache_name
+
+        metric_point = metric.metric_points.add()
+        metric_point.gauge_value.int_value = self.value
+
+
+class HistogramStat(NamedTuple):
+    """Describes a single histogram, e.g. how long script runs waited to be
+    started.
+
+    Properties
+    ----------
+    family_name : str
+        The name of the OpenMetrics metric family that the histogram belongs
+        to - e.g. "script_run_queue_wait_seconds". Histograms with the same
+        family_name are reported together.
+    category_name : str
+        A human-readable name for the "category" that the histogram belongs
+        to.
+    cache_name : str
+        A human-readable name for the instance that the histogram belongs to.
+        If the category doesn't have multiple separate instances, this can
+        just be the empty string.
+    buckets : list[tuple[float, int]]
+        (upper_bound, count) pairs, in increasing order of upper_bound. Counts
+        are cumulative, and the last bucket's upper_bound must be infinity.
+    sum : float
+        The sum of all observed values.
+    """
+
+    family_name: str
+    category_name: str
+    cache_name: str
+    buckets: list[tuple[float, int]]
+    sum: float
+
+    @property
+    def sample_count(self) -> int:
+        """The number of observed values."""
+        return self.buckets[-1][1] if self.buckets else 0
+
+    def to_metric_str(self) -> str:
+        labels = f'cache_type="{self.category_name}",cache="{self.cache_name}"'
+        lines = [
+            f'{self.family_name}_bucket{{{labels},le="{_format_bound(upper_bound)}"}} {count}'
+            for upper_bound, count in self.buckets
+        ]
+        lines.append(f"{self.family_name}_count{{{labels}}} {self.sample_count}")
+        lines.append(f"{self.family_name}_sum{{{labels}}} {self.sum}")
+        return "\n".join(lines)
+
+    def marshall_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object."""
+        label = metric.labels.add()
+        label.name = "cache_type"
+        label.value = self.category_name
+
+        label = metric.labels.add()
+        label.name = "cache"
+        label.value = self.cache_name
+
+        metric_point = metric.metric_points.add()
+        histogram_value = metric_point.histogram_value
+        histogram_value.double_value = self.sum
+        histogram_value.count = self.sample_count
+        for upper_bound, count in self.buckets:
+            bucket = histogram_value.buckets.add()
+            bucket.upper_bound = upper_bound
+            bucket.count = count
+
+
+def _format_bound(upper_bound: float) -> str:
+    return "+Inf" if math.isinf(upper_bound) else str(float(upper_bound))
+
+
 def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
     """Group a list of CacheStats by category_name and cache_name and sum byte_length"""
 
@@ -82,6 +235,70 @@ def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
     return result
 
 
+def group_counter_stats(stats: list[CounterStat]) -> list[CounterStat]:
+    """Group a list of CounterStats by family_name, category_name and
+    cache_name and sum their values.
+    """
+
+    def key_function(individual_stat):
+        return (
+            individual_stat.family_name,
+            individual_stat.category_name,
+            individual_stat.cache_name,
+        )
+
+    result: list[CounterStat] = []
+
+    sorted_stats = sorted(stats, key=key_function)
+    grouped_stats = itertools.groupby(sorted_stats, key=key_function)
+
+    for (family_name, category_name, cache_name), single_group_stats in grouped_stats:
+        result.append(
+            CounterStat(
+                family_name=family_name,
+                category_name=category_name,
+                cache_name=cache_name,
+                value=sum(item.value for item in single_group_stats),
+            )
+        )
+    return result
+
+
+def group_histogram_stats(stats: list[HistogramStat]) -> list[HistogramStat]:
+    """Group a list of HistogramStats by family_name, category_name and
+    cache_name, and sum their buckets and sums. Histograms of the same family
+    must have the same bucket upper bounds.
+    """
+
+    def key_function(individual_stat):
+        return (
+            individual_stat.family_name,
+            individual_stat.category_name,
+            individual_stat.cache_name,
+        )
+
+    result: list[HistogramStat] = []
+
+    sorted_stats = sorted(stats, key=key_function)
+    grouped_stats = itertools.groupby(sorted_stats, key=key_function)
+
+    for (family_name, category_name, cache_name), single_group_stats in grouped_stats:
+        group = list(single_group_stats)
+        result.append(
+            HistogramStat(
+                family_name=family_name,
+                category_name=category_name,
+                cache_name=cache_name,
+                buckets=[
+                    (buckets[0][0], sum(count for _, count in buckets))
+                    for buckets in zip(*(item.buckets for item in group))
+                ],
+                sum=sum(item.sum for item in group),
+            )
+        )
+    return result
+
+
 @runtime_checkable
 class CacheStatsProvider(Protocol):
     @abstractmethod
@@ -89,16 +306,54 @@ class CacheStatsProvider(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class CounterStatsProvider(Protocol):
+    @abstractmethod
+    def get_counter_stats(self) -> list[CounterStat]:
+        raise NotImplementedError
+
+
+@runtime_checkable
+class GaugeStatsProvider(Protocol):
+    @abstractmethod
+    def get_gauge_stats(self) -> list[GaugeStat]:
+        raise NotImplementedError
+
+
+@runtime_checkable
+class HistogramStatsProvider(Protocol):
+    @abstractmethod
+    def get_histogram_stats(self) -> list[HistogramStat]:
+        raise NotImplementedError
+
+
 class StatsManager:
     def __init__(self):
         self._cache_stats_providers: list[CacheStatsProvider] = []
+        self._counter_stats_providers: list[CounterStatsProvider] = []
+        self._gauge_stats_providers: list[GaugeStatsProvider] = []
+        self._histogram_stats_providers: list[HistogramStatsProvider] = []
 
-    def register_provider(self, provider: CacheStatsProvider) -> None:
-        """Register a CacheStatsProvider with the manager.
+    def register_provider(
+        self,
+        provider: CacheStatsProvider
+        | CounterStatsProvider
+        | GaugeStatsProvider
+        | HistogramStatsProvider,
+    ) -> None:
+        """Register a CacheStatsProvider, CounterStatsProvider,
+        GaugeStatsProvider and/or HistogramStatsProvider with the manager.
         This function is not thread-safe. Call it immediately after
         creation.
         """
-        self._cache_stats_providers.append(provider)
+        if isinstance(provider, CacheStatsProvider):
+            self._cache_stats_providers.append(provider)
+        if isinstance(provider, CounterStatsProvider):
+            self._counter_stats_providers.append(provider)
+        if isinstance(provider, GaugeStatsProvider):
+            self._gauge_stats_providers.append(provider)
+        if isinstance(provider, HistogramStatsProvider):
+            self._histogram_stats_providers.append(provider)
 
     def get_stats(self) -> list[CacheStat]:
         """Return a list containing all stats from each registered provider."""
@@ -107,3 +362,27 @@ class StatsManager:
             all_stats.extend(provider.get_stats())
 
         return all_stats
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        """Return a list containing all counters from each registered provider."""
+        all_stats: list[CounterStat] = []
+        for provider in self._counter_stats_providers:
+            all_stats.extend(provider.get_counter_stats())
+
+        return all_stats
+
+    def get_gauge_stats(self) -> list[GaugeStat]:
+        """Return a list containing all gauges from each registered provider."""
+        all_stats: list[GaugeStat] = []
+        for provider in self._gauge_stats_providers:
+            all_stats.extend(provider.get_gauge_stats())
+
+        return all_stats
+
+    def get_histogram_stats(self) -> list[HistogramStat]:
+        """Return a list containing all histograms from each registered provider."""
+        all_stats: list[HistogramStat] = []
+        for provider in self._histogram_stats_providers:
+            all_stats.extend(provider.get_histogram_stats())
+
+        return all_stats
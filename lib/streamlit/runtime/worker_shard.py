@@ -0,0 +1,52 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Which share of a multi-process server's sessions this process owns.
+
+When the server runs several worker processes (see server.workerProcesses),
+requests that belong to a session, to a media file, to a cached ForwardMsg,
+or to a paged dataframe are routed to a worker based on the session's, file's
+or table's ID, or the message's hash, alone. Each worker therefore only hands
+out IDs that route back to itself.
+"""
+
+from __future__ import annotations
+
+import zlib
+
+_shard_index = 0
+_shard_count = 1
+
+
+def set_shard(index: int, count: int) -> None:
+    """Make this process the owner of shard `index` out of `count`.
+
+    Called once in each worker process, right after it has been started.
+    """
+    global _shard_index, _shard_count
+    _shard_index = index
+    _shard_count = count
+
+
+def shard_for_key(key: str, shard_count: int) -> int:
+    """Return the index of the shard that the given ID belongs to."""
+    return zlib.crc32(key.encode("utf-8")) % shard_count
+
+
+def is_local_key(key: str) -> bool:
+    """True if the given ID belongs to this process's shard.
+
+    Always True unless this process is one of several workers.
+    """
+    return _shard_count <= 1 or shard_for_key(key, _shard_count) == _shard_index
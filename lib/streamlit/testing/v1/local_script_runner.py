@@ -93,7 +93,9 @@ class LocalScriptRunner(ScriptRunner):
 
     def join(self) -> None:
         """Wait for the script thread to finish, if it is running."""
-        if self._script_thread is not None:
+        if self._script_future is not None:
+            self._script_future.result()
+        elif self._script_thread is not None:
             self._script_thread.join()
 
     def forward_msgs(self) -> list[ForwardMsg]:
@@ -123,7 +125,7 @@ class LocalScriptRunner(ScriptRunner):
             page_script_hash=page_hash,
         )
         self.request_rerun(rerun_data)
-        if not self._script_thread:
+        if self._script_thread is None and self._script_future is None:
             self.start()
         require_widgets_deltas(self, timeout)
 
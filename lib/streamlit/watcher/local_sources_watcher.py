@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Final, NamedTuple
 
@@ -28,6 +30,7 @@ from streamlit.watcher.path_watcher import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from types import ModuleType
 
     from streamlit.runtime.pages_manager import PagesManager
@@ -168,13 +171,24 @@ class LocalSourcesWatcher:
         if self._is_closed:
             return
 
-        if set(sys.modules) != self._cached_sys_modules:
-            modules_paths = {
-                name: self._exclude_blacklisted_paths(get_module_paths(module))
-                for name, module in dict(sys.modules).items()
-            }
-            self._cached_sys_modules = set(sys.modules)
-            self._register_necessary_watchers(modules_paths)
+        # Only look at the modules that have been imported since we last
+        # checked. Modules we've already seen are either watched already, or
+        # don't need to be.
+        module_names = set(sys.modules)
+        new_module_names = module_names - self._cached_sys_modules
+        self._cached_sys_modules = module_names
+        if not new_module_names:
+            return
+
+        modules_paths: dict[str, set[str]] = {}
+        for name in new_module_names:
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+            modules_paths[name] = self._exclude_blacklisted_paths(
+                _module_path_index.get_module_paths(name, module)
+            )
+        self._register_necessary_watchers(modules_paths)
 
     def _register_necessary_watchers(self, module_paths: dict[str, set[str]]) -> None:
         for name, paths in module_paths.items():
@@ -182,10 +196,58 @@ class LocalSourcesWatcher:
                 if self._file_should_be_watched(path):
                     self._register_watcher(str(Path(path).resolve()), name)
 
-    def _exclude_blacklisted_paths(self, paths: set[str]) -> set[str]:
+    def _exclude_blacklisted_paths(self, paths: Iterable[str]) -> set[str]:
         return {p for p in paths if not self._folder_black_list.is_blacklisted(p)}
 
 
+class ModulePathIndex:
+    """Process-wide cache of the paths of loaded modules.
+
+    Finding a module's paths means checking the file system for each of
+    them, and every session's LocalSourcesWatcher needs the paths of the
+    same modules. So we look them up once per module, and share them.
+
+    An entry is reused for as long as the same module object is loaded
+    under its name, so a module that has been unloaded and imported again
+    is looked up again.
+
+    Notes
+    -----
+    Threading: SAFE. May be called from any script thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # module name -> (weak reference to the module, the module's paths)
+        self._entries: dict[str, tuple[weakref.ref[Any], frozenset[str]]] = {}
+
+    def get_module_paths(self, name: str, module: ModuleType) -> frozenset[str]:
+        """Return the paths of the module loaded under the given name."""
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is not None and entry[0]() is module:
+            return entry[1]
+
+        paths = frozenset(get_module_paths(module))
+        try:
+            module_ref = weakref.ref(module)
+        except TypeError:
+            # Not every object in sys.modules is a real module, and some of
+            # them can't be weakly referenced. We just don't cache those.
+            return paths
+
+        with self._lock:
+            self._entries[name] = (module_ref, paths)
+        return paths
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_module_path_index: Final = ModulePathIndex()
+
+
 def get_module_paths(module: ModuleType) -> set[str]:
     paths_extractors = [
         # https://docs.python.org/3/reference/datamodel.html
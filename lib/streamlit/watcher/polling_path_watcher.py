@@ -12,13 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""A class that watches a given path via polling."""
+"""A class that watches a given path via polling.
+
+All PollingPathWatchers in the process share a single polling loop, which
+checks each watched path once per period however many watchers (e.g. one per
+session) are interested in it, and notifies all of them when it changes.
+"""
 
 from __future__ import annotations
 
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Final
+from typing import Callable, Final, Union
+
+from typing_extensions import TypeAlias
 
 from streamlit.logger import get_logger
 from streamlit.util import repr_
@@ -30,11 +38,51 @@ _MAX_WORKERS: Final = 4
 _POLLING_PERIOD_SECS: Final = 0.2
 
 
+# A watched path, with the options it's watched with. Watchers that watch the
+# same path with different options are polled separately.
+_PolledPathKey: TypeAlias = tuple[str, Union[str, None], bool]
+
+
+class _PolledPath:
+    """The state of a single watched path, and the callbacks to notify when
+    it changes.
+    """
+
+    def __init__(
+        self,
+        md5: str,
+        modification_time: float,
+        *,  # keyword-only arguments:
+        glob_pattern: str | None = None,
+        allow_nonexistent: bool = False,
+    ):
+        self.md5 = md5
+        self.modification_time = modification_time
+
+        self.glob_pattern = glob_pattern
+        self.allow_nonexistent = allow_nonexistent
+
+        self.callbacks: list[Callable[[str], None]] = []
+
+    def __repr__(self) -> str:
+        return repr_(self)
+
+
 class PollingPathWatcher:
     """Watches a path on disk via a polling loop."""
 
     _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
 
+    # Map of (path, glob_pattern, allow_nonexistent) -> _PolledPath, shared by
+    # all PollingPathWatchers.
+    _polled_paths: dict[_PolledPathKey, _PolledPath] = {}
+
+    # Guards _polled_paths and _is_polling.
+    _lock = threading.Lock()
+
+    # True while a poll of _polled_paths is scheduled on the executor.
+    _is_polling = False
+
     @staticmethod
     def close_all() -> None:
         """Close top-level watcher object.
@@ -55,8 +103,8 @@ class PollingPathWatcher:
         """Constructor.
 
         You do not need to retain a reference to a PollingPathWatcher to
-        prevent it from being garbage collected. (The global _executor object
-        retains references to all active instances.)
+        prevent it from being garbage collected. (The class-level
+        _polled_paths dict retains references to all active callbacks.)
         """
         # TODO(vdonato): Modernize this by switching to pathlib.
         self._path = path
@@ -66,59 +114,114 @@ class PollingPathWatcher:
         self._allow_nonexistent = allow_nonexistent
 
         self._active = True
-
-        self._modification_time = util.path_modification_time(
-            self._path, self._allow_nonexistent
-        )
-        self._md5 = util.calc_md5_with_blocking_retries(
-            self._path,
-            glob_pattern=self._glob_pattern,
-            allow_nonexistent=self._allow_nonexistent,
-        )
-        self._schedule()
+        self._key: _PolledPathKey = (path, glob_pattern, allow_nonexistent)
+
+        cls = PollingPathWatcher
+        with cls._lock:
+            polled_path = cls._polled_paths.get(self._key)
+
+        if polled_path is None:
+            # Hash the path outside the lock: this may block for a while, e.g.
+            # while the path doesn't exist yet.
+            polled_path = _PolledPath(
+                md5=util.calc_md5_with_blocking_retries(
+                    path,
+                    glob_pattern=glob_pattern,
+                    allow_nonexistent=allow_nonexistent,
+                ),
+                modification_time=util.path_modification_time(path, allow_nonexistent),
+                glob_pattern=glob_pattern,
+                allow_nonexistent=allow_nonexistent,
+            )
+
+        with cls._lock:
+            # Another watcher may have started watching the path meanwhile.
+            polled_path = cls._polled_paths.setdefault(self._key, polled_path)
+            polled_path.callbacks.append(on_changed)
+
+            if not cls._is_polling:
+                cls._is_polling = True
+                cls._schedule()
 
     def __repr__(self) -> str:
         return repr_(self)
 
-    def _schedule(self) -> None:
+    @staticmethod
+    def _schedule() -> None:
         def task():
             time.sleep(_POLLING_PERIOD_SECS)
-            self._check_if_path_changed()
+            PollingPathWatcher._poll()
 
         PollingPathWatcher._executor.submit(task)
 
-    def _check_if_path_changed(self) -> None:
-        if not self._active:
-            # Don't call self._schedule()
-            return
+    @staticmethod
+    def _poll() -> None:
+        """Check every watched path once, notify the watchers of the paths
+        that have changed, and schedule the next poll.
+        """
+        cls = PollingPathWatcher
+        try:
+            with cls._lock:
+                polled_paths = list(cls._polled_paths.items())
+
+            for (path, _, _), polled_path in polled_paths:
+                if not cls._check_if_path_changed(path, polled_path):
+                    continue
+
+                _LOGGER.debug("Change detected: %s", path)
+                with cls._lock:
+                    callbacks = list(polled_path.callbacks)
+                for callback in callbacks:
+                    try:
+                        callback(path)
+                    except Exception:
+                        _LOGGER.exception("Error in file change callback")
+        finally:
+            with cls._lock:
+                if cls._polled_paths:
+                    cls._schedule()
+                else:
+                    # The next PollingPathWatcher will start polling again.
+                    cls._is_polling = False
 
+    @staticmethod
+    def _check_if_path_changed(path: str, polled_path: _PolledPath) -> bool:
         modification_time = util.path_modification_time(
-            self._path, self._allow_nonexistent
+            path, polled_path.allow_nonexistent
         )
         # We add modification_time != 0.0 check since on some file systems (s3fs/fuse)
         # modification_time is always 0.0 because of file system limitations.
-        if modification_time != 0.0 and modification_time <= self._modification_time:
-            self._schedule()
-            return
+        if (
+            modification_time != 0.0
+            and modification_time <= polled_path.modification_time
+        ):
+            return False
 
-        self._modification_time = modification_time
+        polled_path.modification_time = modification_time
 
         md5 = util.calc_md5_with_blocking_retries(
-            self._path,
-            glob_pattern=self._glob_pattern,
-            allow_nonexistent=self._allow_nonexistent,
+            path,
+            glob_pattern=polled_path.glob_pattern,
+            allow_nonexistent=polled_path.allow_nonexistent,
         )
-        if md5 == self._md5:
-            self._schedule()
-            return
-
-        self._md5 = md5
-
-        _LOGGER.debug("Change detected: %s", self._path)
-        self._on_changed(self._path)
+        if md5 == polled_path.md5:
+            return False
 
-        self._schedule()
+        polled_path.md5 = md5
+        return True
 
     def close(self) -> None:
         """Stop watching the file system."""
+        if not self._active:
+            return
         self._active = False
+
+        cls = PollingPathWatcher
+        with cls._lock:
+            polled_path = cls._polled_paths.get(self._key)
+            if polled_path is None:
+                return
+
+            polled_path.callbacks.remove(self._on_changed)
+            if not polled_path.callbacks:
+                del cls._polled_paths[self._key]
@@ -18,14 +18,23 @@ import asyncio
 import os
 import signal
 import sys
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final
 
 from streamlit import cli_util, config, env_util, file_util, net_util, secrets
 from streamlit.config import CONFIG_FILENAMES
 from streamlit.git_util import MIN_GIT_VERSION, GitRepo
 from streamlit.logger import get_logger
 from streamlit.watcher import report_watchdog_availability, watch_file
-from streamlit.web.server import Server, server_address_is_unix_socket, server_util
+from streamlit.web.server import (
+    Server,
+    server_address_is_unix_socket,
+    server_util,
+    worker_processes,
+)
+from streamlit.web.server.server import start_routing_to_workers
+
+if TYPE_CHECKING:
+    from streamlit.web.server.worker_processes import ConnectionRouter
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -102,10 +111,12 @@ def _fix_sys_argv(main_script_path: str, args: list[str]) -> None:
 
 
 def _on_server_start(server: Server) -> None:
-    _maybe_print_old_git_warning(server.main_script_path)
-    _maybe_print_static_folder_warning(server.main_script_path)
-    _print_url(server.is_running_hello)
-    report_watchdog_availability()
+    # With several worker processes, their parent process prints the startup
+    # messages and opens the browser instead.
+    is_worker_process = worker_processes.is_worker_process()
+
+    if not is_worker_process:
+        _print_startup_messages(server.main_script_path, server.is_running_hello)
 
     # Load secrets.toml if it exists. If the file doesn't exist, this
     # function will return without raising an exception. We catch any parse
@@ -115,25 +126,34 @@ def _on_server_start(server: Server) -> None:
     except Exception as ex:
         _LOGGER.error("Failed to load secrets.toml file", exc_info=ex)
 
-    def maybe_open_browser():
-        if config.get_option("server.headless"):
-            # Don't open browser when in headless mode.
-            return
+    if not is_worker_process:
+        # Schedule the browser to open on the main thread.
+        asyncio.get_running_loop().call_soon(_maybe_open_browser)
 
-        if config.is_manually_set("browser.serverAddress"):
-            addr = config.get_option("browser.serverAddress")
-        elif config.is_manually_set("server.address"):
-            if server_address_is_unix_socket():
-                # Don't open browser when server address is an unix socket
-                return
-            addr = config.get_option("server.address")
-        else:
-            addr = "localhost"
 
-        cli_util.open_browser(server_util.get_url(addr))
+def _print_startup_messages(main_script_path: str, is_running_hello: bool) -> None:
+    _maybe_print_old_git_warning(main_script_path)
+    _maybe_print_static_folder_warning(main_script_path)
+    _print_url(is_running_hello)
+    report_watchdog_availability()
+
+
+def _maybe_open_browser() -> None:
+    if config.get_option("server.headless"):
+        # Don't open browser when in headless mode.
+        return
+
+    if config.is_manually_set("browser.serverAddress"):
+        addr = config.get_option("browser.serverAddress")
+    elif config.is_manually_set("server.address"):
+        if server_address_is_unix_socket():
+            # Don't open browser when server address is an unix socket
+            return
+        addr = config.get_option("server.address")
+    else:
+        addr = "localhost"
 
-    # Schedule the browser to open on the main thread.
-    asyncio.get_running_loop().call_soon(maybe_open_browser)
+    cli_util.open_browser(server_util.get_url(addr))
 
 
 def _fix_pydeck_mapbox_api_warning() -> None:
@@ -309,6 +329,102 @@ def run(
     _fix_tornado_crash()
     _fix_sys_argv(main_script_path, args)
     _fix_pydeck_mapbox_api_warning()
+
+    num_worker_processes = _get_num_worker_processes()
+    if num_worker_processes > 1:
+        # This must happen before any threads or event loops are started.
+        router = worker_processes.start_worker_processes(num_worker_processes)
+        if router is not None:
+            _run_worker_router(
+                router, main_script_path, is_hello, stop_immediately_for_testing
+            )
+        else:
+            exit_code = 0
+            try:
+                _run_server(
+                    main_script_path,
+                    is_hello,
+                    flag_options,
+                    stop_immediately_for_testing,
+                )
+            except BaseException:
+                _LOGGER.exception("Worker process crashed")
+                exit_code = 1
+            finally:
+                # Never return into our caller: it belongs to the parent
+                # process.
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(exit_code)
+        return
+
+    _run_server(main_script_path, is_hello, flag_options, stop_immediately_for_testing)
+
+
+def _get_num_worker_processes() -> int:
+    num_worker_processes: int = config.get_option("server.workerProcesses")
+    if num_worker_processes <= 1:
+        return 1
+
+    if env_util.IS_WINDOWS:
+        _LOGGER.warning(
+            "server.workerProcesses is not supported on Windows. "
+            "Running the server in a single process."
+        )
+        return 1
+
+    if config.get_option("server.sslCertFile"):
+        _LOGGER.warning(
+            "server.workerProcesses can't be used together with "
+            "server.sslCertFile. Running the server in a single process."
+        )
+        return 1
+
+    return num_worker_processes
+
+
+def _run_worker_router(
+    router: ConnectionRouter,
+    main_script_path: str,
+    is_hello: bool,
+    stop_immediately_for_testing: bool,
+) -> None:
+    """Pass connections to our worker processes until they have all exited.
+
+    This starts a blocking asyncio eventloop.
+    """
+
+    async def run_router() -> None:
+        start_routing_to_workers(router)
+        _print_startup_messages(main_script_path, is_hello)
+        asyncio.get_running_loop().call_soon(_maybe_open_browser)
+
+        def stop_workers() -> None:
+            cli_util.print_to_cli("  Stopping...", fg="blue")
+            router.stop_workers()
+
+        # The workers install their own signal handlers. We pass on the
+        # signals we get to them, and exit once they have shut down.
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGTERM, signal.SIGINT, signal.SIGQUIT):
+            loop.add_signal_handler(signal_number, stop_workers)
+
+        if stop_immediately_for_testing:
+            _LOGGER.debug("Stopping worker processes immediately for testing")
+            router.stop_workers()
+
+        await router.wait_for_workers()
+        router.stop()
+
+    asyncio.run(run_router())
+
+
+def _run_server(
+    main_script_path: str,
+    is_hello: bool,
+    flag_options: dict[str, Any],
+    stop_immediately_for_testing: bool,
+) -> None:
     _install_config_watchers(flag_options)
 
     # Create the server. It won't start running yet.
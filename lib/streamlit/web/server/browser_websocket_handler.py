@@ -31,7 +31,10 @@ from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.runtime import Runtime, SessionClient, SessionClientDisconnectedError
-from streamlit.runtime.runtime_util import serialize_forward_msg
+from streamlit.runtime.runtime_util import (
+    serialize_forward_msg,
+    serialize_forward_msg_batches,
+)
 from streamlit.web.server.server_util import (
     AUTH_COOKIE_NAME,
     is_url_from_allowed_origins,
@@ -39,7 +42,7 @@ from streamlit.web.server.server_util import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable
+    from collections.abc import Awaitable, Iterable
 
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 
@@ -52,6 +55,9 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
     def initialize(self, runtime: Runtime) -> None:
         self._runtime = runtime
         self._session_id: str | None = None
+        # The number of bytes handed to write_message that haven't been
+        # flushed to the network yet.
+        self._buffered_amount = 0
         # The XSRF cookie is normally set when xsrf_form_html is used, but in a
         # pure-Javascript application that does not use any regular forms we just
         # need to read the self.xsrf_token manually to set the cookie as a side
@@ -117,10 +123,40 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
     def write_forward_msg(self, msg: ForwardMsg) -> None:
         """Send a ForwardMsg to the browser."""
         try:
-            self.write_message(serialize_forward_msg(msg), binary=True)
+            self._write_frame(serialize_forward_msg(msg))
+        except tornado.websocket.WebSocketClosedError as e:
+            raise SessionClientDisconnectedError from e
+
+    def write_forward_msgs(self, msgs: Iterable[ForwardMsg]) -> None:
+        """Send a sequence of ForwardMsgs to the browser, batching them into as
+        few websocket frames as server.maxWebsocketBatchSize allows.
+        """
+        max_batch_size_bytes = config.get_option("server.maxWebsocketBatchSize") * 1000
+        try:
+            for frame in serialize_forward_msg_batches(msgs, max_batch_size_bytes):
+                self._write_frame(frame)
         except tornado.websocket.WebSocketClosedError as e:
             raise SessionClientDisconnectedError from e
 
+    def get_buffered_amount(self) -> int:
+        """Return the number of bytes that haven't been flushed to the
+        network yet.
+        """
+        return self._buffered_amount
+
+    def _write_frame(self, frame: bytes) -> None:
+        """Write a binary frame, keeping track of the bytes that are still
+        buffered until tornado has flushed them.
+        """
+        future = self.write_message(frame, binary=True)
+        frame_size = len(frame)
+        self._buffered_amount += frame_size
+
+        def on_flushed(_: Any) -> None:
+            self._buffered_amount -= frame_size
+
+        future.add_done_callback(on_flushed)
+
     def select_subprotocol(self, subprotocols: list[str]) -> str | None:
         """Return the first subprotocol in the given list.
 
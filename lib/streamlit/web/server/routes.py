@@ -21,6 +21,7 @@ import tornado.web
 
 from streamlit import config, file_util
 from streamlit.logger import get_logger
+from streamlit.runtime.dataframe_page_manager import MAX_REQUESTED_ROWS, PAGE_ROWS
 from streamlit.runtime.runtime_util import serialize_forward_msg
 from streamlit.web.server.server_util import (
     emit_endpoint_deprecation_notice,
@@ -30,6 +31,8 @@ from streamlit.web.server.server_util import (
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from streamlit.runtime.dataframe_page_manager import DataframePageManager
+
 _LOGGER: Final = get_logger(__name__)
 
 
@@ -293,3 +296,68 @@ class MessageCacheHandler(tornado.web.RequestHandler):
         """/OPTIONS handler for preflight CORS checks."""
         self.set_status(204)
         self.finish()
+
+
+class DataframePageHandler(tornado.web.RequestHandler):
+    """Returns rows of paged dataframes from the DataframePageManager as Arrow
+    IPC bytes.
+    """
+
+    def initialize(self, page_manager: DataframePageManager) -> None:
+        """Initializes the handler.
+
+        Parameters
+        ----------
+        page_manager : DataframePageManager
+
+        """
+        self._page_manager = page_manager
+
+    def set_default_headers(self):
+        if allow_cross_origin_requests():
+            self.set_header("Access-Control-Allow-Origin", "*")
+
+    def get(self, table_id: str) -> None:
+        try:
+            offset = int(self.get_argument("offset", "0"))
+            limit = int(self.get_argument("limit", str(PAGE_ROWS)))
+        except ValueError:
+            self.send_error(400, reason="offset and limit must be integers.")
+            return
+
+        order = self.get_argument("order", "asc")
+        if offset < 0 or not 0 < limit <= MAX_REQUESTED_ROWS:
+            self.send_error(400, reason="offset or limit out of range.")
+            return
+        if order not in ("asc", "desc"):
+            self.send_error(400, reason="order must be 'asc' or 'desc'.")
+            return
+
+        try:
+            table = self._page_manager.get_rows(
+                table_id,
+                offset,
+                limit,
+                sort_column=self.get_argument("sort", None),
+                ascending=order == "asc",
+            )
+        except ValueError:
+            self.send_error(400, reason="Invalid sort column.")
+            return
+
+        if table is None:
+            # The table was removed, because no session shows it anymore.
+            self.send_error(404)
+            return
+
+        from streamlit import dataframe_util
+
+        self.set_header("Content-Type", "application/octet-stream")
+        self.set_header("Cache-Control", "no-cache")
+        self.write(dataframe_util.convert_arrow_table_to_arrow_bytes(table))
+        self.set_status(200)
+
+    def options(self, table_id: str) -> None:
+        """/OPTIONS handler for preflight CORS checks."""
+        self.set_status(204)
+        self.finish()
@@ -34,6 +34,7 @@ from streamlit.auth_util import is_authlib_installed
 from streamlit.config_option import ConfigOption
 from streamlit.logger import get_logger
 from streamlit.runtime import Runtime, RuntimeConfig, RuntimeState
+from streamlit.runtime.dataframe_page_manager import DATAFRAME_PAGE_ENDPOINT
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
@@ -41,12 +42,14 @@ from streamlit.runtime.runtime_util import get_max_message_size_bytes
 from streamlit.web.cache_storage_manager_config import (
     create_default_cache_storage_manager,
 )
+from streamlit.web.server import worker_processes
 from streamlit.web.server.app_static_file_handler import AppStaticFileHandler
 from streamlit.web.server.browser_websocket_handler import BrowserWebSocketHandler
 from streamlit.web.server.component_request_handler import ComponentRequestHandler
 from streamlit.web.server.media_file_handler import MediaFileHandler
 from streamlit.web.server.routes import (
     AddSlashHandler,
+    DataframePageHandler,
     HealthHandler,
     HostConfigHandler,
     MessageCacheHandler,
@@ -66,6 +69,10 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable
     from ssl import SSLContext
 
+    from tornado.tcpserver import TCPServer
+
+    from streamlit.web.server.worker_processes import ConnectionRouter
+
 _LOGGER: Final = get_logger(__name__)
 
 TORNADO_SETTINGS = {
@@ -138,12 +145,26 @@ def start_listening(app: tornado.web.Application) -> None:
         ssl_options=ssl_options,
     )
 
-    if server_address_is_unix_socket():
+    if worker_processes.is_worker_process():
+        app.add_transform(worker_processes.CloseConnectionTransform)
+        worker_processes.accept_routed_connections(http_server)
+    elif server_address_is_unix_socket():
         start_listening_unix_socket(http_server)
     else:
         start_listening_tcp_socket(http_server)
 
 
+def start_routing_to_workers(router: ConnectionRouter) -> None:
+    """Makes the parent process of several worker processes start listening
+    at the configured port, or unix socket, and pass the connections it
+    accepts to its workers.
+    """
+    if server_address_is_unix_socket():
+        start_listening_unix_socket(router)
+    else:
+        start_listening_tcp_socket(router)
+
+
 def _get_ssl_options(cert_file: str | None, key_file: str | None) -> SSLContext | None:
     if bool(cert_file) != bool(key_file):
         _LOGGER.error(
@@ -183,7 +204,7 @@ def _get_ssl_options(cert_file: str | None, key_file: str | None) -> SSLContext
     return None
 
 
-def start_listening_unix_socket(http_server: HTTPServer) -> None:
+def start_listening_unix_socket(http_server: TCPServer) -> None:
     address = config.get_option("server.address")
     file_name = os.path.expanduser(address[len(UNIX_SOCKET_PREFIX) :])
 
@@ -191,7 +212,7 @@ def start_listening_unix_socket(http_server: HTTPServer) -> None:
     http_server.add_socket(unix_socket)
 
 
-def start_listening_tcp_socket(http_server: HTTPServer) -> None:
+def start_listening_tcp_socket(http_server: TCPServer) -> None:
     call_count = 0
 
     port = None
@@ -325,6 +346,13 @@ class Server:
                 MessageCacheHandler,
                 {"cache": self._runtime.message_cache},
             ),
+            (
+                make_url_path_regex(
+                    base, rf"{DATAFRAME_PAGE_ENDPOINT}/(?P<table_id>[^/]+)"
+                ),
+                DataframePageHandler,
+                {"page_manager": self._runtime.dataframe_page_mgr},
+            ),
             (
                 make_url_path_regex(base, METRIC_ENDPOINT),
                 StatsRequestHandler,
@@ -466,7 +494,9 @@ class Server:
         return self._main_script_path == streamlit_app.__file__
 
     def stop(self) -> None:
-        cli_util.print_to_cli("  Stopping...", fg="blue")
+        if not worker_processes.is_worker_process():
+            # The parent process says this on behalf of all its workers.
+            cli_util.print_to_cli("  Stopping...", fg="blue")
         self._runtime.stop()
 
 
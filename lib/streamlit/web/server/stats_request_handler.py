@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 import tornado.web
 
@@ -23,7 +23,13 @@ from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
 
 if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-    from streamlit.runtime.stats import CacheStat, StatsManager
+    from streamlit.runtime.stats import (
+        CacheStat,
+        CounterStat,
+        GaugeStat,
+        HistogramStat,
+        StatsManager,
+    )
 
 
 class StatsRequestHandler(tornado.web.RequestHandler):
@@ -44,36 +50,69 @@ class StatsRequestHandler(tornado.web.RequestHandler):
             emit_endpoint_deprecation_notice(self, new_path="/_stcore/metrics")
 
         stats = self._manager.get_stats()
+        counter_stats = self._manager.get_counter_stats()
+        gauge_stats = self._manager.get_gauge_stats()
+        histogram_stats = self._manager.get_histogram_stats()
 
         # If the request asked for protobuf output, we return a serialized
         # protobuf. Else we return text.
         if "application/x-protobuf" in self.request.headers.get_list("Accept"):
-            self.write(self._stats_to_proto(stats).SerializeToString())
+            self.write(
+                self._stats_to_proto(
+                    stats, counter_stats, gauge_stats, histogram_stats
+                ).SerializeToString()
+            )
             self.set_header("Content-Type", "application/x-protobuf")
             self.set_status(200)
         else:
-            self.write(self._stats_to_text(self._manager.get_stats()))
+            self.write(
+                self._stats_to_text(stats, counter_stats, gauge_stats, histogram_stats)
+            )
             self.set_header("Content-Type", "application/openmetrics-text")
             self.set_status(200)
 
     @staticmethod
-    def _stats_to_text(stats: list[CacheStat]) -> str:
+    def _stats_to_text(
+        stats: list[CacheStat],
+        counter_stats: list[CounterStat] | None = None,
+        gauge_stats: list[GaugeStat] | None = None,
+        histogram_stats: list[HistogramStat] | None = None,
+    ) -> str:
         metric_type = "# TYPE cache_memory_bytes gauge"
         metric_unit = "# UNIT cache_memory_bytes bytes"
         metric_help = "# HELP Total memory consumed by a cache."
         openmetrics_eof = "# EOF\n"
 
-        # Format: header, stats, EOF
+        # Format: header, stats, [counter header, counter stats]...,
+        # [gauge header, gauge stats]..., [histogram header, histograms]..., EOF
         result = [metric_type, metric_unit, metric_help]
         result.extend(stat.to_metric_str() for stat in stats)
+        for family_name, family_stats in _group_by_family(counter_stats or []):
+            result.append(f"# TYPE {family_name} counter")
+            result.extend(stat.to_metric_str() for stat in family_stats)
+        for family_name, family_gauges in _group_by_family(gauge_stats or []):
+            result.append(f"# TYPE {family_name} gauge")
+            result.extend(stat.to_metric_str() for stat in family_gauges)
+        for family_name, family_histograms in _group_by_family(histogram_stats or []):
+            result.append(f"# TYPE {family_name} histogram")
+            result.extend(stat.to_metric_str() for stat in family_histograms)
         result.append(openmetrics_eof)
 
         return "\n".join(result)
 
     @staticmethod
-    def _stats_to_proto(stats: list[CacheStat]) -> MetricSetProto:
+    def _stats_to_proto(
+        stats: list[CacheStat],
+        counter_stats: list[CounterStat] | None = None,
+        gauge_stats: list[GaugeStat] | None = None,
+        histogram_stats: list[HistogramStat] | None = None,
+    ) -> MetricSetProto:
         # Lazy load the import of this proto message for better performance:
-        from streamlit.proto.openmetrics_data_model_pb2 import GAUGE
+        from streamlit.proto.openmetrics_data_model_pb2 import (
+            COUNTER,
+            GAUGE,
+            HISTOGRAM,
+        )
         from streamlit.proto.openmetrics_data_model_pb2 import (
             MetricSet as MetricSetProto,
         )
@@ -92,4 +131,44 @@ class StatsRequestHandler(tornado.web.RequestHandler):
 
         metric_set = MetricSetProto()
         metric_set.metric_families.append(metric_family)
+
+        for family_name, family_stats in _group_by_family(counter_stats or []):
+            metric_family = metric_set.metric_families.add()
+            metric_family.name = family_name
+            metric_family.type = COUNTER
+
+            for counter_stat in family_stats:
+                metric_proto = metric_family.metrics.add()
+                counter_stat.marshall_metric_proto(metric_proto)
+
+        for family_name, family_gauges in _group_by_family(gauge_stats or []):
+            metric_family = metric_set.metric_families.add()
+            metric_family.name = family_name
+            metric_family.type = GAUGE
+
+            for gauge_stat in family_gauges:
+                metric_proto = metric_family.metrics.add()
+                gauge_stat.marshall_metric_proto(metric_proto)
+
+        for family_name, family_histograms in _group_by_family(histogram_stats or []):
+            metric_family = metric_set.metric_families.add()
+            metric_family.name = family_name
+            metric_family.type = HISTOGRAM
+
+            for histogram_stat in family_histograms:
+                metric_proto = metric_family.metrics.add()
+                histogram_stat.marshall_metric_proto(metric_proto)
+
         return metric_set
+
+
+_StatT = TypeVar("_StatT", "CounterStat", "GaugeStat", "HistogramStat")
+
+
+def _group_by_family(stats: list[_StatT]) -> list[tuple[str, list[_StatT]]]:
+    """Group counters, gauges or histograms by their metric family, preserving the order
+    in which each family first appears."""
+    families: dict[str, list[_StatT]] = {}
+    for stat in stats:
+        families.setdefault(stat.family_name, []).append(stat)
+    return list(families.items())
@@ -0,0 +1,372 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serve an app from several worker processes behind a single port.
+
+The parent process listens on the server's port. For each connection it
+accepts, it peeks at the HTTP request head (without consuming it), picks a
+worker, and passes the connection's file descriptor to that worker over a
+Unix socket. The worker then serves the connection as if it had accepted it
+itself, with its own Runtime.
+
+Requests that belong to a session (its websocket, including reconnects, and
+its file uploads), to a media file, to a cached ForwardMsg or to a paged
+dataframe are routed by the session's, file's or table's ID or the message's
+hash, using `worker_shard`. All other requests are spread round-robin.
+
+Because routing happens per connection, workers ask clients not to keep HTTP
+connections alive between requests (see CloseConnectionTransform). Websocket
+connections are unaffected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import signal
+import socket
+from typing import TYPE_CHECKING, Any, Final
+
+from tornado.iostream import IOStream
+from tornado.tcpserver import TCPServer
+from tornado.web import OutputTransform
+
+from streamlit.logger import get_logger
+from streamlit.runtime import worker_shard
+
+if TYPE_CHECKING:
+    from tornado import httputil
+    from tornado.httpserver import HTTPServer
+
+_LOGGER: Final = get_logger(__name__)
+
+# Maximum size of a message sent to a worker along with a connection.
+_CHANNEL_MSG_SIZE: Final = 1024
+
+# We route a connection once we've seen this many bytes of its request head,
+# even if the head isn't complete yet.
+_MAX_REQUEST_HEAD_BYTES: Final = 64 * 1024
+
+# How long we wait for a client to send its request head before handing the
+# connection to any worker, which will deal with it.
+_REQUEST_HEAD_TIMEOUT_SECONDS: Final = 10.0
+
+# How long we wait before peeking again when only part of the request head has
+# arrived, and before retrying to pass a connection to a busy worker.
+_RETRY_SECONDS: Final = 0.005
+
+# How often workers check that the parent process is still alive, and the
+# parent checks that its workers are.
+_PROCESS_CHECK_INTERVAL_SECONDS: Final = 0.5
+
+_STREAM_PATH_RE: Final = re.compile(rb"/_stcore/stream(?:[?#]|$)")
+_UPLOAD_FILE_PATH_RE: Final = re.compile(rb"/_stcore/upload_file/([^/?#]+)")
+_MEDIA_PATH_RE: Final = re.compile(rb"/media/([^/?#.]+)")
+_MESSAGE_PATH_RE: Final = re.compile(rb"/_stcore/message\?(?:[^#]*&)?hash=([^&#]+)")
+_DATAFRAME_PATH_RE: Final = re.compile(rb"/_stcore/dataframe/([^/?#]+)")
+_WEBSOCKET_PROTOCOL_HEADER_RE: Final = re.compile(
+    rb"^sec-websocket-protocol:(.*)$", re.IGNORECASE | re.MULTILINE
+)
+
+# Set in worker processes: our end of the Unix socket that the parent
+# process passes connections over.
+_worker_channel: socket.socket | None = None
+
+
+def is_worker_process() -> bool:
+    """True if this process is a worker started by start_worker_processes."""
+    return _worker_channel is not None
+
+
+def get_routing_key(request_head: bytes) -> str | None:
+    """Return the ID that decides which worker should serve a request, or
+    None if any worker can serve it.
+
+    Parameters
+    ----------
+    request_head : bytes
+        The start of the request: its request line and (some of) its
+        headers.
+    """
+    request_line, _, headers = request_head.partition(b"\r\n")
+    request_line_parts = request_line.split(b" ")
+    if len(request_line_parts) < 2:
+        return None
+    path = request_line_parts[1]
+
+    if _STREAM_PATH_RE.search(path):
+        # A reconnecting client sends the ID of its session as the third
+        # entry of the Sec-WebSocket-Protocol header. (See
+        # BrowserWebSocketHandler.select_subprotocol.)
+        header_match = _WEBSOCKET_PROTOCOL_HEADER_RE.search(headers)
+        if header_match:
+            protocols = [p.strip() for p in header_match.group(1).split(b",")]
+            if len(protocols) >= 3 and protocols[2]:
+                return protocols[2].decode("latin-1")
+        return None
+
+    path_match = (
+        _UPLOAD_FILE_PATH_RE.search(path)
+        or _MEDIA_PATH_RE.search(path)
+        or _MESSAGE_PATH_RE.search(path)
+        or _DATAFRAME_PATH_RE.search(path)
+    )
+    if path_match:
+        return path_match.group(1).decode("latin-1")
+
+    return None
+
+
+class CloseConnectionTransform(OutputTransform):
+    """Tells clients to close their connection to a worker after each
+    response, so that their next request is routed anew.
+
+    Websocket handshakes are left alone: the connection is upgraded, and
+    stays with the worker that serves the session.
+    """
+
+    def transform_first_chunk(
+        self,
+        status_code: int,
+        headers: httputil.HTTPHeaders,
+        chunk: bytes,
+        finishing: bool,
+    ) -> tuple[int, httputil.HTTPHeaders, bytes]:
+        if status_code != 101:
+            headers["Connection"] = "close"
+        return status_code, headers, chunk
+
+
+class ConnectionRouter(TCPServer):
+    """Accepts connections in the parent process and passes each of them to
+    a worker process.
+    """
+
+    def __init__(self, worker_channels: list[socket.socket], worker_pids: list[int]):
+        super().__init__()
+        self._worker_channels = worker_channels
+        self._worker_pids = worker_pids
+        self._next_worker = 0
+        self._stopping_workers = False
+
+    def choose_worker(self, routing_key: str | None) -> int:
+        """Return the index of the worker that should serve a request with the
+        given routing key.
+        """
+        num_workers = len(self._worker_channels)
+        if routing_key is not None:
+            return worker_shard.shard_for_key(routing_key, num_workers)
+
+        worker = self._next_worker
+        self._next_worker = (worker + 1) % num_workers
+        return worker
+
+    async def handle_stream(self, stream: IOStream, address: Any) -> None:
+        connection = stream.socket
+        try:
+            request_head = await _peek_request_head(connection)
+            if request_head is None:
+                # The client hung up before sending anything.
+                return
+
+            worker = self.choose_worker(get_routing_key(request_head))
+            await _send_connection(self._worker_channels[worker], connection, address)
+        except OSError as ex:
+            _LOGGER.debug("Unable to route connection from %s", address, exc_info=ex)
+        finally:
+            # The worker has its own copy of the connection now.
+            stream.close()
+
+    def stop_workers(self) -> None:
+        """Ask all worker processes to shut down."""
+        self._stopping_workers = True
+        for pid in self._worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    async def wait_for_workers(self) -> None:
+        """Wait until all worker processes have exited.
+
+        If a worker exits before stop_workers is called, the others are
+        stopped too, since the sessions routed to it can't be served anymore.
+        """
+        running = set(self._worker_pids)
+        while running:
+            await asyncio.sleep(_PROCESS_CHECK_INTERVAL_SECONDS)
+            for pid in list(running):
+                exited_pid, status = os.waitpid(pid, os.WNOHANG)
+                if exited_pid == 0:
+                    continue
+                running.discard(pid)
+                if not self._stopping_workers:
+                    _LOGGER.error(
+                        "Worker process %s exited unexpectedly (status %s). "
+                        "Stopping the server.",
+                        pid,
+                        status,
+                    )
+                    self.stop_workers()
+
+
+def start_worker_processes(num_workers: int) -> ConnectionRouter | None:
+    """Fork `num_workers` worker processes.
+
+    Must be called before an event loop is created. Returns a ConnectionRouter
+    in the parent process, which should start listening on the server's port
+    and pass the connections it accepts to the workers. Returns None in the
+    workers, which should go on to start a Server as usual.
+    """
+    global _worker_channel
+
+    worker_channels: list[socket.socket] = []
+    worker_pids: list[int] = []
+    for index in range(num_workers):
+        parent_end, worker_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        pid = os.fork()
+        if pid == 0:
+            parent_end.close()
+            for channel in worker_channels:
+                channel.close()
+            worker_shard.set_shard(index, num_workers)
+            _worker_channel = worker_end
+            return None
+
+        worker_end.close()
+        parent_end.setblocking(False)
+        worker_channels.append(parent_end)
+        worker_pids.append(pid)
+
+    _LOGGER.debug("Started worker processes %s", worker_pids)
+    return ConnectionRouter(worker_channels, worker_pids)
+
+
+def accept_routed_connections(http_server: HTTPServer) -> None:
+    """Serve the connections that the parent process passes to this worker
+    with the given HTTPServer.
+
+    The worker shuts itself down, via SIGTERM, if the parent process goes
+    away.
+    """
+    assert _worker_channel is not None, "Not a worker process"
+    accept_connections_from_channel(http_server, _worker_channel)
+
+    parent_pid = os.getppid()
+
+    async def watch_parent() -> None:
+        while os.getppid() == parent_pid:
+            await asyncio.sleep(_PROCESS_CHECK_INTERVAL_SECONDS)
+        _LOGGER.debug("Parent process exited. Shutting down worker.")
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    asyncio.get_running_loop().create_task(watch_parent())
+
+
+def accept_connections_from_channel(
+    http_server: HTTPServer, channel: socket.socket
+) -> None:
+    """Serve the connections received on `channel` with the given HTTPServer."""
+    channel.setblocking(False)
+
+    def on_channel_readable() -> None:
+        while True:
+            try:
+                msg, fds, _, _ = socket.recv_fds(channel, _CHANNEL_MSG_SIZE, 1)
+            except BlockingIOError:
+                return
+            if not fds:
+                continue
+
+            address = json.loads(msg)
+            connection = socket.socket(fileno=fds[0])
+            connection.setblocking(False)
+            # This mirrors what TCPServer does with the connections it accepts.
+            stream = IOStream(
+                connection,
+                max_buffer_size=http_server.max_buffer_size,
+                read_chunk_size=http_server.read_chunk_size,
+            )
+            http_server.handle_stream(
+                stream, tuple(address) if isinstance(address, list) else address
+            )
+
+    asyncio.get_running_loop().add_reader(channel.fileno(), on_channel_readable)
+
+
+async def _peek_request_head(connection: socket.socket) -> bytes | None:
+    """Return the start of the request on the connection, without consuming
+    it, or None if the client closes the connection first.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _REQUEST_HEAD_TIMEOUT_SECONDS
+    data = b""
+    while True:
+        try:
+            data = connection.recv(_MAX_REQUEST_HEAD_BYTES, socket.MSG_PEEK)
+        except BlockingIOError:
+            pass
+        else:
+            if not data:
+                return None
+            if b"\r\n\r\n" in data or len(data) >= _MAX_REQUEST_HEAD_BYTES:
+                return data
+
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            return data
+
+        if data:
+            # The connection stays readable until we consume the data, so we
+            # can't wait for the rest of the head to arrive. Poll instead; in
+            # practice, request heads almost always arrive in one piece.
+            await asyncio.sleep(_RETRY_SECONDS)
+        else:
+            await _wait_until_readable(connection, timeout)
+
+
+async def _wait_until_readable(connection: socket.socket, timeout: float) -> None:
+    loop = asyncio.get_running_loop()
+    readable = loop.create_future()
+
+    def on_readable() -> None:
+        if not readable.done():
+            readable.set_result(None)
+
+    loop.add_reader(connection.fileno(), on_readable)
+    try:
+        await asyncio.wait_for(readable, timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        loop.remove_reader(connection.fileno())
+
+
+async def _send_connection(
+    channel: socket.socket, connection: socket.socket, address: Any
+) -> None:
+    if isinstance(address, bytes):
+        # Unix socket addresses may be bytes, which JSON can't encode.
+        address = address.decode("utf-8", "surrogateescape")
+    msg = json.dumps(address).encode("utf-8")
+    while True:
+        try:
+            socket.send_fds(channel, [msg], [connection.fileno()])
+            return
+        except BlockingIOError:
+            # The worker hasn't picked up the connections we've already
+            # passed it yet.
+            await asyncio.sleep(_RETRY_SECONDS)
@@ -408,6 +408,10 @@ class ConfigTest(unittest.TestCase):
                 "global.minCachedMessageSize",
                 "global.showWarningOnDirectExecution",
                 "global.storeCachedForwardMessagesInMemory",
+                "global.maxCacheDataBytes",
+                "global.maxDiskCacheBytes",
+                "global.cacheHashAlgorithm",
+                "global.exactCacheHashing",
                 "global.includeFragmentRunsInForwardMessageCacheCount",
                 "global.suppressDeprecationWarnings",
                 "global.unitTest",
@@ -418,6 +422,8 @@ class ConfigTest(unittest.TestCase):
                 "runner.magicEnabled",
                 "runner.postScriptGC",
                 "runner.fastReruns",
+                "runner.scriptThreadPoolSize",
+                "runner.maxConcurrentScriptRuns",
                 "runner.enumCoercion",
                 "magic.displayRootDocString",
                 "magic.displayLastExprIfNoSemicolon",
@@ -428,6 +434,12 @@ class ConfigTest(unittest.TestCase):
                 "server.cookieSecret",
                 "server.scriptHealthCheckEnabled",
                 "server.enableWebsocketCompression",
+                "server.maxWebsocketBatchSize",
+                "server.maxSessionQueueSize",
+                "server.workerProcesses",
+                "server.warmupScript",
+                "server.warmupMaxWorkers",
+                "server.dataframePagingRowThreshold",
                 "server.enableXsrfProtection",
                 "server.fileWatcherType",
                 "server.folderWatchBlacklist",
@@ -440,6 +452,8 @@ class ConfigTest(unittest.TestCase):
                 "server.maxMessageSize",
                 "server.enableStaticServing",
                 "server.enableArrowTruncation",
+                "server.arrowTruncationStrategy",
+                "server.arrowCompression",
                 "server.sslCertFile",
                 "server.sslKeyFile",
                 "server.disconnectedSessionTTL",
@@ -30,6 +30,7 @@ from parameterized import parameterized
 
 import streamlit as st
 from streamlit import dataframe_util
+from streamlit.errors import StreamlitAPIException
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.data_mocks.snowpandas_mocks import DataFrame as SnowpandasDataFrame
 from tests.streamlit.data_mocks.snowpandas_mocks import Index as SnowpandasIndex
@@ -54,6 +55,38 @@ class DataframeUtilTest(unittest.TestCase):
         except Exception as ex:
             self.fail(f"Converting dtype dataframes to Arrow should not fail: {ex}")
 
+    @patch_config_options({"server.arrowCompression": "lz4"})
+    def test_convert_arrow_table_to_compressed_arrow_bytes(self):
+        """Test that `convert_arrow_table_to_arrow_bytes` compresses the buffers
+        of large tables if server.arrowCompression is set.
+        """
+        table = pa.table({"ints": np.arange(100000), "strings": ["foo"] * 100000})
+
+        arrow_bytes = dataframe_util.convert_arrow_table_to_arrow_bytes(table)
+
+        self.assertLess(
+            len(arrow_bytes), len(dataframe_util._serialize_arrow_table(table))
+        )
+        self.assertTrue(pa.ipc.open_stream(arrow_bytes).read_all().equals(table))
+
+    @patch_config_options({"server.arrowCompression": "lz4"})
+    def test_dont_compress_small_arrow_tables(self):
+        """Test that `convert_arrow_table_to_arrow_bytes` doesn't compress small
+        tables.
+        """
+        table = pa.table({"ints": [1, 2, 3]})
+
+        self.assertEqual(
+            dataframe_util.convert_arrow_table_to_arrow_bytes(table),
+            dataframe_util._serialize_arrow_table(table),
+        )
+
+    @patch_config_options({"server.arrowCompression": "gzip"})
+    def test_invalid_arrow_compression(self):
+        """Test that an invalid server.arrowCompression raises an exception."""
+        with pytest.raises(StreamlitAPIException):
+            dataframe_util.convert_arrow_table_to_arrow_bytes(pa.table({"a": [1]}))
+
     @parameterized.expand(
         SHARED_TEST_CASES,
     )
@@ -818,6 +851,256 @@ class DataframeUtilTest(unittest.TestCase):
         assert converted_sequence is not input_data
 
 
+class _ArrowStream:
+    """An object that only implements the Arrow PyCapsule stream interface."""
+
+    def __init__(self, table: pa.Table):
+        self._table = table
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self._table.__arrow_c_stream__(requested_schema)
+
+
+class _InterchangeDataFrame:
+    """An object that only implements the dataframe interchange protocol."""
+
+    def __init__(self, table: pa.Table):
+        self._table = table
+
+    def __dataframe__(self, nan_as_null=False, allow_copy=True):
+        return self._table.__dataframe__(nan_as_null, allow_copy)
+
+
+class DirectArrowConversionTest(unittest.TestCase):
+    """Tests for converting data to Arrow without converting it to pandas."""
+
+    def _convert(self, data: Any) -> pa.Table | None:
+        return dataframe_util.convert_to_arrow_table_directly(
+            data, dataframe_util.determine_data_format(data)
+        )
+
+    def test_numpy_list(self):
+        table = self._convert(np.array([1.0, np.nan, 3.0]))
+
+        assert table == pa.table({"value": pa.array([1.0, None, 3.0])})
+
+    def test_numpy_matrix(self):
+        table = self._convert(np.arange(6).reshape(3, 2))
+
+        assert table == pa.table({"0": [0, 2, 4], "1": [1, 3, 5]})
+        assert self._convert(np.array([[1], [2]])).column_names == ["value"]
+
+    def test_numpy_structured_array(self):
+        data = np.array([(1, "a"), (2, "b")], dtype=[("x", "i4"), ("y", "U1")])
+
+        assert self._convert(data) == pa.table(
+            {"x": pa.array([1, 2], pa.int32()), "y": ["a", "b"]}
+        )
+        assert self._convert(data.view(np.recarray)) == self._convert(data)
+
+    @parameterized.expand(
+        [
+            ("empty", np.array([])),
+            ("complex", np.array([1 + 2j])),
+            ("object", np.array([1, "a"], dtype=object)),
+            ("datetime", np.array(["2020-01-01"], dtype="datetime64[D]")),
+            ("3d", np.zeros((2, 2, 2))),
+        ]
+    )
+    def test_numpy_arrays_that_need_pandas(self, _, data):
+        assert self._convert(data) is None
+
+    def test_numpy_matches_pandas_conversion(self):
+        """Directly converted NumPy arrays have the same columns and values as
+        the ones converted via pandas.
+        """
+        for data in [
+            np.array([1, 2, 3]),
+            np.array(["a", "b"]),
+            np.array([[1.5, np.nan], [3.0, 4.0]]),
+            np.array([(1, 2.0)], dtype=[("a", "i8"), ("b", "f8")]),
+        ]:
+            table = self._convert(data)
+            via_pandas = pa.Table.from_pandas(
+                dataframe_util.convert_anything_to_pandas_df(data),
+                preserve_index=False,
+            )
+            assert table.replace_schema_metadata() == (
+                via_pandas.replace_schema_metadata()
+            ), data
+
+    def test_arrow_stream(self):
+        table = pa.table({"a": [1, 2], "b": ["x", "y"]})
+
+        assert self._convert(_ArrowStream(table)) == table
+        assert self._convert(table.to_reader()) == table
+        assert self._convert(table.to_batches()[0]) == table
+
+    def test_chunked_array_needs_pandas(self):
+        assert self._convert(pa.chunked_array([[1, 2]])) is None
+
+    def test_dataframe_interchange_protocol(self):
+        table = pa.table({"a": [1, 2], "b": ["x", "y"]})
+
+        assert self._convert(_InterchangeDataFrame(table)).to_pydict() == (
+            table.to_pydict()
+        )
+
+    def test_failed_conversion_needs_pandas(self):
+        class BrokenStream:
+            def __arrow_c_stream__(self, requested_schema=None):
+                raise pa.ArrowInvalid("mock error")
+
+        assert self._convert(BrokenStream()) is None
+
+    def test_frontend_compatible_types(self):
+        """View and large list types, which the frontend can't read, are cast
+        to equivalent types.
+        """
+        table = pa.table(
+            {
+                "list": pa.array([[1]], pa.large_list(pa.int64())),
+                "struct": pa.array(
+                    [{"x": ["a"]}],
+                    pa.struct([("x", pa.large_list(pa.large_string()))]),
+                ),
+            }
+        )
+
+        converted = self._convert(_ArrowStream(table))
+
+        assert converted.schema == pa.schema(
+            [
+                ("list", pa.list_(pa.int64())),
+                ("struct", pa.struct([("x", pa.list_(pa.large_string()))])),
+            ]
+        )
+        assert converted.to_pylist() == table.to_pylist()
+
+    @parameterized.expand(
+        [
+            (pa.string_view(), pa.large_string()),
+            (pa.binary_view(), pa.large_binary()),
+            (pa.large_list(pa.string_view()), pa.list_(pa.large_string())),
+            (
+                pa.dictionary(pa.int32(), pa.string_view()),
+                pa.dictionary(pa.int32(), pa.large_string()),
+            ),
+            (pa.int64(), pa.int64()),
+        ]
+    )
+    def test_frontend_compatible_type(self, arrow_type, expected_type):
+        assert (
+            dataframe_util._to_frontend_compatible_arrow_type(arrow_type)
+            == expected_type
+        )
+
+    def test_convert_anything_to_arrow_bytes_skips_pandas(self):
+        with patch(
+            "streamlit.dataframe_util.convert_anything_to_pandas_df"
+        ) as convert_to_pandas:
+            arrow_bytes = dataframe_util.convert_anything_to_arrow_bytes(
+                np.arange(6).reshape(3, 2)
+            )
+
+        convert_to_pandas.assert_not_called()
+        assert dataframe_util.convert_arrow_bytes_to_pandas_df(arrow_bytes).shape == (
+            3,
+            2,
+        )
+
+    @pytest.mark.require_integration
+    def test_polars(self):
+        import polars as pl
+
+        df = pl.DataFrame(
+            {
+                "int": [1, 2],
+                "str": ["a", None],
+                "list": [[1], [2, 3]],
+                "cat": pl.Series(["a", "b"], dtype=pl.Categorical),
+            }
+        )
+
+        table = self._convert(df)
+        assert table.column_names == ["int", "str", "list", "cat"]
+        assert table.schema.field("list").type == pa.list_(pa.int64())
+        assert table.to_pylist() == df.to_dicts()
+
+        series_table = self._convert(df["str"])
+        assert series_table.column_names == ["str"]
+        assert series_table.num_rows == 2
+
+    @pytest.mark.require_integration
+    def test_polars_lazyframe_is_limited(self):
+        import polars as pl
+
+        lazy_frame = pl.LazyFrame({"a": range(100)})
+
+        with patch("streamlit.dataframe_util._show_data_information") as show_info:
+            table = dataframe_util.convert_to_arrow_table_directly(
+                lazy_frame, dataframe_util.DataFormat.POLARS_LAZYFRAME, 10
+            )
+
+        assert table.num_rows == 10
+        show_info.assert_called_once()
+
+    @pytest.mark.require_integration
+    def test_duckdb_relation(self):
+        import duckdb
+
+        items = pd.DataFrame([["foo", 1], ["bar", 2]], columns=["name", "value"])  # noqa: F841
+        db_relation = duckdb.sql("SELECT * from items")
+
+        table = self._convert(db_relation)
+        assert table.column_names == ["name", "value"]
+        assert table.num_rows == 2
+
+
+@pytest.mark.usefixtures("benchmark")
+class DirectArrowConversionPerformanceTest(unittest.TestCase):
+    """Benchmarks for converting 1M x 50 frames to Arrow bytes."""
+
+    _ROWS = 1_000_000
+    _COLS = 50
+
+    def test_numpy_matrix_performance(self):
+        data = np.random.default_rng(0).random((self._ROWS, self._COLS))
+        self.benchmark(lambda: dataframe_util.convert_anything_to_arrow_bytes(data))
+
+    def test_numpy_matrix_via_pandas_performance(self):
+        data = np.random.default_rng(0).random((self._ROWS, self._COLS))
+        self.benchmark(
+            lambda: dataframe_util.convert_pandas_df_to_arrow_bytes(
+                dataframe_util.convert_anything_to_pandas_df(data)
+            )
+        )
+
+    def test_polars_dataframe_performance(self):
+        try:
+            import polars as pl
+        except ImportError:
+            # Skip if polars is not installed.
+            return
+
+        data = pl.DataFrame(np.random.default_rng(0).random((self._ROWS, self._COLS)))
+        self.benchmark(lambda: dataframe_util.convert_anything_to_arrow_bytes(data))
+
+    def test_polars_dataframe_via_pandas_performance(self):
+        try:
+            import polars as pl
+        except ImportError:
+            # Skip if polars is not installed.
+            return
+
+        data = pl.DataFrame(np.random.default_rng(0).random((self._ROWS, self._COLS)))
+        self.benchmark(
+            lambda: dataframe_util.convert_pandas_df_to_arrow_bytes(
+                dataframe_util.convert_anything_to_pandas_df(data)
+            )
+        )
+
+
 class TestArrowTruncation(DeltaGeneratorTestCase):
     """Test class for the automatic arrow truncation feature."""
 
@@ -924,3 +1207,204 @@ class TestArrowTruncation(DeltaGeneratorTestCase):
         el = self.get_delta_from_queue(-2).new_element
         self.assertIn("due to data size limitations", el.markdown.body)
         self.assertTrue(el.markdown.is_caption)
+
+    @patch_config_options(
+        {"server.maxMessageSize": 3, "server.enableArrowTruncation": True}
+    )
+    def test_truncate_at_exact_row(self):
+        """Test that `_maybe_truncate_table` keeps as many rows as fit into the
+        max message size, for string-heavy tables where `nbytes` is a poor
+        estimate of the serialized size.
+        """
+        rng = np.random.default_rng(0)
+        original_df = pd.DataFrame(
+            {
+                "ints": range(100000),
+                "strings": [
+                    "x" * int(length) if length % 7 else None
+                    for length in rng.integers(0, 100, 100000)
+                ],
+                "categories": pd.Categorical(rng.choice(["a", "b"], 100000)),
+            }
+        )
+        original_table = pa.Table.from_pandas(original_df)
+        truncated_table = dataframe_util._maybe_truncate_table(original_table)
+
+        # The max message size minus 1 MB for the rest of the message:
+        max_table_size = 2 * int(1e6)
+        self.assertLessEqual(
+            len(dataframe_util._serialize_arrow_table(truncated_table)),
+            max_table_size,
+        )
+        # One more row doesn't fit:
+        self.assertGreater(
+            len(
+                dataframe_util._serialize_arrow_table(
+                    original_table.slice(0, truncated_table.num_rows + 1)
+                )
+            ),
+            max_table_size,
+        )
+
+    @patch_config_options(
+        {"server.maxMessageSize": 3, "server.enableArrowTruncation": True}
+    )
+    def test_truncate_nested_table(self):
+        """Test that `_maybe_truncate_table` truncates tables with columns of
+        nested types, whose row sizes are estimated, to fit into the max
+        message size.
+        """
+        original_table = pa.concat_tables(
+            [pa.table({"lists": [[1, 2, 3]] * 50000, "strings": ["abc"] * 50000})] * 5
+        )
+        truncated_table = dataframe_util._maybe_truncate_table(original_table)
+
+        self.assertLess(truncated_table.num_rows, original_table.num_rows)
+        self.assertLessEqual(
+            len(dataframe_util._serialize_arrow_table(truncated_table)),
+            2 * int(1e6),
+        )
+
+    @patch_config_options(
+        {
+            "server.maxMessageSize": 3,
+            "server.enableArrowTruncation": True,
+            "server.arrowTruncationStrategy": "sample",
+        }
+    )
+    def test_truncate_with_sample_strategy(self):
+        """Test that the sample strategy keeps the first and last rows, and
+        the labels of the rows.
+        """
+        col_data = list(range(200000))
+        original_df = pd.DataFrame(
+            {
+                "col 1": col_data,
+                "col 2": col_data,
+                "col 3": col_data,
+            }
+        )
+        original_table = pa.Table.from_pandas(original_df)
+        truncated_table = dataframe_util._maybe_truncate_table(original_table)
+
+        self.assertLess(truncated_table.num_rows, original_table.num_rows)
+        self.assertLessEqual(
+            len(dataframe_util._serialize_arrow_table(truncated_table)),
+            2 * int(1e6),
+        )
+
+        truncated_df = truncated_table.to_pandas()
+        self.assertEqual([0, 1, 2], truncated_df.index[:3].tolist())
+        self.assertEqual([199997, 199998, 199999], truncated_df.index[-3:].tolist())
+        self.assertEqual(truncated_df.index.tolist(), truncated_df["col 1"].tolist())
+        self.assertTrue(truncated_df.index.is_monotonic_increasing)
+
+        el = self.get_delta_from_queue().new_element
+        self.assertIn("a sample of the rows in between", el.markdown.body)
+        self.assertTrue(el.markdown.is_caption)
+
+    @patch_config_options(
+        {
+            "server.enableArrowTruncation": True,
+            "server.arrowTruncationStrategy": "tail",
+        }
+    )
+    def test_invalid_truncation_strategy(self):
+        """Test that an invalid truncation strategy raises an exception."""
+        with pytest.raises(StreamlitAPIException):
+            dataframe_util._maybe_truncate_table(pa.table({"a": [1, 2, 3]}))
+
+
+@pytest.mark.usefixtures("benchmark")
+class ArrowTruncationPerformanceTest(unittest.TestCase):
+    """Benchmarks for truncating wide, string-heavy tables."""
+
+    _ROWS = 100_000
+    _COLS = 50
+
+    def _create_table(self) -> pa.Table:
+        rng = np.random.default_rng(0)
+        return pa.table(
+            {
+                f"col_{i}": [
+                    "x" * int(length) for length in rng.integers(0, 40, self._ROWS)
+                ]
+                for i in range(self._COLS)
+            }
+        )
+
+    @patch_config_options(
+        {"server.maxMessageSize": 50, "server.enableArrowTruncation": True}
+    )
+    def test_head_truncation_performance(self):
+        table = self._create_table()
+        self.benchmark(lambda: dataframe_util.convert_arrow_table_to_arrow_bytes(table))
+
+    @patch_config_options(
+        {
+            "server.maxMessageSize": 50,
+            "server.enableArrowTruncation": True,
+            "server.arrowTruncationStrategy": "sample",
+        }
+    )
+    def test_sample_truncation_performance(self):
+        table = self._create_table()
+        self.benchmark(lambda: dataframe_util.convert_arrow_table_to_arrow_bytes(table))
+
+
+@pytest.mark.usefixtures("benchmark")
+class ArrowCompressionPerformanceTest(unittest.TestCase):
+    """Benchmarks for encoding and decoding compressed Arrow bytes of 1M row
+    tables. The number of encoded bytes is reported as `bytes` in the
+    benchmarks' extra info.
+    """
+
+    _ROWS = 1_000_000
+
+    def _create_table(self, kind: str) -> pa.Table:
+        rng = np.random.default_rng(0)
+        if kind == "numeric":
+            return pa.table(
+                {
+                    "ints": rng.integers(0, 1000, self._ROWS),
+                    "floats": rng.random(self._ROWS).round(2),
+                    "counter": np.arange(self._ROWS),
+                }
+            )
+        return pa.table(
+            {
+                "names": rng.choice(["alice", "bob", "carol", "dave"], self._ROWS),
+                "ids": [f"id-{i}" for i in range(self._ROWS)],
+            }
+        )
+
+    @parameterized.expand(
+        [
+            ("numeric", "none"),
+            ("numeric", "lz4"),
+            ("strings", "none"),
+            ("strings", "lz4"),
+        ]
+    )
+    def test_encode_performance(self, kind: str, compression: str):
+        table = self._create_table(kind)
+        with patch_config_options({"server.arrowCompression": compression}):
+            arrow_bytes = self.benchmark(
+                lambda: dataframe_util.convert_arrow_table_to_arrow_bytes(table)
+            )
+        self.benchmark.extra_info["bytes"] = len(arrow_bytes)
+
+    @parameterized.expand(
+        [
+            ("numeric", None),
+            ("numeric", "lz4"),
+            ("strings", None),
+            ("strings", "lz4"),
+        ]
+    )
+    def test_decode_performance(self, kind: str, compression: str | None):
+        arrow_bytes = dataframe_util._serialize_arrow_table(
+            self._create_table(kind), compression=compression
+        )
+        self.benchmark.extra_info["bytes"] = len(arrow_bytes)
+        self.benchmark(lambda: pa.ipc.open_stream(arrow_bytes).read_all())
@@ -14,11 +14,18 @@
 
 """Unit test of dg.add_rows()."""
 
+from unittest import mock
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
 from parameterized import parameterized
 
 import streamlit as st
 from streamlit.dataframe_util import convert_arrow_bytes_to_pandas_df
+from streamlit.elements import arrow
+from streamlit.errors import StreamlitAPIException
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 
 DATAFRAME = pd.DataFrame({"a": [10], "b": [20], "c": [30]})
@@ -44,19 +51,19 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_implict_x_and_y(self, chart_command):
         expected = pd.DataFrame(
             {
-                "index--p5bJXXpQgvPz6yvQMFiy": [1, 2, 3, 1, 2, 3, 1, 2, 3],
+                "index--p5bJXXpQgvPz6yvQMFiy": [1, 1, 1, 2, 2, 2, 3, 3, 3],
                 "color--p5bJXXpQgvPz6yvQMFiy": [
                     "a",
-                    "a",
-                    "a",
-                    "b",
-                    "b",
                     "b",
                     "c",
+                    "a",
+                    "b",
                     "c",
+                    "a",
+                    "b",
                     "c",
                 ],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 21, 22, 23, 31, 32, 33],
+                "value--p5bJXXpQgvPz6yvQMFiy": [11, 21, 31, 12, 22, 32, 13, 23, 33],
             }
         )
 
@@ -110,9 +117,9 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_explicit_x_and_implicit_y(self, chart_command):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 21, 22, 22, 23, 23],
+                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "c", "a", "c", "a", "c"],
+                "value--p5bJXXpQgvPz6yvQMFiy": [11, 31, 12, 32, 13, 33],
             }
         )
 
@@ -129,9 +136,9 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_explicit_x_and_y_sequence(self, chart_command):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 21, 22, 22, 23, 23],
+                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "c", "a", "c", "a", "c"],
+                "value--p5bJXXpQgvPz6yvQMFiy": [11, 31, 12, 32, 13, 33],
             }
         )
 
@@ -150,9 +157,9 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     ):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 21, 22, 22, 23, 23],
+                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "c", "a", "c", "a", "c"],
+                "value--p5bJXXpQgvPz6yvQMFiy": [11, 31, 12, 32, 13, 33],
             }
         )
 
@@ -168,10 +175,10 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_explicit_x_and_y_sequence_and_size_set(self):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "d": [41, 42, 43, 41, 42, 43],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 21, 22, 22, 23, 23],
+                "d": [41, 41, 42, 42, 43, 43],
+                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "c", "a", "c", "a", "c"],
+                "value--p5bJXXpQgvPz6yvQMFiy": [11, 31, 12, 32, 13, 33],
             }
         )
 
@@ -202,3 +209,185 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
         )
 
         pd.testing.assert_frame_equal(proto, expected)
+
+    def _read_add_rows_table(self) -> pa.Table:
+        return pa.ipc.open_stream(
+            self.get_delta_from_queue().arrow_add_rows.data.data
+        ).read_all()
+
+    def _add_rows_twice(self, element, new_rows, later_rows) -> pa.Table:
+        """Add rows to the element twice, and return the table of the second
+        call."""
+        element.add_rows(new_rows)
+        element.add_rows(later_rows)
+        return self._read_add_rows_table()
+
+    @parameterized.expand(
+        [
+            ({},),
+            ({"x": "b", "y": "c"},),
+            ({"y": "b"},),
+            ({"x": "b"},),
+            ({"x": "b", "y": ["a", "c"]},),
+            ({"x": "b", "y": ["a", "c"], "color": ["#f00", "#0f0"]},),
+        ]
+    )
+    def test_charts_add_rows_without_pandas(self, chart_kwargs):
+        """Test that columns are added to charts without pandas, with the
+        same result as with pandas."""
+        for chart_command in ST_CHART_ARGS:
+            expected = self._add_rows_twice(
+                chart_command(DATAFRAME, **chart_kwargs), NEW_ROWS, NEW_ROWS
+            )
+
+            element = chart_command(DATAFRAME, **chart_kwargs)
+            element.add_rows(NEW_ROWS)
+            with mock.patch.object(
+                arrow, "_prep_data_for_add_rows", wraps=arrow._prep_data_for_add_rows
+            ) as prep_data_with_pandas:
+                element.add_rows(NEW_ROWS.to_dict("list"))
+            prep_data_with_pandas.assert_not_called()
+
+            assert self._read_add_rows_table().equals(expected, check_metadata=True)
+
+    def test_scatter_chart_with_size_add_rows_without_pandas(self):
+        """Test that the size column is kept when rows are melted without
+        pandas."""
+        chart_kwargs = {"x": "b", "y": ["a", "c"], "size": "d"}
+        expected = self._add_rows_twice(
+            st.scatter_chart(DATAFRAME2, **chart_kwargs), NEW_ROWS2, NEW_ROWS2
+        )
+
+        later_rows = {name: pa.array(column) for name, column in NEW_ROWS2.items()}
+        actual = self._add_rows_twice(
+            st.scatter_chart(DATAFRAME2, **chart_kwargs), NEW_ROWS2, later_rows
+        )
+
+        assert actual.equals(expected, check_metadata=True)
+
+    def test_charts_add_rows_with_pandas_if_types_differ(self):
+        """Test that rows that can't be cast to the types of the rows added
+        before are converted with pandas."""
+        element = st.line_chart(DATAFRAME)
+        element.add_rows(NEW_ROWS)
+        element.add_rows({"a": [1.5], "b": ["x"], "c": [3]})
+
+        proto = convert_arrow_bytes_to_pandas_df(
+            self.get_delta_from_queue().arrow_add_rows.data.data
+        )
+
+        assert proto["value--p5bJXXpQgvPz6yvQMFiy"].tolist() == ["1.5", "x", "3"]
+
+    @parameterized.expand(
+        [
+            ("dict", {"a": [11, 12, 13], "b": ["x", "y", "z"]}),
+            ("numpy", {"a": np.array([11, 12, 13]), "b": np.array(["x", "y", "z"])}),
+            (
+                "record_batch",
+                pa.record_batch({"a": [11, 12, 13], "b": ["x", "y", "z"]}),
+            ),
+            ("table", pa.table({"a": [11, 12, 13], "b": ["x", "y", "z"]})),
+        ]
+    )
+    def test_dataframe_add_rows_without_pandas(self, _, later_rows):
+        """Test that columnar rows are added to dataframes without pandas,
+        with the same result as with pandas."""
+        df = pd.DataFrame({"a": [10], "b": ["w"]})
+        new_rows = pd.DataFrame({"a": [11, 12, 13], "b": ["x", "y", "z"]})
+
+        expected = self._add_rows_twice(st.dataframe(df), new_rows, new_rows)
+        with mock.patch.object(
+            arrow, "_prep_data_for_add_rows", wraps=arrow._prep_data_for_add_rows
+        ) as prep_data_with_pandas:
+            actual = self._add_rows_twice(st.dataframe(df), new_rows, later_rows)
+        assert prep_data_with_pandas.call_count == 1
+
+        assert actual.equals(expected, check_metadata=True)
+
+    def test_dataframe_add_rows_with_pandas_index(self):
+        """Test that rows with a pandas index keep it."""
+        df = pd.DataFrame({"a": [10]})
+        element = st.dataframe(df)
+        element.add_rows({"a": [11]})
+        element.add_rows(pd.DataFrame({"a": [12]}, index=["x"]))
+
+        proto = convert_arrow_bytes_to_pandas_df(
+            self.get_delta_from_queue().arrow_add_rows.data.data
+        )
+
+        assert proto.index.tolist() == ["x"]
+
+    def test_add_rows_max_rows(self):
+        """Test that max_rows is set in the proto."""
+        element = st.dataframe(DATAFRAME)
+        element.add_rows(NEW_ROWS, max_rows=100)
+        assert self.get_delta_from_queue().arrow_add_rows.max_rows == 100
+
+        element.add_rows(NEW_ROWS)
+        assert self.get_delta_from_queue().arrow_add_rows.max_rows == 0
+
+    def test_melted_chart_add_rows_max_rows(self):
+        """Test that max_rows counts the rows of melted charts per added
+        row."""
+        element = st.line_chart(DATAFRAME)
+        element.add_rows(NEW_ROWS, max_rows=100)
+        assert self.get_delta_from_queue().arrow_add_rows.max_rows == 300
+
+    def test_melted_chart_max_rows_keeps_last_rows_of_every_series(self):
+        """Test that the last max_rows rows of every y column are kept when
+        the browser keeps the last rows of a melted chart's data, even if
+        max_rows isn't a multiple of the number of rows per add_rows call."""
+        element = st.line_chart(DATAFRAME, y=["a", "c"])
+        chart_proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        dfs = [convert_arrow_bytes_to_pandas_df(chart_proto.datasets[0].data.data)]
+
+        # The first rows are prepared with pandas, the later rows without.
+        element.add_rows(NEW_ROWS, max_rows=4)
+        dfs.append(self._read_add_rows_table().to_pandas())
+        for start in (14, 17):
+            a = list(range(start, start + 3))
+            element.add_rows(
+                pa.table({"a": a, "b": [v + 10 for v in a], "c": [v + 20 for v in a]}),
+                max_rows=4,
+            )
+            dfs.append(self._read_add_rows_table().to_pandas())
+
+        # The browser keeps the last max_rows rows of the chart's data.
+        max_rows = self.get_delta_from_queue().arrow_add_rows.max_rows
+        kept = pd.concat(dfs, ignore_index=True).tail(max_rows)
+
+        series = kept.groupby("color--p5bJXXpQgvPz6yvQMFiy")[
+            "value--p5bJXXpQgvPz6yvQMFiy"
+        ].apply(list)
+        assert series.to_dict() == {"a": [16, 17, 18, 19], "c": [36, 37, 38, 39]}
+        assert kept["index--p5bJXXpQgvPz6yvQMFiy"].tolist() == [6, 6, 7, 7, 8, 8, 9, 9]
+
+    @parameterized.expand([(0,), (-1,), (1.5,), ("10",), (True,)])
+    def test_invalid_max_rows(self, max_rows):
+        """Test that max_rows must be a positive integer."""
+        element = st.dataframe(DATAFRAME)
+        with pytest.raises(StreamlitAPIException):
+            element.add_rows(NEW_ROWS, max_rows=max_rows)
+
+
+@pytest.mark.usefixtures("benchmark")
+class AddRowsPerformanceTest(DeltaGeneratorTestCase):
+    """Benchmarks of streaming rows into a chart."""
+
+    def _stream_rows(self, make_rows) -> None:
+        element = st.line_chart(pd.DataFrame({"a": [0.0], "b": [0.0], "c": [0.0]}))
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            element.add_rows(make_rows(rng.standard_normal((3, 1000))), max_rows=10_000)
+
+    def test_add_rows_with_pandas(self):
+        self.benchmark(
+            lambda: self._stream_rows(
+                lambda values: pd.DataFrame(dict(zip("abc", values)))
+            )
+        )
+
+    def test_add_rows_without_pandas(self):
+        self.benchmark(
+            lambda: self._stream_rows(lambda values: dict(zip("abc", values)))
+        )
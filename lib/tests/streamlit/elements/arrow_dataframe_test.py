@@ -30,8 +30,11 @@ from streamlit.dataframe_util import (
 from streamlit.elements.lib.column_config_utils import INDEX_IDENTIFIER
 from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+from streamlit.runtime import Runtime
+from streamlit.runtime.dataframe_page_manager import PAGE_ROWS
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.data_test_cases import SHARED_TEST_CASES, CaseMetadata
+from tests.testutil import patch_config_options
 
 
 def mock_data_frame():
@@ -371,6 +374,59 @@ class ArrowDataFrameProtoTest(DeltaGeneratorTestCase):
         el = self.get_delta_from_queue().new_element
         self.assertEqual(el.plotly_chart.selection_mode, [])
 
+    @patch_config_options({"server.dataframePagingRowThreshold": 100})
+    def test_paged_dataframe(self):
+        """Dataframes with more rows than the threshold are sent in pages."""
+        df = pd.DataFrame({"a": range(2500)}, index=pd.RangeIndex(10, 2510))
+        st.dataframe(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertTrue(proto.HasField("paged_data"))
+        self.assertEqual(proto.paged_data.num_rows, 2500)
+        self.assertEqual(proto.paged_data.page_rows, PAGE_ROWS)
+
+        # Only the first page is sent with the element.
+        first_page = convert_arrow_bytes_to_pandas_df(proto.data)
+        pd.testing.assert_frame_equal(first_page, df.iloc[:PAGE_ROWS])
+
+        # The other pages can be requested from the page manager.
+        table_id = proto.paged_data.url.rsplit("/", 1)[-1]
+        self.assertEqual(proto.paged_data.url, f"/_stcore/dataframe/{table_id}")
+        page_mgr = Runtime.instance().dataframe_page_mgr
+        last_page = page_mgr.get_rows(table_id, 2000, PAGE_ROWS).to_pandas()
+        self.assertEqual(last_page.index.tolist(), list(range(2010, 2510)))
+
+    @patch_config_options({"server.dataframePagingRowThreshold": 100})
+    def test_small_dataframe_is_not_paged(self):
+        """Dataframes with fewer rows than the threshold are sent at once."""
+        df = pd.DataFrame({"a": range(100)})
+        st.dataframe(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertFalse(proto.HasField("paged_data"))
+        pd.testing.assert_frame_equal(convert_arrow_bytes_to_pandas_df(proto.data), df)
+
+    @patch_config_options({"server.dataframePagingRowThreshold": 100})
+    def test_selectable_and_styled_dataframes_are_not_paged(self):
+        """Dataframes with selections and styled dataframes are sent at once."""
+        df = pd.DataFrame({"a": range(200)})
+
+        st.dataframe(df, on_select="rerun")
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertFalse(proto.HasField("paged_data"))
+
+        st.dataframe(df.style.highlight_max())
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertFalse(proto.HasField("paged_data"))
+
+    def test_paging_is_disabled_by_default(self):
+        """Dataframes aren't paged unless a threshold is configured."""
+        df = pd.DataFrame({"a": range(5000)})
+        st.dataframe(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertFalse(proto.HasField("paged_data"))
+
 
 class StArrowTableAPITest(DeltaGeneratorTestCase):
     """Test Public Streamlit Public APIs."""
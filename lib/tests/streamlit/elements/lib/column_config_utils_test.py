@@ -481,6 +481,7 @@ class ColumnConfigUtilsTest(unittest.TestCase):
     @parameterized.expand(
         [
             (DataFormat.COLUMN_VALUE_MAPPING, True),
+            (DataFormat.DUCKDB_RELATION, True),
             (DataFormat.LIST_OF_RECORDS, True),
             (DataFormat.LIST_OF_ROWS, True),
             (DataFormat.LIST_OF_VALUES, True),
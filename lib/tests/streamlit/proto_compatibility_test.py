@@ -156,6 +156,7 @@ FD = FieldDescriptor
             {
                 ("run_on_save", FD.LABEL_OPTIONAL, FD.TYPE_BOOL),
                 ("script_is_running", FD.LABEL_OPTIONAL, FD.TYPE_BOOL),
+                ("script_is_waiting", FD.LABEL_OPTIONAL, FD.TYPE_BOOL),
             },
         ),
     ]
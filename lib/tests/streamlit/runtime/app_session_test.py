@@ -44,6 +44,7 @@ from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.pages_manager import PagesManager
 from streamlit.runtime.script_data import ScriptData
+from streamlit.runtime.script_run_admission import ScriptRunAdmissionController
 from streamlit.runtime.scriptrunner import (
     RerunData,
     ScriptRunContext,
@@ -116,6 +117,14 @@ class AppSessionTest(unittest.TestCase):
 
         assert session.id == "some_uuid"
 
+    @patch.object(app_session.worker_shard, "_shard_count", 4)
+    @patch.object(app_session.worker_shard, "_shard_index", 2)
+    def test_generates_session_id_for_own_worker_shard(self):
+        """In a worker process, session IDs route back to that worker."""
+        for _ in range(10):
+            session = _create_test_session()
+            assert app_session.worker_shard.shard_for_key(session.id, 4) == 2
+
     def test_uses_session_id_override_if_set(self):
         session = _create_test_session(session_id_override="some_custom_session_id")
 
@@ -330,6 +339,73 @@ class AppSessionTest(unittest.TestCase):
         # And a new ScriptRunner should *not* be created.
         mock_create_scriptrunner.assert_not_called()
 
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 1})
+    @patch("streamlit.runtime.app_session.AppSession._create_scriptrunner")
+    def test_rerun_waits_for_admission(self, mock_create_scriptrunner: MagicMock):
+        """If the Runtime is already running as many scripts as it may, our
+        run is queued, and reruns requested in the meantime are coalesced
+        into it."""
+        admission = ScriptRunAdmissionController()
+        Runtime._instance.script_run_admission = admission
+        assert admission.request_admission("other_session", MagicMock())
+
+        session = _create_test_session()
+        session.request_rerun(ClientState(query_string="a=1"))
+        session.request_rerun(ClientState(query_string="a=2"))
+
+        mock_create_scriptrunner.assert_not_called()
+        msgs = session.flush_browser_queue()
+        assert len(msgs) == 1
+        assert msgs[0].session_status_changed.script_is_waiting
+
+        admission.release("other_session")
+
+        mock_create_scriptrunner.assert_called_once()
+        assert mock_create_scriptrunner.call_args.args[0].query_string == "a=2"
+        assert not session._create_session_status_changed_message().session_status_changed.script_is_waiting
+
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 1})
+    @patch("streamlit.runtime.app_session.AppSession._create_scriptrunner")
+    def test_stop_drops_waiting_run(self, mock_create_scriptrunner: MagicMock):
+        admission = ScriptRunAdmissionController()
+        Runtime._instance.script_run_admission = admission
+        assert admission.request_admission("other_session", MagicMock())
+
+        session = _create_test_session()
+        session.request_rerun(None)
+        assert admission.is_waiting(session.id)
+
+        session.request_script_stop()
+
+        assert not admission.is_waiting(session.id)
+        msgs = session.flush_browser_queue()
+        assert not msgs[-1].session_status_changed.script_is_waiting
+
+        admission.release("other_session")
+        mock_create_scriptrunner.assert_not_called()
+
+    def test_scriptrunner_shutdown_releases_admission(self):
+        """Once our ScriptRunner has shut down, another session may run its
+        script."""
+        admission = MagicMock(spec=ScriptRunAdmissionController)
+        Runtime._instance.script_run_admission = admission
+        event_loop = MagicMock()
+        session = _create_test_session(event_loop)
+        mock_scriptrunner = MagicMock(spec=ScriptRunner)
+        session._scriptrunner = mock_scriptrunner
+
+        with patch(
+            "streamlit.runtime.app_session.asyncio.get_running_loop",
+            return_value=event_loop,
+        ):
+            session._handle_scriptrunner_event_on_event_loop(
+                sender=mock_scriptrunner,
+                event=ScriptRunnerEvent.SHUTDOWN,
+                client_state=ClientState(),
+            )
+
+        admission.release.assert_called_once_with(session.id)
+
     @patch("streamlit.runtime.app_session.ScriptRunner")
     def test_create_scriptrunner(self, mock_scriptrunner: MagicMock):
         """Test that _create_scriptrunner does what it should."""
@@ -349,6 +425,7 @@ class AppSessionTest(unittest.TestCase):
             user_info={"email": "test@example.com"},
             fragment_storage=session._fragment_storage,
             pages_manager=session._pages_manager,
+            browser_queue=session._browser_queue,
         )
 
         assert session._scriptrunner is not None
@@ -16,24 +16,35 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 import os
 import pickle
 import re
 import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
 from parameterized import parameterized
+from testfixtures import TempDirectory
 
 import streamlit as st
-from streamlit import file_util
+from streamlit import file_util, type_util
 from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Text_pb2 import Text as TextProto
 from streamlit.runtime import Runtime
-from streamlit.runtime.caching import cached_message_replay
-from streamlit.runtime.caching.cache_data_api import get_data_cache_stats_provider
+from streamlit.runtime.caching import cache_serializers, cached_message_replay
+from streamlit.runtime.caching.cache_data_api import (
+    DataCache,
+    _data_caches,
+    get_data_cache_stats_provider,
+)
 from streamlit.runtime.caching.cache_errors import CacheError
 from streamlit.runtime.caching.cached_message_replay import (
     CachedResult,
@@ -43,6 +54,7 @@ from streamlit.runtime.caching.hashing import UserHashError
 from streamlit.runtime.caching.storage import (
     CacheStorage,
     CacheStorageContext,
+    CacheStorageKeyNotFoundError,
     CacheStorageManager,
 )
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
@@ -52,12 +64,17 @@ from streamlit.runtime.caching.storage.dummy_cache_storage import (
     DummyCacheStorage,
     MemoryCacheStorageManager,
 )
+from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
+    InMemoryCacheStorageWrapper,
+)
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
+    LocalDiskCacheStorage,
     LocalDiskCacheStorageManager,
     get_cache_folder_path,
 )
 from streamlit.runtime.scriptrunner import add_script_run_ctx
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, CounterStat
+from streamlit.testing.v1.util import patch_config_options
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.element_mocks import (
     ELEMENT_PRODUCER,
@@ -71,7 +88,8 @@ from tests.testutil import create_mock_script_run_ctx
 
 
 def as_cached_result(value: Any) -> CachedResult:
-    return _as_cached_result(value)
+    # st.cache_data records when each value was computed.
+    return dataclasses.replace(_as_cached_result(value), computed_at=0.0)
 
 
 def as_replay_test_data() -> CachedResult:
@@ -278,6 +296,641 @@ If you think this is actually a Streamlit bug, please
         assert example_instance.foo(1) == 2
 
 
+class CacheDataCopyOnWriteTest(unittest.TestCase):
+    """Tests for @st.cache_data(copy="on_write")."""
+
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+    def tearDown(self):
+        st.cache_data.clear()
+
+    def test_unpickles_value_once(self):
+        """Cache hits share the value unpickled by the first hit."""
+
+        @st.cache_data(copy="on_write")
+        def f():
+            return np.arange(10)
+
+        f()
+        with patch(
+            "streamlit.runtime.caching.cache_data_api.pickle.loads",
+            wraps=pickle.loads,
+        ) as loads:
+            r1 = f()
+            r2 = f()
+            r3 = f()
+
+        loads.assert_called_once()
+        assert np.shares_memory(r1, r2)
+        assert np.shares_memory(r2, r3)
+
+    def test_numpy_arrays_are_read_only(self):
+        @st.cache_data(copy="on_write")
+        def f():
+            return np.arange(10)
+
+        f()
+        r1 = f()
+        with pytest.raises(ValueError):
+            r1[0] = 100
+
+        np.testing.assert_array_equal(f(), np.arange(10))
+
+    def test_pandas_objects_are_copied_on_write(self):
+        @st.cache_data(copy="on_write")
+        def f():
+            return pd.DataFrame({"a": [1, 2, 3]})
+
+        with pd.option_context("mode.copy_on_write", True):
+            f()
+            r1 = f()
+            r1.loc[0, "a"] = 100
+            r1["b"] = 1
+
+            r2 = f()
+            pd.testing.assert_frame_equal(r2, pd.DataFrame({"a": [1, 2, 3]}))
+
+    def test_pandas_objects_are_copied_without_copy_on_write(self):
+        """Without pandas' Copy-on-Write, every hit gets its own copy."""
+
+        @st.cache_data(copy="on_write")
+        def f():
+            return pd.DataFrame({"a": [1, 2, 3]})
+
+        f()
+        r1 = f()
+        r1.loc[0, "a"] = 100
+
+        pd.testing.assert_frame_equal(f(), pd.DataFrame({"a": [1, 2, 3]}))
+
+    @parameterized.expand(
+        [
+            ("str", "hello"),
+            ("bytes", b"hello"),
+            ("int", 42),
+            ("pyarrow table", pa.table({"a": [1, 2, 3]})),
+        ]
+    )
+    def test_immutable_values_are_shared(self, _, value):
+        @st.cache_data(copy="on_write")
+        def f():
+            return value
+
+        f()
+        assert f() is f()
+
+    def test_other_values_are_copied(self):
+        """Values we can't share safely are copied, as with copy="always"."""
+
+        @st.cache_data(copy="on_write")
+        def f():
+            return [0, 1]
+
+        f()
+        r1 = f()
+        r1[0] = 1
+
+        assert f() == [0, 1]
+
+    def test_clear_drops_unpickled_values(self):
+        self.x = 0
+
+        @st.cache_data(copy="on_write")
+        def f():
+            self.x += 1
+            return np.array([self.x])
+
+        f()
+        np.testing.assert_array_equal(f(), [1])
+
+        f.clear()
+        f()
+        np.testing.assert_array_equal(f(), [2])
+
+    @patch("streamlit.runtime.caching.cache_utils.TTLCACHE_TIMER")
+    def test_expired_values_are_not_returned(self, timer_patch: Mock):
+        self.x = 0
+        timer_patch.return_value = 0
+
+        @st.cache_data(copy="on_write", ttl=60)
+        def f():
+            self.x += 1
+            return np.array([self.x])
+
+        f()
+        np.testing.assert_array_equal(f(), [1])
+
+        timer_patch.return_value = 61
+        np.testing.assert_array_equal(f(), [2])
+
+    def test_invalid_copy_option(self):
+        with pytest.raises(StreamlitAPIException):
+
+            @st.cache_data(copy="never")
+            def f():
+                return 42
+
+    @parameterized.expand([("always",), ("on_write",)])
+    @pytest.mark.usefixtures("benchmark")
+    def test_cache_hit_performance(self, copy: str):
+        """Performance test for a cache hit returning an 80 MB array."""
+
+        @st.cache_data(copy=copy)
+        def f():
+            return np.arange(10_000_000, dtype=np.float64)
+
+        f()
+        self.benchmark(f)
+
+    @parameterized.expand([("always",), ("on_write",)])
+    @pytest.mark.usefixtures("benchmark")
+    def test_cache_hit_peak_memory(self, copy: str):
+        """Performance test for the memory a cache hit returning an 80 MB
+        array allocates. (Reported as extra_info.peak_bytes.)"""
+        import tracemalloc
+
+        @st.cache_data(copy=copy)
+        def f():
+            return np.arange(10_000_000, dtype=np.float64)
+
+        f()
+
+        def hit():
+            tracemalloc.start()
+            try:
+                f()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        peak_bytes = self.benchmark.pedantic(hit, rounds=5)
+        self.benchmark.extra_info["peak_bytes"] = peak_bytes
+        if copy == "on_write":
+            assert peak_bytes < 1_000_000
+        else:
+            assert peak_bytes > 80_000_000
+
+
+class CacheDataOutOfBandBuffersTest(unittest.TestCase):
+    """Tests for storing large buffers out-of-band, with pickle protocol 5."""
+
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        self.tempdir = TempDirectory(create=True)
+        self.patch_get_cache_folder_path = patch(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage.get_cache_folder_path",
+            return_value=self.tempdir.path,
+        )
+        self.patch_get_cache_folder_path.start()
+        self.mock_runtime = MagicMock(spec=Runtime)
+        self.mock_runtime.cache_storage_manager = LocalDiskCacheStorageManager()
+        Runtime._instance = self.mock_runtime
+
+    def tearDown(self):
+        st.cache_data.clear()
+        self.patch_get_cache_folder_path.stop()
+        self.tempdir.cleanup()
+
+    def test_stores_buffers_out_of_band(self):
+        @st.cache_data
+        def f():
+            return np.arange(100, dtype=np.float64)
+
+        with patch.object(
+            InMemoryCacheStorageWrapper,
+            "set_with_buffers",
+            autospec=True,
+            side_effect=InMemoryCacheStorageWrapper.set_with_buffers,
+        ) as set_with_buffers:
+            f()
+
+        set_with_buffers.assert_called_once()
+        _, _, pickled_entry, buffers = set_with_buffers.call_args[0]
+        assert len(pickled_entry) < 800
+        assert [buffer.nbytes for buffer in buffers] == [800]
+
+    @parameterized.expand([(None,), ("disk",)])
+    def test_values_are_copied(self, persist: str | None):
+        """With copy="always", values don't share the cached buffers."""
+
+        @st.cache_data(persist=persist)
+        def f():
+            return np.arange(10)
+
+        f()
+        r1 = f()
+        r1[0] = 100
+
+        np.testing.assert_array_equal(f(), np.arange(10))
+
+    def test_reads_buffers_from_disk(self):
+        self.x = 0
+
+        @st.cache_data(persist="disk", copy="on_write")
+        def f():
+            self.x += 1
+            return pd.DataFrame(np.full((10, 100), self.x))
+
+        f()
+        # Forget everything but the cache file.
+        (cache,) = _data_caches._function_caches.values()
+        cache._unpickled_entries.clear()
+        cache.storage._mem_cache.clear()
+
+        with patch.object(
+            LocalDiskCacheStorage,
+            "get_with_buffers",
+            autospec=True,
+            side_effect=LocalDiskCacheStorage.get_with_buffers,
+        ) as get_with_buffers:
+            pd.testing.assert_frame_equal(f(), pd.DataFrame(np.full((10, 100), 1)))
+
+        get_with_buffers.assert_called_once()
+        assert self.x == 1
+
+    def test_falls_back_to_in_band_buffers(self):
+        """Storages that don't support out-of-band buffers get the whole
+        pickled entry.
+        """
+        self.mock_runtime.cache_storage_manager = DictCacheStorageManager()
+
+        @st.cache_data
+        def f():
+            return np.arange(100, dtype=np.float64)
+
+        f()
+        r1 = f()
+        np.testing.assert_array_equal(r1, np.arange(100, dtype=np.float64))
+
+        (pickled_entry,) = DictCacheStorage.values.values()
+        assert len(pickled_entry) > 800
+
+    @parameterized.expand([(None, False), ("disk", True)])
+    def test_uses_registered_serializers(self, persist: str | None, compress: bool):
+        serializer = MagicMock()
+        serializer.serialize.return_value = memoryview(b"serialized")
+        serializer.deserialize.return_value = "deserialized"
+
+        @st.cache_data(persist=persist)
+        def f():
+            return UserType()
+
+        with patch.dict(
+            cache_serializers._serializers,
+            {type_util.get_fqn_type(UserType()): serializer},
+        ):
+            f()
+            assert f() == "deserialized"
+
+        serializer.serialize.assert_called_once()
+        assert serializer.serialize.call_args[0][1] == compress
+        assert bytes(serializer.deserialize.call_args[0][0]) == b"serialized"
+
+    @parameterized.expand(
+        [
+            (f"{value_name}_{storage_name}", value, persist, storage_manager)
+            for value_name, value in [
+                ("array", lambda: np.arange(100_000_000, dtype=np.float32)),
+                ("wide_frame", lambda: pd.DataFrame(np.zeros((10_000, 1_000)))),
+            ]
+            for storage_name, persist, storage_manager in [
+                ("in_band", None, lambda: DictCacheStorageManager()),
+                ("memory", None, lambda: LocalDiskCacheStorageManager()),
+                ("disk", "disk", lambda: LocalDiskCacheStorageManager()),
+            ]
+        ]
+    )
+    @pytest.mark.usefixtures("benchmark")
+    def test_write_and_read_performance(self, _, value, persist, storage_manager):
+        """Performance test for caching, and then reading back, a 400 MB
+        array, or an 80 MB frame with 1000 columns.
+        """
+        self.mock_runtime.cache_storage_manager = storage_manager()
+        cached_value = value()
+
+        @st.cache_data(persist=persist)
+        def f():
+            return cached_value
+
+        def write_and_read():
+            f.clear()
+            f()
+            f()
+
+        self.benchmark.pedantic(write_and_read, rounds=3)
+
+
+class CacheDataMaxSizeTest(unittest.TestCase):
+    """Tests for limiting the memory that st.cache_data uses."""
+
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        self.tempdir = TempDirectory(create=True)
+        self.patch_get_cache_folder_path = patch(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage.get_cache_folder_path",
+            return_value=self.tempdir.path,
+        )
+        self.patch_get_cache_folder_path.start()
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = LocalDiskCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+    def tearDown(self):
+        st.cache_data.clear()
+        self.patch_get_cache_folder_path.stop()
+        self.tempdir.cleanup()
+
+    def test_evicts_least_recently_used_entries(self):
+        calls: list[int] = []
+
+        @st.cache_data(max_size="25KB")
+        def f(x):
+            calls.append(x)
+            return np.zeros(10_000, dtype=np.uint8)
+
+        f(1)
+        f(2)
+        f(1)
+        # Evicts the entry for 2, which was used least recently.
+        f(3)
+        f(1)
+        f(2)
+
+        assert calls == [1, 2, 3, 2]
+
+    def test_does_not_keep_entries_larger_than_max_size(self):
+        calls: list[int] = []
+
+        @st.cache_data(max_size="10KB")
+        def f(x):
+            calls.append(x)
+            return np.zeros(x, dtype=np.uint8)
+
+        f(10)
+        f(20_000)
+        f(20_000)
+        f(10)
+
+        assert calls == [10, 20_000, 20_000]
+
+    def test_evicted_entries_remain_on_disk(self):
+        calls: list[int] = []
+
+        @st.cache_data(max_size="15KB", persist="disk")
+        def f(x):
+            calls.append(x)
+            return np.zeros(10_000, dtype=np.uint8)
+
+        f(1)
+        f(2)
+        f(1)
+
+        assert calls == [1, 2]
+
+    @patch_config_options({"global.maxCacheDataBytes": 15_000})
+    def test_copy_on_write_forgets_evicted_entries(self):
+        # Only the storage knows about the global limit.
+        @st.cache_data(copy="on_write")
+        def f(x):
+            return np.zeros(10_000, dtype=np.uint8)
+
+        f(1)
+        f(1)
+        f(2)
+        f(2)
+
+        cache = _data_caches._function_caches[next(iter(_data_caches._function_caches))]
+        assert len(cache._unpickled_entries) == 1
+
+    @patch_config_options({"global.maxCacheDataBytes": 25_000})
+    def test_global_limit_applies_across_functions(self):
+        calls: list[str] = []
+
+        @st.cache_data
+        def f():
+            calls.append("f")
+            return np.zeros(10_000, dtype=np.uint8)
+
+        @st.cache_data
+        def g(x):
+            calls.append(f"g{x}")
+            return np.zeros(10_000, dtype=np.uint8)
+
+        f()
+        g(1)
+        # Evicts the entry of f, which was used least recently.
+        g(2)
+        g(1)
+        f()
+
+        assert calls == ["f", "g1", "g2", "f"]
+
+    def test_eviction_stats(self):
+        @st.cache_data(max_entries=1)
+        def f(x):
+            return x
+
+        f(1)
+        f(2)
+        f(3)
+
+        assert get_data_cache_stats_provider().get_counter_stats() == [
+            CounterStat(
+                family_name="cache_evictions",
+                category_name="st_cache_data",
+                cache_name=f"{f.__module__}.{f.__qualname__}",
+                value=2,
+            )
+        ]
+
+    def test_invalid_max_size(self):
+        with pytest.raises(StreamlitAPIException):
+
+            @st.cache_data(max_size="a lot")
+            def f():
+                return 1
+
+
+class CacheDataBackgroundRefreshTest(unittest.TestCase):
+    """Tests for refreshing expired values in the background, with
+    refresh="background".
+    """
+
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        self.tempdir = TempDirectory(create=True)
+        self.patch_get_cache_folder_path = patch(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage.get_cache_folder_path",
+            return_value=self.tempdir.path,
+        )
+        self.patch_get_cache_folder_path.start()
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = LocalDiskCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+        self.now = 1000.0
+        self.patch_clock = patch(
+            "streamlit.runtime.caching.cache_utils.COMPUTED_AT_CLOCK",
+            lambda: self.now,
+        )
+        self.patch_clock.start()
+
+        # A single worker runs refreshes in order, so that we can wait for
+        # them to finish.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.patch_executor = patch(
+            "streamlit.runtime.caching.cache_utils.get_refresh_executor",
+            return_value=self.executor,
+        )
+        self.patch_executor.start()
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+        self.patch_executor.stop()
+        self.patch_clock.stop()
+        st.cache_data.clear()
+        self.patch_get_cache_folder_path.stop()
+        self.tempdir.cleanup()
+
+    def _wait_for_refreshes(self) -> None:
+        self.executor.submit(lambda: None).result(timeout=10)
+
+    @parameterized.expand([(None,), ("disk",)])
+    def test_returns_stale_value_while_refreshing(self, persist: str | None):
+        calls: list[int] = []
+
+        @st.cache_data(ttl=60, refresh="background", persist=persist)
+        def f():
+            calls.append(1)
+            return len(calls)
+
+        assert f() == 1
+        self.now += 30
+        assert f() == 1
+        assert len(calls) == 1
+
+        # The value has expired: it's returned, and recomputed in the
+        # background.
+        self.now += 60
+        assert f() == 1
+        self._wait_for_refreshes()
+        assert len(calls) == 2
+        assert f() == 2
+
+    def test_refreshes_each_value_once_at_a_time(self):
+        calls: list[int] = []
+        refresh_started = threading.Event()
+        finish_refresh = threading.Event()
+
+        @st.cache_data(ttl=60, refresh="background")
+        def f():
+            calls.append(1)
+            if len(calls) > 1:
+                refresh_started.set()
+                finish_refresh.wait(timeout=10)
+            return len(calls)
+
+        f()
+        self.now += 120
+        assert f() == 1
+        assert refresh_started.wait(timeout=10)
+        assert f() == 1
+        assert f() == 1
+
+        finish_refresh.set()
+        self._wait_for_refreshes()
+        assert len(calls) == 2
+        assert f() == 2
+
+    def test_keeps_stale_value_if_refresh_fails(self):
+        calls: list[int] = []
+
+        @st.cache_data(ttl=60, refresh="background")
+        def f():
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("mock exception")
+            return len(calls)
+
+        f()
+        self.now += 120
+        with self.assertLogs(
+            "streamlit.runtime.caching.cache_utils", level=logging.WARNING
+        ):
+            assert f() == 1
+            self._wait_for_refreshes()
+
+        # The stale value is still returned, and refreshed again.
+        assert f() == 1
+        self._wait_for_refreshes()
+        assert f() == 3
+
+        failures = [
+            stat
+            for stat in get_data_cache_stats_provider().get_counter_stats()
+            if stat.family_name == "cache_refresh_failures"
+        ]
+        assert [stat.value for stat in failures] == [1]
+
+    def test_reports_staleness(self):
+        @st.cache_data(ttl=60, refresh="background")
+        def f():
+            return 1
+
+        f()
+        self.now += 100
+        f()
+        self._wait_for_refreshes()
+
+        stats = get_data_cache_stats_provider().get_histogram_stats()
+        assert len(stats) == 1
+        assert stats[0].family_name == "cache_staleness_seconds"
+        assert stats[0].sample_count == 1
+        assert stats[0].sum == 40
+        # 40 seconds is in the bucket for up to 60 seconds.
+        assert dict(stats[0].buckets)[10.0] == 0
+        assert dict(stats[0].buckets)[60.0] == 1
+
+    def test_refreshes_results_of_unknown_age(self):
+        """Results cached without a computed_at time are refreshed."""
+        cache = DataCache(
+            key="key",
+            storage=MagicMock(),
+            persist=None,
+            max_entries=None,
+            ttl_seconds=60,
+            display_name="f",
+            refresh="background",
+        )
+
+        assert cache.is_stale(CachedResult(1, [], "main", "sidebar"))
+        assert not cache.is_stale(
+            CachedResult(1, [], "main", "sidebar", computed_at=self.now)
+        )
+
+    def test_requires_ttl(self):
+        with pytest.raises(StreamlitAPIException):
+
+            @st.cache_data(refresh="background")
+            def f():
+                return 1
+
+    def test_bad_refresh_value(self):
+        with pytest.raises(StreamlitAPIException):
+
+            @st.cache_data(ttl=60, refresh="foreground")
+            def f():
+                return 1
+
+
 class CacheDataPersistTest(DeltaGeneratorTestCase):
     """st.cache_data disk persistence tests"""
 
@@ -291,7 +944,9 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         st.cache_data.clear()
         super().tearDown()
 
-    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._write_cache_file"
+    )
     def test_dont_persist_by_default(self, mock_write):
         @st.cache_data
         def foo():
@@ -300,7 +955,9 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         foo()
         mock_write.assert_not_called()
 
-    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._write_cache_file"
+    )
     def test_persist_path(self, mock_write):
         """Ensure we're writing to ~/.streamlit/cache/*.memo"""
 
@@ -476,7 +1133,7 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
 
     @patch("streamlit.file_util.os.stat", MagicMock())
     @patch(
-        "streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write",
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._write_cache_file",
         MagicMock(),
     )
     @patch(
@@ -499,7 +1156,7 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
 
     @patch("streamlit.file_util.os.stat", MagicMock())
     @patch(
-        "streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write",
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._write_cache_file",
         MagicMock(),
     )
     @patch(
@@ -515,13 +1172,17 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         # Executes normally, without raising any errors
         foo(1)
 
-    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
-    def test_warning_memo_ttl_persist(self, _):
-        """Using @st.cache_data with ttl and persist produces a warning."""
-        with self.assertLogs(
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._write_cache_file"
+    )
+    def test_no_warning_memo_ttl_persist(self, _):
+        """Using @st.cache_data with ttl and persist doesn't produce a warning,
+        since the TTL applies to the files on disk.
+        """
+        with self.assertNoLogs(
             "streamlit.runtime.caching.storage.local_disk_cache_storage",
             level=logging.WARNING,
-        ) as logs:
+        ):
 
             @st.cache_data(ttl=60, persist="disk")
             def user_function():
@@ -529,12 +1190,6 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
 
             st.write(user_function())
 
-            output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'user_function' has a TTL that will be ignored.",
-                output,
-            )
-
     @parameterized.expand(
         [
             ("disk", "disk", True),
@@ -543,7 +1198,9 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             ("False", False, False),
         ]
     )
-    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._write_cache_file"
+    )
     def test_persist_param_value(
         self,
         _,
@@ -565,6 +1222,109 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             mock_write.assert_not_called()
 
 
+class CacheDataDiskLimitsTest(unittest.TestCase):
+    """Tests for the limits of st.cache_data's disk cache, with a real cache
+    folder.
+    """
+
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        self.tempdir = TempDirectory(create=True)
+        self.patch_get_cache_folder_path = patch(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage.get_cache_folder_path",
+            return_value=self.tempdir.path,
+        )
+        self.patch_get_cache_folder_path.start()
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = LocalDiskCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+    def tearDown(self):
+        st.cache_data.clear()
+        self.patch_get_cache_folder_path.stop()
+        self.tempdir.cleanup()
+
+    def _cache_files(self) -> list[str]:
+        return [f for f in os.listdir(self.tempdir.path) if f.endswith(".memo")]
+
+    def test_clear_one_function(self):
+        """A function's clear() removes only that function's files."""
+
+        @st.cache_data(persist="disk")
+        def foo(val):
+            return val
+
+        @st.cache_data(persist="disk")
+        def bar(val):
+            return val
+
+        foo(0)
+        foo(1)
+        bar(0)
+        assert len(self._cache_files()) == 3
+
+        foo.clear()
+
+        files = self._cache_files()
+        assert len(files) == 1
+        assert bar(0) == 0
+
+    def test_max_entries_applies_to_disk(self):
+        @st.cache_data(persist="disk", max_entries=2)
+        def foo(val):
+            return val
+
+        for i in range(5):
+            foo(i)
+
+        assert len(self._cache_files()) == 2
+
+    def test_ttl_applies_to_disk(self):
+        @st.cache_data(persist="disk", ttl=60)
+        def foo(val):
+            return val
+
+        with patch("time.time", return_value=1000):
+            foo(0)
+        assert len(self._cache_files()) == 1
+
+        # Another cached function's write removes the expired file.
+        @st.cache_data(persist="disk")
+        def bar(val):
+            return val
+
+        with patch("time.time", return_value=1060):
+            bar(0)
+        assert len(self._cache_files()) == 1
+
+    @patch_config_options({"global.maxDiskCacheBytes": 30_000.0})
+    def test_max_disk_cache_bytes(self):
+        """The least recently used files of all functions are evicted when the
+        cache folder is over the quota.
+        """
+
+        @st.cache_data(persist="disk")
+        def foo(val):
+            return np.full(1_000, val, dtype=np.float64)
+
+        @st.cache_data(persist="disk")
+        def bar(val):
+            return np.full(1_000, val, dtype=np.float64)
+
+        foo(0)
+        bar(0)
+        foo(1)
+        bar(1)
+
+        sizes = [
+            os.path.getsize(os.path.join(self.tempdir.path, f))
+            for f in self._cache_files()
+        ]
+        assert len(sizes) == 3
+        assert sum(sizes) <= 30_000
+
+
 class CacheDataStatsProviderTest(unittest.TestCase):
     def setUp(self):
         # Caching functions rely on an active script run ctx
@@ -727,6 +1487,44 @@ def get_byte_length(value):
     return len(pickle.dumps(value))
 
 
+class UserType:
+    pass
+
+
+class DictCacheStorage(CacheStorage):
+    """A CacheStorage that keeps entries in a dict, and doesn't support
+    out-of-band buffers.
+    """
+
+    values: dict[str, bytes] = {}
+
+    def get(self, key: str) -> bytes:
+        try:
+            return self.values[key]
+        except KeyError:
+            raise CacheStorageKeyNotFoundError() from None
+
+    def set(self, key: str, value: bytes) -> None:
+        self.values[key] = value
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    def clear(self) -> None:
+        self.values.clear()
+
+
+class DictCacheStorageManager(CacheStorageManager):
+    def create(self, context: CacheStorageContext) -> CacheStorage:
+        return DictCacheStorage()
+
+    def clear_all(self) -> None:
+        DictCacheStorage.values.clear()
+
+    def check_context(self, context: CacheStorageContext) -> None:
+        pass
+
+
 class AlwaysFailingTestCacheStorageManager(CacheStorageManager):
     """A CacheStorageManager that always fails in check_context."""
 
@@ -0,0 +1,257 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""cache_memory unit tests."""
+
+from __future__ import annotations
+
+import math
+import threading
+import unittest
+from unittest.mock import Mock
+
+import pytest
+from parameterized import parameterized
+
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.caching.cache_memory import (
+    CacheMemoryBudget,
+    SizedTTLCache,
+    max_size_to_bytes,
+)
+
+
+class MaxSizeToBytesTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (None, None),
+            (0, 0),
+            (1234, 1234),
+            ("1234", 1234),
+            ("100B", 100),
+            ("1KB", 1000),
+            ("1kb", 1000),
+            ("1KiB", 1024),
+            ("500MB", 500_000_000),
+            ("2 GB", 2_000_000_000),
+            ("1.5GiB", int(1.5 * 1024**3)),
+            ("1TB", 10**12),
+            (" 3M ", 3_000_000),
+        ]
+    )
+    def test_valid_values(self, max_size, expected):
+        assert max_size_to_bytes(max_size) == expected
+
+    @parameterized.expand([(-1,), ("",), ("-1MB",), ("1PB",), ("MB",), (1.5,), (True,)])
+    def test_invalid_values(self, max_size):
+        with pytest.raises(StreamlitAPIException):
+            max_size_to_bytes(max_size)
+
+
+class _Timer:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def _sized_cache(
+    maxsize: float = math.inf,
+    ttl: float = math.inf,
+    max_bytes: float = math.inf,
+    **kwargs,
+) -> SizedTTLCache[str, bytes]:
+    return SizedTTLCache(
+        maxsize=maxsize, ttl=ttl, max_bytes=max_bytes, getsizeof=len, **kwargs
+    )
+
+
+class SizedTTLCacheTest(unittest.TestCase):
+    def test_get_and_set(self):
+        cache = _sized_cache()
+        cache["a"] = b"12"
+        cache["b"] = b"345"
+
+        assert cache["a"] == b"12"
+        assert cache.get("b") == b"345"
+        assert cache.get("c") is None
+        assert "a" in cache
+        assert "c" not in cache
+        assert len(cache) == 2
+        assert cache.currsize_bytes == 5
+
+    def test_replace_entry(self):
+        cache = _sized_cache()
+        cache["a"] = b"12"
+        cache["a"] = b"345"
+
+        assert cache["a"] == b"345"
+        assert cache.currsize_bytes == 3
+        assert cache.evictions == 0
+
+    def test_remove_entries(self):
+        cache = _sized_cache()
+        cache["a"] = b"12"
+        cache["b"] = b"345"
+
+        del cache["a"]
+        assert cache.pop("b") == b"345"
+        assert cache.pop("b") is None
+        assert len(cache) == 0
+        assert cache.currsize_bytes == 0
+
+    def test_evicts_least_recently_used_entry_over_maxsize(self):
+        on_evict = Mock()
+        cache = _sized_cache(maxsize=2, on_evict=on_evict)
+        cache["a"] = b"1"
+        cache["b"] = b"2"
+        # Using "a" makes "b" the least recently used entry.
+        assert cache["a"] == b"1"
+        cache["c"] = b"3"
+
+        assert "b" not in cache
+        assert "a" in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+        on_evict.assert_called_once_with("b", b"2")
+
+    def test_evicts_least_recently_used_entries_over_max_bytes(self):
+        cache = _sized_cache(max_bytes=10)
+        cache["a"] = b"1234"
+        cache["b"] = b"1234"
+        cache["c"] = b"1234567"
+
+        assert "a" not in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.currsize_bytes == 7
+        assert cache.evictions == 2
+
+    def test_does_not_store_values_larger_than_max_bytes(self):
+        on_evict = Mock()
+        cache = _sized_cache(max_bytes=10, on_evict=on_evict)
+        cache["a"] = b"1234"
+        cache["b"] = b"12345678901"
+
+        # The existing entry is kept.
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.currsize_bytes == 4
+        assert cache.evictions == 1
+        on_evict.assert_called_once_with("b", b"12345678901")
+
+    def test_entries_expire(self):
+        timer = _Timer()
+        cache = _sized_cache(ttl=10, timer=timer)
+        cache["a"] = b"1"
+        timer.time = 5
+        cache["b"] = b"2"
+
+        timer.time = 10
+        assert "a" not in cache
+        assert cache.get("a") is None
+        assert cache.values() == [b"2"]
+
+        timer.time = 15
+        cache.expire()
+        assert len(cache) == 0
+        assert cache.currsize_bytes == 0
+        # Expired entries aren't evictions.
+        assert cache.evictions == 0
+
+    def test_oldest_use(self):
+        cache = _sized_cache()
+        assert cache.oldest_use is None
+
+        cache["a"] = b"1"
+        cache["b"] = b"2"
+        a_stamp = cache.oldest_use
+        cache["a"]
+
+        assert cache.oldest_use is not None
+        assert a_stamp is not None
+        assert cache.oldest_use > a_stamp
+
+    def test_clear(self):
+        cache = _sized_cache()
+        cache["a"] = b"1"
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.currsize_bytes == 0
+        assert cache.oldest_use is None
+
+
+class _BudgetedCache:
+    """A BudgetedCache backed by a SizedTTLCache, for testing."""
+
+    def __init__(self):
+        self.cache = _sized_cache()
+        self._lock = threading.Lock()
+
+    @property
+    def currsize_bytes(self) -> int:
+        return self.cache.currsize_bytes
+
+    @property
+    def oldest_use(self) -> int | None:
+        return self.cache.oldest_use
+
+    def evict_oldest(self) -> None:
+        with self._lock:
+            if len(self.cache) > 0:
+                self.cache.evict_oldest()
+
+
+class CacheMemoryBudgetTest(unittest.TestCase):
+    def test_evicts_least_recently_used_entries_across_caches(self):
+        budget = CacheMemoryBudget(lambda: 10)
+        cache1 = _BudgetedCache()
+        cache2 = _BudgetedCache()
+        budget.register(cache1)
+        budget.register(cache2)
+
+        cache1.cache["a"] = b"1234"
+        cache2.cache["b"] = b"1234"
+        cache1.cache["c"] = b"1234"
+        assert budget.currsize_bytes == 12
+
+        budget.enforce()
+
+        assert "a" not in cache1.cache
+        assert "b" in cache2.cache
+        assert "c" in cache1.cache
+        assert budget.currsize_bytes == 8
+
+    def test_no_limit(self):
+        budget = CacheMemoryBudget(lambda: 0)
+        cache = _BudgetedCache()
+        budget.register(cache)
+        cache.cache["a"] = b"1234"
+
+        budget.enforce()
+
+        assert "a" in cache.cache
+
+    def test_caches_are_held_weakly(self):
+        budget = CacheMemoryBudget(lambda: 10)
+        cache = _BudgetedCache()
+        budget.register(cache)
+        cache.cache["a"] = b"1234"
+        assert budget.currsize_bytes == 4
+
+        del cache
+
+        assert budget.currsize_bytes == 0
@@ -31,7 +31,7 @@ from streamlit.runtime.caching import (
 )
 from streamlit.runtime.caching.hashing import UserHashError
 from streamlit.runtime.scriptrunner import add_script_run_ctx
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, CounterStat
 from streamlit.vendor.pympler.asizeof import asizeof
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.element_mocks import (
@@ -354,6 +354,56 @@ class CacheResourceStatsProviderTest(unittest.TestCase):
         )
 
 
+class CacheResourceMaxSizeTest(unittest.TestCase):
+    def setUp(self):
+        # Guard against external tests not properly cache-clearing
+        # in their teardowns.
+        st.cache_resource.clear()
+
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+
+    def tearDown(self):
+        st.cache_resource.clear()
+
+    def test_evicts_least_recently_used_entries(self):
+        calls: list[int] = []
+        resource_size = asizeof(as_cached_result(bytes(1000)))
+
+        @st.cache_resource(max_size=int(resource_size * 2.5))
+        def f(x):
+            calls.append(x)
+            return bytes(1000)
+
+        f(1)
+        f(2)
+        f(1)
+        # Evicts the entry for 2, which was used least recently.
+        f(3)
+        f(1)
+        f(2)
+
+        assert calls == [1, 2, 3, 2]
+
+    def test_eviction_stats(self):
+        @st.cache_resource(max_entries=1)
+        def f(x):
+            return x
+
+        f(1)
+        f(2)
+        f(3)
+
+        assert get_resource_cache_stats_provider().get_counter_stats() == [
+            CounterStat(
+                family_name="cache_evictions",
+                category_name="st_cache_resource",
+                cache_name=f"{f.__module__}.{f.__qualname__}",
+                value=2,
+            )
+        ]
+
+
 class CacheResourceMessageReplayTest(DeltaGeneratorTestCase):
     def setUp(self):
         super().setUp()
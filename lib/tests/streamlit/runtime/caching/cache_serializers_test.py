@@ -0,0 +1,184 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""cache_serializers unit tests."""
+
+from __future__ import annotations
+
+import datetime
+import pickle
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from parameterized import parameterized
+
+from streamlit import type_util
+from streamlit.runtime.caching import cache_serializers
+from streamlit.runtime.caching.cache_serializers import (
+    prepare_value_for_pickle,
+    register_serializer,
+)
+
+
+def _pickle_round_trip(value: Any, compress: bool = False) -> Any:
+    """Pickle a value prepared for pickling, with out-of-band buffers, and
+    unpickle it again, the way DataCache does.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    pickled = pickle.dumps(
+        prepare_value_for_pickle(value, compress),
+        protocol=5,
+        buffer_callback=buffers.append,
+    )
+    return pickle.loads(pickled, buffers=[memoryview(b).toreadonly() for b in buffers])
+
+
+class _Point:
+    def __init__(self, x: int):
+        self.x = x
+
+
+class _PointSerializer:
+    def serialize(self, value: Any, compress: bool) -> memoryview | None:
+        return memoryview(str(value.x).encode())
+
+    def deserialize(self, data: memoryview | bytes | bytearray) -> Any:
+        return _Point(int(bytes(data)))
+
+
+class _FailingSerializer:
+    def serialize(self, value: Any, compress: bool) -> memoryview | None:
+        raise RuntimeError("Can't serialize")
+
+    def deserialize(self, data: memoryview | bytes | bytearray) -> Any:
+        raise RuntimeError("Can't deserialize")
+
+
+class CacheSerializersTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.dict(cache_serializers._serializers)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_values_without_serializer_are_unchanged(self):
+        value = pd.DataFrame({"a": [1, 2]})
+        assert prepare_value_for_pickle(value, compress=False) is value
+
+    def test_registered_serializer(self):
+        register_serializer(type_util.get_fqn_type(_Point(0)), _PointSerializer())
+
+        buffers: list[pickle.PickleBuffer] = []
+        pickled = pickle.dumps(
+            prepare_value_for_pickle(_Point(42), compress=False),
+            protocol=5,
+            buffer_callback=buffers.append,
+        )
+
+        assert [bytes(buffer) for buffer in buffers] == [b"42"]
+        assert pickle.loads(pickled, buffers=buffers).x == 42
+
+    def test_in_band_pickle(self):
+        register_serializer(type_util.get_fqn_type(_Point(0)), _PointSerializer())
+
+        for protocol in (4, 5):
+            pickled = pickle.dumps(
+                prepare_value_for_pickle(_Point(42), compress=False),
+                protocol=protocol,
+            )
+            assert pickle.loads(pickled).x == 42
+
+    def test_failing_serializer_falls_back_to_pickle(self):
+        register_serializer(type_util.get_fqn_type(_Point(0)), _FailingSerializer())
+
+        value = _Point(42)
+        assert prepare_value_for_pickle(value, compress=False) is value
+
+    def test_unregistered_serializer(self):
+        register_serializer(type_util.get_fqn_type(_Point(0)), _PointSerializer())
+        pickled = pickle.dumps(
+            prepare_value_for_pickle(_Point(42), compress=False), protocol=5
+        )
+        cache_serializers._serializers.clear()
+
+        with pytest.raises(pickle.UnpicklingError):
+            pickle.loads(pickled)
+
+
+@pytest.mark.require_integration
+class PolarsSerializersTest(unittest.TestCase):
+    @parameterized.expand([(False,), (True,)])
+    def test_polars_dataframe(self, compress: bool):
+        import polars as pl
+        from polars.testing import assert_frame_equal
+
+        df = pl.DataFrame(
+            {
+                "int": [1, None, 3],
+                "str": ["a", "b", None],
+                "cat": pl.Series(["x", "y", "x"], dtype=pl.Categorical),
+                "date": [datetime.date(2020, 1, 1), None, datetime.date(2020, 1, 3)],
+                "list": [[1], [2, 3], []],
+                "struct": [{"a": 1}, {"a": 2}, {"a": 3}],
+            }
+        )
+        assert_frame_equal(_pickle_round_trip(df, compress), df)
+
+    def test_polars_series(self):
+        import polars as pl
+        from polars.testing import assert_series_equal
+
+        series = pl.Series("name", [1.5, 2.5, None])
+        assert_series_equal(_pickle_round_trip(series), series)
+
+    def test_polars_object_columns_are_pickled(self):
+        import polars as pl
+
+        df = pl.DataFrame({"obj": pl.Series([_Point(1)], dtype=pl.Object)})
+        assert prepare_value_for_pickle(df, compress=False) is df
+
+    def test_compression(self):
+        import polars as pl
+
+        df = pl.DataFrame({"str": ["some repeated string"] * 100_000})
+
+        uncompressed = prepare_value_for_pickle(df, compress=False).data
+        compressed = prepare_value_for_pickle(df, compress=True).data
+
+        assert compressed.nbytes < uncompressed.nbytes / 10
+
+    @parameterized.expand([("pickle",), ("arrow",)])
+    @pytest.mark.usefixtures("benchmark")
+    def test_polars_dataframe_performance(self, serialization: str):
+        """Performance test for storing, and then reading back, a Polars
+        DataFrame with 10M rows.
+        """
+        import polars as pl
+
+        df = pl.DataFrame(
+            {
+                "float": np.random.rand(10_000_000),
+                "str": [f"str{i}" for i in range(10_000_000)],
+            }
+        )
+
+        def round_trip():
+            if serialization == "pickle":
+                return pickle.loads(pickle.dumps(df, protocol=5))
+            return _pickle_round_trip(df)
+
+        self.benchmark.pedantic(round_trip, rounds=3)
@@ -0,0 +1,287 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""cache_warmup unit tests."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.caching.cache_warmup import CacheWarmup, WarmupProgress
+from streamlit.testing.v1 import AppTest
+
+
+def _wait_until_finished(warmup: CacheWarmup) -> WarmupProgress:
+    deadline = time.monotonic() + 5
+    while not warmup.get_progress().finished:
+        assert time.monotonic() < deadline, "The warm-up didn't finish."
+        time.sleep(0.01)
+    return warmup.get_progress()
+
+
+class CacheWarmupTest(unittest.TestCase):
+    def setUp(self):
+        self.warmup = CacheWarmup(max_workers=2)
+        self.addCleanup(self.warmup.stop)
+
+    def test_finished_without_script(self):
+        assert self.warmup.get_progress() == WarmupProgress(
+            done=0, total=0, failed=0, finished=True
+        )
+
+    def test_bounded_parallelism(self):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def call():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        futures = [self.warmup.submit(call, name="call") for _ in range(6)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert max_running == 2
+
+    def test_script_progress(self):
+        release = threading.Event()
+
+        def script(path, run_name):
+            assert path == "warmup.py"
+            assert run_name == "__main__"
+            for _ in range(3):
+                self.warmup.submit(lambda: release.wait(5), name="call")
+
+        with patch("runpy.run_path", side_effect=script):
+            self.warmup.run_script("warmup.py")
+
+            deadline = time.monotonic() + 5
+            while self.warmup.get_progress().total < 3:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            assert self.warmup.get_progress() == WarmupProgress(
+                done=0, total=3, failed=0, finished=False
+            )
+            release.set()
+
+            assert _wait_until_finished(self.warmup) == WarmupProgress(
+                done=3, total=3, failed=0, finished=True
+            )
+
+    def test_nested_calls_are_counted(self):
+        def inner():
+            time.sleep(0.02)
+
+        def outer():
+            self.warmup.submit(inner, name="inner")
+
+        with patch(
+            "runpy.run_path",
+            side_effect=lambda *_, **__: self.warmup.submit(outer, name="outer"),
+        ):
+            self.warmup.run_script("warmup.py")
+            assert _wait_until_finished(self.warmup) == WarmupProgress(
+                done=2, total=2, failed=0, finished=True
+            )
+
+    def test_failed_calls(self):
+        def fail():
+            raise RuntimeError("mock exception")
+
+        with (
+            patch(
+                "runpy.run_path",
+                side_effect=lambda *_, **__: self.warmup.submit(fail, name="fail"),
+            ),
+            self.assertLogs(
+                "streamlit.runtime.caching.cache_warmup", level="WARNING"
+            ) as logs,
+        ):
+            self.warmup.run_script("warmup.py")
+            assert _wait_until_finished(self.warmup) == WarmupProgress(
+                done=1, total=1, failed=1, finished=True
+            )
+
+        assert "Cache warm-up call to fail failed." in logs.output[0]
+
+    def test_calls_after_startup_are_not_counted(self):
+        with patch("runpy.run_path"):
+            self.warmup.run_script("warmup.py")
+            _wait_until_finished(self.warmup)
+
+        self.warmup.submit(lambda: None, name="call").result(timeout=5)
+
+        assert self.warmup.get_progress() == WarmupProgress(
+            done=0, total=0, failed=0, finished=True
+        )
+
+    def test_script_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script_path = os.path.join(tmpdir, "warmup.py")
+            with open(script_path, "w") as f:
+                f.write(
+                    "import os\n"
+                    "if __name__ == '__main__':\n"
+                    "    open(os.path.join(os.path.dirname(__file__), 'ran'), 'w')\n"
+                )
+
+            self.warmup.run_script(script_path)
+            _wait_until_finished(self.warmup)
+
+            assert os.path.exists(os.path.join(tmpdir, "ran"))
+
+    def test_failed_script(self):
+        with self.assertLogs(
+            "streamlit.runtime.caching.cache_warmup", level="ERROR"
+        ) as logs:
+            self.warmup.run_script("/mock/missing/warmup.py")
+            _wait_until_finished(self.warmup)
+
+        assert (
+            "Cache warm-up script /mock/missing/warmup.py failed." in (logs.output[0])
+        )
+
+    def test_submit_after_stop(self):
+        self.warmup.stop()
+
+        assert self.warmup.submit(lambda: None, name="call").cancelled()
+
+
+def _write_file(dir_path: str, file_name: str, source: str) -> str:
+    path = os.path.join(dir_path, file_name)
+    with open(path, "w") as f:
+        f.write(textwrap.dedent(source))
+    return path
+
+
+class CacheWarmupScriptRunTest(unittest.TestCase):
+    """Tests that warm-up scripts warm up the caches that apps read."""
+
+    def setUp(self):
+        self.warmup = CacheWarmup(max_workers=2)
+        self.addCleanup(self.warmup.stop)
+        self.addCleanup(st.cache_data.clear)
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = tmpdir.name
+
+        sys_path_patch = patch.object(sys, "path", [self.tmpdir, *sys.path])
+        sys_path_patch.start()
+        self.addCleanup(sys_path_patch.stop)
+
+        get_cache_warmup_patch = patch(
+            "streamlit.runtime.caching.cache_utils.get_cache_warmup",
+            return_value=self.warmup,
+        )
+        get_cache_warmup_patch.start()
+        self.addCleanup(get_cache_warmup_patch.stop)
+
+    def _add_module(self, name: str, source: str) -> None:
+        _write_file(self.tmpdir, f"{name}.py", source)
+        self.addCleanup(sys.modules.pop, name, None)
+
+    def test_warmed_value_is_cache_hit_in_script_run(self):
+        self._add_module(
+            "cache_warmup_test_data",
+            """
+            import streamlit as st
+
+            calls = []
+
+            @st.cache_data
+            def load_data(year):
+                calls.append(year)
+                return year * 2
+            """,
+        )
+        warmup_path = _write_file(
+            self.tmpdir,
+            "warmup.py",
+            """
+            from cache_warmup_test_data import load_data
+
+            load_data.warmup(2024)
+            """,
+        )
+        app_path = _write_file(
+            self.tmpdir,
+            "app.py",
+            """
+            import streamlit as st
+            from cache_warmup_test_data import calls, load_data
+
+            st.text(f"{load_data(2024)} computed {len(calls)} time(s)")
+            """,
+        )
+
+        self.warmup.run_script(warmup_path, app_path)
+        assert _wait_until_finished(self.warmup) == WarmupProgress(
+            done=1, total=1, failed=0, finished=True
+        )
+
+        at = AppTest.from_file(app_path).run()
+        assert not at.exception
+        assert at.text[0].value == "4048 computed 1 time(s)"
+
+    def test_functions_of_main_script_are_rejected(self):
+        self._add_module(
+            "cache_warmup_test_app",
+            """
+            import streamlit as st
+
+            @st.cache_data
+            def load_data(year):
+                return year * 2
+            """,
+        )
+        self._add_module(
+            "cache_warmup_test_data",
+            """
+            import streamlit as st
+
+            @st.cache_data
+            def load_data(year):
+                return year * 2
+            """,
+        )
+        app = importlib.import_module("cache_warmup_test_app")
+        data = importlib.import_module("cache_warmup_test_data")
+
+        with patch("runpy.run_path"):
+            self.warmup.run_script("warmup.py", app.__file__)
+
+        with pytest.raises(StreamlitAPIException, match="main script"):
+            app.load_data.warmup(2024)
+
+        data.load_data.warmup(2024).result(timeout=5)
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
 import unittest
@@ -684,6 +685,212 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         self.assertEqual(empty_elements_count, 1)
 
 
+class CommonCacheAsyncTest(DeltaGeneratorTestCase):
+    """Tests for caching coroutine functions."""
+
+    def tearDown(self):
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        super().tearDown()
+
+    def get_text_delta_contents(self) -> list[str]:
+        deltas = self.get_all_deltas_from_queue()
+        return [
+            element.text.body
+            for element in (delta.new_element for delta in deltas)
+            if element.WhichOneof("type") == "text"
+        ]
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_caches_awaited_result(self, _, cache_decorator):
+        calls: list[int] = []
+
+        @cache_decorator
+        async def foo(i):
+            calls.append(i)
+            await asyncio.sleep(0)
+            return i * 2
+
+        assert asyncio.run(foo(1)) == 2
+        assert asyncio.run(foo(1)) == 2
+        assert asyncio.run(foo(2)) == 4
+        assert calls == [1, 2]
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_concurrent_calls_share_one_computation(self, _, cache_decorator):
+        calls: list[int] = []
+
+        @cache_decorator
+        async def foo():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def main():
+            return await asyncio.gather(*(foo() for _ in range(10)))
+
+        assert asyncio.run(main()) == [42] * 10
+        assert len(calls) == 1
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_waiting_calls_retry_failed_computation(self, _, cache_decorator):
+        calls: list[int] = []
+
+        @cache_decorator
+        async def foo():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            if len(calls) == 1:
+                raise RuntimeError("mock exception")
+            return 42
+
+        async def main():
+            return await asyncio.gather(foo(), foo(), return_exceptions=True)
+
+        first, second = asyncio.run(main())
+        assert isinstance(first, RuntimeError)
+        assert second == 42
+        assert len(calls) == 2
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_replay_with_concurrent_calls(self, _, cache_decorator):
+        """The messages of cached functions that run concurrently on one event
+        loop aren't mixed up.
+        """
+
+        @cache_decorator
+        async def foo(i):
+            st.text(f"start {i}")
+            await asyncio.sleep(0.01)
+            st.text(f"end {i}")
+            return i
+
+        async def main():
+            return await asyncio.gather(foo(1), foo(2))
+
+        assert asyncio.run(main()) == [1, 2]
+        assert sorted(self.get_text_delta_contents()) == [
+            "end 1",
+            "end 2",
+            "start 1",
+            "start 2",
+        ]
+        self.forward_msg_queue.clear()
+
+        assert asyncio.run(foo(1)) == 1
+        assert self.get_text_delta_contents() == ["start 1", "end 1"]
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_cached_async_member_function(self, _, cache_decorator):
+        class TestClass:
+            calls = 0
+
+            @cache_decorator
+            async def get_value(_self, x):
+                # We underscore-prefix `_self`, because our class is not hashable.
+                TestClass.calls += 1
+                return x
+
+        obj = TestClass()
+        assert asyncio.run(obj.get_value(1)) == 1
+        assert asyncio.run(obj.get_value(1)) == 1
+        assert TestClass.calls == 1
+
+        obj.get_value.clear()
+        assert asyncio.run(obj.get_value(1)) == 1
+        assert TestClass.calls == 2
+
+
+class CommonCacheWarmupTest(DeltaGeneratorTestCase):
+    """Tests for warming up cached functions in the background."""
+
+    def tearDown(self):
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        super().tearDown()
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_warmup_caches_value(self, _, cache_decorator):
+        calls: list[int] = []
+
+        @cache_decorator
+        def foo(i):
+            calls.append(i)
+            return i * 2
+
+        foo.warmup(1).result(timeout=5)
+        assert calls == [1]
+        assert foo(1) == 2
+        assert calls == [1]
+
+        # Values that are cached already aren't recomputed.
+        foo.warmup(1).result(timeout=5)
+        assert calls == [1]
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_warmup_async_function(self, _, cache_decorator):
+        calls: list[int] = []
+
+        @cache_decorator
+        async def foo(i):
+            calls.append(i)
+            await asyncio.sleep(0)
+            return i * 2
+
+        foo.warmup(1).result(timeout=5)
+        assert asyncio.run(foo(1)) == 2
+        assert calls == [1]
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_warmup_member_function(self, _, cache_decorator):
+        class TestClass:
+            calls = 0
+
+            @cache_decorator
+            def get_value(_self, x):
+                # We underscore-prefix `_self`, because our class is not hashable.
+                TestClass.calls += 1
+                return x
+
+        obj = TestClass()
+        obj.get_value.warmup(1).result(timeout=5)
+        assert obj.get_value(1) == 1
+        assert TestClass.calls == 1
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_warmup_exception(self, _, cache_decorator):
+        @cache_decorator
+        def foo():
+            raise RuntimeError("mock exception")
+
+        with self.assertLogs(
+            "streamlit.runtime.caching.cache_warmup", level="WARNING"
+        ) as logs:
+            future = foo.warmup()
+            with self.assertRaisesRegex(RuntimeError, "mock exception"):
+                future.result(timeout=5)
+
+        assert "Cache warm-up call to" in logs.output[0]
+
+
 class CommonCacheTTLTest(unittest.TestCase):
     def setUp(self) -> None:
         # Caching functions rely on an active script run ctx
@@ -945,6 +1152,42 @@ class CommonCacheThreadingTest(unittest.TestCase):
         self.assertEqual(42, foo())
 
 
+class CommonCacheAsyncThreadingTest(unittest.TestCase):
+    # The number of threads to run our tests on
+    NUM_THREADS = 10
+
+    def setUp(self):
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+    def tearDown(self):
+        st.cache_data.clear()
+        st.cache_resource.clear()
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_compute_value_only_once(self, _, cache_decorator):
+        """Async cached values should be computed only once, even if callers on
+        several threads, with their own event loops, read from an unwarmed
+        cache simultaneously.
+        """
+        cached_func_call_count = [0]
+
+        @cache_decorator
+        async def foo():
+            cached_func_call_count[0] += 1
+            await asyncio.sleep(0.25)
+            return 42
+
+        def call_foo(_: int) -> None:
+            self.assertEqual(42, asyncio.run(foo()))
+
+        call_on_threads(call_foo, num_threads=self.NUM_THREADS, timeout=2)
+        self.assertEqual(1, cached_func_call_count[0])
+
+
 def test_arrow_replay():
     """Regression test for https://github.com/streamlit/streamlit/issues/6103"""
     at = AppTest.from_file("test_data/arrow_replay.py").run()
@@ -21,6 +21,7 @@ import functools
 import hashlib
 import os
 import re
+import sys
 import tempfile
 import time
 import types
@@ -29,14 +30,17 @@ import uuid
 from dataclasses import dataclass
 from enum import Enum, auto
 from io import BytesIO, StringIO
-from unittest.mock import MagicMock, Mock
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from parameterized import parameterized
 from PIL import Image
 
+from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Common_pb2 import FileURLs
 from streamlit.runtime.caching import cache_data, cache_resource
 from streamlit.runtime.caching.cache_errors import UnhashableTypeError
@@ -45,10 +49,17 @@ from streamlit.runtime.caching.hashing import (
     _NP_SIZE_LARGE,
     _PANDAS_ROWS_LARGE,
     UserHashError,
+    _CacheFuncHasher,
+    new_hasher,
     update_hash,
 )
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    get_script_run_ctx,
+)
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+from streamlit.testing.v1.util import patch_config_options
 from streamlit.type_util import is_type
+from tests.delta_generator_test_case import DeltaGeneratorTestCase
 
 get_main_script_director = MagicMock(return_value=os.getcwd())
 
@@ -737,3 +748,428 @@ If you think this is actually a Streamlit bug, please
 
         with self.assertRaises(UnhashableTypeError):
             get_hash(A().__reduce__())
+
+
+class HashAlgorithmTest(unittest.TestCase):
+    """Tests for the global.cacheHashAlgorithm config option."""
+
+    def test_default_is_md5(self):
+        assert new_hasher().name == "md5"
+
+    @patch_config_options({"global.cacheHashAlgorithm": "blake2b"})
+    def test_blake2b(self):
+        hasher = new_hasher()
+        hasher.update(b"foo")
+
+        assert hasher.name == "blake2b"
+        # The digest is as long as an md5 digest.
+        assert len(hasher.hexdigest()) == 32
+
+    def test_algorithms_produce_different_hashes(self):
+        hashes = set()
+        for algorithm in ("md5", "blake2b"):
+            with patch_config_options({"global.cacheHashAlgorithm": algorithm}):
+                hasher = new_hasher()
+                update_hash([1, "foo", np.zeros(10)], hasher, CacheType.DATA)
+                hashes.add(hasher.digest())
+
+        assert len(hashes) == 2
+
+    @pytest.mark.require_integration
+    @patch_config_options({"global.cacheHashAlgorithm": "xxhash"})
+    def test_xxhash(self):
+        import xxhash
+
+        hasher = new_hasher()
+        hasher.update(b"foo")
+
+        assert hasher.hexdigest() == xxhash.xxh3_128_hexdigest(b"foo")
+
+    @patch_config_options({"global.cacheHashAlgorithm": "xxhash"})
+    def test_xxhash_not_installed(self):
+        with patch.dict(sys.modules, {"xxhash": None}):
+            with pytest.raises(StreamlitAPIException, match="pip install xxhash"):
+                new_hasher()
+
+    @patch_config_options({"global.cacheHashAlgorithm": "sha1"})
+    def test_invalid_algorithm(self):
+        with pytest.raises(StreamlitAPIException, match="cacheHashAlgorithm"):
+            new_hasher()
+
+
+def _large_mixed_dataframe() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "float": rng.random(_PANDAS_ROWS_LARGE),
+            "int": rng.integers(0, 1000, _PANDAS_ROWS_LARGE),
+            "str": [f"row-{i}" for i in range(_PANDAS_ROWS_LARGE)],
+            "category": pd.Categorical(rng.choice(["a", "b", "c"], _PANDAS_ROWS_LARGE)),
+            "date": pd.date_range(
+                "2020-01-01", periods=_PANDAS_ROWS_LARGE, freq="min", tz="UTC"
+            ),
+        }
+    )
+
+
+class ExactHashingTest(unittest.TestCase):
+    """Tests for hashing large dataframes and arrays with
+    global.exactCacheHashing.
+    """
+
+    def setUp(self):
+        super().setUp()
+        config_patch = patch_config_options({"global.exactCacheHashing": True})
+        config_patch.__enter__()
+        self.addCleanup(config_patch.__exit__, None, None, None)
+
+    def test_numpy_large_array(self):
+        arr1 = np.zeros(_NP_SIZE_LARGE * 3)
+        arr2 = arr1.copy()
+        arr2[-1] = 1
+
+        assert get_hash(arr1) == get_hash(arr1.copy())
+        assert get_hash(arr1) != get_hash(arr2)
+
+    def test_numpy_non_contiguous_array(self):
+        arr = np.arange(_NP_SIZE_LARGE * 2)[::2]
+
+        assert not arr.flags.c_contiguous
+        assert get_hash(arr) == get_hash(arr.copy())
+
+    def test_numpy_datetime_array(self):
+        arr1 = np.arange(_NP_SIZE_LARGE).astype("datetime64[s]")
+        arr2 = arr1.copy()
+        arr2[-1] = np.datetime64("1990-01-01")
+
+        assert get_hash(arr1) == get_hash(arr1.copy())
+        assert get_hash(arr1) != get_hash(arr2)
+
+    def test_pandas_large_dataframe(self):
+        df1 = _large_mixed_dataframe()
+
+        assert get_hash(df1) == get_hash(df1.copy())
+
+        for column, value in [
+            ("float", -1.0),
+            ("int", -1),
+            ("str", "other"),
+            ("category", "b"),
+            ("date", pd.Timestamp("1990-01-01", tz="UTC")),
+        ]:
+            df2 = df1.copy()
+            df2.loc[_PANDAS_ROWS_LARGE - 7, column] = value
+            assert get_hash(df1) != get_hash(df2), column
+
+    def test_pandas_large_dataframe_index_and_columns(self):
+        df1 = _large_mixed_dataframe()
+
+        assert get_hash(df1) != get_hash(df1.set_axis(df1.index + 1))
+        assert get_hash(df1) != get_hash(df1.set_axis(df1.index[::-1]))
+        assert get_hash(df1) != get_hash(df1.add_prefix("x"))
+
+    def test_pandas_large_series(self):
+        series1 = pd.Series(np.zeros(_PANDAS_ROWS_LARGE * 2))
+        series2 = series1.copy()
+        series2.iloc[-1] = 1
+
+        assert get_hash(series1) == get_hash(series1.copy())
+        assert get_hash(series1) != get_hash(series2)
+        assert get_hash(series1) != get_hash(series1.astype("str"))
+
+    @pytest.mark.require_integration
+    def test_polars_large_dataframe(self):
+        import polars as pl
+
+        df1 = pl.from_pandas(_large_mixed_dataframe())
+        df2 = df1.with_columns(
+            pl.when(pl.int_range(pl.len()) == 7)
+            .then(pl.lit("other"))
+            .otherwise(pl.col("str"))
+            .alias("str")
+        )
+
+        assert get_hash(df1) == get_hash(df1.clone())
+        assert get_hash(df1) != get_hash(df2)
+        assert get_hash(df1["str"]) != get_hash(df2["str"])
+
+    def test_small_objects_are_hashed_as_without_it(self):
+        """Only large objects are hashed differently, so keys of small
+        arguments don't change with the option.
+        """
+        values = [
+            np.arange(100),
+            pd.DataFrame({"a": [1, 2, 3]}),
+            pd.Series(["a", "b"]),
+        ]
+        exact_hashes = [get_hash(v) for v in values]
+
+        with patch_config_options({"global.exactCacheHashing": False}):
+            assert [get_hash(v) for v in values] == exact_hashes
+
+    def test_hash_does_not_depend_on_threads(self):
+        arr = np.random.default_rng(0).random(_NP_SIZE_LARGE)
+
+        with patch("os.cpu_count", return_value=1):
+            single_threaded_hash = get_hash(arr)
+        with patch("os.cpu_count", return_value=8):
+            assert get_hash(arr) == single_threaded_hash
+
+
+class PyArrowHashTest(unittest.TestCase):
+    """PyArrow data is hashed exactly, from its memory."""
+
+    def test_table(self):
+        table = pa.table({"a": [1, 2, 3], "b": ["x", "y", None]})
+
+        assert get_hash(table) == get_hash(
+            pa.table({"a": [1, 2, 3], "b": ["x", "y", None]})
+        )
+        assert get_hash(table) != get_hash(
+            pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        )
+        assert get_hash(table) != get_hash(table.rename_columns(["a", "c"]))
+        assert get_hash(table) != get_hash(table.to_batches()[0])
+
+    def test_arrays(self):
+        assert get_hash(pa.array([1, 2])) == get_hash(pa.array([1, 2]))
+        assert get_hash(pa.array([1, 2])) != get_hash(pa.array([1, 3]))
+        assert get_hash(pa.array([1, 2])) != get_hash(pa.chunked_array([[1, 2]]))
+        assert get_hash(pa.array([1, 2], pa.int64())) != get_hash(
+            pa.array([1, 2], pa.int32())
+        )
+
+    def test_sliced_arrays(self):
+        arr = pa.array(["a", "b", "c", "d"])
+
+        assert get_hash(arr.slice(0, 2)) != get_hash(arr.slice(2, 2))
+        assert get_hash(arr.slice(0, 2)) != get_hash(arr.slice(0, 3))
+
+    def test_dictionary_arrays(self):
+        arr1 = pa.array(["a", "b"]).dictionary_encode()
+        arr2 = pa.array(["b", "a"]).dictionary_encode()
+
+        # The indices are the same, only the dictionaries differ.
+        assert arr1.indices == arr2.indices
+        assert get_hash(arr1) != get_hash(arr2)
+
+    def test_nested_arrays(self):
+        arr = pa.array([{"a": [1, 2]}, {"a": [3]}])
+
+        assert get_hash(arr) == get_hash(pa.array([{"a": [1, 2]}, {"a": [3]}]))
+        assert get_hash(arr) != get_hash(pa.array([{"a": [1, 2]}, {"a": [4]}]))
+        assert get_hash(arr.slice(1)) != get_hash(arr.slice(0, 1))
+
+
+class ArgHashMemoTest(DeltaGeneratorTestCase):
+    """Tests for the memo of immutable data's hashes in a script run."""
+
+    def setUp(self):
+        super().setUp()
+        to_bytes = _CacheFuncHasher._to_bytes
+        patcher = patch.object(
+            _CacheFuncHasher, "_to_bytes", autospec=True, side_effect=to_bytes
+        )
+        self.to_bytes = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _hash_count(self, obj) -> int:
+        """Return how many times obj itself was hashed."""
+        return sum(1 for call in self.to_bytes.call_args_list if call.args[1] is obj)
+
+    def test_read_only_array(self):
+        arr = np.arange(100.0)
+        arr.flags.writeable = False
+
+        assert get_hash(arr) == get_hash(arr)
+        assert self._hash_count(arr) == 1
+
+        # Nested objects are memoized, too.
+        assert get_hash([arr, 1]) != get_hash(arr)
+        assert self._hash_count(arr) == 1
+
+    def test_memo_is_scoped_to_script_run(self):
+        arr = np.arange(100.0)
+        arr.flags.writeable = False
+
+        get_hash(arr)
+        get_script_run_ctx().reset()
+        get_hash(arr)
+
+        assert self._hash_count(arr) == 2
+
+    def test_pyarrow_table(self):
+        table = pa.table({"a": [1, 2, 3]})
+
+        assert get_hash(table) == get_hash(table)
+        assert self._hash_count(table) == 1
+
+    def test_writeable_array_is_not_memoized(self):
+        arr = np.arange(100.0)
+
+        h1 = get_hash(arr)
+        arr[0] = 42
+
+        assert get_hash(arr) != h1
+        assert self._hash_count(arr) == 2
+
+    def test_read_only_view_of_writeable_array_is_not_memoized(self):
+        arr = np.arange(100.0)
+        view = arr.view()
+        view.flags.writeable = False
+
+        h1 = get_hash(view)
+        arr[0] = 42
+
+        assert get_hash(view) != h1
+
+    def test_object_array_is_not_memoized(self):
+        arr = np.empty(2, dtype=object)
+        arr[0] = [1]
+        arr[1] = [2]
+        arr.flags.writeable = False
+
+        get_hash(arr)
+        get_hash(arr)
+
+        assert self._hash_count(arr) == 2
+
+    def test_hash_funcs_bypass_memo(self):
+        arr = np.arange(100.0)
+        arr.flags.writeable = False
+        hash_funcs = {np.ndarray: lambda x: time.time()}
+
+        assert get_hash(arr, hash_funcs=hash_funcs) != get_hash(
+            arr, hash_funcs=hash_funcs
+        )
+
+    def test_memo_is_per_algorithm(self):
+        arr = np.arange(100.0)
+        arr.flags.writeable = False
+
+        get_hash(arr)
+        with patch_config_options({"global.cacheHashAlgorithm": "blake2b"}):
+            get_hash(arr)
+
+        assert self._hash_count(arr) == 2
+
+    def test_shared_cached_value_is_hashed_once(self):
+        """An array returned by a copy="on_write" function is hashed once, however
+        many cached functions it's passed to.
+        """
+
+        @cache_data(copy="on_write")
+        def load():
+            return np.arange(1000.0)
+
+        @cache_data
+        def total(arr):
+            return arr.sum()
+
+        @cache_data
+        def maximum(arr):
+            return arr.max()
+
+        load()
+        arr = load()
+
+        assert total(arr) == 499500
+        assert maximum(arr) == 999
+        assert total(arr) == 499500
+        assert self._hash_count(arr) == 1
+
+
+@dataclass
+class _Point:
+    x: float
+    y: float
+    label: str
+
+
+@pytest.mark.usefixtures("benchmark")
+class HashPerformanceTest(unittest.TestCase):
+    """Benchmarks for hashing common cached function arguments."""
+
+    def test_pandas_mixed_dataframe_performance(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "float": rng.random(_PANDAS_ROWS_LARGE),
+                "int": rng.integers(0, 1000, _PANDAS_ROWS_LARGE),
+                "str": [f"row-{i}" for i in range(_PANDAS_ROWS_LARGE)],
+                "category": pd.Categorical(
+                    rng.choice(["a", "b", "c"], _PANDAS_ROWS_LARGE)
+                ),
+            }
+        )
+        self.benchmark(lambda: get_hash(df, cache_type=CacheType.DATA))
+
+    def test_pandas_small_dataframe_performance(self):
+        df = pd.DataFrame(np.zeros((1000, 4)), columns=list("ABCD"))
+        self.benchmark(lambda: get_hash(df, cache_type=CacheType.DATA))
+
+    def test_numpy_large_array_performance(self):
+        arr = np.random.default_rng(0).random(_NP_SIZE_LARGE)
+        self.benchmark(lambda: get_hash(arr, cache_type=CacheType.DATA))
+
+    def test_numpy_small_array_performance(self):
+        arr = np.random.default_rng(0).random(10_000)
+        self.benchmark(lambda: get_hash(arr, cache_type=CacheType.DATA))
+
+    @patch_config_options({"global.cacheHashAlgorithm": "blake2b"})
+    def test_numpy_large_array_blake2b_performance(self):
+        arr = np.random.default_rng(0).random(_NP_SIZE_LARGE)
+        self.benchmark(lambda: get_hash(arr, cache_type=CacheType.DATA))
+
+    def test_numpy_memoized_array_performance(self):
+        arr = np.random.default_rng(0).random(_NP_SIZE_LARGE)
+        arr.flags.writeable = False
+        memo: dict[Any, Any] = {}
+        with patch(
+            "streamlit.runtime.caching.hashing._get_arg_hash_memo", new=lambda: memo
+        ):
+            self.benchmark(lambda: get_hash(arr, cache_type=CacheType.DATA))
+
+    def test_nested_dict_performance(self):
+        data = {
+            f"key-{i}": {
+                "values": list(range(100)),
+                "meta": {"name": f"item-{i}", "score": i / 3, "tags": ("a", "b")},
+            }
+            for i in range(100)
+        }
+        self.benchmark(lambda: get_hash(data, cache_type=CacheType.DATA))
+
+    def test_dataclass_performance(self):
+        points = [_Point(i, i / 2, f"point-{i}") for i in range(1000)]
+        self.benchmark(lambda: get_hash(points, cache_type=CacheType.DATA))
+
+    def test_pandas_mixed_dataframe_exact_performance(self):
+        df = _large_mixed_dataframe()
+        with patch_config_options({"global.exactCacheHashing": True}):
+            self.benchmark(lambda: get_hash(df, cache_type=CacheType.DATA))
+
+    def test_pandas_large_dataframe_exact_performance(self):
+        df = pd.DataFrame(np.zeros((_PANDAS_ROWS_LARGE, 4)), columns=list("ABCD"))
+        with patch_config_options({"global.exactCacheHashing": True}):
+            self.benchmark(lambda: get_hash(df, cache_type=CacheType.DATA))
+
+    def test_numpy_large_array_exact_performance(self):
+        arr = np.random.default_rng(0).random(_NP_SIZE_LARGE)
+        with patch_config_options({"global.exactCacheHashing": True}):
+            self.benchmark(lambda: get_hash(arr, cache_type=CacheType.DATA))
+
+    def test_polars_large_dataframe_exact_performance(self):
+        try:
+            import polars as pl
+        except ImportError:
+            # Skip if polars is not installed.
+            return
+
+        df = pl.DataFrame(np.zeros((_PANDAS_ROWS_LARGE, 4)), schema=list("abcd"))
+        with patch_config_options({"global.exactCacheHashing": True}):
+            self.benchmark(lambda: get_hash(df, cache_type=CacheType.DATA))
+
+    def test_pyarrow_table_performance(self):
+        table = pa.Table.from_pandas(_large_mixed_dataframe())
+        self.benchmark(lambda: get_hash(table, cache_type=CacheType.DATA))
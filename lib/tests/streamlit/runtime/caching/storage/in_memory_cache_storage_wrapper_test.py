@@ -23,6 +23,7 @@ from testfixtures import TempDirectory
 
 from streamlit.runtime.caching.storage import (
     CacheStorageContext,
+    CacheStorageError,
     CacheStorageKeyNotFoundError,
 )
 from streamlit.runtime.caching.storage.dummy_cache_storage import DummyCacheStorage
@@ -179,3 +180,62 @@ class InMemoryCacheStorageWrapperTest(unittest.TestCase):
         ) as mock_persist_close:
             wrapped_storage.close()
             mock_persist_close.assert_called_once()
+
+    def test_in_memory_cache_storage_wrapper_set_with_buffers(self):
+        """
+        Test that storage.set_with_buffers() keeps the buffers in memory, and
+        passes them to the persist storage
+        """
+        context = self.get_storage_context()
+        persist_storage = LocalDiskCacheStorage(context)
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=persist_storage, context=context
+        )
+        buffers = [memoryview(b"some-buffer")]
+
+        with patch.object(
+            persist_storage, "set_with_buffers", wraps=persist_storage.set_with_buffers
+        ) as mock_persist_set_with_buffers:
+            wrapped_storage.set_with_buffers("some-key", b"some-value", buffers)
+            mock_persist_set_with_buffers.assert_called_once_with(
+                "some-key", b"some-value", buffers
+            )
+
+        with patch.object(
+            persist_storage, "get_with_buffers", wraps=persist_storage.get_with_buffers
+        ) as mock_persist_get_with_buffers:
+            self.assertEqual(
+                wrapped_storage.get_with_buffers("some-key"),
+                (b"some-value", buffers),
+            )
+            mock_persist_get_with_buffers.assert_not_called()
+
+        with self.assertRaises(CacheStorageError):
+            wrapped_storage.get("some-key")
+
+        self.assertEqual(
+            [stat.byte_length for stat in wrapped_storage.get_stats()],
+            [len(b"some-value") + len(b"some-buffer")],
+        )
+
+    def test_in_memory_cache_storage_wrapper_set_with_buffers_not_supported(self):
+        """
+        Test that storage.set_with_buffers() doesn't keep the entry if the
+        persist storage doesn't support buffers
+        """
+        context = self.get_storage_context()
+        persist_storage = LocalDiskCacheStorage(context)
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=persist_storage, context=context
+        )
+
+        with patch.object(
+            persist_storage, "set_with_buffers", side_effect=NotImplementedError
+        ):
+            with self.assertRaises(NotImplementedError):
+                wrapped_storage.set_with_buffers(
+                    "some-key", b"some-value", [memoryview(b"some-buffer")]
+                )
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            wrapped_storage.get_with_buffers("some-key")
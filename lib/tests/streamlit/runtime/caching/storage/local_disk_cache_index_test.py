@@ -0,0 +1,186 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""DiskCacheIndex unit tests."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import sqlite3
+import threading
+import unittest
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from streamlit.runtime.caching.storage.local_disk_cache_index import DiskCacheIndex
+
+
+class DiskCacheIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = TempDirectory(create=True)
+        self.index = DiskCacheIndex(self.tempdir.path, "memo")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _add(
+        self,
+        file_name: str,
+        data: bytes = b"data",
+        function_key: str = "func",
+        ttl_seconds: float = math.inf,
+        max_entries: float = math.inf,
+        max_bytes: float = math.inf,
+    ) -> None:
+        temp_path = os.path.join(self.tempdir.path, f"{file_name}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        self.index.add(
+            file_name,
+            temp_path,
+            function_key=function_key,
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+
+    def _files(self) -> list[str]:
+        return sorted(f for f in os.listdir(self.tempdir.path) if f.endswith(".memo"))
+
+    def test_add_moves_file_into_place(self):
+        self._add("func-a.memo", b"some data")
+
+        assert self._files() == ["func-a.memo"]
+        with open(os.path.join(self.tempdir.path, "func-a.memo"), "rb") as f:
+            assert f.read() == b"some data"
+        assert not any(f.endswith(".tmp") for f in os.listdir(self.tempdir.path))
+
+    def test_expired_files_are_removed(self):
+        with patch("time.time", return_value=1000):
+            self._add("func-a.memo", ttl_seconds=10)
+            self._add("func-b.memo")
+
+        with patch("time.time", return_value=1005):
+            assert self.index.touch("func-a.memo")
+
+        with patch("time.time", return_value=1010):
+            assert not self.index.touch("func-a.memo")
+            assert self.index.touch("func-b.memo")
+
+        assert self._files() == ["func-b.memo"]
+
+    def test_adding_removes_expired_files_of_all_functions(self):
+        with patch("time.time", return_value=1000):
+            self._add("func-a.memo", function_key="func", ttl_seconds=10)
+
+        with patch("time.time", return_value=1010):
+            self._add("other-b.memo", function_key="other")
+
+        assert self._files() == ["other-b.memo"]
+
+    def test_max_entries_evicts_least_recently_used_files_of_function(self):
+        with patch("time.time", side_effect=itertools.count(1000)):
+            self._add("func-a.memo", max_entries=2)
+            self._add("other-x.memo", function_key="other")
+            self._add("func-b.memo", max_entries=2)
+            self.index.touch("func-a.memo")
+            self._add("func-c.memo", max_entries=2)
+
+        assert self._files() == ["func-a.memo", "func-c.memo", "other-x.memo"]
+
+    def test_max_bytes_evicts_least_recently_used_files(self):
+        with patch("time.time", side_effect=itertools.count(1000)):
+            self._add("func-a.memo", b"1234", max_bytes=10)
+            self._add("other-b.memo", b"1234", function_key="other", max_bytes=10)
+            self.index.touch("func-a.memo")
+            self._add("func-c.memo", b"1234", max_bytes=10)
+
+        assert self._files() == ["func-a.memo", "func-c.memo"]
+
+    def test_remove_function(self):
+        self._add("func-a.memo")
+        self._add("func-b.memo")
+        self._add("other-c.memo", function_key="other")
+
+        assert self.index.remove_function("func")
+        assert self._files() == ["other-c.memo"]
+
+    def test_indexes_existing_files(self):
+        """Files written before the index existed are indexed when it's
+        created, so they count towards the limits.
+        """
+        with open(os.path.join(self.tempdir.path, "old-a.memo"), "wb") as f:
+            f.write(b"1234")
+
+        self._add("func-b.memo", b"1234", max_bytes=6)
+
+        assert self._files() == ["func-b.memo"]
+
+    def test_works_without_index(self):
+        """Files are still written if the index can't be used."""
+        with patch("sqlite3.connect", side_effect=sqlite3.Error("mock exception")):
+            self._add("func-a.memo")
+            assert self.index.touch("func-a.memo")
+            assert not self.index.remove_function("func")
+
+        assert self._files() == ["func-a.memo"]
+
+    def test_missing_cache_folder(self):
+        cache_dir = self.tempdir.path
+        self.tempdir.cleanup()
+
+        assert self.index.touch("func-a.memo")
+        assert not self.index.remove_function("func")
+        assert not os.path.exists(cache_dir)
+
+    def test_concurrent_writers(self):
+        """Several writers, each with its own index connection like separate
+        processes have, keep the folder within the limits.
+        """
+
+        def write(writer: int) -> None:
+            index = DiskCacheIndex(self.tempdir.path, "memo")
+            for i in range(20):
+                file_name = f"func{writer}-{i}.memo"
+                temp_path = os.path.join(self.tempdir.path, f"{file_name}.tmp")
+                with open(temp_path, "wb") as f:
+                    f.write(b"0123456789")
+                index.add(
+                    file_name,
+                    temp_path,
+                    function_key=f"func{writer}",
+                    ttl_seconds=math.inf,
+                    max_entries=math.inf,
+                    max_bytes=100,
+                )
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        files = self._files()
+        assert len(files) == 10
+        conn = sqlite3.connect(os.path.join(self.tempdir.path, "index.sqlite3"))
+        try:
+            indexed = sorted(
+                row[0] for row in conn.execute("SELECT file_name FROM entries")
+            )
+        finally:
+            conn.close()
+        assert indexed == files
@@ -16,16 +16,17 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import math
 import os.path
 import shutil
+import sqlite3
 import unittest
 from unittest.mock import MagicMock, patch
 
 from testfixtures import TempDirectory
 
-from streamlit import errors
 from streamlit.logger import get_logger
 from streamlit.runtime.caching.storage import (
     CacheStorageContext,
@@ -39,6 +40,7 @@ from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorage,
     LocalDiskCacheStorageManager,
 )
+from streamlit.testing.v1.util import patch_config_options
 
 
 class LocalDiskCacheStorageManagerTest(unittest.TestCase):
@@ -93,8 +95,9 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
         self.assertEqual(storage.max_entries, math.inf)
 
     def test_check_context_with_persist_and_ttl(self):
-        """Tests that LocalDiskCacheStorageManager.check_context() writes a warning
-        in logs when persist="disk" and ttl_seconds is not None
+        """Tests that LocalDiskCacheStorageManager.check_context() does not
+        write a warning in logs when persist="disk" and ttl_seconds is not None,
+        since persisted entries expire too.
         """
         context = CacheStorageContext(
             function_key="func-key",
@@ -111,12 +114,14 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
             manager = LocalDiskCacheStorageManager()
             manager.check_context(context)
 
+            # assertLogs is being used as a context manager, but it also checks
+            # that some log output was captured, so we have to let it capture something
+            get_logger(
+                "streamlit.runtime.caching.storage.local_disk_cache_storage"
+            ).warning("irrelevant warning so assertLogs passes")
+
             output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'func-display-name' has a TTL that will be "
-                "ignored. Persistent cached functions currently don't support TTL.",
-                output,
-            )
+            self.assertNotIn("TTL", output)
 
     def test_check_context_without_persist(self):
         """Tests that LocalDiskCacheStorageManager.check_context() does not
@@ -202,8 +207,8 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
             self.assertEqual(f.read(), b"new-value")
 
     @patch(
-        "streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write",
-        MagicMock(side_effect=errors.Error("mock exception")),
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._write_cache_file",
+        MagicMock(side_effect=OSError("mock exception")),
     )
     def test_storage_set_error(self):
         """Test that storage.set() raises an exception when it fails to write to disk."""
@@ -249,19 +254,38 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
         with self.assertRaises(CacheStorageKeyNotFoundError):
             self.storage.get("another-key")
 
-        # test that cache folder is empty
-        self.assertEqual(os.listdir(self.tempdir.path), [])
+        # test that cache folder has no cache files left
+        self.assertEqual(self._get_cache_files(), [])
 
     def test_storage_clear_not_existing_cache_directory(self):
         """Test that clear() is not crashing if the cache directory does not exist."""
         self.tempdir.cleanup()
         self.storage.clear()
 
-    def test_storage_clear_call_listdir_existing_cache_directory(self):
-        """Test that clear() call os.listdir if cache folder does not exist."""
+    def test_storage_clear_uses_index(self):
+        """Test that clear() finds the storage's files in the index, without
+        calling os.listdir.
+        """
+        self.storage.set("some-key", b"some-value")
+
         with patch("os.listdir") as mock_listdir:
             self.storage.clear()
+
+        mock_listdir.assert_not_called()
+        self.assertEqual(self._get_cache_files(), [])
+
+    def test_storage_clear_call_listdir_without_index(self):
+        """Test that clear() calls os.listdir if the index can't be used."""
+        self.storage.set("some-key", b"some-value")
+
+        with (
+            patch("sqlite3.connect", side_effect=sqlite3.Error("mock exception")),
+            patch("os.listdir", wraps=os.listdir) as mock_listdir,
+        ):
+            self.storage.clear()
+
         mock_listdir.assert_called_once()
+        self.assertEqual(self._get_cache_files(), [])
 
     def test_storage_clear_not_call_listdir_not_existing_cache_directory(self):
         """Test that clear() doesn't call os.listdir if cache folder does not exist."""
@@ -275,3 +299,126 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
     def test_storage_close(self):
         """Test that storage.close() does not raise any exception."""
         self.storage.close()
+
+    def test_storage_get_with_buffers(self):
+        """Test that buffers set with storage.set_with_buffers() are read back
+        from a memory-mapped, read-only file.
+        """
+        self.storage.set_with_buffers(
+            "some-key", b"some-value", [memoryview(b"a" * 100), memoryview(b"bc")]
+        )
+
+        value, buffers = self.storage.get_with_buffers("some-key")
+        self.assertEqual(value, b"some-value")
+        self.assertEqual([bytes(buffer) for buffer in buffers], [b"a" * 100, b"bc"])
+        self.assertTrue(all(buffer.readonly for buffer in buffers))
+
+    def test_storage_get_with_buffers_plain_file(self):
+        """Test that storage.get_with_buffers() reads files written by
+        storage.set().
+        """
+        self.storage.set("some-key", b"some-value")
+        self.assertEqual(self.storage.get_with_buffers("some-key"), (b"some-value", []))
+
+    def test_storage_get_entry_with_buffers(self):
+        """Test that storage.get() doesn't return entries without their
+        buffers.
+        """
+        self.storage.set_with_buffers("some-key", b"some-value", [memoryview(b"a")])
+        with self.assertRaises(CacheStorageError):
+            self.storage.get("some-key")
+
+    def test_storage_set_with_buffers_replaces_file(self):
+        """Test that overwriting an entry doesn't change buffers that were
+        already read.
+        """
+        self.storage.set_with_buffers("some-key", b"value", [memoryview(b"old")])
+        _, buffers = self.storage.get_with_buffers("some-key")
+
+        self.storage.set_with_buffers("some-key", b"value", [memoryview(b"new")])
+        self.assertEqual(bytes(buffers[0]), b"old")
+        self.assertEqual(bytes(self.storage.get_with_buffers("some-key")[1][0]), b"new")
+        self.assertEqual(self._get_cache_files(), ["func-key-some-key.memo"])
+
+    def test_storage_get_with_buffers_truncated_file(self):
+        """Test that storage.get_with_buffers() raises on truncated files."""
+        self.storage.set_with_buffers("some-key", b"value", [memoryview(b"a" * 100)])
+        path = self.tempdir.path + "/func-key-some-key.memo"
+        os.truncate(path, os.path.getsize(path) - 10)
+
+        with self.assertRaises(CacheStorageError):
+            self.storage.get_with_buffers("some-key")
+
+    def test_storage_entries_expire(self):
+        """Test that entries are no longer returned once their TTL has passed."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                ttl_seconds=60,
+            )
+        )
+        with patch("time.time", return_value=1000):
+            storage.set("some-key", b"some-value")
+
+        with patch("time.time", return_value=1059):
+            self.assertEqual(storage.get("some-key"), b"some-value")
+
+        with patch("time.time", return_value=1060):
+            with self.assertRaises(CacheStorageKeyNotFoundError):
+                storage.get("some-key")
+
+        self.assertEqual(self._get_cache_files(), [])
+
+    def test_storage_max_entries(self):
+        """Test that the least recently used entries are evicted beyond
+        max_entries.
+        """
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                max_entries=2,
+            )
+        )
+        with patch("time.time", side_effect=itertools.count(1000)):
+            storage.set("key-1", b"value")
+            storage.set("key-2", b"value")
+            storage.get("key-1")
+            storage.set("key-3", b"value")
+
+        self.assertEqual(
+            self._get_cache_files(), ["func-key-key-1.memo", "func-key-key-3.memo"]
+        )
+
+    @patch_config_options({"global.maxDiskCacheBytes": 25})
+    def test_storage_max_bytes(self):
+        """Test that the least recently used entries of all functions are
+        evicted beyond global.maxDiskCacheBytes.
+        """
+        other_storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+                persist="disk",
+            )
+        )
+        with patch("time.time", side_effect=itertools.count(1000)):
+            other_storage.set("key-1", b"0123456789")
+            self.storage.set("key-2", b"0123456789")
+            other_storage.set("key-3", b"0123456789")
+
+        self.assertEqual(
+            self._get_cache_files(),
+            ["func-key-key-2.memo", "other-func-key-key-3.memo"],
+        )
+        other_storage.clear()
+
+    def _get_cache_files(self) -> list[str]:
+        return sorted(
+            file_name
+            for file_name in os.listdir(self.tempdir.path)
+            if file_name.endswith(".memo")
+        )
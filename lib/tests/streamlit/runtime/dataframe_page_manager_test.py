@@ -0,0 +1,169 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for DataframePageManager"""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+
+from streamlit.runtime import worker_shard
+from streamlit.runtime.dataframe_page_manager import (
+    DATAFRAME_PAGE_ENDPOINT,
+    DataframePageManager,
+)
+from streamlit.web.server.worker_processes import get_routing_key
+from tests.exception_capturing_thread import call_on_threads
+
+
+def _create_table(num_rows: int = 10) -> pa.Table:
+    return pa.Table.from_pandas(
+        pd.DataFrame({"a": range(num_rows), "b": [str(i % 3) for i in range(num_rows)]})
+    )
+
+
+@mock.patch(
+    "streamlit.runtime.dataframe_page_manager._get_session_id",
+    mock.MagicMock(return_value="mock_session_id"),
+)
+class DataframePageManagerTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.page_mgr = DataframePageManager()
+
+    def test_get_rows(self):
+        """Rows are returned by offset and limit."""
+        table_id = self.page_mgr.add(_create_table(), "coord")
+
+        self.assertEqual(10, self.page_mgr.get_num_rows(table_id))
+        rows = self.page_mgr.get_rows(table_id, 2, 3)
+        self.assertEqual([2, 3, 4], rows.column("a").to_pylist())
+
+        # Rows past the end are left out.
+        self.assertEqual(2, self.page_mgr.get_rows(table_id, 8, 5).num_rows)
+
+    def test_get_rows_of_unknown_table(self):
+        """None is returned for tables that don't exist."""
+        self.assertIsNone(self.page_mgr.get_rows("unknown", 0, 10))
+        self.assertIsNone(self.page_mgr.get_num_rows("unknown"))
+
+    def test_get_sorted_rows(self):
+        """Rows are returned in the requested sort order, with nulls last."""
+        table = pa.table({"a": [3, None, 1, 2]})
+        table_id = self.page_mgr.add(table, "coord")
+
+        rows = self.page_mgr.get_rows(table_id, 0, 4, sort_column="a")
+        self.assertEqual([1, 2, 3, None], rows.column("a").to_pylist())
+
+        rows = self.page_mgr.get_rows(table_id, 1, 2, sort_column="a", ascending=False)
+        self.assertEqual([2, 1], rows.column("a").to_pylist())
+
+    def test_get_rows_sorted_by_unknown_column(self):
+        """A ValueError is raised for sort columns that don't exist."""
+        table_id = self.page_mgr.add(_create_table(), "coord")
+
+        with self.assertRaises(ValueError):
+            self.page_mgr.get_rows(table_id, 0, 10, sort_column="unknown")
+
+    def test_range_index_is_kept_in_pages(self):
+        """Pages of a table with a RangeIndex get the labels of their rows."""
+        df = pd.DataFrame({"a": range(10)}, index=pd.RangeIndex(100, 110))
+        table_id = self.page_mgr.add(pa.Table.from_pandas(df), "coord")
+
+        page = self.page_mgr.get_rows(table_id, 5, 3).to_pandas()
+        self.assertEqual([105, 106, 107], page.index.tolist())
+        self.assertEqual([5, 6, 7], page["a"].tolist())
+
+    def test_identical_tables_are_stored_once(self):
+        """Identical tables get the same ID."""
+        table_id_1 = self.page_mgr.add(_create_table(), "coord1")
+        table_id_2 = self.page_mgr.add(_create_table(), "coord2")
+        table_id_3 = self.page_mgr.add(_create_table(20), "coord3")
+
+        self.assertEqual(table_id_1, table_id_2)
+        self.assertNotEqual(table_id_1, table_id_3)
+        self.assertEqual(2, len(self.page_mgr._tables))
+
+    @mock.patch.object(worker_shard, "_shard_count", 4)
+    @mock.patch.object(worker_shard, "_shard_index", 1)
+    def test_page_requests_are_routed_to_own_worker(self):
+        """In a worker process, requests for pages of a table are routed back
+        to that worker."""
+        for num_rows in range(1, 6):
+            table_id = self.page_mgr.add(_create_table(num_rows), f"coord{num_rows}")
+            request_head = (
+                f"GET /{DATAFRAME_PAGE_ENDPOINT}/{table_id}?offset=0&limit=10 "
+                "HTTP/1.1\r\nHost: localhost\r\n\r\n"
+            ).encode()
+            routing_key = get_routing_key(request_head)
+
+            self.assertEqual(table_id, routing_key)
+            self.assertEqual(1, worker_shard.shard_for_key(routing_key, 4))
+
+            # The ID is stable for the same table.
+            self.assertEqual(
+                table_id, self.page_mgr.add(_create_table(num_rows), "other_coord")
+            )
+
+    def test_remove_orphaned_tables(self):
+        """Tables are removed once no session shows them anymore."""
+        with mock.patch(
+            "streamlit.runtime.dataframe_page_manager._get_session_id"
+        ) as mock_get_session_id:
+            mock_get_session_id.return_value = "session_1"
+            shared_table_id = self.page_mgr.add(_create_table(), "coord")
+            table_id_1 = self.page_mgr.add(_create_table(20), "other_coord")
+
+            mock_get_session_id.return_value = "session_2"
+            self.page_mgr.add(_create_table(), "coord")
+
+        self.page_mgr.clear_session_refs("session_1")
+        self.page_mgr.remove_orphaned_tables()
+
+        self.assertIsNone(self.page_mgr.get_num_rows(table_id_1))
+        self.assertEqual(10, self.page_mgr.get_num_rows(shared_table_id))
+
+        self.page_mgr.clear_session_refs("session_2")
+        self.page_mgr.remove_orphaned_tables()
+
+        self.assertEqual(0, len(self.page_mgr._tables))
+
+    def test_table_replaced_at_same_coord(self):
+        """A table is no longer used when another one is shown in its place."""
+        table_id_1 = self.page_mgr.add(_create_table(), "coord")
+        table_id_2 = self.page_mgr.add(_create_table(20), "coord")
+
+        self.page_mgr.remove_orphaned_tables()
+
+        self.assertIsNone(self.page_mgr.get_num_rows(table_id_1))
+        self.assertEqual(20, self.page_mgr.get_num_rows(table_id_2))
+
+    def test_get_sorted_rows_multiple_threads(self):
+        """Sorted rows can be requested from multiple threads at once."""
+        table_id = self.page_mgr.add(_create_table(1000), "coord")
+
+        def get_rows(thread_index: int) -> None:
+            rows = self.page_mgr.get_rows(
+                table_id, 0, 5, sort_column="a", ascending=thread_index % 2 == 0
+            )
+            expected = (
+                [0, 1, 2, 3, 4] if thread_index % 2 == 0 else [999, 998, 997, 996, 995]
+            )
+            self.assertEqual(expected, rows.column("a").to_pylist())
+
+        call_on_threads(get_rows, num_threads=10)
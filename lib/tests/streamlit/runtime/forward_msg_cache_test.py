@@ -17,13 +17,15 @@
 from __future__ import annotations
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from streamlit import config
-from streamlit.runtime import app_session
+from streamlit import config, util
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg, ForwardMsgMetadata
+from streamlit.runtime import app_session, worker_shard
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
+    get_serialized_body,
     populate_hash_if_needed,
 )
 from streamlit.runtime.stats import CacheStat
@@ -60,6 +62,50 @@ class ForwardMsgCacheTest(unittest.TestCase):
         self.assertEqual(populate_hash_if_needed(msg), ref_msg.ref_hash)
         self.assertEqual(msg.metadata, ref_msg.metadata)
 
+    @patch.object(worker_shard, "_shard_count", 4)
+    @patch.object(worker_shard, "_shard_index", 1)
+    def test_msg_hash_belongs_to_own_worker_shard(self):
+        """In a worker process, message hashes route back to that worker."""
+        for data in ([1], [2], [3], [4], [5]):
+            msg = create_dataframe_msg(data)
+            msg_hash = populate_hash_if_needed(msg)
+            self.assertEqual(1, worker_shard.shard_for_key(msg_hash, 4))
+
+            # The hash is stable for the same message.
+            self.assertEqual(
+                msg_hash, populate_hash_if_needed(create_dataframe_msg(data))
+            )
+
+    def test_serialized_body(self):
+        """Test that the serialized body excludes hash and metadata, and that
+        the hash is computed from it."""
+        msg = create_dataframe_msg([1, 2, 3], 34)
+        metadata = ForwardMsgMetadata()
+        metadata.CopyFrom(msg.metadata)
+        body = get_serialized_body(msg)
+
+        body_msg = ForwardMsg()
+        body_msg.ParseFromString(body)
+        self.assertEqual("", body_msg.hash)
+        self.assertFalse(body_msg.HasField("metadata"))
+        self.assertEqual(msg.delta, body_msg.delta)
+
+        self.assertEqual(util.calc_md5(body), msg.hash)
+        # The hash and metadata are left untouched on the message itself.
+        self.assertEqual(metadata, msg.metadata)
+
+    def test_serialized_body_reserializes_unseen_message(self):
+        """Test that get_serialized_body works for a message whose hash was
+        computed elsewhere."""
+        msg1 = create_dataframe_msg([1, 2, 3])
+        msg2 = create_dataframe_msg([1, 2, 3])
+        msg2.hash = populate_hash_if_needed(msg1)
+
+        # Hash something else so that msg1's body isn't the last one hashed.
+        populate_hash_if_needed(create_dataframe_msg([4, 5, 6]))
+
+        self.assertEqual(get_serialized_body(msg1), get_serialized_body(msg2))
+
     def test_add_message(self):
         """Test MessageCache.add_message and has_message_reference"""
         cache = ForwardMsgCache()
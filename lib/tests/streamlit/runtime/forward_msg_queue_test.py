@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import copy
 import unittest
+from unittest.mock import MagicMock
 
 from parameterized import parameterized
 
@@ -25,7 +26,11 @@ from streamlit.cursor import make_delta_path
 from streamlit.elements import arrow
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.proto.RootContainer_pb2 import RootContainer
-from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.runtime.forward_msg_queue import (
+    ForwardMsgQueue,
+    ForwardMsgQueueStatProvider,
+)
+from streamlit.runtime.stats import CacheStat
 
 # For the messages below, we don't really care about their contents so much as
 # their general type.
@@ -360,3 +365,72 @@ class ForwardMsgQueueTest(unittest.TestCase):
         fmq.enqueue(TEXT_DELTA_MSG2)
 
         assert count == 0
+
+    def test_bounded_queue_tracks_size(self):
+        """A bounded queue is full once it holds more than max_bytes."""
+        fmq = ForwardMsgQueue(max_bytes=DF_DELTA_MSG.ByteSize())
+        self.assertFalse(fmq.is_full())
+
+        DF_DELTA_MSG.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        fmq.enqueue(DF_DELTA_MSG)
+        self.assertEqual(DF_DELTA_MSG.ByteSize(), fmq.get_queued_bytes())
+        self.assertFalse(fmq.is_full())
+
+        fmq.enqueue(NEW_SESSION_MSG)
+        self.assertTrue(fmq.is_full())
+        self.assertFalse(fmq.wait_until_not_full(0))
+
+        fmq.flush()
+        self.assertEqual(0, fmq.get_queued_bytes())
+        self.assertTrue(fmq.wait_until_not_full(0))
+
+    def test_unbounded_queue_is_never_full(self):
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(DF_DELTA_MSG)
+
+        self.assertFalse(fmq.is_full())
+        self.assertEqual(DF_DELTA_MSG.ByteSize(), fmq.get_queued_bytes())
+
+    def test_bounded_queue_replaces_block_of_same_type(self):
+        """A bounded queue replaces an add_block delta with a newer add_block
+        delta for a block of the same type, but not of a different type."""
+        delta_path = make_delta_path(RootContainer.MAIN, (), 0)
+
+        def add_block_msg(block_type: str) -> ForwardMsg:
+            msg = ForwardMsg()
+            getattr(msg.delta.add_block, block_type).SetInParent()
+            msg.metadata.delta_path[:] = delta_path
+            return msg
+
+        child_msg = copy.deepcopy(TEXT_DELTA_MSG1)
+        child_msg.metadata.delta_path[:] = delta_path + [0]
+
+        fmq = ForwardMsgQueue(max_bytes=1_000_000)
+        fmq.enqueue(add_block_msg("vertical"))
+        fmq.enqueue(child_msg)
+        fmq.enqueue(add_block_msg("vertical"))
+        self.assertEqual(2, len(fmq))
+        self.assertEqual(sum(m.ByteSize() for m in fmq._queue), fmq.get_queued_bytes())
+
+        fmq.enqueue(add_block_msg("horizontal"))
+        self.assertEqual(3, len(fmq))
+
+        # Unbounded queues never replace blocks.
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(add_block_msg("vertical"))
+        fmq.enqueue(add_block_msg("vertical"))
+        self.assertEqual(2, len(fmq))
+
+    def test_stat_provider(self):
+        """ForwardMsgQueueStatProvider reports each active session's queued
+        bytes."""
+        session_info = MagicMock()
+        session_info.session.id = "session_id"
+        session_info.session.get_browser_queue_bytes.return_value = 42
+        session_mgr = MagicMock()
+        session_mgr.list_active_sessions.return_value = [session_info]
+
+        self.assertEqual(
+            [CacheStat("ForwardMsgQueue", "session_id", 42)],
+            ForwardMsgQueueStatProvider(session_mgr).get_stats(),
+        )
@@ -0,0 +1,195 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ForwardMsgScheduler"""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.forward_msg_cache import (
+    create_reference_msg,
+    get_serialized_body,
+    populate_hash_if_needed,
+)
+from streamlit.runtime.forward_msg_scheduler import (
+    MAX_CLIENT_BUFFERED_BYTES,
+    ForwardMsgScheduler,
+)
+from streamlit.runtime.session_manager import ActiveSessionInfo
+from streamlit.runtime.stats import GaugeStat
+from tests.streamlit.message_mocks import (
+    create_dataframe_msg,
+    create_script_finished_message,
+)
+
+
+def _create_session_info(session_id: str) -> ActiveSessionInfo:
+    session = MagicMock()
+    session.id = session_id
+    client = MagicMock()
+    client.get_buffered_amount.return_value = 0
+    return ActiveSessionInfo(client, session)
+
+
+def _session_ids(session_infos: list[ActiveSessionInfo]) -> list[str]:
+    return [info.session.id for info in session_infos]
+
+
+class ForwardMsgSchedulerTest(unittest.TestCase):
+    def test_round_robin(self):
+        """The session that is served first rotates on every tick."""
+        scheduler = ForwardMsgScheduler()
+        sessions = [_create_session_info(sid) for sid in ("a", "b", "c")]
+        for info in sessions:
+            scheduler.enqueue(info.session.id, [create_dataframe_msg([1])])
+
+        self.assertEqual(
+            ["a", "b", "c"], _session_ids(scheduler.select_sessions(sessions))
+        )
+        self.assertEqual(
+            ["b", "c", "a"], _session_ids(scheduler.select_sessions(sessions))
+        )
+
+    def test_only_sessions_with_messages_are_selected(self):
+        scheduler = ForwardMsgScheduler()
+        sessions = [_create_session_info(sid) for sid in ("a", "b")]
+        scheduler.enqueue("b", [create_dataframe_msg([1])])
+
+        self.assertEqual(["b"], _session_ids(scheduler.select_sessions(sessions)))
+
+    def test_lifecycle_messages_first(self):
+        """Sessions with a lifecycle message at the head of their queue are
+        served before the others."""
+        scheduler = ForwardMsgScheduler()
+        sessions = [_create_session_info(sid) for sid in ("a", "b")]
+        scheduler.enqueue("a", [create_dataframe_msg([1])])
+        scheduler.enqueue(
+            "b",
+            [create_script_finished_message(ForwardMsg.FINISHED_SUCCESSFULLY)],
+        )
+
+        self.assertEqual(["b", "a"], _session_ids(scheduler.select_sessions(sessions)))
+
+    def test_widget_messages_first(self):
+        """Sessions with a widget at the head of their queue are served
+        before sessions with bulk deltas, but dataframes aren't, even if
+        they're widgets."""
+        scheduler = ForwardMsgScheduler()
+        sessions = [_create_session_info(sid) for sid in ("a", "b", "c")]
+        scheduler.enqueue("a", [create_dataframe_msg(list(range(1000)))])
+
+        dataframe_widget_msg = create_dataframe_msg([1])
+        dataframe_widget_msg.delta.new_element.arrow_data_frame.id = "dataframe_id"
+        scheduler.enqueue("b", [dataframe_widget_msg])
+
+        slider_msg = ForwardMsg()
+        slider_msg.delta.new_element.slider.id = "slider_id"
+        scheduler.enqueue("c", [slider_msg])
+
+        self.assertEqual(
+            ["c", "a", "b"], _session_ids(scheduler.select_sessions(sessions))
+        )
+
+    def test_backpressure(self):
+        """Sessions whose client is backed up are skipped, but keep their
+        messages."""
+        scheduler = ForwardMsgScheduler()
+        sessions = [_create_session_info(sid) for sid in ("a", "b")]
+        sessions[0].client.get_buffered_amount.return_value = (
+            MAX_CLIENT_BUFFERED_BYTES + 1
+        )
+        for info in sessions:
+            scheduler.enqueue(info.session.id, [create_dataframe_msg([1])])
+
+        self.assertEqual(["b"], _session_ids(scheduler.select_sessions(sessions)))
+        list(scheduler.take_messages("b"))
+        self.assertTrue(scheduler.has_pending())
+
+    def test_take_messages_budget(self):
+        """Messages are taken in order until the byte budget is used up, but
+        at least one message is always taken."""
+        scheduler = ForwardMsgScheduler()
+        msgs = [create_dataframe_msg([i], i) for i in range(3)]
+        scheduler.enqueue("a", msgs)
+
+        with patch("streamlit.runtime.forward_msg_scheduler.SESSION_BYTES_PER_TICK", 1):
+            self.assertEqual(msgs[:1], list(scheduler.take_messages("a")))
+
+        self.assertEqual(msgs[1:], list(scheduler.take_messages("a")))
+        self.assertFalse(scheduler.has_pending())
+
+    def test_take_messages_charges_sent_messages(self):
+        """Messages that are sent as references to cached messages are
+        charged for the size of the reference."""
+        scheduler = ForwardMsgScheduler()
+        msgs = [create_dataframe_msg(list(range(1000)), i) for i in range(3)]
+        scheduler.enqueue("a", msgs)
+        budget = len(get_serialized_body(msgs[0]))
+
+        with patch(
+            "streamlit.runtime.forward_msg_scheduler.SESSION_BYTES_PER_TICK", budget
+        ):
+            sent = list(scheduler.take_messages("a", create_reference_msg))
+
+        self.assertEqual(
+            [populate_hash_if_needed(msg) for msg in msgs],
+            [msg.ref_hash for msg in sent],
+        )
+        self.assertFalse(scheduler.has_pending())
+
+    def test_inactive_sessions_are_dropped(self):
+        scheduler = ForwardMsgScheduler()
+        scheduler.enqueue("a", [create_dataframe_msg([1])])
+
+        self.assertEqual([], scheduler.select_sessions([]))
+        self.assertFalse(scheduler.has_pending())
+
+    def test_stats(self):
+        scheduler = ForwardMsgScheduler()
+        scheduler.enqueue("a", [create_dataframe_msg([i], i) for i in range(3)])
+        scheduler.enqueue("b", [create_dataframe_msg([1])])
+
+        with patch("streamlit.runtime.forward_msg_scheduler.SESSION_BYTES_PER_TICK", 1):
+            list(scheduler.take_messages("a"))
+
+        self.assertEqual(
+            [
+                GaugeStat("forward_msg_queue_depth", "ForwardMsgScheduler", "a", 2),
+                GaugeStat("forward_msg_queue_depth", "ForwardMsgScheduler", "b", 1),
+            ],
+            scheduler.get_gauge_stats(),
+        )
+
+        counter_stats = {
+            (stat.family_name, stat.cache_name): stat.value
+            for stat in scheduler.get_counter_stats()
+        }
+        self.assertEqual(
+            {
+                ("forward_msg_queue_wait_milliseconds", "a"),
+                ("forward_msg_queue_sent_messages", "a"),
+            },
+            set(counter_stats),
+        )
+        self.assertEqual(1, counter_stats[("forward_msg_queue_sent_messages", "a")])
+
+        scheduler.remove_session("a")
+        self.assertEqual([], scheduler.get_counter_stats())
+        self.assertEqual(
+            [GaugeStat("forward_msg_queue_depth", "ForwardMsgScheduler", "b", 1)],
+            scheduler.get_gauge_stats(),
+        )
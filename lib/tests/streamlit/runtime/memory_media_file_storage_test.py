@@ -22,6 +22,7 @@ from unittest.mock import MagicMock, mock_open
 
 from parameterized import parameterized
 
+from streamlit.runtime import worker_shard
 from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
 from streamlit.runtime.memory_media_file_storage import (
     MemoryFile,
@@ -116,6 +117,17 @@ class MemoryMediaFileStorageTest(unittest.TestCase):
         )
         self.assertNotEqual(file_id1, changed_filename)
 
+    @mock.patch.object(worker_shard, "_shard_count", 4)
+    @mock.patch.object(worker_shard, "_shard_index", 1)
+    def test_file_ids_belong_to_own_worker_shard(self):
+        """In a worker process, media file IDs route back to that worker."""
+        for content in (b"a", b"b", b"c", b"d", b"e"):
+            file_id = self.storage.load_and_get_id(
+                content, mimetype="image/png", kind=MediaFileKind.MEDIA
+            )
+            self.assertEqual(1, worker_shard.shard_for_key(file_id, 4))
+            self.assertIsNotNone(self.storage.get_file(file_id))
+
     @mock.patch(
         "streamlit.runtime.memory_media_file_storage.open",
         MagicMock(side_effect=Exception),
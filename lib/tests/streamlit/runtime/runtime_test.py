@@ -32,6 +32,7 @@ from streamlit.runtime import (
     SessionClient,
     SessionClientDisconnectedError,
 )
+from streamlit.runtime.caching.cache_warmup import CacheWarmup, WarmupProgress
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
@@ -138,6 +139,49 @@ class RuntimeTest(RuntimeTestCase):
         self.runtime.disconnect_session(session_id)
         self.assertEqual(RuntimeState.NO_SESSIONS_CONNECTED, self.runtime.state)
 
+    async def test_is_ready_for_browser_connection(self):
+        assert await self.runtime.is_ready_for_browser_connection == (
+            False,
+            "unavailable",
+        )
+
+        await self.runtime.start()
+        assert await self.runtime.is_ready_for_browser_connection == (True, "ok")
+
+    async def test_not_ready_while_warming_up_caches(self):
+        """The runtime runs the cache warm-up script when it starts, and isn't
+        ready for browser connections until the warm-up has finished.
+        """
+        cache_warmup = CacheWarmup(max_workers=1)
+        progress = WarmupProgress(done=1, total=3, failed=0, finished=False)
+        with (
+            patch_config_options({"server.warmupScript": "warmup.py"}),
+            patch(
+                "streamlit.runtime.runtime.get_cache_warmup",
+                return_value=cache_warmup,
+            ),
+            patch.object(cache_warmup, "run_script") as run_script,
+            patch.object(cache_warmup, "get_progress", side_effect=lambda: progress),
+            patch.object(cache_warmup, "stop") as stop,
+        ):
+            await self.runtime.start()
+            run_script.assert_called_once_with(
+                os.path.join(os.path.abspath("mock/script"), "warmup.py"),
+                "mock/script/path.py",
+            )
+
+            assert await self.runtime.is_ready_for_browser_connection == (
+                False,
+                "warming up caches: 1/3",
+            )
+
+            progress = WarmupProgress(done=3, total=3, failed=1, finished=True)
+            assert await self.runtime.is_ready_for_browser_connection == (True, "ok")
+
+            self.runtime.stop()
+            await self.runtime.stopped
+            stop.assert_called_once()
+
     async def test_connect_session_error_if_both_session_id_args(self):
         """Test that setting both existing_session_id and session_id_override is an error."""
         await self.runtime.start()
@@ -439,6 +483,7 @@ class RuntimeTest(RuntimeTestCase):
         await self.runtime.start()
 
         client = MagicMock(spec=SessionClient)
+        client.get_buffered_amount.return_value = 0
         session_id = self.runtime.connect_session(client, MagicMock())
 
         # Send the client a message. All should be well.
@@ -458,6 +503,47 @@ class RuntimeTest(RuntimeTestCase):
         raise_disconnected_error.assert_called_once()
         self.assertFalse(self.runtime.is_active_session(session_id))
 
+    async def test_batched_messages(self):
+        """With batching enabled, a session's queued messages are handed to
+        the client in a single `write_forward_msgs` call."""
+        await self.runtime.start()
+
+        client = MockSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        sent_msgs: list[ForwardMsg] = []
+        with (
+            patch_config_options({"server.maxWebsocketBatchSize": 100}),
+            patch.object(
+                client,
+                "write_forward_msgs",
+                side_effect=lambda msgs: sent_msgs.extend(msgs),
+            ) as write_forward_msgs,
+        ):
+            msgs = [create_dataframe_msg([i], i) for i in range(3)]
+            for msg in msgs:
+                self.enqueue_forward_msg(session_id, msg)
+            await self.tick_runtime_loop()
+
+            write_forward_msgs.assert_called_once()
+            self.assertEqual(msgs, sent_msgs)
+
+    async def test_messages_over_budget_are_sent_on_later_ticks(self):
+        """Messages that don't fit into a session's byte budget for a tick are
+        sent on the following ticks, without waiting for new messages."""
+        await self.runtime.start()
+
+        client = MockSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        with patch("streamlit.runtime.forward_msg_scheduler.SESSION_BYTES_PER_TICK", 1):
+            msgs = [create_dataframe_msg([i], i) for i in range(3)]
+            for msg in msgs:
+                self.enqueue_forward_msg(session_id, msg)
+            await self.tick_runtime_loop()
+
+        self.assertEqual(msgs, client.forward_msgs)
+
     async def test_stable_number_of_async_tasks(self):
         """Test that the number of async tasks remains stable.
 
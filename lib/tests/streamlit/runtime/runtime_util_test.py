@@ -18,10 +18,19 @@ from __future__ import annotations
 
 import unittest
 
+import pytest
+
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import runtime_util
-from streamlit.runtime.runtime_util import is_cacheable_msg, serialize_forward_msg
-from tests.streamlit.message_mocks import create_dataframe_msg
+from streamlit.runtime.runtime_util import (
+    is_cacheable_msg,
+    serialize_forward_msg,
+    serialize_forward_msg_batches,
+)
+from tests.streamlit.message_mocks import (
+    create_dataframe_msg,
+    create_script_finished_message,
+)
 from tests.testutil import patch_config_options
 
 
@@ -34,6 +43,18 @@ class RuntimeUtilTest(unittest.TestCase):
         with patch_config_options({"global.minCachedMessageSize": 1000}):
             self.assertFalse(is_cacheable_msg(create_dataframe_msg([1, 2, 3])))
 
+    def test_dont_cache_add_rows_with_max_rows(self):
+        """Rows streamed into elements that only keep their last rows are not
+        cached."""
+        msg = ForwardMsg()
+        msg.delta.arrow_add_rows.data.data = b"x" * 100
+
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            self.assertTrue(is_cacheable_msg(msg))
+
+            msg.delta.arrow_add_rows.max_rows = 10
+            self.assertFalse(is_cacheable_msg(msg))
+
     def test_should_limit_msg_size(self):
         max_message_size_mb = 50
 
@@ -57,3 +78,84 @@ class RuntimeUtilTest(unittest.TestCase):
                 "exceeds the message size limit"
                 in deserialized_msg.delta.new_element.exception.message
             )
+
+    def test_serialize_forward_msg(self):
+        """Test that a serialized ForwardMsg round-trips with its hash and
+        metadata."""
+        msg = create_dataframe_msg([1, 2, 3], 12)
+        msg.metadata.cacheable = True
+
+        deserialized_msg = ForwardMsg()
+        deserialized_msg.ParseFromString(serialize_forward_msg(msg))
+
+        self.assertNotEqual("", msg.hash)
+        self.assertEqual(msg, deserialized_msg)
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_serialize_large_forward_msg_performance(self):
+        """Performance test for hashing and serializing a ~10 MB dataframe
+        message, as done by the Runtime for every outgoing message."""
+        template_msg = create_dataframe_msg([1, 2, 3])
+        template_msg.delta.new_element.arrow_data_frame.data = b"x" * 10_000_000
+
+        def setup():
+            msg = ForwardMsg()
+            msg.CopyFrom(template_msg)
+            return (msg,), {}
+
+        def send(msg: ForwardMsg) -> bytes:
+            is_cacheable_msg(msg)
+            return serialize_forward_msg(msg)
+
+        self.benchmark.pedantic(send, setup=setup, rounds=20)
+
+    def test_serialize_forward_msg_batches(self):
+        """Test that messages are packed into ForwardMsgList batches that stay
+        under the size limit, in order."""
+        small_msgs = [create_dataframe_msg([i], i) for i in range(5)]
+        large_msg = create_dataframe_msg(list(range(1000)), 5)
+        finished_msg = create_script_finished_message(
+            ForwardMsg.FINISHED_WITH_COMPILE_ERROR
+        )
+        msgs = [*small_msgs, large_msg, finished_msg]
+
+        small_msg_size = max(len(serialize_forward_msg(m)) for m in small_msgs)
+        max_batch_size = 3 * (small_msg_size + 3) + 4
+        frames = serialize_forward_msg_batches(msgs, max_batch_size)
+
+        # Three small messages fit into the first batch, the other two into the
+        # second one. The large message is sent on its own, and so is the
+        # trailing message since it's the only one left.
+        self.assertEqual(4, len(frames))
+        for frame in frames[:2]:
+            self.assertLessEqual(len(frame), max_batch_size)
+
+        received_msgs = []
+        for frame in frames:
+            frame_msg = ForwardMsg()
+            frame_msg.ParseFromString(frame)
+            if frame_msg.WhichOneof("type") == "forward_msg_list":
+                received_msgs.extend(frame_msg.forward_msg_list.messages)
+            else:
+                received_msgs.append(frame_msg)
+
+        self.assertEqual(msgs, received_msgs)
+        self.assertEqual(
+            3, len(ForwardMsg.FromString(frames[0]).forward_msg_list.messages)
+        )
+        self.assertEqual(large_msg, ForwardMsg.FromString(frames[2]))
+        self.assertEqual(finished_msg, ForwardMsg.FromString(frames[3]))
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_serialize_forward_msgs_individually_performance(self):
+        """Performance test for serializing 500 small messages into one
+        websocket frame each."""
+        msgs = [create_dataframe_msg([i], i) for i in range(500)]
+        self.benchmark(lambda: [serialize_forward_msg(msg) for msg in msgs])
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_serialize_forward_msg_batches_performance(self):
+        """Performance test for serializing 500 small messages into batched
+        websocket frames."""
+        msgs = [create_dataframe_msg([i], i) for i in range(500)]
+        self.benchmark(lambda: serialize_forward_msg_batches(msgs, 1_000_000))
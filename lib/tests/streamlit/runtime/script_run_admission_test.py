@@ -0,0 +1,115 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ScriptRunAdmissionController"""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from streamlit.runtime.script_run_admission import ScriptRunAdmissionController
+from streamlit.runtime.stats import GaugeStat
+from tests.testutil import patch_config_options
+
+
+class ScriptRunAdmissionControllerTest(unittest.TestCase):
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 0})
+    def test_unlimited(self):
+        controller = ScriptRunAdmissionController()
+        for i in range(100):
+            assert controller.request_admission(f"session{i}", MagicMock())
+
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 2})
+    def test_fifo_admission(self):
+        """Sessions beyond the limit wait, and are admitted in the order in
+        which they asked, as slots are released."""
+        controller = ScriptRunAdmissionController()
+        callbacks = {sid: MagicMock() for sid in ("a", "b", "c", "d")}
+
+        assert controller.request_admission("a", callbacks["a"])
+        assert controller.request_admission("b", callbacks["b"])
+        assert not controller.request_admission("c", callbacks["c"])
+        assert not controller.request_admission("d", callbacks["d"])
+
+        controller.release("a")
+        callbacks["c"].assert_called_once()
+        callbacks["d"].assert_not_called()
+
+        controller.release("b")
+        callbacks["d"].assert_called_once()
+
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 1})
+    def test_sessions_are_counted_once(self):
+        """A session that is already admitted or waiting doesn't take another
+        slot or place in the queue."""
+        controller = ScriptRunAdmissionController()
+        assert controller.request_admission("a", MagicMock())
+        assert controller.request_admission("a", MagicMock())
+
+        first_callback = MagicMock()
+        second_callback = MagicMock()
+        assert not controller.request_admission("b", first_callback)
+        assert not controller.request_admission("b", second_callback)
+
+        controller.release("a")
+        first_callback.assert_not_called()
+        second_callback.assert_called_once()
+
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 1})
+    def test_cancel(self):
+        controller = ScriptRunAdmissionController()
+        assert controller.request_admission("a", MagicMock())
+        callback = MagicMock()
+        assert not controller.request_admission("b", callback)
+        assert controller.is_waiting("b")
+
+        controller.cancel("b")
+        controller.release("a")
+
+        assert not controller.is_waiting("b")
+        callback.assert_not_called()
+
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 1})
+    def test_stats(self):
+        controller = ScriptRunAdmissionController()
+        assert controller.request_admission("a", MagicMock())
+
+        with patch(
+            "streamlit.runtime.script_run_admission.time.monotonic",
+            return_value=100.0,
+        ):
+            assert not controller.request_admission("b", MagicMock())
+
+        assert controller.get_gauge_stats() == [
+            GaugeStat("script_runs_admitted", "ScriptRunAdmission", "", 1),
+            GaugeStat("script_runs_waiting", "ScriptRunAdmission", "", 1),
+        ]
+
+        with patch(
+            "streamlit.runtime.script_run_admission.time.monotonic",
+            return_value=102.0,
+        ):
+            controller.release("a")
+
+        [histogram] = controller.get_histogram_stats()
+        assert histogram.family_name == "script_run_queue_wait_seconds"
+        assert histogram.sample_count == 2
+        assert histogram.sum == 2.0
+        buckets = dict(histogram.buckets)
+        # "a" was admitted right away, "b" after waiting for 2 seconds.
+        assert buckets[0.01] == 1
+        assert buckets[1.0] == 1
+        assert buckets[5.0] == 2
+        assert buckets[float("inf")] == 2
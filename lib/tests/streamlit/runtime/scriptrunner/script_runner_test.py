@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 import time
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, call, patch
@@ -50,6 +51,9 @@ from streamlit.runtime.scriptrunner_utils.script_requests import (
     ScriptRequests,
     ScriptRequestType,
 )
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME,
+)
 from streamlit.runtime.state.session_state import SessionState
 from tests import testutil
 
@@ -698,6 +702,106 @@ class ScriptRunnerTest(AsyncTestCase):
         )
         self._assert_text_deltas(scriptrunner, ["loop_forever"])
 
+    def test_full_browser_queue_pauses_script(self):
+        """Test that the script thread waits while a bounded browser queue is
+        full, and can still be stopped while waiting."""
+        scriptrunner = TestScriptRunner("infinite_loop.py", max_queue_bytes=1)
+        scriptrunner.request_rerun(RerunData())
+        scriptrunner.start()
+
+        time.sleep(0.3)
+        enqueue_events = [
+            event
+            for event in scriptrunner.events
+            if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG
+        ]
+        self.assertEqual(1, len(enqueue_events))
+
+        scriptrunner.request_stop()
+        scriptrunner.join()
+
+        self._assert_no_exceptions(scriptrunner)
+        self._assert_control_events(
+            scriptrunner,
+            [
+                ScriptRunnerEvent.SCRIPT_STARTED,
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ScriptRunnerEvent.SHUTDOWN,
+            ],
+        )
+
+    @testutil.patch_config_options({"runner.scriptThreadPoolSize": 1})
+    def test_script_thread_pool(self):
+        """Test that ScriptRunners reuse the threads of the script thread pool
+        when runner.scriptThreadPoolSize is set."""
+        script_threads: list[threading.Thread] = []
+
+        def on_event(sender, event, **kwargs) -> None:
+            if event == ScriptRunnerEvent.SCRIPT_STARTED:
+                script_threads.append(threading.current_thread())
+
+        for _ in range(2):
+            scriptrunner = TestScriptRunner("good_script.py")
+            scriptrunner.on_event.connect(on_event, weak=False)
+            scriptrunner.request_rerun(RerunData())
+            scriptrunner.start()
+            scriptrunner.join()
+
+            self._assert_no_exceptions(scriptrunner)
+            self._assert_text_deltas(scriptrunner, ["complete! 👨‍🎤"])
+            self.assertIsNone(scriptrunner._script_thread)
+
+        self.assertEqual(2, len(script_threads))
+        self.assertIs(script_threads[0], script_threads[1])
+        self.assertTrue(script_threads[0].name.startswith("ScriptRunner.scriptThread"))
+        # The pool thread doesn't hold on to the last script's context.
+        self.assertIsNone(
+            getattr(script_threads[0], SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+        )
+
+    def _run_sessions(self, num_sessions: int) -> int:
+        """Run good_script.py in num_sessions concurrent ScriptRunners and
+        return the peak number of live threads."""
+        peak_threads = threading.active_count()
+
+        def on_event(sender, event, **kwargs) -> None:
+            nonlocal peak_threads
+            if event == ScriptRunnerEvent.SCRIPT_STARTED:
+                peak_threads = max(peak_threads, threading.active_count())
+
+        scriptrunners = []
+        for _ in range(num_sessions):
+            scriptrunner = TestScriptRunner("good_script.py")
+            scriptrunner.on_event.connect(on_event, weak=False)
+            scriptrunner.request_rerun(RerunData())
+            scriptrunner.start()
+            scriptrunners.append(scriptrunner)
+
+        for scriptrunner in scriptrunners:
+            scriptrunner.join()
+            self._assert_no_exceptions(scriptrunner)
+
+        return peak_threads
+
+    @pytest.mark.usefixtures("benchmark")
+    @testutil.patch_config_options({"runner.postScriptGC": False})
+    def test_rerun_latency_with_thread_per_run(self):
+        """Benchmark running 200 sessions with a new thread per ScriptRunner."""
+        self.benchmark.pedantic(self._run_sessions, args=(200,), rounds=3)
+
+    @pytest.mark.usefixtures("benchmark")
+    @testutil.patch_config_options(
+        {"runner.postScriptGC": False, "runner.scriptThreadPoolSize": 8}
+    )
+    def test_rerun_latency_with_script_thread_pool(self):
+        """Benchmark running 200 sessions on the script thread pool, which
+        also bounds the number of script threads."""
+        baseline_threads = threading.active_count()
+        peak_threads = self.benchmark.pedantic(
+            self._run_sessions, args=(200,), rounds=3
+        )
+        self.assertLessEqual(peak_threads, baseline_threads + 8)
+
     def test_widgets(self):
         """Tests that widget values behave as expected."""
         scriptrunner = TestScriptRunner("widgets_script.py")
@@ -1044,10 +1148,10 @@ class TestScriptRunner(ScriptRunner):
     # To prevent PytestCollectionWarning we set __test__ property to False
     __test__ = False
 
-    def __init__(self, script_name: str):
+    def __init__(self, script_name: str, max_queue_bytes: int = 0):
         """Initializes the ScriptRunner for the given script_name"""
         # DeltaGenerator deltas will be enqueued into self.forward_msg_queue.
-        self.forward_msg_queue = ForwardMsgQueue()
+        self.forward_msg_queue = ForwardMsgQueue(max_bytes=max_queue_bytes)
 
         main_script_path = os.path.join(
             os.path.dirname(__file__), "test_data", script_name
@@ -1064,6 +1168,7 @@ class TestScriptRunner(ScriptRunner):
             user_info={"email": "test@example.com"},
             fragment_storage=MemoryFragmentStorage(),
             pages_manager=PagesManager(main_script_path, script_cache),
+            browser_queue=self.forward_msg_queue,
         )
 
         # Accumulates uncaught exceptions thrown by our run thread.
@@ -1107,7 +1212,9 @@ class TestScriptRunner(ScriptRunner):
 
     def join(self) -> None:
         """Join the script_thread if it's running."""
-        if self._script_thread is not None:
+        if self._script_future is not None:
+            self._script_future.result()
+        elif self._script_thread is not None:
             self._script_thread.join()
 
     def clear_forward_msgs(self) -> None:
@@ -19,7 +19,11 @@ import unittest
 from streamlit.runtime.stats import (
     CacheStat,
     CacheStatsProvider,
+    CounterStat,
+    CounterStatsProvider,
+    HistogramStat,
     StatsManager,
+    group_histogram_stats,
     group_stats,
 )
 
@@ -32,6 +36,14 @@ class MockStatsProvider(CacheStatsProvider):
         return self.stats
 
 
+class MockCounterStatsProvider(CounterStatsProvider):
+    def __init__(self):
+        self.counter_stats: list[CounterStat] = []
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        return self.counter_stats
+
+
 class StatsManagerTest(unittest.TestCase):
     def test_get_stats(self):
         """StatsManager.get_stats should return all providers' stats."""
@@ -57,6 +69,23 @@ class StatsManagerTest(unittest.TestCase):
 
         self.assertEqual(provider1.stats + provider2.stats, manager.get_stats())
 
+    def test_get_counter_stats(self):
+        """StatsManager.get_counter_stats should return all counter providers'
+        stats, and only register providers with the protocols they implement."""
+        manager = StatsManager()
+        cache_provider = MockStatsProvider()
+        counter_provider = MockCounterStatsProvider()
+        manager.register_provider(cache_provider)
+        manager.register_provider(counter_provider)
+
+        counter_provider.counter_stats = [
+            CounterStat("hits", "provider2", "foo", 1),
+            CounterStat("misses", "provider2", "foo", 2),
+        ]
+
+        self.assertEqual(counter_provider.counter_stats, manager.get_counter_stats())
+        self.assertEqual([], manager.get_stats())
+
     def test_group_stats(self):
         """Should return stats grouped by category_name and cache_name.
         byte_length should be summed."""
@@ -108,3 +137,21 @@ class StatsManagerTest(unittest.TestCase):
                 CacheStat("provider3", "boo", 7),
             },
         )
+
+    def test_group_histogram_stats(self):
+        """Should return histograms grouped by family_name, category_name and
+        cache_name. Bucket counts and sums should be summed."""
+        inf = float("inf")
+        stats = [
+            HistogramStat("family", "provider", "foo", [(1.0, 1), (inf, 2)], 3.0),
+            HistogramStat("family", "provider", "bar", [(1.0, 0), (inf, 1)], 5.0),
+            HistogramStat("family", "provider", "foo", [(1.0, 2), (inf, 4)], 7.0),
+        ]
+
+        self.assertEqual(
+            group_histogram_stats(stats),
+            [
+                HistogramStat("family", "provider", "bar", [(1.0, 0), (inf, 1)], 5.0),
+                HistogramStat("family", "provider", "foo", [(1.0, 3), (inf, 6)], 10.0),
+            ],
+        )
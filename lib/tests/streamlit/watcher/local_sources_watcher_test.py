@@ -69,6 +69,8 @@ class LocalSourcesWatcherTest(unittest.TestCase):
             except Exception:
                 pass
 
+        local_sources_watcher._module_path_index.clear()
+
     @patch("streamlit.watcher.local_sources_watcher.PathWatcher")
     def test_just_script(self, fob):
         lsw = local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
@@ -321,6 +323,47 @@ class LocalSourcesWatcherTest(unittest.TestCase):
         lsw.update_watched_modules()
         register.assert_not_called()
 
+    @patch("streamlit.watcher.local_sources_watcher.PathWatcher")
+    def test_only_examines_new_modules(self, fob):
+        lsw = local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
+        lsw.register_file_change_callback(NOOP_CALLBACK)
+
+        with patch("sys.modules", {"DUMMY_MODULE_1": DUMMY_MODULE_1}):
+            lsw.update_watched_modules()
+
+            sys.modules["DUMMY_MODULE_2"] = DUMMY_MODULE_2
+            fob.reset_mock()
+            with patch.object(
+                local_sources_watcher,
+                "get_module_paths",
+                wraps=local_sources_watcher.get_module_paths,
+            ) as get_module_paths:
+                lsw.update_watched_modules()
+
+            get_module_paths.assert_called_once_with(DUMMY_MODULE_2)
+            fob.assert_called_once()
+            self.assertEqual(fob.call_args[0][0], DUMMY_MODULE_2_FILE)
+
+    @patch("streamlit.watcher.local_sources_watcher.PathWatcher")
+    def test_module_paths_are_shared_between_watchers(self, fob):
+        lsw1 = local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
+        lsw2 = local_sources_watcher.LocalSourcesWatcher(PagesManager(SCRIPT_PATH))
+
+        with patch(
+            "sys.modules",
+            {"DUMMY_MODULE_1": DUMMY_MODULE_1, "DUMMY_MODULE_2": DUMMY_MODULE_2},
+        ):
+            lsw1.update_watched_modules()
+
+            with patch.object(
+                local_sources_watcher, "get_module_paths"
+            ) as get_module_paths:
+                lsw2.update_watched_modules()
+
+            get_module_paths.assert_not_called()
+            self.assertIn(DUMMY_MODULE_1_FILE, lsw2._watched_modules)
+            self.assertIn(DUMMY_MODULE_2_FILE, lsw2._watched_modules)
+
     @patch(
         "streamlit.runtime.pages_manager.PagesManager.get_pages",
         MagicMock(
@@ -493,5 +536,16 @@ def test_get_module_paths_outputs_abs_paths():
     assert module_paths == {DUMMY_MODULE_1_FILE}
 
 
+def test_module_path_index_looks_up_reimported_modules_again():
+    index = local_sources_watcher.ModulePathIndex()
+    old_module = MagicMock()
+    old_module.__file__ = DUMMY_MODULE_1_FILE
+    new_module = MagicMock()
+    new_module.__file__ = DUMMY_MODULE_2_FILE
+
+    assert index.get_module_paths("mod", old_module) == {DUMMY_MODULE_1_FILE}
+    assert index.get_module_paths("mod", new_module) == {DUMMY_MODULE_2_FILE}
+
+
 def sort_args_list(args_list):
     return sorted(args_list, key=lambda args: args[0])
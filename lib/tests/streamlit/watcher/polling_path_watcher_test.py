@@ -14,9 +14,14 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 import unittest
 from unittest import mock
 
+import pytest
+from parameterized import parameterized
+
 from streamlit.watcher import polling_path_watcher
 
 
@@ -38,6 +43,14 @@ class PollingPathWatcherTest(unittest.TestCase):
         executor_mock = self.executor_patch.start()
         executor_mock.submit = self._submit_executor_task
 
+        # Start each test without any watched paths or scheduled polls.
+        self.state_patch = mock.patch.multiple(
+            polling_path_watcher.PollingPathWatcher,
+            _polled_paths={},
+            _is_polling=False,
+        )
+        self.state_patch.start()
+
         # Patch PollingPathWatcher's `time.sleep` to no-op, so that the tasks
         # submitted to our mock executor don't block.
         self.sleep_patch = mock.patch(
@@ -49,6 +62,7 @@ class PollingPathWatcherTest(unittest.TestCase):
         super().tearDown()
         self.util_patch.stop()
         self.executor_patch.stop()
+        self.state_patch.stop()
         self.sleep_patch.stop()
 
     def _submit_executor_task(self, task):
@@ -243,3 +257,152 @@ class PollingPathWatcherTest(unittest.TestCase):
         # should not have increased.
         self.assertEqual(callback1.call_count, 1)
         self.assertEqual(callback2.call_count, 2)
+
+    def test_path_polled_once_for_all_watchers(self):
+        """Test that a path watched by many watchers is only checked, and only
+        has a poll scheduled, once per polling period."""
+        self.util_mock.path_modification_time = mock.Mock(return_value=101.0)
+        self.util_mock.calc_md5_with_blocking_retries = mock.Mock(return_value="1")
+
+        callbacks = [mock.Mock() for _ in range(100)]
+        watchers = [
+            polling_path_watcher.PollingPathWatcher("/this/is/my/file.py", callback)
+            for callback in callbacks
+        ]
+        self.assertEqual(1, len(self._executor_tasks))
+        self.assertEqual(1, self.util_mock.calc_md5_with_blocking_retries.call_count)
+
+        self.util_mock.path_modification_time.reset_mock()
+        self._run_executor_tasks()
+        self.assertEqual(1, self.util_mock.path_modification_time.call_count)
+        self.assertEqual(1, len(self._executor_tasks))
+
+        self.util_mock.path_modification_time.return_value = 102.0
+        self.util_mock.calc_md5_with_blocking_retries.return_value = "2"
+        self._run_executor_tasks()
+        for callback in callbacks:
+            callback.assert_called_once_with("/this/is/my/file.py")
+
+        for watcher in watchers:
+            watcher.close()
+
+    def test_watchers_with_different_globs_polled_separately(self):
+        """Test that watchers of the same directory with different glob
+        patterns each have their directory checked with their own pattern."""
+        md5s = {"*.py": "py1", "*.toml": "toml1"}
+        self.util_mock.path_modification_time = lambda *args: 101.0
+        self.util_mock.calc_md5_with_blocking_retries = (
+            lambda _, glob_pattern, **kwargs: md5s[glob_pattern]
+        )
+
+        py_callback = mock.Mock()
+        toml_callback = mock.Mock()
+        py_watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/dir", py_callback, glob_pattern="*.py"
+        )
+        toml_watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/dir", toml_callback, glob_pattern="*.toml"
+        )
+
+        # Only the files matching "*.toml" change.
+        self.util_mock.path_modification_time = lambda *args: 102.0
+        md5s["*.toml"] = "toml2"
+        self._run_executor_tasks()
+
+        py_callback.assert_not_called()
+        toml_callback.assert_called_once_with("/this/is/my/dir")
+
+        toml_watcher.close()
+        self.assertEqual(
+            [("/this/is/my/dir", "*.py", False)],
+            list(polling_path_watcher.PollingPathWatcher._polled_paths),
+        )
+        py_watcher.close()
+
+    def test_stops_polling_without_watchers(self):
+        """Test that polling stops when the last watcher is closed, and starts
+        again with the next one."""
+        self.util_mock.path_modification_time = lambda *args: 101.0
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", mock.Mock()
+        )
+        watcher.close()
+        self._run_executor_tasks()
+        self.assertEqual([], self._executor_tasks)
+
+        watcher = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", mock.Mock()
+        )
+        self.assertEqual(1, len(self._executor_tasks))
+        watcher.close()
+
+    def test_callback_error_does_not_affect_other_watchers(self):
+        """Test that a failing callback doesn't keep other watchers from being
+        notified, or stop polling."""
+        self.util_mock.path_modification_time = lambda *args: 101.0
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "1"
+
+        failing_callback = mock.Mock(side_effect=RuntimeError("boom"))
+        callback = mock.Mock()
+        watcher1 = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", failing_callback
+        )
+        watcher2 = polling_path_watcher.PollingPathWatcher(
+            "/this/is/my/file.py", callback
+        )
+
+        self.util_mock.path_modification_time = lambda *args: 102.0
+        self.util_mock.calc_md5_with_blocking_retries = lambda _, **kwargs: "2"
+        self._run_executor_tasks()
+
+        failing_callback.assert_called_once()
+        callback.assert_called_once()
+        self.assertEqual(1, len(self._executor_tasks))
+
+        watcher1.close()
+        watcher2.close()
+
+
+class PollingPathWatcherPerformanceTest(unittest.TestCase):
+    """Performance tests for polling the files watched by many idle sessions."""
+
+    def setUp(self):
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(20):
+            path = os.path.join(self._temp_dir.name, f"module_{i}.py")
+            with open(path, "w") as f:
+                f.write(f"x = {i}\n" * 100)
+            self.paths.append(path)
+
+        # Don't schedule any polls: the test runs them itself.
+        self.patches = [
+            mock.patch.object(polling_path_watcher.PollingPathWatcher, "_executor"),
+            mock.patch.multiple(
+                polling_path_watcher.PollingPathWatcher,
+                _polled_paths={},
+                _is_polling=False,
+            ),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    @parameterized.expand([(0,), (100,), (1000,)])
+    @pytest.mark.usefixtures("benchmark")
+    def test_poll_performance(self, num_sessions: int):
+        """Performance test for one polling period, with every session
+        watching the same 20 files."""
+        for _ in range(num_sessions):
+            for path in self.paths:
+                polling_path_watcher.PollingPathWatcher(path, mock.Mock())
+
+        self.benchmark(polling_path_watcher.PollingPathWatcher._poll)
@@ -100,6 +100,36 @@ class BrowserWebSocketHandlerTest(ServerTestCase):
 
                 write_message_mock.assert_called_once()
 
+    @patch_config_options({"server.maxWebsocketBatchSize": 100})
+    @tornado.testing.gen_test
+    async def test_write_forward_msgs_batches_messages(self):
+        """`write_forward_msgs` should write all messages in a single frame
+        when they fit into the batch size limit.
+        """
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            with patch.object(websocket_handler, "write_message") as write_message_mock:
+                msgs = []
+                for status in (
+                    ForwardMsg.ScriptFinishedStatus.FINISHED_WITH_COMPILE_ERROR,
+                    ForwardMsg.ScriptFinishedStatus.FINISHED_EARLY_FOR_RERUN,
+                ):
+                    msg = ForwardMsg()
+                    msg.script_finished = status
+                    msgs.append(msg)
+
+                websocket_handler.write_forward_msgs(msgs)
+
+                write_message_mock.assert_called_once()
+                frame = ForwardMsg()
+                frame.ParseFromString(write_message_mock.call_args.args[0])
+                self.assertEqual(msgs, list(frame.forward_msg_list.messages))
+
     @tornado.testing.gen_test
     async def test_backmsg_deserialization_exception(self):
         """If BackMsg deserialization raises an Exception, we should call the Runtime's
@@ -18,13 +18,19 @@ import json
 import mimetypes
 import os
 import tempfile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pyarrow as pa
 import tornado.httpserver
 import tornado.testing
 import tornado.web
 import tornado.websocket
 
+from streamlit import dataframe_util
+from streamlit.runtime.dataframe_page_manager import (
+    DATAFRAME_PAGE_ENDPOINT,
+    DataframePageManager,
+)
 from streamlit.runtime.forward_msg_cache import ForwardMsgCache, populate_hash_if_needed
 from streamlit.runtime.runtime_util import serialize_forward_msg
 from streamlit.web.server import Server
@@ -35,6 +41,7 @@ from streamlit.web.server.server import (
     MESSAGE_ENDPOINT,
     NEW_HEALTH_ENDPOINT,
     AddSlashHandler,
+    DataframePageHandler,
     HealthHandler,
     HostConfigHandler,
     MessageCacheHandler,
@@ -128,6 +135,66 @@ class MessageCacheHandlerTest(tornado.testing.AsyncHTTPTestCase):
         self.assertEqual(404, self.fetch("/_stcore/message?id=non_existent").code)
 
 
+class DataframePageHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self):
+        self._page_mgr = DataframePageManager()
+        return tornado.web.Application(
+            [
+                (
+                    rf"/{DATAFRAME_PAGE_ENDPOINT}/(?P<table_id>[^/]+)",
+                    DataframePageHandler,
+                    dict(page_manager=self._page_mgr),
+                )
+            ]
+        )
+
+    def _add_table(self) -> str:
+        with patch(
+            "streamlit.runtime.dataframe_page_manager._get_session_id",
+            MagicMock(return_value="session_id"),
+        ):
+            return self._page_mgr.add(pa.table({"a": [3, 1, 4, 2, 5]}), "coord")
+
+    def test_get_rows(self):
+        """Rows are returned as Arrow IPC bytes."""
+        table_id = self._add_table()
+
+        response = self.fetch(f"/_stcore/dataframe/{table_id}?offset=1&limit=2")
+        self.assertEqual(200, response.code)
+        df = dataframe_util.convert_arrow_bytes_to_pandas_df(response.body)
+        self.assertEqual([1, 4], df["a"].tolist())
+
+    def test_get_sorted_rows(self):
+        """Rows are returned in the requested sort order."""
+        table_id = self._add_table()
+
+        response = self.fetch(
+            f"/_stcore/dataframe/{table_id}?offset=0&limit=3&sort=a&order=desc"
+        )
+        self.assertEqual(200, response.code)
+        df = dataframe_util.convert_arrow_bytes_to_pandas_df(response.body)
+        self.assertEqual([5, 4, 3], df["a"].tolist())
+
+    def test_unknown_table(self):
+        """Requests for tables that don't exist fail with 404."""
+        self.assertEqual(404, self.fetch("/_stcore/dataframe/unknown").code)
+
+    def test_invalid_params(self):
+        """Malformed requests fail with 400."""
+        table_id = self._add_table()
+
+        for query in [
+            "offset=foo",
+            "offset=-1",
+            "limit=0",
+            "limit=1000000",
+            "order=up",
+            "sort=unknown",
+        ]:
+            response = self.fetch(f"/_stcore/dataframe/{table_id}?{query}")
+            self.assertEqual(400, response.code, query)
+
+
 class StaticFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def setUp(self) -> None:
         self._tmpdir = tempfile.TemporaryDirectory()
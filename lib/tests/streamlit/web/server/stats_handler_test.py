@@ -22,7 +22,7 @@ from google.protobuf.json_format import MessageToDict
 from tornado.httputil import HTTPHeaders
 
 from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, CounterStat, GaugeStat, HistogramStat
 from streamlit.web.server.server import METRIC_ENDPOINT
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
 
@@ -30,8 +30,20 @@ from streamlit.web.server.stats_request_handler import StatsRequestHandler
 class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def get_app(self):
         self.mock_stats = []
+        self.mock_counter_stats = []
+        self.mock_gauge_stats = []
+        self.mock_histogram_stats = []
         mock_stats_manager = MagicMock()
         mock_stats_manager.get_stats = MagicMock(side_effect=lambda: self.mock_stats)
+        mock_stats_manager.get_counter_stats = MagicMock(
+            side_effect=lambda: self.mock_counter_stats
+        )
+        mock_stats_manager.get_gauge_stats = MagicMock(
+            side_effect=lambda: self.mock_gauge_stats
+        )
+        mock_stats_manager.get_histogram_stats = MagicMock(
+            side_effect=lambda: self.mock_histogram_stats
+        )
         return tornado.web.Application(
             [
                 (
@@ -97,6 +109,209 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
 
         self.assertEqual(expected_body, response.body)
 
+    def test_has_counter_stats(self):
+        self.mock_stats = [
+            CacheStat(
+                category_name="st.memo",
+                cache_name="bar",
+                byte_length=256,
+            ),
+        ]
+        self.mock_counter_stats = [
+            CounterStat(
+                family_name="hits",
+                category_name="st.memo",
+                cache_name="bar",
+                value=3,
+            ),
+            CounterStat(
+                family_name="misses",
+                category_name="st.memo",
+                cache_name="bar",
+                value=1,
+            ),
+            CounterStat(
+                family_name="hits",
+                category_name="st.memo",
+                cache_name="baz",
+                value=5,
+            ),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b'cache_memory_bytes{cache_type="st.memo",cache="bar"} 256\n'
+            b"# TYPE hits counter\n"
+            b'hits_total{cache_type="st.memo",cache="bar"} 3\n'
+            b'hits_total{cache_type="st.memo",cache="baz"} 5\n'
+            b"# TYPE misses counter\n"
+            b'misses_total{cache_type="st.memo",cache="bar"} 1\n'
+            b"# EOF\n"
+        )
+
+        self.assertEqual(expected_body, response.body)
+
+    def test_has_gauge_stats(self):
+        self.mock_counter_stats = [
+            CounterStat(
+                family_name="sent",
+                category_name="queue",
+                cache_name="session1",
+                value=7,
+            ),
+        ]
+        self.mock_gauge_stats = [
+            GaugeStat(
+                family_name="depth",
+                category_name="queue",
+                cache_name="session1",
+                value=2,
+            ),
+            GaugeStat(
+                family_name="depth",
+                category_name="queue",
+                cache_name="session2",
+                value=0,
+            ),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b"# TYPE sent counter\n"
+            b'sent_total{cache_type="queue",cache="session1"} 7\n'
+            b"# TYPE depth gauge\n"
+            b'depth{cache_type="queue",cache="session1"} 2\n'
+            b'depth{cache_type="queue",cache="session2"} 0\n'
+            b"# EOF\n"
+        )
+
+        self.assertEqual(expected_body, response.body)
+
+    def test_has_histogram_stats(self):
+        self.mock_histogram_stats = [
+            HistogramStat(
+                family_name="wait_seconds",
+                category_name="queue",
+                cache_name="",
+                buckets=[(0.5, 1), (1, 3), (float("inf"), 4)],
+                sum=7.5,
+            ),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b"# TYPE wait_seconds histogram\n"
+            b'wait_seconds_bucket{cache_type="queue",cache="",le="0.5"} 1\n'
+            b'wait_seconds_bucket{cache_type="queue",cache="",le="1.0"} 3\n'
+            b'wait_seconds_bucket{cache_type="queue",cache="",le="+Inf"} 4\n'
+            b'wait_seconds_count{cache_type="queue",cache=""} 4\n'
+            b'wait_seconds_sum{cache_type="queue",cache=""} 7.5\n'
+            b"# EOF\n"
+        )
+
+        self.assertEqual(expected_body, response.body)
+
+    def test_protobuf_histogram_stats(self):
+        """Histograms are returned as HISTOGRAM metric families in
+        OpenMetrics protobuf format."""
+        self.mock_histogram_stats = [
+            HistogramStat(
+                family_name="wait_seconds",
+                category_name="queue",
+                cache_name="runner",
+                buckets=[(0.5, 1), (float("inf"), 2)],
+                sum=1.25,
+            ),
+        ]
+
+        response = self.fetch(
+            "/_stcore/metrics", headers={"Accept": "application/x-protobuf"}
+        )
+        self.assertEqual(200, response.code)
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+
+        self.assertEqual(
+            {
+                "name": "wait_seconds",
+                "type": "HISTOGRAM",
+                "metrics": [
+                    {
+                        "labels": [
+                            {"name": "cache_type", "value": "queue"},
+                            {"name": "cache", "value": "runner"},
+                        ],
+                        "metricPoints": [
+                            {
+                                "histogramValue": {
+                                    "doubleValue": 1.25,
+                                    "count": "2",
+                                    "buckets": [
+                                        {"count": "1", "upperBound": 0.5},
+                                        {"count": "2", "upperBound": "Infinity"},
+                                    ],
+                                }
+                            }
+                        ],
+                    }
+                ],
+            },
+            MessageToDict(metric_set)["metricFamilies"][1],
+        )
+
+    def test_protobuf_counter_stats(self):
+        """Counters are returned as separate COUNTER metric families in
+        OpenMetrics protobuf format."""
+        self.mock_counter_stats = [
+            CounterStat(
+                family_name="hits",
+                category_name="st.memo",
+                cache_name="bar",
+                value=3,
+            ),
+        ]
+
+        response = self.fetch(
+            "/_stcore/metrics", headers={"Accept": "application/x-protobuf"}
+        )
+        self.assertEqual(200, response.code)
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+
+        self.assertEqual(
+            {
+                "name": "hits",
+                "type": "COUNTER",
+                "metrics": [
+                    {
+                        "labels": [
+                            {"name": "cache_type", "value": "st.memo"},
+                            {"name": "cache", "value": "bar"},
+                        ],
+                        "metricPoints": [{"counterValue": {"intValue": "3"}}],
+                    }
+                ],
+            },
+            MessageToDict(metric_set)["metricFamilies"][1],
+        )
+
     def test_new_metrics_endpoint_should_not_display_deprecation_warning(self):
         response = self.fetch("/_stcore/metrics")
         self.assertNotIn("link", response.headers)
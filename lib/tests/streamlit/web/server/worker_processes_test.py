@@ -0,0 +1,178 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""worker_processes unit tests"""
+
+from __future__ import annotations
+
+import socket
+import unittest
+
+import tornado.httpserver
+import tornado.testing
+import tornado.web
+from parameterized import parameterized
+
+from streamlit.runtime import worker_shard
+from streamlit.web.server.worker_processes import (
+    CloseConnectionTransform,
+    ConnectionRouter,
+    accept_connections_from_channel,
+    get_routing_key,
+)
+
+
+def _request_head(path: str, *headers: str) -> bytes:
+    lines = [f"GET {path} HTTP/1.1", "Host: localhost", *headers]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+class GetRoutingKeyTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (
+                "websocket reconnect",
+                _request_head(
+                    "/_stcore/stream",
+                    "Sec-WebSocket-Protocol: streamlit, xsrf_token, session_id",
+                ),
+                "session_id",
+            ),
+            (
+                "websocket under a base path",
+                _request_head(
+                    "/base/_stcore/stream",
+                    "sec-websocket-protocol: streamlit,xsrf_token,session_id",
+                ),
+                "session_id",
+            ),
+            (
+                "new websocket",
+                _request_head(
+                    "/_stcore/stream", "Sec-WebSocket-Protocol: streamlit, xsrf_token"
+                ),
+                None,
+            ),
+            (
+                "websocket without protocols",
+                _request_head("/_stcore/stream"),
+                None,
+            ),
+            (
+                "file upload",
+                _request_head("/_stcore/upload_file/session_id/file_id"),
+                "session_id",
+            ),
+            ("media file", _request_head("/media/file_id.png"), "file_id"),
+            (
+                "cached message",
+                _request_head("/_stcore/message?hash=msg_hash"),
+                "msg_hash",
+            ),
+            (
+                "cached message with other query arguments",
+                _request_head("/base/_stcore/message?foo=bar&hash=msg_hash&x=y"),
+                "msg_hash",
+            ),
+            (
+                "dataframe page",
+                _request_head("/_stcore/dataframe/table_id?offset=1000&limit=1000"),
+                "table_id",
+            ),
+            ("other path", _request_head("/_stcore/health"), None),
+            ("garbage", b"garbage", None),
+        ]
+    )
+    def test_get_routing_key(self, _, request_head: bytes, expected: str | None):
+        assert get_routing_key(request_head) == expected
+
+
+class ConnectionRouterTest(unittest.TestCase):
+    def test_routes_keys_to_their_shard(self):
+        router = ConnectionRouter([socket.socket() for _ in range(3)], [])
+        try:
+            for key in ("a", "b", "c", "d"):
+                assert router.choose_worker(key) == worker_shard.shard_for_key(key, 3)
+                # Always the same worker for the same key.
+                assert router.choose_worker(key) == router.choose_worker(key)
+        finally:
+            for channel in router._worker_channels:
+                channel.close()
+
+    def test_spreads_other_requests_round_robin(self):
+        router = ConnectionRouter([socket.socket() for _ in range(3)], [])
+        try:
+            assert [router.choose_worker(None) for _ in range(4)] == [0, 1, 2, 0]
+        finally:
+            for channel in router._worker_channels:
+                channel.close()
+
+
+class _HelloHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.write("hello")
+
+
+class RoutedConnectionTest(tornado.testing.AsyncHTTPTestCase):
+    """Runs a router and a "worker" in the same process, connected the way
+    start_worker_processes connects them.
+    """
+
+    def get_app(self):
+        return tornado.web.Application(
+            [("/", _HelloHandler)], transforms=[CloseConnectionTransform]
+        )
+
+    def setUp(self):
+        super().setUp()
+        router_end, worker_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        router_end.setblocking(False)
+        self.worker_end = worker_end
+
+        # The HTTPServer that AsyncHTTPTestCase creates listens on our port.
+        # Make the router listen there instead, and serve what it routes with
+        # a second HTTPServer.
+        self.http_server.stop()
+        worker_server = tornado.httpserver.HTTPServer(self._app)
+        self.io_loop.run_sync(
+            lambda: self._accept_connections(worker_server, worker_end)
+        )
+
+        self.router = ConnectionRouter([router_end], [])
+        sock, port = tornado.testing.bind_unused_port()
+        self.router.add_socket(sock)
+        self.__port = port
+
+    async def _accept_connections(self, http_server, channel):
+        accept_connections_from_channel(http_server, channel)
+
+    def tearDown(self):
+        self.router.stop()
+        self.io_loop.remove_handler(self.worker_end.fileno())
+        self.worker_end.close()
+        for channel in self.router._worker_channels:
+            channel.close()
+        super().tearDown()
+
+    def get_http_port(self) -> int:
+        return self.__port
+
+    def test_serves_routed_connection(self):
+        response = self.fetch("/")
+
+        assert response.code == 200
+        assert response.body == b"hello"
+        # Clients must open a new connection, which is routed anew, for each
+        # request.
+        assert response.headers["Connection"] == "close"